@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, Iterable, List
 
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import format_url
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class Annotation(TM1Object):
@@ -61,7 +61,7 @@ class Annotation(TM1Object):
         :param annotation_as_json: String, JSON
         :return: instance of Annotation
         """
-        annotation_as_dict = json.loads(annotation_as_json)
+        annotation_as_dict = json_loads(annotation_as_json)
         annotation_id = annotation_as_dict["ID"]
         text = annotation_as_dict["Text"]
         creator = annotation_as_dict["Creator"]
@@ -92,7 +92,7 @@ class Annotation(TM1Object):
 
         :return: JSON string representation of the annotation.
         """
-        return json.dumps(self._construct_body())
+        return json_dumps(self._construct_body())
 
     @property
     def body_as_dict(self) -> Dict:
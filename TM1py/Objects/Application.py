@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import json
 import warnings
 from collections import OrderedDict, namedtuple
 from enum import Enum
@@ -7,6 +6,7 @@ from typing import Dict, Union
 
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import format_url
+from TM1py.Utils.JsonCodec import json_dumps
 
 ApplicationType = namedtuple("ApplicationType", ["value", "suffix", "odata_type"])
 
@@ -63,7 +63,7 @@ class Application(TM1Object):
     @property
     def body(self) -> str:
         body_as_dict = self.body_as_dict
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
 
 
 class ChoreApplication(Application):
@@ -75,7 +75,7 @@ class ChoreApplication(Application):
     def body(self) -> str:
         body_as_dict = self.body_as_dict
         body_as_dict["Chore@odata.bind"] = format_url("Chores('{}')", self.chore_name)
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
 
 
 class CubeApplication(Application):
@@ -87,7 +87,7 @@ class CubeApplication(Application):
     def body(self) -> str:
         body_as_dict = self.body_as_dict
         body_as_dict["Cube@odata.bind"] = format_url("Cubes('{}')", self.cube_name)
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
 
 
 class DimensionApplication(Application):
@@ -99,7 +99,7 @@ class DimensionApplication(Application):
     def body(self) -> str:
         body_as_dict = self.body_as_dict
         body_as_dict["Dimension@odata.bind"] = format_url("Dimensions('{}')", self.dimension_name)
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
 
 
 class DocumentApplication(Application):
@@ -141,7 +141,7 @@ class LinkApplication(Application):
     def body(self) -> str:
         body_as_dict = self.body_as_dict
         body_as_dict["URL"] = self.url
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
 
 
 class ProcessApplication(Application):
@@ -153,7 +153,7 @@ class ProcessApplication(Application):
     def body(self) -> str:
         body_as_dict = self.body_as_dict
         body_as_dict["Process@odata.bind"] = format_url("Processes('{}')", self.process_name)
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
 
 
 class SubsetApplication(Application):
@@ -172,7 +172,7 @@ class SubsetApplication(Application):
             self.hierarchy_name,
             self.subset_name,
         )
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
 
 
 class ViewApplication(Application):
@@ -185,4 +185,4 @@ class ViewApplication(Application):
     def body(self) -> str:
         body_as_dict = self.body_as_dict
         body_as_dict["View@odata.bind"] = format_url("Cubes('{}')/Views('{}')", self.cube_name, self.view_name)
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
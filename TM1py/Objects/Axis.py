@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, Union
 
 from TM1py.Objects.Subset import AnonymousSubset, Subset
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import format_url
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class ViewAxisSelection(TM1Object):
@@ -36,7 +36,7 @@ class ViewAxisSelection(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self._construct_body(), ensure_ascii=False)
+        return json_dumps(self._construct_body())
 
     @property
     def body_as_dict(self) -> Dict:
@@ -49,7 +49,7 @@ class ViewAxisSelection(TM1Object):
         """
         body_as_dict = collections.OrderedDict()
         if isinstance(self._subset, AnonymousSubset):
-            body_as_dict["Subset"] = json.loads(self._subset.body)
+            body_as_dict["Subset"] = json_loads(self._subset.body)
         elif isinstance(self._subset, Subset):
             subset_path = format_url(
                 "Dimensions('{}')/Hierarchies('{}')/Subsets('{}')",
@@ -91,7 +91,7 @@ class ViewTitleSelection:
 
     @property
     def body(self) -> str:
-        return json.dumps(self._construct_body(), ensure_ascii=False)
+        return json_dumps(self._construct_body())
 
     def _construct_body(self) -> Dict:
         """construct the ODATA conform JSON represenation for the ViewTitleSelection entity.
@@ -100,7 +100,7 @@ class ViewTitleSelection:
         """
         body_as_dict = collections.OrderedDict()
         if isinstance(self._subset, AnonymousSubset):
-            body_as_dict["Subset"] = json.loads(self._subset.body)
+            body_as_dict["Subset"] = json_loads(self._subset.body)
         elif isinstance(self._subset, Subset):
             subset_path = format_url(
                 "Dimensions('{}')/Hierarchies('{}')/Subsets('{}')",
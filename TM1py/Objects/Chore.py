@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, Iterable, List
 
 from TM1py.Objects.ChoreFrequency import ChoreFrequency
 from TM1py.Objects.ChoreStartTime import ChoreStartTime
 from TM1py.Objects.ChoreTask import ChoreTask
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class Chore(TM1Object):
@@ -41,7 +41,7 @@ class Chore(TM1Object):
         :param chore_as_json: string, JSON. Response of /Chores('x')/Tasks?$expand=*
         :return: Chore, an instance of this class
         """
-        chore_as_dict = json.loads(chore_as_json)
+        chore_as_dict = json_loads(chore_as_json)
         return cls.from_dict(chore_as_dict)
 
     @classmethod
@@ -119,7 +119,7 @@ class Chore(TM1Object):
 
     @property
     def body_as_dict(self) -> Dict:
-        return json.loads(self.body)
+        return json_loads(self.body)
 
     @property
     def execution_path(self) -> Dict:
@@ -162,4 +162,4 @@ class Chore(TM1Object):
         body_as_dict["ExecutionMode"] = self._execution_mode
         body_as_dict["Frequency"] = self._frequency.frequency_string
         body_as_dict["Tasks"] = [task.body_as_dict for task in self._tasks]
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
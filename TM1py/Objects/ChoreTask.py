@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, List
 
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import format_url
+from TM1py.Utils.JsonCodec import json_dumps
 
 
 class ChoreTask(TM1Object):
@@ -71,7 +71,7 @@ class ChoreTask(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self.body_as_dict, ensure_ascii=False)
+        return json_dumps(self.body_as_dict)
 
     def __eq__(self, other: "ChoreTask") -> bool:
         return self.process_name == other.process_name and self.parameters == other.parameters
@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, Iterable, List, Optional, Union
 
 from TM1py.Objects.Rules import Rules
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import format_url
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class Cube(TM1Object):
@@ -81,7 +81,7 @@ class Cube(TM1Object):
         :param cube_as_json: user as JSON string
         :return: cube, an instance of this class
         """
-        cube_as_dict = json.loads(cube_as_json)
+        cube_as_dict = json_loads(cube_as_json)
         return cls.from_dict(cube_as_dict)
 
     @classmethod
@@ -113,4 +113,4 @@ class Cube(TM1Object):
         ]
         if self.has_rules:
             body_as_dict["Rules"] = str(self.rules)
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, Iterable, List, Optional
 
 from TM1py.Objects.Hierarchy import Hierarchy
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 from TM1py.Utils.Utils import case_and_space_insensitive_equals
 
 
@@ -28,7 +28,7 @@ class Dimension(TM1Object):
 
     @classmethod
     def from_json(cls, dimension_as_json: str) -> "Dimension":
-        dimension_as_dict = json.loads(dimension_as_json)
+        dimension_as_dict = json_loads(dimension_as_json)
         return cls.from_dict(dimension_as_dict)
 
     @classmethod
@@ -71,7 +71,7 @@ class Dimension(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self._construct_body())
+        return json_dumps(self._construct_body())
 
     @property
     def body_as_dict(self) -> Dict:
@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from enum import Enum
 from typing import Dict, List, Union
 
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import case_and_space_insensitive_equals
+from TM1py.Utils.JsonCodec import json_dumps
 
 
 class Element(TM1Object):
@@ -85,7 +85,7 @@ class Element(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self._construct_body())
+        return json_dumps(self._construct_body())
 
     @property
     def body_as_dict(self) -> Dict:
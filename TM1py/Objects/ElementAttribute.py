@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
-import json
 from enum import Enum
 from typing import Dict, Union
 
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import case_and_space_insensitive_equals
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class ElementAttribute(TM1Object):
@@ -53,11 +53,11 @@ class ElementAttribute(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self.body_as_dict, ensure_ascii=False)
+        return json_dumps(self.body_as_dict)
 
     @classmethod
     def from_json(cls, element_attribute_as_json: str) -> "ElementAttribute":
-        return cls.from_dict(json.loads(element_attribute_as_json))
+        return cls.from_dict(json_loads(element_attribute_as_json))
 
     @classmethod
     def from_dict(cls, element_attribute_as_dict: Dict) -> "ElementAttribute":
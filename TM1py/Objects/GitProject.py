@@ -4,6 +4,7 @@ import json
 from typing import Dict, List, Optional
 
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 def clean_null_terms(d: Dict):
@@ -285,7 +286,7 @@ class TM1Project(TM1Object):
         :param tm1project_as_json: response of /!tm1project
         :return: an instance of this class
         """
-        tm1project_as_dict = json.loads(tm1project_as_json)
+        tm1project_as_dict = json_loads(tm1project_as_json)
         return cls.from_dict(tm1project_as_dict=tm1project_as_dict)
 
     @classmethod
@@ -358,7 +359,7 @@ class TM1Project(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self.body_as_dict, ensure_ascii=False)
+        return json_dumps(self.body_as_dict)
 
     @property
     def version(self) -> int:
@@ -507,7 +508,7 @@ class TM1ProjectDeployment(TM1Project):
 
     @property
     def body(self) -> str:
-        return json.dumps(self.body_as_dict, ensure_ascii=False)
+        return json_dumps(self.body_as_dict)
 
     # construct self.body (json) from the class-attributes
     def construct_body(self) -> Dict:
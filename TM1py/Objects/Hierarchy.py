@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from TM1py.Objects.Element import Element
 from TM1py.Objects.ElementAttribute import ElementAttribute
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps
 from TM1py.Utils.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveTuplesDict,
@@ -131,7 +131,7 @@ class Hierarchy(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self._construct_body())
+        return json_dumps(self._construct_body())
 
     @property
     def body_as_dict(self) -> Dict:
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 import re
 from typing import Dict, Optional
 
 from TM1py.Objects.DynamicPropertiesMixin import DynamicPropertiesMixin
 from TM1py.Objects.View import View
 from TM1py.Utils import case_and_space_insensitive_equals
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class MDXView(DynamicPropertiesMixin, View):
@@ -81,7 +81,7 @@ class MDXView(DynamicPropertiesMixin, View):
 
     @classmethod
     def from_json(cls, view_as_json: str, cube_name: Optional[str] = None) -> "MDXView":
-        view_as_dict = json.loads(view_as_json)
+        view_as_dict = json_loads(view_as_json)
         return cls.from_dict(view_as_dict, cube_name)
 
     @classmethod
@@ -99,4 +99,4 @@ class MDXView(DynamicPropertiesMixin, View):
         mdx_view_as_dict["Name"] = self._name
         mdx_view_as_dict["MDX"] = self._mdx
         mdx_view_as_dict.update(self._filter_dynamic_properties(self._dynamic_properties))
-        return json.dumps(mdx_view_as_dict, ensure_ascii=False)
+        return json_dumps(mdx_view_as_dict)
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import json
 from typing import Dict, Iterable, List, Optional, Union
 
 from mdxpy import MdxBuilder, MdxHierarchySet, Member
@@ -10,6 +9,7 @@ from TM1py.Objects.DynamicPropertiesMixin import DynamicPropertiesMixin
 from TM1py.Objects.Subset import AnonymousSubset, Subset
 from TM1py.Objects.View import View
 from TM1py.Utils import case_and_space_insensitive_equals, read_object_name_from_url
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class NativeView(DynamicPropertiesMixin, View):
@@ -245,7 +245,7 @@ class NativeView(DynamicPropertiesMixin, View):
         :Returns:
             `View` : an instance of this class
         """
-        view_as_dict = json.loads(view_as_json)
+        view_as_dict = json_loads(view_as_json)
         return NativeView.from_dict(view_as_dict, cube_name)
 
     @classmethod
@@ -329,9 +329,9 @@ class NativeView(DynamicPropertiesMixin, View):
         body = {
             "@odata.type": "ibm.tm1.api.v1.NativeView",
             "Name": self._name,
-            "Columns": [json.loads(column.body) for column in self._columns],
-            "Rows": [json.loads(row.body) for row in self._rows],
-            "Titles": [json.loads(title.body) for title in self._titles],
+            "Columns": [json_loads(column.body) for column in self._columns],
+            "Rows": [json_loads(row.body) for row in self._rows],
+            "Titles": [json_loads(title.body) for title in self._titles],
             "SuppressEmptyColumns": self._suppress_empty_columns,
             "SuppressEmptyRows": self._suppress_empty_rows,
             "FormatString": self._format_string,
@@ -341,4 +341,4 @@ class NativeView(DynamicPropertiesMixin, View):
         if dynamic_props:
             body.update(dynamic_props)
 
-        return json.dumps(body, ensure_ascii=False)
+        return json_dumps(body)
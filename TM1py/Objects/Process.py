@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
-import json
 import re
 from typing import Dict, Iterable, List, Optional, Union
 
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import verify_version
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class Process(TM1Object):
@@ -134,7 +134,7 @@ class Process(TM1Object):
         :param process_as_json: response of /Processes('x')?$expand=*
         :return: an instance of this class
         """
-        process_as_dict = json.loads(process_as_json)
+        process_as_dict = json_loads(process_as_json)
         return cls.from_dict(process_as_dict)
 
     @classmethod
@@ -441,7 +441,7 @@ class Process(TM1Object):
 
     # construct self.body (json) from the class-attributes
     def _construct_body(self) -> str:
-        return json.dumps(self._construct_body_as_dict(), ensure_ascii=False)
+        return json_dumps(self._construct_body_as_dict())
 
     def _construct_body_as_dict(self) -> Dict:
         # general parameters
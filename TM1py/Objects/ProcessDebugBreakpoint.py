@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-import json
 from enum import Enum
 from typing import Dict, Union
 
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps
 
 
 class HitMode(Enum):
@@ -165,7 +165,7 @@ class ProcessDebugBreakpoint(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self._construct_body())
+        return json_dumps(self._construct_body())
 
     @property
     def body_as_dict(self) -> Dict:
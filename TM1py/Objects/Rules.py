@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
-import json
 from typing import Dict, List
 
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps
 
 
 class Rules(TM1Object):
@@ -83,7 +83,7 @@ class Rules(TM1Object):
 
     @property
     def body(self) -> str:
-        return json.dumps(self.body_as_dict)
+        return json_dumps(self.body_as_dict)
 
     @property
     def body_as_dict(self) -> Dict:
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict
 
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class Sandbox(TM1Object):
@@ -54,7 +54,7 @@ class Sandbox(TM1Object):
         :param sandbox_as_json: user as JSON string
         :return: sandbox, an instance of this class
         """
-        sandbox_as_dict = json.loads(sandbox_as_json)
+        sandbox_as_dict = json_loads(sandbox_as_json)
         return cls.from_dict(sandbox_as_dict)
 
     @classmethod
@@ -84,4 +84,4 @@ class Sandbox(TM1Object):
         body_as_dict = collections.OrderedDict()
         body_as_dict["Name"] = self.name
         body_as_dict["IncludeInSandboxDimension"] = self._include_in_sandbox_dimension
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
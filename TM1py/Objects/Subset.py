@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from typing import Dict, Iterable, List, Optional
 
 from TM1py.Objects.TM1Object import TM1Object
 from TM1py.Utils import format_url, read_object_name_from_url
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 
 
 class Subset(TM1Object):
@@ -109,7 +109,7 @@ class Subset(TM1Object):
             `Subset` : an instance of this class
         """
 
-        subset_as_dict = json.loads(subset_as_json)
+        subset_as_dict = json_loads(subset_as_json)
         return cls.from_dict(subset_as_dict=subset_as_dict)
 
     @classmethod
@@ -130,7 +130,7 @@ class Subset(TM1Object):
     @property
     def body(self) -> str:
         """same logic here as in TM1 : when subset has expression its dynamic, otherwise static"""
-        return json.dumps(self.body_as_dict, ensure_ascii=False)
+        return json_dumps(self.body_as_dict)
 
     @property
     def body_as_dict(self) -> Dict:
@@ -210,7 +210,7 @@ class AnonymousSubset(Subset):
         :Returns:
             `Subset` : an instance of this class
         """
-        subset_as_dict = json.loads(subset_as_json)
+        subset_as_dict = json_loads(subset_as_json)
         return cls.from_dict(subset_as_dict=subset_as_dict)
 
     @classmethod
@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import collections
-import json
 from enum import Enum
 from typing import Dict, Iterable, List, Optional, Union
 
 from TM1py.Objects.TM1Object import TM1Object
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 from TM1py.Utils.Utils import CaseAndSpaceInsensitiveSet, format_url
 
 
@@ -141,7 +141,7 @@ class User(TM1Object):
         :param user_as_json: user as JSON string
         :return: user, an instance of this class
         """
-        user_as_dict = json.loads(user_as_json)
+        user_as_dict = json_loads(user_as_json)
         return cls.from_dict(user_as_dict)
 
     @classmethod
@@ -176,4 +176,4 @@ class User(TM1Object):
         if self.password:
             body_as_dict["Password"] = self._password
         body_as_dict["Groups@odata.bind"] = [format_url("Groups('{}')", group) for group in self.groups]
-        return json.dumps(body_as_dict, ensure_ascii=False)
+        return json_dumps(body_as_dict)
@@ -0,0 +1,612 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import functools
+import re
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Callable, Dict, Optional, Union
+
+from requests import ConnectionError, Response, Timeout
+from requests.structures import CaseInsensitiveDict
+
+from TM1py.Exceptions import TM1pyTimeout
+from TM1py.Services.RestService import RestService
+from TM1py.Utils.Instrumentation import RequestMetrics
+
+try:
+    import httpx
+
+    _has_httpx = True
+except ImportError:
+    _has_httpx = False
+
+
+class AsyncRestService:
+    """asyncio transport on top of an authenticated RestService.
+
+    Shares session cookie, headers, authentication, re-connect, request body compression and
+    async polling settings with the wrapped RestService.
+
+    Two transports are available:
+
+    - native: HTTP round trips are awaited on an `httpx.AsyncClient` (`pip install TM1py[httpx]`).
+      No thread is occupied while a request is on the wire, so hundreds of requests can be in flight
+      on one event loop. At most `max_concurrency` connections are open; further requests wait for a
+      free connection.
+    - executor: HTTP round trips are sent by the `requests` session of the RestService on a thread pool
+      of `max_concurrency` workers. At most `max_concurrency` requests are on the wire at any time,
+      the others wait for a worker thread. Used when httpx is not installed and when the RestService
+      relies on features that only `requests` provides: proxies, client certificates and per-request
+      authentication handlers (e.g. Kerberos).
+
+    In both modes `max_concurrency` defaults to `connection_pool_size` (10 unless configured).
+    Waits between async polls (`Prefer: respond-async`) are `asyncio.sleep` calls and never occupy a thread.
+
+    Coroutines can be awaited from within an already running event loop (e.g. FastAPI).
+    """
+
+    def __init__(self, rest: RestService, max_concurrency: int = None, native: bool = None):
+        """
+        :param rest: connected RestService
+        :param max_concurrency: maximum number of concurrent HTTP round trips. Sizes the connection pool of the
+            native transport or the thread pool of the executor transport. If larger than `connection_pool_size`,
+            the HTTP connection pool of the RestService is enlarged too. Default: connection_pool_size
+        :param native: True: use the native httpx transport. False: use the executor transport.
+            None (default): use the native transport when httpx is installed and the RestService supports it
+        """
+        self._rest = rest
+        pool_size = getattr(rest, "_connection_pool_size", RestService.DEFAULT_CONNECTION_POOL_SIZE)
+        self._max_concurrency = int(max_concurrency or pool_size)
+        if self._max_concurrency < 1:
+            raise ValueError("'max_concurrency' must be a positive int")
+        if self._max_concurrency > pool_size:
+            # otherwise urllib3 would discard the surplus connections after every request
+            rest._connection_pool_size = self._max_concurrency
+            rest._manage_http_adapter()
+
+        unsupported = self._native_unsupported_reason(rest)
+        if native and unsupported:
+            raise ValueError(f"native transport is not available: {unsupported}")
+        self._native = unsupported is None if native is None else bool(native)
+        self._client = None
+        self._client_loop = None
+
+        # runs blocking calls: the executor transport, re-connects and the sync fallback of the service facades
+        self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix="TM1py")
+
+    @staticmethod
+    def _native_unsupported_reason(rest: RestService) -> Optional[str]:
+        if not _has_httpx:
+            return "httpx is not installed"
+        session = rest._s
+        if getattr(session, "proxies", None):
+            return "proxies are not supported"
+        if getattr(session, "cert", None):
+            return "client certificates are not supported"
+        if getattr(session, "auth", None) is not None:
+            return "authentication handlers of the requests session are not supported"
+        return None
+
+    @property
+    def rest(self) -> RestService:
+        return self._rest
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def native(self) -> bool:
+        return self._native
+
+    @property
+    def version(self) -> str:
+        return self._rest.version
+
+    @property
+    def session_id(self) -> str:
+        return self._rest.session_id
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run a blocking callable on the bounded executor and await its result
+
+        :param func: callable
+        :return: result of func(*args, **kwargs)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        encoding="utf-8",
+        async_requests_mode: Optional[bool] = None,
+        return_async_id=False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """
+        Execute a request to TM1 REST API. Awaitable counterpart of `RestService.request`
+
+        Request hooks registered on the RestService receive a RequestMetrics object per request, like for the
+        sync transport
+        """
+        rest = self._rest
+        if not rest._request_hooks:
+            return await self._request(
+                method,
+                url,
+                data,
+                encoding,
+                async_requests_mode,
+                return_async_id,
+                timeout,
+                cancel_at_timeout,
+                idempotent,
+                verify_response,
+                None,
+                **kwargs,
+            )
+
+        metrics = RequestMetrics(method=method, url=url)
+        stream = kwargs.get("stream", False)
+        # download the body here instead of in requests, to count the bytes before and after decompression
+        kwargs["stream"] = True
+        started = time.perf_counter()
+        try:
+            response = await self._request(
+                method,
+                url,
+                data,
+                encoding,
+                async_requests_mode,
+                return_async_id,
+                timeout,
+                cancel_at_timeout,
+                idempotent,
+                verify_response,
+                metrics,
+                **kwargs,
+            )
+            if isinstance(response, Response):
+                metrics.status_code = response.status_code
+                metrics.time_to_first_byte = response.elapsed.total_seconds()
+                if self._native:
+                    # the body is in memory already
+                    rest._account_response_body(metrics, response, stream)
+                else:
+                    await self.run(rest._account_response_body, metrics, response, stream)
+            return response
+
+        except Exception as e:
+            metrics.error = type(e).__name__
+            metrics.status_code = getattr(e, "status_code", None)
+            raise
+
+        finally:
+            metrics.latency = time.perf_counter() - started
+            rest._call_request_hooks(metrics)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, bytes, BytesIO],
+        encoding: str,
+        async_requests_mode: Optional[bool],
+        return_async_id: bool,
+        timeout: float,
+        cancel_at_timeout: bool,
+        idempotent: bool,
+        verify_response: bool,
+        metrics: Optional[RequestMetrics],
+        **kwargs,
+    ):
+        rest = self._rest
+        url, data = rest._url_and_body(url=url, data=data, encoding=encoding)
+
+        # compress once, before any retry path, exactly like the sync transport
+        if rest._compress_request_body:
+            data, kwargs["headers"] = rest._maybe_compress_body(data, kwargs.get("headers") or {})
+
+        if metrics is not None:
+            metrics.bytes_sent = rest._request_body_size(data)
+
+        if self._native:
+            # read streams once, so the body can be re-sent after a re-connect
+            data = self._native_body(data)
+
+        timeout = timeout if timeout else rest._timeout
+
+        if return_async_id:
+            async_requests_mode = True
+        elif async_requests_mode is None:
+            async_requests_mode = rest._async_requests_mode
+
+        try:
+            if not async_requests_mode:
+                response = await self._execute_sync_request(
+                    method=method, url=url, data=data, timeout=timeout, metrics=metrics, **kwargs
+                )
+            else:
+                response = await self._execute_async_request(
+                    method=method,
+                    url=url,
+                    data=data,
+                    timeout=timeout,
+                    cancel_at_timeout=cancel_at_timeout,
+                    return_async_id=return_async_id,
+                    metrics=metrics,
+                    **kwargs,
+                )
+
+            if return_async_id and isinstance(response, str):
+                return response
+
+            if verify_response:
+                rest.verify_response(response=response)
+            response.encoding = encoding
+            return response
+
+        except Timeout:
+            if cancel_at_timeout or (cancel_at_timeout is None and rest._cancel_at_timeout):
+                await self.run(rest.cancel_running_operation)
+            raise TM1pyTimeout(method=method, url=url, timeout=timeout)
+
+        except ConnectionError as e:
+            if re.search("Read timed out", str(e), re.IGNORECASE):
+                if cancel_at_timeout or (cancel_at_timeout is None and rest._cancel_at_timeout):
+                    await self.run(rest.cancel_running_operation)
+                raise TM1pyTimeout(method=method, url=url, timeout=timeout)
+
+            if re.search("RemoteDisconnected|Connection aborted", str(e), re.IGNORECASE):
+                if rest._re_connect_on_remote_disconnect:
+                    # rare path: reuse the sync backoff / reconnect logic on a worker thread
+                    return await self.run(
+                        self._in_metrics_scope,
+                        metrics,
+                        rest._handle_remote_disconnect,
+                        e,
+                        method,
+                        url,
+                        data,
+                        timeout,
+                        idempotent,
+                        async_requests_mode,
+                        cancel_at_timeout,
+                        return_async_id,
+                        encoding,
+                        **kwargs,
+                    )
+
+            raise e
+
+    @staticmethod
+    def _in_metrics_scope(metrics: Optional[RequestMetrics], func: Callable, *args, **kwargs):
+        """Run func on a worker thread with metrics as the current request metrics of that thread"""
+        with RestService._metrics_scope(metrics):
+            return func(*args, **kwargs)
+
+    async def _send(
+        self, method: str, url: str, data, timeout: float, metrics: Optional[RequestMetrics] = None, **kwargs
+    ) -> Response:
+        rest = self._rest
+        response = await self._round_trip(method=method, url=url, data=data, timeout=timeout, **kwargs)
+
+        # Handle session timeout
+        if rest._re_connect_on_session_timeout and response.status_code == 401:
+            response.close()
+            if metrics is not None:
+                metrics.retries += 1
+            await self.run(rest.connect)
+            if self._client is not None:
+                self._client.cookies = httpx.Cookies(rest._s.cookies)
+            response = await self._round_trip(method=method, url=url, data=data, timeout=timeout, **kwargs)
+
+        return response
+
+    async def _round_trip(self, method: str, url: str, data, timeout: float, **kwargs) -> Response:
+        rest = self._rest
+        if not self._native:
+            return await self.run(
+                rest._s.request, method=method, url=url, data=data, verify=rest._verify, timeout=timeout, **kwargs
+            )
+
+        kwargs.pop("stream", None)
+        try:
+            response = await self._http_client().request(
+                method.upper(),
+                url,
+                content=data or None,
+                timeout=httpx.Timeout(timeout, pool=None),
+                **kwargs,
+            )
+        # map to the exceptions of requests, so both transports share the timeout and re-connect handling
+        except httpx.TimeoutException as e:
+            raise Timeout(str(e)) from e
+        except (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError) as e:
+            raise ConnectionError(f"Connection aborted: {e}") from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+
+        return self._to_requests_response(response)
+
+    def _http_client(self) -> "httpx.AsyncClient":
+        """httpx client of the running event loop. Connections can't be shared across event loops"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            rest = self._rest
+            if rest._ssl_context is not None:
+                verify = rest._ssl_context
+            elif isinstance(rest._verify, str):
+                verify = ssl.create_default_context(cafile=rest._verify)
+            else:
+                verify = bool(rest._verify)
+            self._client = httpx.AsyncClient(
+                cookies=httpx.Cookies(rest._s.cookies),
+                verify=verify,
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency, max_keepalive_connections=self._max_concurrency
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    def _native_body(data) -> Optional[Union[str, bytes]]:
+        if data is None or isinstance(data, (str, bytes)):
+            return data
+        if isinstance(data, BytesIO):
+            return data.getbuffer()[data.tell() :].tobytes()
+        if isinstance(data, bytearray):
+            return bytes(data)
+        return b"".join(data)
+
+    @staticmethod
+    def _to_requests_response(response: "httpx.Response") -> Response:
+        """Wrap a fully read httpx response, so callers get the same Response type from both transports"""
+        converted = Response()
+        converted.status_code = response.status_code
+        converted.headers = CaseInsensitiveDict(response.headers.items())
+        converted._content = response.content
+        converted._content_consumed = True
+        converted.url = str(response.url)
+        converted.reason = response.reason_phrase
+        converted.elapsed = response.elapsed
+        return converted
+
+    async def _execute_sync_request(
+        self, method: str, url: str, data, timeout: float, metrics: Optional[RequestMetrics] = None, **kwargs
+    ) -> Response:
+        return await self._send(method=method, url=url, data=data, timeout=timeout, metrics=metrics, **kwargs)
+
+    async def _execute_async_request(
+        self,
+        method: str,
+        url: str,
+        data,
+        timeout: float,
+        cancel_at_timeout: bool,
+        return_async_id: bool,
+        metrics: Optional[RequestMetrics] = None,
+        **kwargs,
+    ):
+        http_headers = dict(kwargs.get("headers") or {})
+        http_headers["Prefer"] = "respond-async" if return_async_id else "respond-async,wait=55"
+        kwargs["headers"] = http_headers
+
+        response = await self._send(method=method, url=url, data=data, timeout=timeout, metrics=metrics, **kwargs)
+        self._rest.verify_response(response=response)
+
+        if response.status_code != 202:
+            return response
+
+        async_id = response.headers.get("Location").split("'")[1]
+        response.close()
+        if return_async_id:
+            return async_id
+
+        response = await self._poll_async_response(async_id, timeout, cancel_at_timeout, method, url, metrics)
+        return self._rest._transform_async_response(response)
+
+    async def _poll_async_response(
+        self,
+        async_id: str,
+        timeout: float,
+        cancel_at_timeout: bool,
+        method: str,
+        url: str,
+        metrics: Optional[RequestMetrics] = None,
+    ) -> Response:
+        for wait in self._rest.wait_time_generator(timeout):
+            if metrics is not None:
+                metrics.async_polls += 1
+            response = await self.retrieve_async_response(async_id)
+            if response.status_code in [200, 201]:
+                return response
+            await asyncio.sleep(wait)
+
+        if cancel_at_timeout or (cancel_at_timeout is None and self._rest._cancel_at_timeout):
+            await self.cancel_async_operation(async_id)
+        raise TM1pyTimeout(method=method, url=url, timeout=timeout)
+
+    async def retrieve_async_response(self, async_id: str, **kwargs) -> Response:
+        url = f"/_async('{async_id}')"
+        return await self.GET(url, async_requests_mode=False, **kwargs)
+
+    async def cancel_async_operation(self, async_id: str, **kwargs):
+        url = f"/_async('{async_id}')"
+        response = await self.DELETE(url, async_requests_mode=False, **kwargs)
+        self._rest.verify_response(response)
+
+    def _merge_headers(self, headers: Dict = None) -> Dict:
+        return {**self._rest._headers, **headers} if headers else dict(self._rest._headers)
+
+    async def GET(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = True,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        return await self.request(
+            method="get",
+            headers=self._merge_headers(headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def POST(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        return await self.request(
+            method="post",
+            headers=self._merge_headers(headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def PATCH(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        return await self.request(
+            method="patch",
+            headers=self._merge_headers(headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def PUT(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        return await self.request(
+            method="put",
+            headers=self._merge_headers(headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def DELETE(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        return await self.request(
+            method="delete",
+            headers=self._merge_headers(headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    def close(self):
+        """Shut down the executor. Does not log out the underlying RestService
+
+        Connections of the native transport are released when the client is garbage collected. Use `aclose`
+        from within the event loop to close them right away
+        """
+        self._client = None
+        self._client_loop = None
+        self._executor.shutdown(wait=True)
+
+    async def aclose(self):
+        """Close the connections of the native transport and shut down the executor"""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        await self.aclose()
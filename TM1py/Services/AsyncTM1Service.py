@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import functools
+import json
+from typing import Dict, List, Tuple, Union
+
+from mdxpy import MdxBuilder
+
+from TM1py.Exceptions import TM1pyRestException
+from TM1py.Objects.Process import Process
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Services.CellService import CellService
+from TM1py.Services.ElementService import ElementService, _build_elements_filter
+from TM1py.Services.ProcessService import ProcessService
+from TM1py.Services.TM1Service import TM1Service
+from TM1py.Utils import CaseAndSpaceInsensitiveDict, format_url
+from TM1py.Utils.Utils import add_url_parameters, require_version
+
+
+class _AsyncServiceFacade:
+    """Awaitable view on a sync service.
+
+    Methods implemented on the facade go through the AsyncRestService natively.
+    Every other public method of the wrapped service is awaitable as well and runs on the
+    bounded executor of the AsyncRestService.
+    """
+
+    def __init__(self, service, rest: AsyncRestService):
+        self._service = service
+        self._rest = rest
+
+    @property
+    def version(self) -> str:
+        return self._rest.version
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._service, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def wrapper(*args, **kwargs):
+            return await self._rest.run(attribute, *args, **kwargs)
+
+        return wrapper
+
+
+class AsyncCellService(_AsyncServiceFacade):
+    """Awaitable counterpart of the CellService"""
+
+    def __init__(self, service: CellService, rest: AsyncRestService):
+        super().__init__(service, rest)
+
+    async def create_cellset(self, mdx: Union[str, MdxBuilder], sandbox_name: str = None, **kwargs) -> str:
+        url = add_url_parameters("/ExecuteMDX", **{"!sandbox": sandbox_name})
+        data = {"MDX": mdx.to_mdx() if isinstance(mdx, MdxBuilder) else mdx}
+        response = await self._rest.POST(url=url, data=json.dumps(data, ensure_ascii=False), **kwargs)
+        return response.json()["ID"]
+
+    async def create_cellset_from_view(
+        self, cube_name: str, view_name: str, private: bool, sandbox_name: str = None, **kwargs
+    ) -> str:
+        url = format_url(
+            "/Cubes('{cube_name}')/{views}('{view_name}')/tm1.Execute",
+            cube_name=cube_name,
+            views="PrivateViews" if private else "Views",
+            view_name=view_name,
+        )
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        response = await self._rest.POST(url=url, **kwargs)
+        return response.json()["ID"]
+
+    async def delete_cellset(self, cellset_id: str, sandbox_name: str = None, **kwargs):
+        url = add_url_parameters("/Cellsets('{}')".format(cellset_id), **{"!sandbox": sandbox_name})
+        return await self._rest.DELETE(url, **kwargs)
+
+    async def extract_cellset_values(
+        self,
+        cellset_id: str,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Extract cell values from an existing cellset
+
+        :param cellset_id: String; ID of existing cellset
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :param delete_cellset: delete cellset after extraction
+        :return: List of cell values
+        """
+        url = CellService._build_extract_cellset_values_url(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+        )
+        try:
+            response = await self._rest.GET(url=url, **kwargs)
+            return [cell["Value"] for cell in response.json()["Cells"]]
+        finally:
+            if delete_cellset:
+                try:
+                    await self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+                except TM1pyRestException as ex:
+                    # Fail silently if cellset is already removed
+                    if not ex.status_code == 404:
+                        raise ex
+
+    async def execute_mdx_values(
+        self,
+        mdx: Union[str, MdxBuilder],
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Execute MDX and query only raw cell values. Coordinates are omitted !
+
+        :param mdx: a valid MDX Query
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :return: List of cell values
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset_values(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            **kwargs,
+        )
+
+    async def execute_view_values(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Execute view and query only raw cell values. Coordinates are omitted !
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :return: List of cell values
+        """
+        cellset_id = await self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return await self.extract_cellset_values(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            **kwargs,
+        )
+
+
+class AsyncElementService(_AsyncServiceFacade):
+    """Awaitable counterpart of the ElementService"""
+
+    def __init__(self, service: ElementService, rest: AsyncRestService):
+        super().__init__(service, rest)
+
+    async def get_element_names(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        element_type=None,
+        name_pattern: str = None,
+        level: int = None,
+        **kwargs,
+    ) -> List[str]:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name",
+            dimension_name,
+            hierarchy_name,
+        )
+        filter_clause = _build_elements_filter(element_type, name_pattern, level)
+        if filter_clause:
+            url += "&$filter=" + filter_clause
+        response = await self._rest.GET(url, **kwargs)
+        return [e["Name"] for e in response.json()["value"]]
+
+    async def get_element_types(
+        self, dimension_name: str, hierarchy_name: str, skip_consolidations: bool = False, **kwargs
+    ) -> CaseAndSpaceInsensitiveDict:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name,Type", dimension_name, hierarchy_name
+        )
+        if skip_consolidations:
+            url += "&$filter=Type ne 3"
+        response = await self._rest.GET(url, **kwargs)
+
+        result = CaseAndSpaceInsensitiveDict()
+        for element in response.json()["value"]:
+            result[element["Name"]] = element["Type"]
+        return result
+
+    async def get_edges(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Dict[Tuple[str, str], int]:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Edges?select=ParentName,ComponentName,Weight",
+            dimension_name,
+            hierarchy_name,
+        )
+        response = await self._rest.GET(url, **kwargs)
+        return {(edge["ParentName"], edge["ComponentName"]): edge["Weight"] for edge in response.json()["value"]}
+
+
+class AsyncProcessService(_AsyncServiceFacade):
+    """Awaitable counterpart of the ProcessService
+
+    Pass `async_requests_mode=True` to long-running executions to release the worker thread
+    while TM1 runs the process: the result is then polled with non-blocking sleeps.
+    """
+
+    def __init__(self, service: ProcessService, rest: AsyncRestService):
+        super().__init__(service, rest)
+
+    async def execute_with_return(
+        self,
+        process_name: str = None,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        return_async_id: bool = False,
+        retry_on_disconnect: bool = False,
+        async_requests_mode: bool = None,
+        **kwargs,
+    ) -> Tuple[bool, str, str]:
+        """Ask TM1 Server to execute a process. Pass process parameters as keyword arguments
+
+        :param process_name: name of the TI process
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param return_async_id: return async_id instead of (success, status, error_log_file)
+        :param retry_on_disconnect: bool, indicates that the operation is idempotent and can be safely retried
+        :param async_requests_mode: poll for the result instead of holding the connection open
+        :param kwargs: dictionary of process parameters and values
+        :return: success (boolean), status (String), error_log_file (String)
+        """
+        url = format_url("/Processes('{}')/tm1.ExecuteWithReturn?$expand=*", process_name)
+        parameters = dict()
+        if kwargs:
+            parameters = {"Parameters": []}
+            for parameter_name, parameter_value in kwargs.items():
+                parameters["Parameters"].append({"Name": parameter_name, "Value": parameter_value})
+
+        response = await self._rest.POST(
+            url=url,
+            data=json.dumps(parameters, ensure_ascii=False),
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            return_async_id=return_async_id,
+            async_requests_mode=async_requests_mode,
+            idempotent=retry_on_disconnect,
+        )
+
+        if return_async_id:
+            return response
+
+        return self._service._execute_with_return_parse_response(response)
+
+    @require_version(version="11.3")
+    async def execute_process_with_return(
+        self,
+        process: Process,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        return_async_id: bool = False,
+        retry_on_disconnect: bool = False,
+        async_requests_mode: bool = None,
+        **kwargs,
+    ) -> Tuple[bool, str, str]:
+        """Run unbound TI code directly.
+
+        :param process: a TI Process Object
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param return_async_id: return async_id instead of (success, status, error_log_file)
+        :param retry_on_disconnect: bool, indicates that the operation is idempotent and can be safely retried
+        :param async_requests_mode: poll for the result instead of holding the connection open
+        :param kwargs: dictionary of process parameters and values
+        :return: success (boolean), status (String), error_log_file (String)
+        """
+        url = "/ExecuteProcessWithReturn?$expand=*"
+        for parameter_name, parameter_value in kwargs.items():
+            process.remove_parameter(name=parameter_name)
+            process.add_parameter(name=parameter_name, prompt=parameter_name, value=parameter_value)
+
+        response = await self._rest.POST(
+            url=url,
+            data='{"Process":' + process.body + "}",
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            return_async_id=return_async_id,
+            async_requests_mode=async_requests_mode,
+            idempotent=retry_on_disconnect,
+        )
+
+        if return_async_id:
+            return response
+
+        return self._service._execute_with_return_parse_response(response)
+
+    async def poll_execute_with_return(self, async_id: str):
+        response = await self._rest.retrieve_async_response(async_id=async_id)
+        if response.status_code not in [200, 201]:
+            return None
+
+        # response transformation necessary in TM1 < v11. Not required for v12
+        if response.content.startswith(b"HTTP/"):
+            response = self._rest.rest.build_response_from_binary_response(response.content)
+
+        return self._service._execute_with_return_parse_response(response)
+
+
+class AsyncTM1Service:
+    """asyncio facade over a TM1Service.
+
+    `cells`, `elements` and `processes` expose awaitable versions of the CellService, ElementService and
+    ProcessService calls. All other services remain reachable through the wrapped `tm1` instance.
+
+    With httpx installed (`pip install TM1py[httpx]`) requests are awaited on a native asyncio HTTP client and
+    don't occupy a thread while on the wire. Otherwise they are executed on a thread pool. See AsyncRestService.
+    In both modes at most `max_concurrency` requests run at the same time (default: `connection_pool_size`,
+    i.e. 10 unless configured). To run hundreds of reads concurrently, pass a `max_concurrency` of that size.
+
+    >>> async with await AsyncTM1Service.connect(address="localhost", port=12354, user="admin", password="apple") as tm1:
+    >>>     values = await asyncio.gather(*[tm1.cells.execute_mdx_values(mdx) for mdx in mdxs])
+    """
+
+    def __init__(self, tm1: TM1Service = None, max_concurrency: int = None, native: bool = None, **kwargs):
+        """
+        :param tm1: existing TM1Service. If omitted, a TM1Service is created from kwargs
+        :param max_concurrency: maximum number of concurrent HTTP round trips. Sizes the HTTP connection pool and,
+            for the executor transport, the thread pool. Default: connection_pool_size
+        :param native: use the native httpx transport. None (default): when available. See AsyncRestService
+        :param kwargs: TM1Service arguments, see RestService
+        """
+        self._owns_tm1 = tm1 is None
+        self._tm1 = tm1 if tm1 is not None else TM1Service(**kwargs)
+        self._tm1_rest = AsyncRestService(self._tm1.connection, max_concurrency=max_concurrency, native=native)
+
+        self.cells = AsyncCellService(self._tm1.cells, self._tm1_rest)
+        self.elements = AsyncElementService(self._tm1.elements, self._tm1_rest)
+        self.processes = AsyncProcessService(self._tm1.processes, self._tm1_rest)
+
+    @classmethod
+    async def connect(cls, max_concurrency: int = None, native: bool = None, **kwargs) -> "AsyncTM1Service":
+        """Establish the connection without blocking the running event loop
+
+        :param max_concurrency: maximum number of concurrent HTTP round trips
+        :param native: use the native httpx transport. None (default): when available. See AsyncRestService
+        :param kwargs: TM1Service arguments, see RestService
+        """
+        loop = asyncio.get_running_loop()
+        tm1 = await loop.run_in_executor(None, functools.partial(TM1Service, **kwargs))
+        service = cls(tm1=tm1, max_concurrency=max_concurrency, native=native)
+        service._owns_tm1 = True
+        return service
+
+    @property
+    def tm1(self) -> TM1Service:
+        return self._tm1
+
+    @property
+    def connection(self) -> AsyncRestService:
+        return self._tm1_rest
+
+    @property
+    def version(self) -> str:
+        return self._tm1.version
+
+    async def logout(self, **kwargs):
+        """Log out of TM1 (only if the session was created by this instance) and release the executor"""
+        try:
+            if self._owns_tm1:
+                await self._tm1_rest.run(self._tm1.logout, **kwargs)
+        finally:
+            await self._tm1_rest.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        await self.logout()
@@ -2,16 +2,19 @@
 import asyncio
 import csv
 import functools
+import hashlib
+import inspect
 import itertools
-import json
 import math
+import threading
+import time
 import uuid
 import warnings
 from collections import OrderedDict
 from concurrent.futures.thread import ThreadPoolExecutor
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from io import StringIO
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import ijson
 from mdxpy import MdxBuilder, MdxHierarchySet, MdxTuple, Member
@@ -32,20 +35,27 @@ from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.ProcessService import ProcessService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.SandboxService import SandboxService
+from TM1py.Services.TM1SessionPool import TM1SessionPool
 from TM1py.Services.ViewService import ViewService
 from TM1py.Utils import (
     CaseAndSpaceInsensitiveSet,
     Utils,
     add_url_parameters,
+    coalesce_concurrent_reads,
     format_url,
 )
+from TM1py.Utils.AdaptiveWriteController import AdaptiveWriteController
+from TM1py.Utils.CellsetCache import CellsetCache
+from TM1py.Utils.JsonCodec import json_dumps, json_loads
 from TM1py.Utils.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveTuplesDict,
     abbreviate_mdx,
     build_cellset_from_pandas_dataframe,
+    build_changed_cells_mask,
     build_csv_from_cellset_dict,
     build_dataframe_aggregate_intersections,
+    build_dataframe_from_cellset_columnar,
     build_dataframe_from_csv,
     build_mdx_and_values_from_cellset,
     build_mdx_from_cellset,
@@ -56,6 +66,7 @@ from TM1py.Utils.Utils import (
     dimension_name_from_element_unique_name,
     dimension_names_from_element_unique_names,
     drop_dimension_properties,
+    drop_duplicate_intersections,
     extract_compact_json_cellset,
     frame_to_significant_digits,
     get_cube,
@@ -70,6 +81,7 @@ from TM1py.Utils.Utils import (
 )
 
 try:
+    import numpy as np
     import pandas as pd
 
     _has_pandas = True
@@ -200,15 +212,140 @@ def odata_compact_json(return_as_dict: bool):
     return wrap
 
 
+_cellset_cache_scope = threading.local()
+_CACHE_MISS = object()
+
+
+@decohints
+def cache_cellset_read(func):
+    """Higher order function to serve reads from the cellset cache of the CellService, if enabled
+
+    Key consists of function name, all arguments (normalized MDX) and LastDataUpdate of the cubes involved.
+    Nested reads (e.g. execute_mdx_dataframe_shaped -> execute_mdx_dataframe) are cached only once, on the outside.
+    Reads from a sandbox are not cached: writes to a sandbox don't change the LastDataUpdate of the cube.
+    Reads from cubes with rules are only cached if enabled with `cache_rule_cubes`. See `enable_cellset_cache`.
+    Pass `use_cellset_cache=False` to bypass the cache for a single read.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        use_cellset_cache = kwargs.pop("use_cellset_cache", True)
+        cache = getattr(self, "_cellset_cache", None)
+        if cache is None or not use_cellset_cache or getattr(_cellset_cache_scope, "active", False):
+            return func(self, *args, **kwargs)
+
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+        del arguments["self"]
+        if arguments.get("sandbox_name"):
+            return func(self, *args, **kwargs)
+
+        if "mdx" in arguments:
+            mdx = arguments["mdx"]
+            mdx = mdx.to_mdx() if isinstance(mdx, MdxBuilder) else mdx
+            arguments["mdx"] = " ".join(mdx.split())
+            cube_name = get_cube(mdx)
+        else:
+            cube_name = arguments["cube_name"]
+
+        last_data_updates = self._get_cellset_cache_last_data_updates(cube_name)
+        if last_data_updates is None:
+            return func(self, *args, **kwargs)
+        key = cache.make_key(func.__name__, sorted(arguments.items()), last_data_updates)
+        result = cache.get(key, _CACHE_MISS)
+        if result is not _CACHE_MISS:
+            return result
+
+        _cellset_cache_scope.active = True
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            _cellset_cache_scope.active = False
+        cache.put(key, result)
+        return result
+
+    return wrapper
+
+
+class _QuotedNames(dict):
+    """Element name -> TI string literal. Each distinct name is escaped once"""
+
+    def __missing__(self, name: str) -> str:
+        quoted = self[name] = "'" + name.replace("'", "''") + "'"
+        return quoted
+
+
 class CellService(ObjectService):
     """Service to handle Read and Write operations to TM1 cubes"""
 
+    # rough size of one cell property / one axis tuple in a JSON response. Used to size parallel partitions
+    _ESTIMATED_BYTES_PER_CELL_PROPERTY = 24
+    _ESTIMATED_BYTES_PER_TUPLE = 256
+    # name prefix of the persistent processes installed with use_persistent_loader
+    BLOB_LOADER_PREFIX = "}tm1py.blob_loader."
+
     def __init__(self, tm1_rest: RestService):
         """
 
         :param tm1_rest: instance of RestService
         """
         super().__init__(tm1_rest)
+        self._cellset_cache = None
+        self._cache_rule_cubes = False
+        self._installed_blob_loaders = set()
+        self._blob_loader_lock = threading.Lock()
+
+    @property
+    def cellset_cache(self) -> Optional[CellsetCache]:
+        return self._cellset_cache
+
+    def enable_cellset_cache(
+        self, max_bytes: int = 256 * 1024**2, directory: str = None, cache_rule_cubes: bool = False
+    ) -> CellsetCache:
+        """Cache results of execute_mdx* and execute_view* functions on the client
+
+        A cached result is reused as long as the LastDataUpdate of the cube in the FROM clause (or of the view)
+        is unchanged. Reads from cubes with rules are not cached by default, because rules can derive values
+        from other cubes. With `cache_rule_cubes=True` they are cached and reused as long as the LastDataUpdate
+        of every cube on the server is unchanged.
+        Not tracked are changes to dimensions, element attributes that MDX sets depend on, view definitions and
+        rules. Read such results with `use_cellset_cache=False`, or call `cellset_cache.clear()` after the change.
+        Reads from a sandbox are never cached, because writes to a sandbox don't change the LastDataUpdate.
+
+        :param max_bytes: upper bound for the pickled size of all cached results
+        :param directory: optional folder to persist cached results on disk. Cached results are read back with
+            `pickle`, which can execute code. Use a folder that only this application can write to. Never share it
+        :param cache_rule_cubes: cache reads from cubes with rules as well
+        :return: CellsetCache
+        """
+        self._cellset_cache = CellsetCache(max_bytes=max_bytes, directory=directory)
+        self._cache_rule_cubes = cache_rule_cubes
+        return self._cellset_cache
+
+    def disable_cellset_cache(self):
+        self._cellset_cache = None
+
+    def _get_cellset_cache_last_data_updates(self, cube_name: str) -> Optional[Tuple]:
+        """LastDataUpdate of the cubes a read from cube_name depends on. None if the read must not be cached"""
+        url = format_url("/Cubes('{}')?$select=LastDataUpdate,Rules", cube_name)
+        cube = self._rest.GET(url=url).json()
+        if not (cube.get("Rules") or "").strip():
+            return (cube["LastDataUpdate"],)
+        if not self._cache_rule_cubes:
+            return None
+        # rules can pull values from any cube, also through other rule cubes
+        return tuple(sorted(self.get_cube_service().get_last_data_updates().items()))
+
+    @contextmanager
+    def _pooled_rest(self, session_pool: Optional[TM1SessionPool]) -> Iterator[RestService]:
+        """RestService of a session checked out from the pool, or the own RestService without pool"""
+        if session_pool is None:
+            yield self._rest
+            return
+        with session_pool.session() as rest:
+            yield rest
 
     def get_value(
         self,
@@ -462,9 +599,9 @@ class CellService(ObjectService):
             )
         else:
             body_as_dict = self._compose_odata_tuple_from_iterable(cube_name, elements, dimensions)
-        data = json.dumps(body_as_dict, ensure_ascii=False)
+        data = json_dumps(body_as_dict)
 
-        return json.loads(self._rest.POST(url=url, data=data, **kwargs).content)
+        return json_loads(self._rest.POST(url=url, data=data, **kwargs).content)
 
     def trace_cell_feeders(
         self,
@@ -510,9 +647,9 @@ class CellService(ObjectService):
             )
         else:
             body_as_dict = self._compose_odata_tuple_from_iterable(cube_name, elements, dimensions)
-        data = json.dumps(body_as_dict, ensure_ascii=False)
+        data = json_dumps(body_as_dict)
 
-        return json.loads(self._rest.POST(url=url, data=data, **kwargs).content)
+        return json_loads(self._rest.POST(url=url, data=data, **kwargs).content)
 
     def check_cell_feeders(
         self,
@@ -558,9 +695,9 @@ class CellService(ObjectService):
             )
         else:
             body_as_dict = self._compose_odata_tuple_from_iterable(cube_name, elements, dimensions)
-        data = json.dumps(body_as_dict, ensure_ascii=False)
+        data = json_dumps(body_as_dict)
 
-        return json.loads(self._rest.POST(url=url, data=data, **kwargs).content)
+        return json_loads(self._rest.POST(url=url, data=data, **kwargs).content)
 
     def relative_proportional_spread(
         self,
@@ -841,8 +978,9 @@ class CellService(ObjectService):
         """
         url = format_url("/Cellsets('{}')/tm1.Update", cellset_id)
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        return self._rest.POST(url=url, data=json.dumps(payload), **kwargs)
+        return self._rest.POST(url=url, data=json_dumps(payload), **kwargs)
 
+    @coalesce_concurrent_reads
     def get_dimension_names_for_writing(self, cube_name: str, **kwargs) -> List[str]:
         """Get dimensions of a cube. Skip sandbox dimension
 
@@ -878,6 +1016,9 @@ class CellService(ObjectService):
         clear_view: str = None,
         static_dimension_elements: Dict = None,
         infer_column_order: bool = False,
+        only_changed: bool = False,
+        use_persistent_loader: bool = False,
+        use_compact_blob: bool = False,
         **kwargs,
     ) -> str:
         """
@@ -907,8 +1048,16 @@ class CellService(ObjectService):
         :param static_dimension_elements: Dict of fixed dimension element pairs. Column is created for you.
         :param infer_column_order: bool indicating whether the column order of the dataframe should automatically be
             inferred and mapped to the dimension order in the cube.
+        :param only_changed: read the current values first and only write cells whose value differs.
+            Can not be combined with `increment` or `clear_view`. See `drop_unchanged_cells`
+        :param use_persistent_loader: with `use_blob`: load through a parameterized process that is installed once
+            per cube, instead of compiling a new unbound process with every write. See `write_through_blob`
+        :param use_compact_blob: with `use_blob`: upload the smaller compact blob layout. See `write_through_blob`
         :return: changeset or None
         """
+        if only_changed and (increment or clear_view):
+            raise ValueError("'only_changed' can not be combined with 'increment' or 'clear_view'")
+
         if not isinstance(data, pd.DataFrame):
             raise ValueError("argument 'data' must of type DataFrame")
 
@@ -944,7 +1093,26 @@ class CellService(ObjectService):
         if not len(data.columns) == len(dimensions) + 1:
             raise ValueError("Number of columns in 'data' DataFrame must be number of dimensions in cube + 1")
 
-        cells = build_cellset_from_pandas_dataframe(data, sum_numeric_duplicates=sum_numeric_duplicates)
+        if only_changed:
+            data = self.drop_unchanged_cells(
+                cells=build_dataframe_aggregate_intersections(data, sum_numeric_duplicates=sum_numeric_duplicates),
+                cube_name=cube_name,
+                dimensions=dimensions,
+                sandbox_name=sandbox_name,
+            )
+            if data.empty:
+                return None
+
+        if use_blob and not use_ti:
+            # blob upload streams straight from the data frame, without an intermediate dict.
+            # Like the dict, the last value of duplicate intersections wins
+            cells = [
+                drop_duplicate_intersections(
+                    build_dataframe_aggregate_intersections(data, sum_numeric_duplicates=sum_numeric_duplicates)
+                )
+            ]
+        else:
+            cells = build_cellset_from_pandas_dataframe(data, sum_numeric_duplicates=sum_numeric_duplicates)
 
         return self.write(
             cube_name=cube_name,
@@ -963,6 +1131,8 @@ class CellService(ObjectService):
             measure_dimension_elements=measure_dimension_elements,
             allow_spread=allow_spread,
             clear_view=clear_view,
+            use_persistent_loader=use_persistent_loader,
+            use_compact_blob=use_compact_blob,
             **kwargs,
         )
 
@@ -980,14 +1150,24 @@ class CellService(ObjectService):
         sandbox_name: str = None,
         precision: int = None,
         measure_dimension_elements: Dict = None,
+        encode_workers: int = 1,
+        upload_workers: int = 2,
+        adaptive: bool = False,
+        session_pool: TM1SessionPool = None,
+        use_persistent_loader: bool = False,
+        use_compact_blob: bool = False,
         **kwargs,
-    ) -> Optional[str]:
+    ) -> Optional[Dict]:
         """Write asynchronously
 
+        Slices are written through blob files in a pipeline: CSV encoding, blob upload and TI execution
+        run as separate stages with their own concurrency limits, so the next blob is uploaded while
+        the server processes the previous one.
+
         :param cube_name:
         :param cells:
         :param slice_size:
-        :param max_workers:
+        :param max_workers: max number of TI processes executed in parallel on the server
         :param dimensions:
         :param increment:
         :param deactivate_transaction_log:
@@ -997,52 +1177,51 @@ class CellService(ObjectService):
         Necessary to decrease when dealing with large numbers to avoid "number too long" TI syntax error.
         :param measure_dimension_elements: dictionary of measure elements and their types to improve
         performance when `use_ti` is `True`.
+        :param encode_workers: max number of slices encoded to CSV in parallel
+        :param upload_workers: max number of blob uploads in parallel
+        :param adaptive: resize slices and the number of parallel TI processes on the fly (AIMD), based on
+        the throughput and failures of completed slices. `slice_size` and `max_workers` become the initial slice size
+        and the upper bound for parallel processes. Slices are cut when they enter the pipeline, so a new slice size
+        takes effect only after the slices already in flight. See `AdaptiveWriteController`
+        :param session_pool: optional TM1SessionPool. Uploads and TI processes run on pooled sessions instead of
+        sharing this session, so they are not serialized on the server. Size the pool to `max_workers`
+        :param use_persistent_loader: load all slices through one parameterized process that is installed once,
+        instead of sending and compiling an unbound process per slice. See `write_through_blob`
+        :param use_compact_blob: upload slices in the compact blob layout. See `write_through_blob`
         :param kwargs:
-        :return:
+        :return: settings chosen by the adaptive controller and throughput statistics, if `adaptive` is True
         """
 
         if not dimensions:
             dimensions = self.get_dimension_names_for_writing(cube_name=cube_name)
 
-        if not measure_dimension_elements:
-            measure_dimension_elements = self.get_elements_from_all_measure_hierarchies(cube_name=cube_name)
+        controller = AdaptiveWriteController(slice_size=slice_size, max_workers=max_workers) if adaptive else None
 
         def _chunks(data: Dict):
-            it = iter(data)
-            for _ in range(0, len(data), slice_size):
-                yield {k: data[k] for k in itertools.islice(it, slice_size)}
-
-        def _write(chunk: Dict):
-            return self.write(
-                cube_name=cube_name,
-                cellset_as_dict=chunk,
-                dimensions=dimensions,
-                increment=increment,
-                use_blob=True,
-                sandbox_name=sandbox_name,
-                precision=precision,
-                measure_dimension_elements=measure_dimension_elements,
-                **kwargs,
-            )
-
-        async def _write_async(data: Dict):
-            loop = asyncio.get_event_loop()
-            failures = []
-
-            with ThreadPoolExecutor(max_workers) as executor:
-                futures = [loop.run_in_executor(executor, _write, chunk) for chunk in _chunks(data)]
-
-                for future in futures:
-                    try:
-                        await future
-                    except (TM1pyWritePartialFailureException, TM1pyWriteFailureException) as exception:
-                        failures.append(exception)
-
-            return failures
-
-        exceptions = asyncio.run(_write_async(cells))
+            items = iter(data.items())
+            while True:
+                chunk = list(itertools.islice(items, controller.slice_size if controller else slice_size))
+                if not chunk:
+                    return
+                yield chunk
+
+        exceptions = self._write_through_blob_pipeline(
+            cube_name=cube_name,
+            chunks=_chunks(cells),
+            dimensions=dimensions,
+            increment=increment,
+            sandbox_name=sandbox_name,
+            encode_workers=encode_workers,
+            upload_workers=upload_workers,
+            execute_workers=max_workers,
+            controller=controller,
+            session_pool=session_pool,
+            use_persistent_loader=use_persistent_loader,
+            use_compact_blob=use_compact_blob,
+            **kwargs,
+        )
         if not exceptions:
-            return
+            return controller.report() if controller else None
 
         # merge all failures into one combined Exception
         raise TM1pyWritePartialFailureException(
@@ -1069,22 +1248,35 @@ class CellService(ObjectService):
         sandbox_name: str = None,
         deactivate_transaction_log: bool = False,
         reactivate_transaction_log: bool = False,
+        encode_workers: int = 1,
+        upload_workers: int = 2,
+        adaptive: bool = False,
+        session_pool: TM1SessionPool = None,
+        use_persistent_loader: bool = False,
+        use_compact_blob: bool = False,
         **kwargs,
     ):
         """Write DataFrame into a cube using unbound TI processes in a multi-threading way. Requires admin permissions.
         For a DataFrame with > 1,000,000 rows, this function will at least save half of runtime compared with `write_dataframe` function.
         Column order must match dimensions in the target cube with an additional column for the values.
         Column names are not relevant.
+        Slices are encoded, uploaded and loaded in a pipeline, like in `write_async`.
         :param cube_name:
         :param data: Pandas Data Frame
         :param slice_size_of_dataframe: Number of rows for each DataFrame slice, e.g. 10000
-        :param max_workers: Max number of threads, e.g. 14
+        :param max_workers: Max number of TI processes executed in parallel on the server, e.g. 14
         :param dimensions:
         :param increment: increment or update cell values. Defaults to True.
         :param sandbox_name: name of the sandbox or None
         :param deactivate_transaction_log:
         :param reactivate_transaction_log:
-        :return: the Future’s result or raise exception.
+        :param encode_workers: max number of slices encoded to CSV in parallel
+        :param upload_workers: max number of blob uploads in parallel
+        :param adaptive: resize slices and the number of parallel TI processes on the fly, like in `write_async`
+        :param session_pool: optional TM1SessionPool to spread uploads and TI processes over, like in `write_async`
+        :param use_persistent_loader: load all slices through one installed, parameterized process, like in `write_async`
+        :param use_compact_blob: upload slices in the compact blob layout, like in `write_async`
+        :return: settings chosen by the adaptive controller and throughput statistics, if `adaptive` is True
         """
         if not isinstance(data, pd.DataFrame):
             raise ValueError("argument 'data' must of type DataFrame")
@@ -1095,41 +1287,38 @@ class CellService(ObjectService):
         if not len(data.columns) == len(dimensions) + 1:
             raise ValueError("Number of columns in 'data' DataFrame must be number of dimensions in cube + 1")
 
-        def _chunks(df: "pd.DataFrame"):
-            return [df.iloc[i : i + slice_size_of_dataframe] for i in range(0, df.shape[0], slice_size_of_dataframe)]
-
-        def _write(chunk: "pd.DataFrame"):
-            return self.write_dataframe(
-                cube_name=cube_name,
-                data=chunk,
-                dimensions=dimensions,
-                increment=increment,
-                use_blob=True,
-                sandbox_name=sandbox_name,
-                **kwargs,
-            )
-
-        async def _write_async(df: "pd.DataFrame"):
-            loop = asyncio.get_event_loop()
-            failures = []
-
-            with ThreadPoolExecutor(max_workers) as executor:
-                futures = [loop.run_in_executor(executor, _write, chunk) for chunk in _chunks(df)]
-
-                for future in futures:
-                    try:
-                        await future
-                    except (TM1pyWritePartialFailureException, TM1pyWriteFailureException) as exception:
-                        failures.append(exception)
+        controller = (
+            AdaptiveWriteController(slice_size=slice_size_of_dataframe, max_workers=max_workers) if adaptive else None
+        )
 
-            return failures
+        def _chunks(df: "pd.DataFrame"):
+            i = 0
+            while i < df.shape[0]:
+                size = controller.slice_size if controller else slice_size_of_dataframe
+                # each slice is aggregated lazily, like write_dataframe would do it
+                yield [build_dataframe_aggregate_intersections(df.iloc[i : i + size], sum_numeric_duplicates=True)]
+                i += size
 
         if increment:
             data = build_dataframe_aggregate_intersections(data, sum_numeric_duplicates=True)
 
-        exceptions = asyncio.run(_write_async(data))
+        exceptions = self._write_through_blob_pipeline(
+            cube_name=cube_name,
+            chunks=_chunks(data),
+            dimensions=dimensions,
+            increment=increment,
+            sandbox_name=sandbox_name,
+            encode_workers=encode_workers,
+            upload_workers=upload_workers,
+            execute_workers=max_workers,
+            controller=controller,
+            session_pool=session_pool,
+            use_persistent_loader=use_persistent_loader,
+            use_compact_blob=use_compact_blob,
+            **kwargs,
+        )
         if not exceptions:
-            return
+            return controller.report() if controller else None
 
         # merge all failures into one combined Exception
         raise TM1pyWritePartialFailureException(
@@ -1167,7 +1356,7 @@ class CellService(ObjectService):
             cube_name, element_tuple, dimensions, **kwargs
         )
         body_as_dict["Value"] = str(value) if value else ""
-        data = json.dumps(body_as_dict, ensure_ascii=False)
+        data = json_dumps(body_as_dict)
         return self._rest.POST(url=url, data=data, **kwargs)
 
     def write(
@@ -1188,6 +1377,9 @@ class CellService(ObjectService):
         remove_blob: bool = True,
         allow_spread: bool = False,
         clear_view: str = None,
+        only_changed: bool = False,
+        use_persistent_loader: bool = False,
+        use_compact_blob: bool = False,
         **kwargs,
     ) -> Optional[str]:
         """Write values to a cube
@@ -1217,12 +1409,34 @@ class CellService(ObjectService):
         :param remove_blob: remove blob file after writing with use_blob=True
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements
         :param clear_view: name of cube view to clear before writing
+        :param only_changed: read the current values first and only write cells whose value differs.
+        Can not be combined with `increment` or `clear_view`. See `drop_unchanged_cells`
+        :param use_persistent_loader: with `use_blob`: load through a parameterized process that is installed once
+        per cube, instead of compiling a new unbound process with every write. See `write_through_blob`
+        :param use_compact_blob: with `use_blob`: upload the smaller compact blob layout. See `write_through_blob`
         :return: changeset or None
         """
 
         if clear_view and not use_blob:
             raise ValueError("'clear_view' can only be used in conjunction with 'use_blob'")
 
+        if use_persistent_loader and (use_ti or not use_blob):
+            raise ValueError("'use_persistent_loader' can only be used in conjunction with 'use_blob'")
+
+        if use_compact_blob and (use_ti or not use_blob):
+            raise ValueError("'use_compact_blob' can only be used in conjunction with 'use_blob'")
+
+        if only_changed:
+            if increment or clear_view:
+                raise ValueError("'only_changed' can not be combined with 'increment' or 'clear_view'")
+            if not dimensions:
+                dimensions = self.get_dimension_names_for_writing(cube_name=cube_name)
+            cellset_as_dict = self.drop_unchanged_cells(
+                cells=cellset_as_dict, cube_name=cube_name, dimensions=dimensions, sandbox_name=sandbox_name
+            )
+            if not len(cellset_as_dict):
+                return None
+
         if use_ti:
             return self.write_through_unbound_process(
                 cube_name=cube_name,
@@ -1252,6 +1466,8 @@ class CellService(ObjectService):
                 remove_blob=remove_blob,
                 allow_spread=allow_spread,
                 clear_view=clear_view,
+                use_persistent_loader=use_persistent_loader,
+                use_compact_blob=use_compact_blob,
                 **kwargs,
             )
 
@@ -1328,7 +1544,7 @@ class CellService(ObjectService):
     def write_through_unbound_process(
         self,
         cube_name: str,
-        cellset_as_dict: Dict,
+        cellset_as_dict: Union[Dict, Iterable],
         increment: bool = False,
         sandbox_name: str = None,
         precision: int = None,
@@ -1337,12 +1553,18 @@ class CellService(ObjectService):
         is_attribute_cube: bool = None,
         dimensions: List = None,
         allow_spread: bool = False,
+        max_workers: int = 1,
+        session_pool: TM1SessionPool = None,
         **kwargs,
     ):
         """
         Writes data back to TM1 via an unbound TI process
+
+        TI statements are generated lazily and cut into processes of at most twice `Process.max_statements`
+        statements (prolog and epilog). Only the processes in flight are held in memory.
+
         :param cube_name: str
-        :param cellset_as_dict: cellset_as_dict
+        :param cellset_as_dict: {(elem_a, elem_b, elem_c): 243, ...} or an iterable of (coordinates, value) tuples
         :param increment: increment or update cell values
         :param sandbox_name: str
         :param precision: max precision when writhing through unbound process.
@@ -1351,9 +1573,16 @@ class CellService(ObjectService):
             When all written values are numeric you can pass a defaultdict with default key: 'Numeric'
         :param is_attribute_cube: bool or None
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements
+        :param max_workers: max number of unbound processes executed in parallel. Processes may complete in any
+        order, so pass every intersection only once
+        :param session_pool: optional TM1SessionPool. Each process is executed on a pooled session, so parallel
+        processes are not serialized on the server. Size the pool to `max_workers`
         :param kwargs: Additional arguments for the REST request.
         :return: Success: bool, Messages: list, ChangeSet: None
         """
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be a positive int")
+
         if is_attribute_cube is None:
             is_attribute_cube = cube_name.lower().startswith("}elementattributes_")
 
@@ -1389,25 +1618,47 @@ class CellService(ObjectService):
                 allow_spread=allow_spread,
             )
 
-        chunk = list()
-
         max_statements = Process.max_statements(self.version)
-        for n, statement in enumerate(statements):
-            chunk.append(statement)
-            if n > 0 and n % (max_statements * 2) == 0:
-                success, status, log_file = self._execute_write_statements(chunk, enable_sandbox, kwargs)
-                successes.append(success)
-                if not success:
-                    statuses.append(status)
-                    log_files.append(log_file)
-
-                chunk = list()
-
-        success, status, log_file = self._execute_write_statements(chunk, enable_sandbox, kwargs)
-        successes.append(success)
-        if not success:
-            statuses.append(status)
-            log_files.append(log_file)
+        batches = iter(lambda: list(itertools.islice(statements, max_statements * 2)), [])
+
+        def _execute(batch: List[str]) -> Tuple[bool, str, str]:
+            with self._pooled_rest(session_pool) as rest:
+                return self._execute_write_statements(batch, enable_sandbox, kwargs, rest=rest)
+
+        if max_workers == 1:
+            results = [_execute(batch) for batch in batches]
+        else:
+            # backpressure: the next batch is only built when a worker is free. Stop submitting after an error
+            in_flight = threading.Semaphore(max_workers)
+            failed = threading.Event()
+
+            def _release(future):
+                if future.exception() is not None:
+                    failed.set()
+                in_flight.release()
+
+            futures = []
+            with ThreadPoolExecutor(max_workers) as executor:
+                while True:
+                    in_flight.acquire()
+                    if failed.is_set():
+                        break
+                    batch = next(batches, None)
+                    if batch is None:
+                        break
+                    future = executor.submit(_execute, batch)
+                    future.add_done_callback(_release)
+                    futures.append(future)
+            results = [future.result() for future in futures]
+
+        if not results:
+            return
+
+        for success, status, log_file in results:
+            successes.append(success)
+            if not success:
+                statuses.append(status)
+                log_files.append(log_file)
 
         if not any(successes):
             if "HasMinorErrors" in statuses:
@@ -1418,6 +1669,75 @@ class CellService(ObjectService):
         if not all(successes):
             raise TM1pyWritePartialFailureException(statuses, log_files, len(successes))
 
+    @require_pandas
+    def drop_unchanged_cells(
+        self,
+        cells: Union[Dict, Iterable, "pd.DataFrame"],
+        cube_name: str,
+        dimensions: List[str],
+        sandbox_name: str = None,
+        **kwargs,
+    ) -> Union[Dict, List, "pd.DataFrame"]:
+        """Remove cells whose value equals the current value in the cube
+
+        Current values are read in one query: the NON EMPTY cross join of the distinct elements per dimension.
+        This is efficient when the cells form a dense slice, e.g. a forecast version that is overwritten.
+        Elements are compared case and space insensitive. Cells addressed through aliases are always kept.
+
+        :param cells: {(elem_a, elem_b, elem_c): 243, ...}, an iterable of DataFrames or a DataFrame.
+        Dimension columns in cube order, value column last.
+        :param cube_name: name of the cube
+        :param dimensions: dimension names in their natural order
+        :param sandbox_name: str
+        :return: changed cells, in the same structure as `cells`
+        """
+        dimensions = list(dimensions)
+        frames = None
+        if not isinstance(cells, pd.DataFrame) and not hasattr(cells, "items"):
+            items = list(cells)
+            if items and all(isinstance(item, pd.DataFrame) for item in items):
+                frames = items
+            else:
+                cells = dict(items)
+
+        if frames is not None:
+            data = pd.concat(frames, ignore_index=True)
+        elif isinstance(cells, pd.DataFrame):
+            data = cells
+        else:
+            data = pd.DataFrame(
+                [(*coordinates, value) for coordinates, value in cells.items()], columns=[*dimensions, "Value"]
+            )
+
+        if data.empty:
+            return [] if frames is not None else cells
+
+        query = MdxBuilder.from_cube(cube_name).tm1_ignore_bad_tuples().rows_non_empty().columns_non_empty()
+        for position, dimension in enumerate(dimensions):
+            members = [Member.of(dimension, element) for element in data.iloc[:, position].astype(str).unique()]
+            if position == len(dimensions) - 1:
+                query.add_hierarchy_set_to_column_axis(MdxHierarchySet.members(members))
+            else:
+                query.add_hierarchy_set_to_row_axis(MdxHierarchySet.members(members))
+
+        current = self.execute_mdx_dataframe(
+            mdx=query.to_mdx(), skip_zeros=True, sandbox_name=sandbox_name, shaped=False, **kwargs
+        )
+        if current.empty:
+            current = pd.DataFrame(columns=data.columns)
+
+        changed = build_changed_cells_mask(data, current)
+        if frames is not None:
+            return [data[changed]] if changed.any() else []
+        if isinstance(cells, pd.DataFrame):
+            return cells[changed]
+
+        changed_cells = CaseAndSpaceInsensitiveTuplesDict()
+        for (coordinates, value), is_changed in zip(cells.items(), changed):
+            if is_changed:
+                changed_cells[coordinates] = value
+        return changed_cells
+
     @require_data_admin
     @require_ops_admin
     @manage_transaction_log
@@ -1425,7 +1745,7 @@ class CellService(ObjectService):
     def write_through_blob(
         self,
         cube_name: str,
-        cellset_as_dict: dict,
+        cellset_as_dict: Union[Dict, Iterable],
         increment: bool = False,
         sandbox_name: str = None,
         skip_non_updateable: bool = False,
@@ -1433,12 +1753,18 @@ class CellService(ObjectService):
         dimensions: str = None,
         allow_spread: bool = False,
         clear_view: str = None,
+        use_persistent_loader: bool = False,
+        use_compact_blob: bool = False,
         **kwargs,
     ):
         """
         Writes data back to TM1 via an unbound TI process having an uploaded CSV as data source
+
+        The CSV is encoded and uploaded part by part, so memory stays constant when cells are passed as iterable.
+
         :param cube_name: str
-        :param cellset_as_dict:
+        :param cellset_as_dict: {(elem_a, elem_b, elem_c): 243, ...}, an iterable of (coordinates, value) tuples
+        or an iterable of DataFrames (dimension columns in cube order, value column last)
         :param increment: increment or update cell values
         :param sandbox_name: str
         :param skip_non_updateable: skip cells that are not updateable (e.g. rule derived or consolidated)
@@ -1446,6 +1772,12 @@ class CellService(ObjectService):
         :param dimensions: optional. Dimension names in their natural order. Will speed up the execution!
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements.
         :param clear_view: name of cube view to clear before writing
+        :param use_persistent_loader: install a parameterized loader process for the cube once and call it with
+        the blob file as parameter, instead of sending and compiling a new unbound process with every write.
+        See `delete_blob_loaders`
+        :param use_compact_blob: upload a smaller blob: fields are only quoted where required and an element name
+        is left empty if it equals the one in the row above. Shrinks the blob most when cells are ordered by
+        their coordinates, e.g. as returned by `execute_mdx`. Element names must not be empty
         :param kwargs: Additional arguments for the REST request
         :return: Success: bool, Messages: list, ChangeSet: None
         """
@@ -1455,33 +1787,45 @@ class CellService(ObjectService):
         file_service = FileService(self._rest)
 
         unique_name = self.suggest_unique_object_name()
+        dimensions = dimensions or cube_service.get_dimension_names(cube_name)
+
+        loader = None
+        if use_persistent_loader:
+            # validates the sandbox. The loader activates it through the pSandbox parameter
+            self.generate_enable_sandbox_ti(sandbox_name)
+            loader = self._build_blob_loader_process(
+                cube_name, dimensions, skip_non_updateable, allow_spread, compact=use_compact_blob
+            )
+            self._install_blob_loader(loader)
 
         # Transform cells to format that's consumable for TI
-        csv_content = StringIO()
-        csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
-        csv_writer.writerows(
-            list(elements) + [value.replace("\r", "").replace("\n", "") if isinstance(value, str) else value]
-            for elements, value in cellset_as_dict.items()
-        )
-
         file_name = f"{unique_name}.csv"
-        file_service.create(file_name=file_name, file_content=csv_content.getvalue().encode("utf-8"), **kwargs)
+        file_service.create(
+            file_name=file_name,
+            file_content=self._iter_blob_csv_parts(cellset_as_dict, compact=use_compact_blob),
+            **kwargs,
+        )
 
         try:
-            # Create and execute unbound TI process to load blob file to cube
-            process = self._build_blob_to_cube_process(
-                cube_name=cube_name,
-                process_name=unique_name,
-                blob_filename=file_name,
-                dimensions=dimensions or cube_service.get_dimension_names(cube_name),
-                increment=increment,
-                skip_non_updateable=skip_non_updateable,
-                sandbox_name=sandbox_name,
-                allow_spread=allow_spread,
-                clear_view=clear_view,
-            )
-
-            success, status, log_file = process_service.execute_process_with_return(process=process, **kwargs)
+            if loader:
+                success, status, log_file = self._execute_blob_loader(
+                    self._rest, loader, file_name, increment, sandbox_name, clear_view, **kwargs
+                )
+            else:
+                # Create and execute unbound TI process to load blob file to cube
+                process = self._build_blob_to_cube_process(
+                    cube_name=cube_name,
+                    process_name=unique_name,
+                    blob_filename=file_name,
+                    dimensions=dimensions,
+                    increment=increment,
+                    skip_non_updateable=skip_non_updateable,
+                    sandbox_name=sandbox_name,
+                    allow_spread=allow_spread,
+                    clear_view=clear_view,
+                    compact=use_compact_blob,
+                )
+                success, status, log_file = process_service.execute_process_with_return(process=process, **kwargs)
             if not success:
                 if status in ["HasMinorErrors"]:
                     raise TM1pyWritePartialFailureException([status], [log_file], 1)
@@ -1492,6 +1836,334 @@ class CellService(ObjectService):
             if remove_blob:
                 file_service.delete(file_name=file_name)
 
+    @require_data_admin
+    @require_ops_admin
+    def _write_through_blob_pipeline(
+        self,
+        cube_name: str,
+        chunks: Iterable,
+        dimensions: List[str],
+        increment: bool = False,
+        sandbox_name: str = None,
+        skip_non_updateable: bool = False,
+        remove_blob: bool = True,
+        allow_spread: bool = False,
+        encode_workers: int = 1,
+        upload_workers: int = 2,
+        execute_workers: int = 8,
+        controller: AdaptiveWriteController = None,
+        session_pool: TM1SessionPool = None,
+        use_persistent_loader: bool = False,
+        use_compact_blob: bool = False,
+        **kwargs,
+    ) -> List[Exception]:
+        """Write chunks through blob files and unbound TI processes in three overlapping stages
+
+        Encoding (client CPU), upload (network) and process execution (server) are each limited by their own
+        number of workers. Chunks are pulled lazily from `chunks` and at most
+        `encode_workers + upload_workers + 2 * execute_workers` chunks are in flight at any time,
+        so uploaded blobs are queued for the server while memory on the client stays bounded.
+        Failed loads are collected per chunk. Any other error (e.g. a failed upload) stops pulling chunks and is
+        raised once the chunks in flight are done.
+
+        :param chunks: iterable of chunks. Each chunk is a dict, an iterable of (coordinates, value) tuples
+        or an iterable of DataFrames, as accepted by `write_through_blob`
+        :param controller: optional AdaptiveWriteController. Further limits the parallel executions and is fed
+        with the runtime and outcome of every chunk
+        :param session_pool: optional TM1SessionPool. Uploads and executions check out a pooled session each
+        :param use_persistent_loader: load all chunks through one parameterized process, that is installed once,
+        instead of an unbound process per chunk. See `write_through_blob`
+        :param use_compact_blob: encode chunks in the compact blob layout. See `write_through_blob`
+        :return: list of TM1pyWritePartialFailureException and TM1pyWriteFailureException, one per failed chunk
+        """
+        for name, workers in (
+            ("encode_workers", encode_workers),
+            ("upload_workers", upload_workers),
+            ("execute_workers", execute_workers),
+        ):
+            if workers < 1:
+                raise ValueError(f"'{name}' must be a positive int")
+
+        file_service = FileService(self._rest)
+        dimensions = list(dimensions)
+
+        encode_slots = threading.Semaphore(encode_workers)
+        upload_slots = threading.Semaphore(upload_workers)
+        execute_slots = threading.Semaphore(execute_workers)
+        max_in_flight = encode_workers + upload_workers + 2 * execute_workers
+        in_flight = threading.Semaphore(max_in_flight)
+
+        loader = None
+        if use_persistent_loader:
+            # validates the sandbox. The loader activates it through the pSandbox parameter
+            self.generate_enable_sandbox_ti(sandbox_name)
+            loader = self._build_blob_loader_process(
+                cube_name, dimensions, skip_non_updateable, allow_spread, compact=use_compact_blob
+            )
+            self._install_blob_loader(loader)
+
+        def _execute(file_name: str, process_name: str):
+            with self._pooled_rest(session_pool) as rest:
+                if loader:
+                    success, status, log_file = self._execute_blob_loader(
+                        rest, loader, file_name, increment, sandbox_name, None, **kwargs
+                    )
+                else:
+                    process = self._build_blob_to_cube_process(
+                        cube_name=cube_name,
+                        process_name=process_name,
+                        blob_filename=file_name,
+                        dimensions=dimensions,
+                        increment=increment,
+                        skip_non_updateable=skip_non_updateable,
+                        sandbox_name=sandbox_name,
+                        allow_spread=allow_spread,
+                        clear_view=None,
+                        compact=use_compact_blob,
+                    )
+                    success, status, log_file = ProcessService(rest).execute_process_with_return(
+                        process=process, **kwargs
+                    )
+            if not success:
+                if status in ["HasMinorErrors"]:
+                    raise TM1pyWritePartialFailureException([status], [log_file], 1)
+                raise TM1pyWriteFailureException([status], [log_file])
+
+        def _execute_adaptive(file_name: str, process_name: str, cells: int):
+            controller.acquire()
+            started = time.monotonic()
+            success, minor_errors = False, False
+            try:
+                _execute(file_name, process_name)
+                success = True
+            except TM1pyWritePartialFailureException:
+                # rejected cells are a data problem, not a sign of contention
+                minor_errors = True
+                raise
+            finally:
+                controller.record(
+                    cells=cells, started=started, finished=time.monotonic(), success=success, minor_errors=minor_errors
+                )
+                controller.release()
+
+        def _write(chunk):
+            cells = 0
+            if controller:
+                cells = sum(len(item) if _has_pandas and isinstance(item, pd.DataFrame) else 1 for item in chunk)
+            with encode_slots:
+                content = b"".join(self._iter_blob_csv_parts(chunk, compact=use_compact_blob))
+            del chunk
+
+            unique_name = self.suggest_unique_object_name()
+            file_name = f"{unique_name}.csv"
+            with upload_slots, self._pooled_rest(session_pool) as rest:
+                FileService(rest).create(file_name=file_name, file_content=content, **kwargs)
+            del content
+
+            try:
+                with execute_slots:
+                    if controller:
+                        _execute_adaptive(file_name, unique_name, cells)
+                    else:
+                        _execute(file_name, unique_name)
+            finally:
+                if remove_blob:
+                    file_service.delete(file_name=file_name)
+
+        # write failures are collected per chunk. Any other error (upload, connection, ...) stops the pipeline
+        failed = threading.Event()
+
+        def _release(future):
+            exception = future.exception()
+            if exception is not None and not isinstance(
+                exception, (TM1pyWritePartialFailureException, TM1pyWriteFailureException)
+            ):
+                failed.set()
+            in_flight.release()
+
+        chunks = iter(chunks)
+        end = object()
+        futures = []
+        with ThreadPoolExecutor(max_in_flight) as executor:
+            while True:
+                # backpressure: don't pull the next chunk before a slot in the pipeline is free
+                in_flight.acquire()
+                if failed.is_set():
+                    break
+                chunk = next(chunks, end)
+                if chunk is end:
+                    break
+                future = executor.submit(_write, chunk)
+                future.add_done_callback(_release)
+                futures.append(future)
+
+        failures = []
+        for future in futures:
+            try:
+                future.result()
+            except (TM1pyWritePartialFailureException, TM1pyWriteFailureException) as exception:
+                failures.append(exception)
+        return failures
+
+    @staticmethod
+    def _blob_row(elements: Iterable, value: Any) -> Tuple:
+        return tuple(elements) + (value.replace("\r", "").replace("\n", "") if isinstance(value, str) else value,)
+
+    @staticmethod
+    def _encode_blob_csv_column(column: "pd.Series", separator: str, strip_line_breaks: bool) -> "np.ndarray":
+        """Quote a column like csv.QUOTE_ALL would. Every distinct value is formatted only once"""
+        codes, uniques = pd.factorize(column)
+
+        def _quote(value) -> str:
+            if value is None:
+                return '""' + separator
+            text = value if isinstance(value, str) else str(value)
+            if strip_line_breaks:
+                text = text.replace("\r", "").replace("\n", "")
+            return '"' + text.replace('"', '""') + '"' + separator
+
+        if pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_extension_array_dtype(column.dtype):
+            # numbers need neither escaping nor line break removal
+            quoted = ['"' + text + '"' + separator for text in map(str, uniques.tolist())]
+        else:
+            quoted = [_quote(value) for value in pd.Index(uniques).tolist()]
+        encoded = np.array(quoted + [""], dtype=object)[codes]
+        missing = codes < 0
+        if missing.any():
+            # NaN, None and NA share one code. Format them one by one, like csv.writer does
+            encoded[missing] = [_quote(value) for value in column[missing].tolist()]
+        return encoded
+
+    @staticmethod
+    def _encode_blob_csv_frame(df: "pd.DataFrame") -> str:
+        """Encode a DataFrame (dimension columns, value column last) as fully quoted CSV without iterating rows"""
+        if df.empty:
+            return ""
+        columns = [df.iloc[:, i] for i in range(df.shape[1])]
+        rows = CellService._encode_blob_csv_column(columns[0], ",", strip_line_breaks=False)
+        for column in columns[1:-1]:
+            rows = rows + CellService._encode_blob_csv_column(column, ",", strip_line_breaks=False)
+        rows = rows + CellService._encode_blob_csv_column(columns[-1], "\r\n", strip_line_breaks=True)
+        return "".join(rows.tolist())
+
+    @staticmethod
+    def _quote_compact(text: str) -> str:
+        """Quote a field only if the TI ASCII reader needs it"""
+        if any(character in text for character in ',"\r\n') or text != text.strip():
+            return '"' + text.replace('"', '""') + '"'
+        return text
+
+    @staticmethod
+    def _compact_blob_value(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return CellService._quote_compact(value.replace("\r", "").replace("\n", ""))
+        return str(value)
+
+    @staticmethod
+    def _encode_compact_blob_rows(rows: List[Tuple[Iterable, Any]], previous: List[str]) -> str:
+        """Encode (coordinates, value) tuples in the compact blob layout. `previous` carries the element names
+        of the last row from one call to the next"""
+        lines = []
+        for elements, value in rows:
+            elements = tuple(elements)
+            if len(previous) != len(elements):
+                previous[:] = [None] * len(elements)
+            fields = []
+            for i, element in enumerate(elements):
+                if element is None or element == "":
+                    raise ValueError("Element names must not be empty in the compact blob layout")
+                if element == previous[i]:
+                    fields.append("")
+                else:
+                    fields.append(CellService._quote_compact(str(element)))
+                    previous[i] = element
+            fields.append(CellService._compact_blob_value(value))
+            lines.append(",".join(fields))
+        return "".join(line + "\r\n" for line in lines)
+
+    @staticmethod
+    def _encode_compact_blob_frame(df: "pd.DataFrame") -> str:
+        """Compact blob layout of a DataFrame: an element name is left empty if it equals the one in the row above"""
+        if df.empty:
+            return ""
+        rows = None
+        for i in range(df.shape[1] - 1):
+            codes, uniques = pd.factorize(df.iloc[:, i])
+            if (codes < 0).any() or (uniques == "").any():
+                raise ValueError("Element names must not be empty in the compact blob layout")
+            encoded = np.array(
+                [CellService._quote_compact(str(name)) + "," for name in pd.Index(uniques).tolist()], dtype=object
+            )[codes]
+            # the first row of every frame is complete
+            encoded[1:][codes[1:] == codes[:-1]] = ","
+            rows = encoded if rows is None else rows + encoded
+
+        values = df.iloc[:, -1]
+        codes, uniques = pd.factorize(values)
+        if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_extension_array_dtype(values.dtype):
+            texts = [text + "\r\n" for text in map(str, uniques.tolist())]
+        else:
+            texts = [CellService._compact_blob_value(value) + "\r\n" for value in pd.Index(uniques).tolist()]
+        encoded = np.array(texts + [""], dtype=object)[codes]
+        missing = codes < 0
+        if missing.any():
+            encoded[missing] = [CellService._compact_blob_value(value) + "\r\n" for value in values[missing].tolist()]
+        return "".join((rows + encoded).tolist())
+
+    @staticmethod
+    def _iter_blob_csv_parts(
+        cells: Union[Dict, Iterable],
+        part_size: int = 4 * 1024**2,
+        frame_slice_size: int = 100_000,
+        compact: bool = False,
+    ) -> Iterator[bytes]:
+        """Encode cells as CSV for the blob to cube process. Yields utf-8 parts of about part_size bytes
+
+        DataFrames are encoded column-wise in slices of frame_slice_size rows, other cells row by row.
+        Default layout is fully quoted CSV. The compact layout quotes only where required and leaves an element
+        name empty if it equals the one in the row above, see `_build_blob_to_cube_data_procedure`
+        """
+        buffer = StringIO()
+        csv_writer = csv.writer(buffer, delimiter=",", quoting=csv.QUOTE_ALL)
+        previous = []
+
+        def _write_rows(rows: List):
+            if compact:
+                buffer.write(CellService._encode_compact_blob_rows(rows, previous))
+            else:
+                csv_writer.writerows(CellService._blob_row(elements, value) for elements, value in rows)
+
+        encode_frame = CellService._encode_compact_blob_frame if compact else CellService._encode_blob_csv_frame
+        items = iter(cells.items() if hasattr(cells, "items") else cells)
+        while True:
+            batch = list(itertools.islice(items, 10_000))
+            if not batch:
+                break
+            rows = []
+            for item in batch:
+                if _has_pandas and isinstance(item, pd.DataFrame):
+                    _write_rows(rows)
+                    rows = []
+                    previous.clear()
+                    for start in range(0, item.shape[0], frame_slice_size):
+                        buffer.write(encode_frame(item.iloc[start : start + frame_slice_size]))
+                        if buffer.tell() >= part_size:
+                            yield buffer.getvalue().encode("utf-8")
+                            buffer.seek(0)
+                            buffer.truncate()
+                    continue
+                rows.append(item)
+            _write_rows(rows)
+            if buffer.tell() >= part_size:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
     def _build_blob_to_cube_process(
         self,
         cube_name: str,
@@ -1503,28 +2175,16 @@ class CellService(ObjectService):
         sandbox_name: str,
         allow_spread: bool,
         clear_view: str,
+        compact: bool = False,
     ) -> Process:
-
-        # v11 automatically adds blb file extensions to documents created via the contents api
-        if not verify_version(required_version="12", version=self.version):
-            blob_filename += ".blb"
-        dataload_process = Process(
-            name=process_name,
-            datasource_type="ASCII",
-            datasource_ascii_header_records=0,
-            datasource_data_source_name_for_server=f"{blob_filename}",
-            datasource_data_source_name_for_client=f"{blob_filename}",
-            datasource_ascii_delimiter_char=",",
-            datasource_ascii_decimal_separator=".",
-            datasource_ascii_thousand_separator="",
-            datasource_ascii_quote_character='"',
+        dataload_process = self._build_blob_datasource_process(
+            process_name=process_name, blob_filename=self._blob_datasource_name(blob_filename), dimensions=dimensions
         )
-        cube_measure = dimensions[-1]
 
         # Define encoding and active sandbox in Prolog section
         dataload_process.prolog_procedure = f"""
         SetInputCharacterSet('TM1CS_UTF8');
-        {self.generate_enable_sandbox_ti(sandbox_name)}
+        {self.generate_enable_sandbox_ti(sandbox_name)}{self._build_compact_blob_prolog(dimensions) if compact else ""}
         """
 
         if clear_view:
@@ -1532,31 +2192,135 @@ class CellService(ObjectService):
                 dataload_process.prolog_procedure + f"\rViewZeroOut('{cube_name}', '{clear_view}');\r"
             )
 
-        # Create variables as all String
-        dimension_variables = [f"v{n}" for n in range(1, len(dimensions) + 1)]
+        dataload_process.data_procedure = self._build_blob_to_cube_data_procedure(
+            cube_name=cube_name,
+            dimensions=dimensions,
+            increment=increment,
+            skip_non_updateable=skip_non_updateable,
+            allow_spread=allow_spread,
+            compact=compact,
+        )
+        return dataload_process
 
-        for variable in dimension_variables:
-            dataload_process.add_variable(name=variable, variable_type="String")
-        variable_cube_measure = dimension_variables[-1]
+    def _build_blob_loader_process(
+        self,
+        cube_name: str,
+        dimensions: List[str],
+        skip_non_updateable: bool,
+        allow_spread: bool,
+        compact: bool = False,
+    ) -> Process:
+        """Persistent counterpart of `_build_blob_to_cube_process`
 
-        comma_sep_var_elements = ",".join(dimension_variables)
-        # Add value variable as type String to enable numeric and string cell updates
-        value_variable = "vValue"
-        dataload_process.add_variable(name=value_variable, variable_type="String")
-        # Write the statement for Cell Is Updateable
-        if skip_non_updateable:
-            cell_is_updateable_pre = f"If( CellIsUpdateable('{cube_name}',{comma_sep_var_elements}) = 1 );"
-            cell_is_updateable_post = "\rElse;\r" "   ItemSkip;\r" "EndIf;\r"
-        else:
-            cell_is_updateable_pre = ""
+        Blob file, increment, sandbox and view to clear are process parameters, so one process serves all writes
+        to a cube with the same options. The name is derived from a checksum of the process definition.
+        Any change to the cube, the options, the blob layout or the generated code leads to a new process.
+        """
+        loader = self._build_blob_datasource_process(
+            process_name="", blob_filename=f"{self.BLOB_LOADER_PREFIX}csv", dimensions=dimensions
+        )
+        loader.add_parameter(name="pFile", prompt="blob file", value="", parameter_type="String")
+        loader.add_parameter(name="pIncrement", prompt="1: increment, 0: update", value=0, parameter_type="Numeric")
+        loader.add_parameter(name="pSandbox", prompt="sandbox. Empty: base", value="", parameter_type="String")
+        loader.add_parameter(name="pClearView", prompt="view to zero out", value="", parameter_type="String")
+
+        enable_sandbox = ""
+        if not self._rest.sandboxing_disabled:
+            enable_sandbox = """
+        If(pSandbox @= '');
+            ServerActiveSandboxSet('');
+            SetUseActiveSandboxProperty(0);
+        Else;
+            ServerActiveSandboxSet(pSandbox);
+            SetUseActiveSandboxProperty(1);
+        EndIf;"""
+
+        loader.prolog_procedure = f"""
+        SetInputCharacterSet('TM1CS_UTF8');
+        DatasourceNameForServer = pFile;
+        DatasourceNameForClient = pFile;{enable_sandbox}{self._build_compact_blob_prolog(dimensions) if compact else ""}
+        If(pClearView @<> '');
+            ViewZeroOut('{cube_name}', pClearView);
+        EndIf;
+        """
+        loader.data_procedure = self._build_blob_to_cube_data_procedure(
+            cube_name=cube_name,
+            dimensions=dimensions,
+            increment=None,
+            skip_non_updateable=skip_non_updateable,
+            allow_spread=allow_spread,
+            compact=compact,
+        )
+
+        checksum = hashlib.sha256(loader.body.encode("utf-8")).hexdigest()[:16]
+        loader.name = f"{self.BLOB_LOADER_PREFIX}{checksum}"
+        return loader
+
+    def _blob_datasource_name(self, blob_filename: str) -> str:
+        # v11 automatically adds blb file extensions to documents created via the contents api
+        if not verify_version(required_version="12", version=self.version):
+            return blob_filename + ".blb"
+        return blob_filename
+
+    @staticmethod
+    def _build_blob_datasource_process(process_name: str, blob_filename: str, dimensions: List[str]) -> Process:
+        process = Process(
+            name=process_name,
+            datasource_type="ASCII",
+            datasource_ascii_header_records=0,
+            datasource_data_source_name_for_server=f"{blob_filename}",
+            datasource_data_source_name_for_client=f"{blob_filename}",
+            datasource_ascii_delimiter_char=",",
+            datasource_ascii_decimal_separator=".",
+            datasource_ascii_thousand_separator="",
+            datasource_ascii_quote_character='"',
+        )
+        # Create variables as all String
+        for n in range(1, len(dimensions) + 1):
+            process.add_variable(name=f"v{n}", variable_type="String")
+        # Add value variable as type String to enable numeric and string cell updates
+        process.add_variable(name="vValue", variable_type="String")
+        return process
+
+    @staticmethod
+    def _build_blob_to_cube_data_procedure(
+        cube_name: str,
+        dimensions: List[str],
+        increment: Optional[bool],
+        skip_non_updateable: bool,
+        allow_spread: bool,
+        compact: bool = False,
+    ) -> str:
+        """Data procedure for the variables of `_build_blob_datasource_process`
+
+        :param increment: None to decide by the numeric process parameter pIncrement
+        :param compact: blob in the compact layout. Empty element names are taken from the previous record
+        """
+        cube_measure = dimensions[-1]
+        dimension_variables = [f"v{n}" for n in range(1, len(dimensions) + 1)]
+        variable_cube_measure = dimension_variables[-1]
+
+        comma_sep_var_elements = ",".join(dimension_variables)
+        value_variable = "vValue"
+        # Write the statement for Cell Is Updateable
+        if skip_non_updateable:
+            cell_is_updateable_pre = f"If( CellIsUpdateable('{cube_name}',{comma_sep_var_elements}) = 1 );"
+            cell_is_updateable_post = "\rElse;\r" "   ItemSkip;\r" "EndIf;\r"
+        else:
+            cell_is_updateable_pre = ""
             cell_is_updateable_post = ""
 
         # Define TI write function based on parameter 'increment' and nature of the cube
-
-        if cube_name.lower().startswith("}elementattributes_"):
-            numeric_function_str = "CellPutN"
+        if cube_name.lower().startswith("}elementattributes_") or increment is False:
+            numeric_write = f"CellPutN(nValue,'{cube_name}',{comma_sep_var_elements});"
+        elif increment:
+            numeric_write = f"CellIncrementN(nValue,'{cube_name}',{comma_sep_var_elements});"
         else:
-            numeric_function_str = "CellIncrementN" if increment else "CellPutN"
+            numeric_write = f"""If(pIncrement = 1);
+                    CellIncrementN(nValue,'{cube_name}',{comma_sep_var_elements});
+                Else;
+                    CellPutN(nValue,'{cube_name}',{comma_sep_var_elements});
+                EndIf;"""
 
         # Define input statement depending on measure element's type: numeric or string
         # For non-existing-element attempt to write to trigger error
@@ -1574,13 +2338,13 @@ class CellService(ObjectService):
             IF({any_c_element_in_write});
                 CellPutProportionalSpread(nValue,'{cube_name}',{comma_sep_var_elements});
             ELSE;
-                {numeric_function_str}(nValue,'{cube_name}',{comma_sep_var_elements});
+                {numeric_write}
             ENDIF;
             """
 
         numeric_write_statement_without_spread = f"""
             nValue = StringToNumber({value_variable});
-            {numeric_function_str}(nValue,'{cube_name}',{comma_sep_var_elements});
+            {numeric_write}
             """
 
         string_write_condition = f"""
@@ -1603,9 +2367,79 @@ class CellService(ObjectService):
 
         # Define Data section
         data_statement = cell_is_updateable_pre + input_statement + cell_is_updateable_post
-        dataload_process.data_procedure = data_statement
+        if compact:
+            # element names can't be empty. An empty field repeats the element of the previous record
+            restore_elements = "".join(f"""
+        If({variable} @= '');
+            {variable} = sPrevious{n};
+        Else;
+            sPrevious{n} = {variable};
+        EndIf;""" for n, variable in enumerate(dimension_variables, start=1))
+            data_statement = restore_elements + data_statement
+        return data_statement
 
-        return dataload_process
+    @staticmethod
+    def _build_compact_blob_prolog(dimensions: List[str]) -> str:
+        return "".join(f"\r        sPrevious{n} = '';" for n in range(1, len(dimensions) + 1))
+
+    def _install_blob_loader(self, loader: Process, **kwargs):
+        """Create the loader process on the server, unless this service or another client did it already"""
+        with self._blob_loader_lock:
+            if loader.name in self._installed_blob_loaders:
+                return
+            process_service = ProcessService(self._rest)
+            if not process_service.exists(loader.name, **kwargs):
+                try:
+                    process_service.create(loader, **kwargs)
+                except TM1pyRestException:
+                    # created by a parallel client in the meantime
+                    if not process_service.exists(loader.name, **kwargs):
+                        raise
+            self._installed_blob_loaders.add(loader.name)
+
+    def _execute_blob_loader(
+        self,
+        rest: RestService,
+        loader: Process,
+        file_name: str,
+        increment: bool,
+        sandbox_name: str,
+        clear_view: str,
+        **kwargs,
+    ) -> Tuple[bool, str, str]:
+        """Run an installed loader. Only the parameters are sent. Reinstalls the loader once if it was deleted"""
+        parameters = {
+            "pFile": self._blob_datasource_name(file_name),
+            "pIncrement": 1 if increment else 0,
+            "pSandbox": sandbox_name or "",
+            "pClearView": clear_view or "",
+        }
+        try:
+            return ProcessService(rest).execute_with_return(process_name=loader.name, **parameters, **kwargs)
+        except TM1pyRestException as e:
+            if e.status_code != 404:
+                raise
+            with self._blob_loader_lock:
+                self._installed_blob_loaders.discard(loader.name)
+            self._install_blob_loader(loader)
+            return ProcessService(rest).execute_with_return(process_name=loader.name, **parameters, **kwargs)
+
+    def delete_blob_loaders(self, **kwargs) -> List[str]:
+        """Delete the persistent loader processes that `use_persistent_loader` installed on the server
+
+        :return: names of the deleted processes
+        """
+        process_service = ProcessService(self._rest)
+        names = [
+            name
+            for name in process_service.get_all_names(**kwargs)
+            if name.lower().startswith(self.BLOB_LOADER_PREFIX.lower())
+        ]
+        for name in names:
+            process_service.delete(name, **kwargs)
+        with self._blob_loader_lock:
+            self._installed_blob_loaders.clear()
+        return names
 
     def _build_cube_to_blob_process(
         self,
@@ -1726,11 +2560,11 @@ class CellService(ObjectService):
         precision: int = None,
         skip_non_updateable: bool = False,
         measure_dimension_elements: Dict = None,
-    ):
+    ) -> Iterator[str]:
         dimension_name = cube_name[19:]
-        statements = list()
+        items = cellset_as_dict.items() if hasattr(cellset_as_dict, "items") else cellset_as_dict
 
-        for coordinates, value in cellset_as_dict.items():
+        for coordinates, value in items:
             # default to 'Numeric' so that not existing elements trigger minor error during TI execution
             raw_element_name = coordinates[0]
             if ":" in raw_element_name:
@@ -1787,39 +2621,44 @@ class CellService(ObjectService):
                 )
                 cell_is_updateable_post = ",0);"
 
-            statement = "".join(
+            yield "".join(
                 [cell_is_updateable_pre, function_str, value_str, comma_separated_args, ")", cell_is_updateable_post]
             )
 
-            statements.append(statement)
-
-        return statements
-
     @staticmethod
     def _build_cell_update_statements(
         cube_name: str,
-        cellset_as_dict: Dict,
+        cellset_as_dict: Union[Dict, Iterable],
         increment: bool,
         measure_dimension_elements: Dict,
         precision: int = None,
         skip_non_updateable: bool = False,
         dimensions: List = None,
         allow_spread: bool = False,
-    ):
-        statements = list()
+    ) -> Iterator[str]:
+        """Yield one TI statement per cell. Nothing is held in memory beyond the escaped element names
 
-        for coordinates, value in cellset_as_dict.items():
-            # default to 'Numeric' so that not existing elements trigger minor error during TI execution
-            measure_element = coordinates[-1]
-            try:
-                element_type = measure_dimension_elements[measure_element]
+        :param cellset_as_dict: {(elem_a, elem_b, elem_c): 243, ...} or an iterable of (coordinates, value) tuples
+        """
+        quoted_names = _QuotedNames()
+        element_types = {}
+        numeric_function_str = "CellIncrementN(" if increment else "CellPutN("
+        quoted_cube_name = f",'{cube_name}',"
+        items = cellset_as_dict.items() if hasattr(cellset_as_dict, "items") else cellset_as_dict
 
-            except KeyError:
-                if ":" in measure_element:
-                    measure_element = measure_element.split(":")[1]
-                    element_type = measure_dimension_elements.get(measure_element, "Numeric")
-                else:
-                    element_type = "Numeric"
+        for coordinates, value in items:
+            measure_element = coordinates[-1]
+            element_type = element_types.get(measure_element)
+            if element_type is None:
+                # default to 'Numeric' so that not existing elements trigger minor error during TI execution
+                try:
+                    element_type = measure_dimension_elements[measure_element]
+                except KeyError:
+                    if ":" in measure_element:
+                        element_type = measure_dimension_elements.get(measure_element.split(":")[1], "Numeric")
+                    else:
+                        element_type = "Numeric"
+                element_types[measure_element] = element_type
 
             if element_type == "String":
                 function_str = "CellPutS("
@@ -1828,7 +2667,7 @@ class CellService(ObjectService):
 
             # by default assume numeric, to trigger minor errors on write operations to C elements
             else:
-                function_str = "CellIncrementN(" if increment else "CellPutN("
+                function_str = numeric_function_str
 
                 # number strings must not exceed float range
                 if isinstance(value, str):
@@ -1847,7 +2686,11 @@ class CellService(ObjectService):
                     else:
                         value_str = format(float(value), f".{precision}f")
 
-            comma_separated_elements = ",".join("'" + element.replace("'", "''") + "'" for element in coordinates)
+            comma_separated_elements = ",".join(map(quoted_names.__getitem__, coordinates))
+
+            if not skip_non_updateable and not allow_spread:
+                yield f"{function_str}{value_str}{quoted_cube_name}{comma_separated_elements});"
+                continue
 
             cell_is_updateable_pre = ""
             cell_is_updateable_post = ";"
@@ -1871,13 +2714,13 @@ class CellService(ObjectService):
                 consolidated_spread_check_start = ""
                 consolidated_spread_check_end = ""
 
-            statement = "".join(
+            yield "".join(
                 [
                     cell_is_updateable_pre,
                     consolidated_spread_check_start,
                     function_str,
                     value_str,
-                    f",'{cube_name}',",
+                    quoted_cube_name,
                     comma_separated_elements,
                     ")",
                     cell_is_updateable_post,
@@ -1885,10 +2728,6 @@ class CellService(ObjectService):
                 ]
             )
 
-            statements.append(statement)
-
-        return statements
-
     def generate_enable_sandbox_ti(self, sandbox_name):
         if self._rest.sandboxing_disabled:
             enable_sandbox = ""
@@ -1903,6 +2742,7 @@ class CellService(ObjectService):
             enable_sandbox = "ServerActiveSandboxSet('');SetUseActiveSandboxProperty(0);"
         return enable_sandbox
 
+    @coalesce_concurrent_reads
     def get_elements_from_all_measure_hierarchies(self, cube_name: str) -> Dict[str, str]:
         from TM1py.Services.CubeService import CubeService
         from TM1py.Services.ElementService import ElementService
@@ -1913,7 +2753,9 @@ class CellService(ObjectService):
         measure_dimension = cube_service.get_measure_dimension(cube_name=cube_name)
         return element_service.get_element_types_from_all_hierarchies(dimension_name=measure_dimension)
 
-    def _execute_write_statements(self, statements: List[str], enable_sandbox: str, kwargs) -> Tuple[bool, str, str]:
+    def _execute_write_statements(
+        self, statements: List[str], enable_sandbox: str, kwargs, rest: RestService = None
+    ) -> Tuple[bool, str, str]:
         max_statements = Process.max_statements(self.version)
 
         process = Process(
@@ -1922,6 +2764,8 @@ class CellService(ObjectService):
             epilog_procedure="\r".join(statements[max_statements:]),
         )
 
+        if rest is not None:
+            return ProcessService(rest).execute_process_with_return(process, **kwargs)
         return self.execute_unbound_process(process, **kwargs)
 
     def get_element_service(self):
@@ -1986,7 +2830,7 @@ class CellService(ObjectService):
                 for dim, elem in zip(dimensions, element_tuple)
             ]
             body_as_dict["Value"] = value if value else ""
-            updates.append(json.dumps(body_as_dict, ensure_ascii=False))
+            updates.append(json_dumps(body_as_dict))
         updates = "[" + ",".join(updates) + "]"
         self._rest.POST(url=url, data=updates, **kwargs)
 
@@ -2060,8 +2904,9 @@ class CellService(ObjectService):
         for o, value in enumerate(values):
             data.append({"Ordinal": o, "Value": value})
 
-        return self._rest.PATCH(url, json.dumps(data, ensure_ascii=False), **kwargs)
+        return self._rest.PATCH(url, json_dumps(data), **kwargs)
 
+    @cache_cellset_read
     def execute_mdx(
         self,
         mdx: str,
@@ -2137,6 +2982,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_mdx_async(
         self,
         mdx: str,
@@ -2197,6 +3043,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_view(
         self,
         cube_name: str,
@@ -2275,6 +3122,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_view_async(
         self,
         cube_name: str,
@@ -2335,6 +3183,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_mdx_raw(
         self,
         mdx: str,
@@ -2388,6 +3237,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_view_raw(
         self,
         cube_name: str,
@@ -2445,6 +3295,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_mdx_values(
         self,
         mdx: str,
@@ -2478,6 +3329,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_view_values(
         self,
         cube_name: str,
@@ -2517,6 +3369,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_mdx_rows_and_values(
         self, mdx: str, element_unique_names: bool = True, sandbox_name: str = None, **kwargs
     ) -> CaseAndSpaceInsensitiveTuplesDict:
@@ -2533,6 +3386,7 @@ class CellService(ObjectService):
             cellset_id, element_unique_names, delete_cellset=True, sandbox_name=sandbox_name, **kwargs
         )
 
+    @cache_cellset_read
     def execute_view_rows_and_values(
         self,
         cube_name: str,
@@ -2559,6 +3413,7 @@ class CellService(ObjectService):
             cellset_id, element_unique_names, delete_cellset=True, sandbox_name=sandbox_name, **kwargs
         )
 
+    @cache_cellset_read
     def execute_mdx_csv(
         self,
         mdx: Union[str, MdxBuilder],
@@ -2660,6 +3515,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_view_csv(
         self,
         cube_name: str,
@@ -2768,6 +3624,98 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    def iter_mdx_cells(
+        self,
+        mdx: Union[str, MdxBuilder],
+        chunk_size: int = 100_000,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        element_unique_names: bool = False,
+        sandbox_name: str = None,
+        **kwargs,
+    ) -> Iterator[Tuple[Tuple[str, ...], Union[str, float, None]]]:
+        """Execute MDX and lazily iterate over the cells with constant memory.
+        The response body is streamed and parsed incrementally. Cells are fetched in pages of `chunk_size`.
+
+        :param mdx: a valid MDX Query
+        :param chunk_size: number of cells (and row tuples) per request
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param sandbox_name: str
+        :return: generator of (row elements + column elements, value)
+        """
+        # the cellset is created on the first next() and deleted when the generator is exhausted or closed
+        cellset_id = self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        yield from self._iter_cells_and_delete_cellset(
+            cellset_id=cellset_id,
+            chunk_size=chunk_size,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            element_unique_names=element_unique_names,
+            sandbox_name=sandbox_name,
+            **kwargs,
+        )
+
+    def iter_view_cells(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        chunk_size: int = 100_000,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        element_unique_names: bool = False,
+        sandbox_name: str = None,
+        **kwargs,
+    ) -> Iterator[Tuple[Tuple[str, ...], Union[str, float, None]]]:
+        """Execute a cube view and lazily iterate over the cells with constant memory.
+        The response body is streamed and parsed incrementally. Cells are fetched in pages of `chunk_size`.
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param chunk_size: number of cells (and row tuples) per request
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param sandbox_name: str
+        :return: generator of (row elements + column elements, value)
+        """
+        # the cellset is created on the first next() and deleted when the generator is exhausted or closed
+        cellset_id = self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        yield from self._iter_cells_and_delete_cellset(
+            cellset_id=cellset_id,
+            chunk_size=chunk_size,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            element_unique_names=element_unique_names,
+            sandbox_name=sandbox_name,
+            **kwargs,
+        )
+
+    def _iter_cells_and_delete_cellset(self, cellset_id: str, sandbox_name: str = None, **kwargs):
+        try:
+            yield from self.iter_cellset_cells(
+                cellset_id=cellset_id, sandbox_name=sandbox_name, delete_cellset=False, **kwargs
+            )
+        finally:
+            try:
+                self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+            except TM1pyRestException as ex:
+                # Fail silently if cellset is already removed
+                if not ex.status_code == 404:
+                    raise ex
+
+    @cache_cellset_read
     def execute_mdx_elements_value_dict(
         self,
         mdx: str,
@@ -2812,6 +3760,7 @@ class CellService(ObjectService):
             elements_value_dict[element_separator.join(row[:-1])] = row[-1]
         return elements_value_dict
 
+    @cache_cellset_read
     @require_pandas
     def execute_mdx_dataframe(
         self,
@@ -2832,6 +3781,9 @@ class CellService(ObjectService):
         fillna_numeric_attributes_value: Any = 0,
         fillna_string_attributes: bool = False,
         fillna_string_attributes_value: Any = "",
+        use_columnar: bool = False,
+        categorical_dimensions: bool = False,
+        max_workers: int = 1,
         **kwargs,
     ) -> "pd.DataFrame":
         """Optimized for performance. Get Pandas DataFrame from MDX Query.
@@ -2860,11 +3812,24 @@ class CellService(ObjectService):
         :param fillna_string_attributes: boolean, fills empty string attributes with fillna_string_attributes_value
         :param fillna_numeric_attributes_value: Any, value with which to replace na if fillna_numeric_attributes is True
         :param fillna_string_attributes_value: Any, value with which to replace na if fillna_string_attributes is True
+        :param use_columnar: decode cellset column-wise with vectorized operations. Fastest option for large reads.
+        Must not be combined with use_blob, use_iterative_json or include_attributes.
+        :param categorical_dimensions: return dimension columns as pd.Categorical to reduce memory footprint.
+        With use_columnar, categories are built from the axis tuples, in axis order. Other reads (incl. use_blob)
+        categorize the element names of the result, in order of first appearance.
+        :param max_workers: Int, number of concurrent requests. Values > 1 retrieve the cellset in partitions.
+        With skip_zeros, skip_consolidated_cells or skip_rule_derived_cells, filtered cells are paged in windows.
+        Must not be combined with use_blob or use_iterative_json.
         :return: Pandas Dataframe
         """
         if (fillna_numeric_attributes or fillna_string_attributes) and not include_attributes:
             raise ValueError("Include attributes must be True if fillna_numeric or fillna_string is True.")
 
+        if use_columnar and use_blob:
+            raise ValueError("'use_columnar' must not be used together with 'use_blob'")
+        if max_workers > 1 and use_blob:
+            raise ValueError("'max_workers' > 1 must not be used together with 'use_blob'")
+
         # necessary to assure column order in line with cube view
         if shaped:
             skip_zeros = False
@@ -2895,7 +3860,9 @@ class CellService(ObjectService):
                 mdx_headers=mdx_headers,
             )
 
-            return build_dataframe_from_csv(raw_csv, sep="~", shaped=shaped, **kwargs)
+            return build_dataframe_from_csv(
+                raw_csv, sep="~", shaped=shaped, categorical_dimensions=categorical_dimensions, **kwargs
+            )
 
         cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
         return self.extract_cellset_dataframe(
@@ -2915,6 +3882,9 @@ class CellService(ObjectService):
             fillna_numeric_attributes_value=fillna_numeric_attributes_value,
             fillna_string_attributes=fillna_string_attributes,
             fillna_string_attributes_value=fillna_string_attributes_value,
+            use_columnar=use_columnar,
+            categorical_dimensions=categorical_dimensions,
+            max_workers=max_workers,
             **kwargs,
         )
 
@@ -2935,26 +3905,37 @@ class CellService(ObjectService):
         use_blob: bool = False,
         shaped: bool = False,
         mdx_headers: bool = False,
+        session_pool: TM1SessionPool = None,
         **kwargs,
     ) -> "pd.DataFrame":
+        """Execute MDX queries in parallel and concatenate the results. Arguments like in `execute_mdx_dataframe`
+
+        :param session_pool: optional TM1SessionPool. Each query checks out a pooled session instead of sharing
+        this session, so the queries run in parallel on the server
+        """
 
         def _execute_mdx_dataframe(mdx: Union[str, MdxBuilder]):
-            return self.execute_mdx_dataframe(
-                mdx=mdx,
-                top=top,
-                skip=skip,
-                skip_zeros=skip_zeros,
-                skip_consolidated_cells=skip_consolidated_cells,
-                skip_rule_derived_cells=skip_rule_derived_cells,
-                sandbox_name=sandbox_name,
-                include_attributes=include_attributes,
-                use_iterative_json=use_iterative_json,
-                use_compact_json=use_compact_json,
-                use_blob=use_blob,
-                shaped=shaped,
-                mdx_headers=mdx_headers,
-                **kwargs,
-            )
+            with self._pooled_rest(session_pool) as rest:
+                cell_service = self
+                if rest is not self._rest:
+                    cell_service = CellService(rest)
+                    cell_service._cellset_cache = self._cellset_cache
+                return cell_service.execute_mdx_dataframe(
+                    mdx=mdx,
+                    top=top,
+                    skip=skip,
+                    skip_zeros=skip_zeros,
+                    skip_consolidated_cells=skip_consolidated_cells,
+                    skip_rule_derived_cells=skip_rule_derived_cells,
+                    sandbox_name=sandbox_name,
+                    include_attributes=include_attributes,
+                    use_iterative_json=use_iterative_json,
+                    use_compact_json=use_compact_json,
+                    use_blob=use_blob,
+                    shaped=shaped,
+                    mdx_headers=mdx_headers,
+                    **kwargs,
+                )
 
         async def _exec_mdx_dataframe_async():
             loop = asyncio.get_event_loop()
@@ -2970,6 +3951,7 @@ class CellService(ObjectService):
 
         return result_dataframe
 
+    @cache_cellset_read
     @require_pandas
     def execute_mdx_dataframe_shaped(
         self,
@@ -3027,6 +4009,7 @@ class CellService(ObjectService):
             mdx=mdx, shaped=True, sandbox_name=sandbox_name, use_blob=True, mdx_headers=mdx_headers, **kwargs
         )
 
+    @cache_cellset_read
     @require_pandas
     def execute_view_dataframe_shaped(
         self,
@@ -3093,6 +4076,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_cellset_read
     @require_pandas
     def execute_view_dataframe_pivot(
         self,
@@ -3121,6 +4105,7 @@ class CellService(ObjectService):
             cellset_id=cellset_id, dropna=dropna, fill_value=fill_value, sandbox_name=sandbox_name, **kwargs
         )
 
+    @cache_cellset_read
     @require_pandas
     def execute_mdx_dataframe_pivot(
         self, mdx: str, dropna: bool = False, fill_value: bool = None, sandbox_name: str = None
@@ -3138,6 +4123,7 @@ class CellService(ObjectService):
             cellset_id=cellset_id, dropna=dropna, fill_value=fill_value, sandbox_name=sandbox_name
         )
 
+    @cache_cellset_read
     def execute_mdx_cellcount(self, mdx: str, sandbox_name: str = None, **kwargs) -> int:
         """Execute MDX in order to understand how many cells are in a cellset.
         Only return number of cells in the cellset. FAST!
@@ -3149,6 +4135,7 @@ class CellService(ObjectService):
         cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
         return self.extract_cellset_cellcount(cellset_id, delete_cellset=True, sandbox_name=sandbox_name, **kwargs)
 
+    @cache_cellset_read
     def execute_view_elements_value_dict(
         self,
         cube_name: str,
@@ -3199,6 +4186,7 @@ class CellService(ObjectService):
             )[-1]
         return elements_value_dict
 
+    @cache_cellset_read
     @require_pandas
     def execute_view_dataframe(
         self,
@@ -3216,6 +4204,9 @@ class CellService(ObjectService):
         shaped: bool = False,
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers: bool = False,
+        use_columnar: bool = False,
+        categorical_dimensions: bool = False,
+        max_workers: int = 1,
         **kwargs,
     ) -> "pd.DataFrame":
         """Optimized for performance. Get Pandas DataFrame from an existing Cube View
@@ -3245,8 +4236,21 @@ class CellService(ObjectService):
          Allows function to skip retrieval of cellset composition in use_blob mode.
          E.g.: axes=(["Year"], ["Region","Product"], ["Period", "Version"])
          :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param use_columnar: decode cellset column-wise with vectorized operations. Fastest option for large reads.
+        Must not be combined with use_blob or use_iterative_json.
+        :param categorical_dimensions: return dimension columns as pd.Categorical to reduce memory footprint.
+        With use_columnar, categories are built from the axis tuples, in axis order. Other reads (incl. use_blob)
+        categorize the element names of the result, in order of first appearance.
+        :param max_workers: Int, number of concurrent requests. Values > 1 retrieve the cellset in partitions.
+        With skip_zeros, skip_consolidated_cells or skip_rule_derived_cells, filtered cells are paged in windows.
+        Must not be combined with use_blob or use_iterative_json.
         :return: Pandas Dataframe
         """
+        if use_columnar and use_blob:
+            raise ValueError("'use_columnar' must not be used together with 'use_blob'")
+        if max_workers > 1 and use_blob:
+            raise ValueError("'max_workers' > 1 must not be used together with 'use_blob'")
+
         # necessary to assure column order in line with cube view
         if shaped:
             skip_zeros = False
@@ -3269,7 +4273,9 @@ class CellService(ObjectService):
                 mdx_headers=mdx_headers,
                 **kwargs,
             )
-            return build_dataframe_from_csv(raw_csv, sep="~", shaped=shaped, **kwargs)
+            return build_dataframe_from_csv(
+                raw_csv, sep="~", shaped=shaped, categorical_dimensions=categorical_dimensions, **kwargs
+            )
 
         cellset_id = self.create_cellset_from_view(
             cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
@@ -3285,9 +4291,13 @@ class CellService(ObjectService):
             use_iterative_json=use_iterative_json,
             shaped=shaped,
             mdx_headers=mdx_headers,
+            use_columnar=use_columnar,
+            categorical_dimensions=categorical_dimensions,
+            max_workers=max_workers,
             **kwargs,
         )
 
+    @cache_cellset_read
     def execute_view_cellcount(
         self, cube_name: str, view_name: str, private: bool = False, sandbox_name: str = None, **kwargs
     ) -> int:
@@ -3305,6 +4315,7 @@ class CellService(ObjectService):
         )
         return self.extract_cellset_cellcount(cellset_id, delete_cellset=True, sandbox_name=sandbox_name, **kwargs)
 
+    @cache_cellset_read
     def execute_mdx_rows_and_values_string_set(
         self, mdx: str, exclude_empty_cells: bool = True, sandbox_name: str = None, **kwargs
     ) -> CaseAndSpaceInsensitiveSet:
@@ -3320,6 +4331,7 @@ class CellService(ObjectService):
         )
         return self._extract_string_set_from_rows_and_values(rows_and_values, exclude_empty_cells)
 
+    @cache_cellset_read
     def execute_view_rows_and_values_string_set(
         self,
         cube_name: str,
@@ -3343,6 +4355,7 @@ class CellService(ObjectService):
         )
         return self._extract_string_set_from_rows_and_values(rows_and_values, exclude_empty_cells)
 
+    @cache_cellset_read
     def execute_mdx_ui_dygraph(
         self,
         mdx: str,
@@ -3398,6 +4411,7 @@ class CellService(ObjectService):
         )
         return Utils.build_ui_dygraph_arrays_from_cellset(raw_cellset_as_dict=data, value_precision=value_precision)
 
+    @cache_cellset_read
     def execute_view_ui_dygraph(
         self,
         cube_name: str,
@@ -3467,6 +4481,7 @@ class CellService(ObjectService):
         )
         return Utils.build_ui_dygraph_arrays_from_cellset(raw_cellset_as_dict=data, value_precision=value_precision)
 
+    @cache_cellset_read
     def execute_mdx_ui_array(
         self,
         mdx: str,
@@ -3531,6 +4546,7 @@ class CellService(ObjectService):
         )
         return Utils.build_ui_arrays_from_cellset(raw_cellset_as_dict=data, value_precision=value_precision, top=top)
 
+    @cache_cellset_read
     def execute_view_ui_array(
         self,
         cube_name: str,
@@ -3754,10 +4770,10 @@ class CellService(ObjectService):
                 skip_rule_derived_cells,
                 sandbox_name,
                 include_hierarchies,
-                **kwargs,
+                **{**kwargs, "stream": True},
             )
 
-            return cellset_response.json()
+            return RestService.read_json(cellset_response)
 
         metadata = self.extract_cellset_metadata_raw(
             cellset_id=cellset_id,
@@ -3839,8 +4855,7 @@ class CellService(ObjectService):
         )
 
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-        return response.json()
+        return self._get_json(url=url, **kwargs)
 
     def extract_cellset_partition(
         self,
@@ -3907,8 +4922,7 @@ class CellService(ObjectService):
         )
 
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url)
-        return response.json()["value"]
+        return self._get_json(url=url)["value"]
 
     @odata_compact_json(return_as_dict=True)
     def extract_cellset_cells_raw(
@@ -3963,13 +4977,11 @@ class CellService(ObjectService):
         )
 
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-        return response.json()
+        return self._get_json(url=url, **kwargs)
 
     def extract_cellset_axes_cardinality(self, cellset_id: str):
         url = "/Cellsets('{cellset_id}')?$expand=Axes($select=Cardinality)".format(cellset_id=cellset_id)
-        response = self._rest.GET(url=url)
-        return response.json()
+        return self._get_json(url=url)
 
     def extract_cellset_axes_raw_async(
         self,
@@ -4035,9 +5047,7 @@ class CellService(ObjectService):
                 )
             )
             url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-            response = self._rest.GET(url=url, **kwargs)
-
-            return response.json()
+            return self._get_json(url=url, **kwargs)
 
         async def _extract_cellset_axes_raw_async():
             partition_size = math.ceil(axes_cardinality["Axes"][async_axis]["Cardinality"] / max_workers)
@@ -4051,7 +5061,7 @@ class CellService(ObjectService):
 
                 for future in futures:
                     result = await future
-                    result_list = result_list + result["Axes"][0]["Tuples"]
+                    result_list.extend(result["Axes"][0]["Tuples"])
             return result_list
 
         # Extract non-asynchronous axis
@@ -4130,9 +5140,7 @@ class CellService(ObjectService):
             )
 
             url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-            response = self._rest.GET(url=url, **kwargs)
-
-            return response.json()
+            return self._get_json(url=url, **kwargs)
 
         async def _extract_cellset_cells_raw_async():
             cellcount = self.extract_cellset_cellcount(
@@ -4148,7 +5156,7 @@ class CellService(ObjectService):
                 ]
                 for future in futures:
                     result = await future
-                    result_list = result_list + result["Cells"]
+                    result_list.extend(result["Cells"])
                 cells = {"@odata.context": result["@odata.context"], "ID": result["ID"], "Cells": result_list}
             return cells
 
@@ -4156,15 +5164,226 @@ class CellService(ObjectService):
 
         return cells
 
+    @tidy_cellset
+    def extract_cellset_raw_parallel(
+        self,
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        max_workers: int = 8,
+        target_bytes_per_request: int = 8_000_000,
+        **kwargs,
+    ) -> Dict:
+        """Extract cellset with concurrent requests and return the raw data from TM1
+
+        Partition size is derived from the cellcount and an estimate of the response size per cell,
+        so that every request stays below `target_bytes_per_request` and all `max_workers` are busy.
+        Cell partitions, axis tuple slices and the cube are retrieved on one executor.
+        Partitions are merged in ordinal order.
+
+        With `skip_zeros`, `skip_consolidated_cells` or `skip_rule_derived_cells` the number of cells that pass
+        the filter is unknown up front, and the cellcount would size partitions for the dense cellset.
+        Filtered cells are therefore requested in windows of `max_workers` pages of the same size, until a page
+        comes back short. At most `max_workers - 1` requests at the end return no cells.
+
+        Result has the same structure as `extract_cellset_raw`. Cells always include the Ordinal property.
+
+        :param cellset_id: String; ID of existing cellset
+        :param cell_properties: List of properties to be queried from cells. E.g. ['Value', 'RuleDerived', ...]
+        :param elem_properties: List of properties to be queried from elements. E.g. ['UniqueName','Attributes', ...]
+        :param member_properties: List properties to be queried from the member. E.g. ['Name', 'UniqueName']
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param max_workers: Int, number of concurrent requests
+        :param target_bytes_per_request: Int, upper bound for the estimated response size of one request
+        :return: Raw format from TM1.
+        """
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be a positive int")
+
+        cell_properties = list(cell_properties) if cell_properties else ["Value"]
+        if skip_rule_derived_cells:
+            cell_properties.append("RuleDerived")
+            # necessary due to bug in TM1 11.8: If only RuleDerived is retrieved it occasionally produces wrong results
+            cell_properties.append("Updateable")
+        if skip_consolidated_cells:
+            cell_properties.append("Consolidated")
+        # partitions are merged by position, ordinals keep the cells addressable in sparse results
+        if "Ordinal" not in cell_properties:
+            cell_properties.append("Ordinal")
+
+        filters = []
+        if skip_zeros:
+            filters.append("Value ne 0 and Value ne null and Value ne ''")
+        if skip_consolidated_cells:
+            filters.append("Consolidated eq false")
+        if skip_rule_derived_cells:
+            filters.append("RuleDerived eq false")
+        filter_cells = " and ".join(filters)
+
+        if member_properties is None or len(list(member_properties)) == 0:
+            member_properties = ["Name"]
+        select_member_properties = "$select={}".format(",".join(member_properties))
+        expand_elem_properties = (
+            ";$expand=Element($select={elem_properties})".format(elem_properties=",".join(elem_properties))
+            if elem_properties is not None and len(list(elem_properties)) > 0
+            else ""
+        )
+
+        def _get(url: str) -> Dict:
+            url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+            return self._get_json(url=url, **kwargs)
+
+        def _extract_cells(partition_skip: int, partition_top: int) -> List[Dict]:
+            url = "/Cellsets('{cellset_id}')?$expand=Cells($select={cell_properties};$top={top}{skip}{filter})".format(
+                cellset_id=cellset_id,
+                cell_properties=",".join(cell_properties),
+                top=partition_top,
+                skip=f";$skip={partition_skip}" if partition_skip else "",
+                filter=f";$filter={filter_cells}" if filter_cells else "",
+            )
+            return _get(url)["Cells"]
+
+        def _extract_axis_tuples(axis: int, partition_skip: int = 0, partition_top: int = 0) -> List[Dict]:
+            url = (
+                "/Cellsets('{cellset_id}')?$expand=Axes($filter=Ordinal eq {axis};$expand=Tuples($expand=Members("
+                "{select_member_properties}{expand_elem_properties}){partition}))".format(
+                    cellset_id=cellset_id,
+                    axis=axis,
+                    select_member_properties=select_member_properties,
+                    expand_elem_properties=expand_elem_properties,
+                    partition=f";$top={partition_top};$skip={partition_skip}" if partition_top else "",
+                )
+            )
+            axes = _get(url)["Axes"]
+            return axes[0]["Tuples"] if axes else []
+
+        def _extract_filtered_cell_pages(executor: ThreadPoolExecutor, page_size: int) -> List[List[Dict]]:
+            # $skip and $top apply to the filtered cells, whose count is unknown: request windows of
+            # max_workers pages until a page comes back short
+            pages = []
+            requested = 0
+            while top is None or requested < top:
+                window = []
+                for _ in range(max_workers):
+                    page_top = page_size if top is None else min(page_size, top - requested)
+                    if page_top <= 0:
+                        break
+                    window.append((page_top, executor.submit(_extract_cells, (skip or 0) + requested, page_top)))
+                    requested += page_top
+                results = [(page_top, future.result()) for page_top, future in window]
+                pages.extend(page for _, page in results)
+                if any(len(page) < page_top for page_top, page in results):
+                    break
+            return pages
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            cellcount_future = None
+            if not filter_cells:
+                cellcount_future = executor.submit(
+                    self.extract_cellset_cellcount,
+                    cellset_id,
+                    sandbox_name=sandbox_name,
+                    **{**kwargs, "delete_cellset": False},
+                )
+            cardinality_future = executor.submit(
+                _get,
+                "/Cellsets('{cellset_id}')?$expand=Axes($select=Ordinal,Cardinality)".format(cellset_id=cellset_id),
+            )
+            cube_future = executor.submit(
+                _get,
+                "/Cellsets('{cellset_id}')?$expand=Cube($select=Name;$expand=Dimensions($select=Name))".format(
+                    cellset_id=cellset_id
+                ),
+            )
+
+            cells_per_request = max(
+                1, target_bytes_per_request // self._ESTIMATED_BYTES_PER_CELL_PROPERTY // len(cell_properties)
+            )
+            cell_futures = []
+            if not filter_cells:
+                # partitions in the cells space: [skip, skip + top)
+                cellcount = max(0, cellcount_future.result() - (skip or 0))
+                if top is not None:
+                    cellcount = min(cellcount, top)
+                cell_futures = [
+                    executor.submit(_extract_cells, (skip or 0) + partition_skip, partition_top)
+                    for partition_skip, partition_top in self._plan_partitions(
+                        cellcount, max_workers, cells_per_request
+                    )
+                ]
+
+            tuples_per_request = target_bytes_per_request // self._ESTIMATED_BYTES_PER_TUPLE
+            axis_futures = []
+            for axis in cardinality_future.result()["Axes"]:
+                if axis["Ordinal"] == 2:
+                    if not skip_contexts:
+                        axis_futures.append((axis, [executor.submit(_extract_axis_tuples, 2)]))
+                    continue
+                axis_futures.append(
+                    (
+                        axis,
+                        [
+                            executor.submit(_extract_axis_tuples, axis["Ordinal"], partition_skip, partition_top)
+                            for partition_skip, partition_top in self._plan_partitions(
+                                axis["Cardinality"], max_workers, tuples_per_request
+                            )
+                        ],
+                    )
+                )
+
+            if filter_cells:
+                cell_pages = _extract_filtered_cell_pages(executor, cells_per_request)
+            else:
+                cell_pages = (future.result() for future in cell_futures)
+
+            # merge once in partition order, no intermediate list copies
+            cells = list(itertools.chain.from_iterable(cell_pages))
+            axes = [
+                {
+                    "Ordinal": axis["Ordinal"],
+                    "Cardinality": axis["Cardinality"],
+                    "Tuples": list(itertools.chain.from_iterable(future.result() for future in futures)),
+                }
+                for axis, futures in axis_futures
+            ]
+            cube = cube_future.result()
+
+        return {"ID": cellset_id, "Cube": cube["Cube"], "Axes": axes, "Cells": cells}
+
+    @staticmethod
+    def _plan_partitions(
+        count: int, max_workers: int, max_partition_size: int, min_partition_size: int = 1_000
+    ) -> List[Tuple[int, int]]:
+        """Split `count` items into (skip, top) partitions.
+        Spread over `max_workers`, but never larger than `max_partition_size` or smaller than `min_partition_size`
+        """
+        if count <= 0:
+            return []
+        partition_size = max(min_partition_size, math.ceil(count / max_workers))
+        partition_size = max(1, min(partition_size, max_partition_size))
+        return [(start, min(partition_size, count - start)) for start in range(0, count, partition_size)]
+
     @tidy_cellset
     def extract_cellset_cube_with_dimensions(self, cellset_id: str, **kwargs):
         url = format_url(
             "/Cellsets('{}')?$expand=Cube($select=Dimensions;$expand=Dimensions($select=Name))", cellset_id
         )
 
-        response = self._rest.GET(url=url, **kwargs)
-
-        return response.json()
+        return self._get_json(url=url, **kwargs)
 
     @tidy_cellset
     @odata_compact_json(return_as_dict=False)
@@ -4188,7 +5407,28 @@ class CellService(ObjectService):
         :param skip_rule_derived_cells: bool
         :return: Raw format from TM1.
         """
+        url = self._build_extract_cellset_values_url(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+        )
+        response_json = self._get_json(url=url, **kwargs)
+
+        if not use_compact_json:
+            return [cell["Value"] for cell in response_json["Cells"]]
 
+        return response_json
+
+    @staticmethod
+    def _build_extract_cellset_values_url(
+        cellset_id: str,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+    ) -> str:
         filter_cells = ""
         if skip_zeros or skip_consolidated_cells or skip_rule_derived_cells:
             filters = []
@@ -4208,12 +5448,7 @@ class CellService(ObjectService):
         )
         if sandbox_name:
             url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-
-        if not use_compact_json:
-            return [cell["Value"] for cell in response.json()["Cells"]]
-
-        return response.json()
+        return url
 
     @tidy_cellset
     def extract_cellset_rows_and_values(
@@ -4234,8 +5469,7 @@ class CellService(ObjectService):
             "Cells($select=Value)".format(cellset_id, "UniqueName" if element_unique_names else "Name")
         )
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-        response_json = response.json()
+        response_json = self._get_json(url=url, **kwargs)
         rows = response_json["Axes"][0]["Tuples"]
         cell_values = [cell["Value"] for cell in response_json["Cells"]]
 
@@ -4278,8 +5512,7 @@ class CellService(ObjectService):
         )
 
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-        response_json = response.json()
+        response_json = self._get_json(url=url, **kwargs)
         cube = response_json["Cube"]["Name"]
 
         rows, titles, columns = [], [], []
@@ -4325,6 +5558,7 @@ class CellService(ObjectService):
         use_compact_json: bool = False,
         include_headers: bool = True,
         mdx_headers: bool = False,
+        max_workers: int = 1,
         **kwargs,
     ) -> str:
         """Execute cellset and return only the 'Content', in csv format
@@ -4344,28 +5578,31 @@ class CellService(ObjectService):
         :param use_compact_json: boolean
         :param include_headers: boolean
         :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+        :param max_workers: Int, number of concurrent requests. Values > 1 retrieve the cellset in partitions.
+        With skip_zeros, skip_consolidated_cells or skip_rule_derived_cells, filtered cells are paged in windows.
         :return: Raw format from TM1.
         """
+        if max_workers > 1 and use_compact_json:
+            raise ValueError("'max_workers' > 1 must not be used together with 'use_compact_json'")
+
         delete_cellset = kwargs.pop("delete_cellset", True)
 
         cube, _, rows, columns = self.extract_cellset_composition(
             cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
         )
 
-        cellset_dict = self.extract_cellset_raw(
+        cellset_dict = self._extract_cellset_raw_for_builder(
             cellset_id,
-            cell_properties=["Value"],
             top=top,
             skip=skip,
-            skip_contexts=True,
             skip_zeros=skip_zeros,
             skip_consolidated_cells=skip_consolidated_cells,
             skip_rule_derived_cells=skip_rule_derived_cells,
             delete_cellset=delete_cellset,
             sandbox_name=sandbox_name,
-            elem_properties=["Name"],
             member_properties=["Name", "Attributes"] if include_attributes else None,
             use_compact_json=use_compact_json,
+            max_workers=max_workers,
             **kwargs,
         )
 
@@ -4431,7 +5668,7 @@ class CellService(ObjectService):
             delete_cellset=True,
             sandbox_name=sandbox_name,
             member_properties=["Name", "Attributes"] if include_attributes else ["Name"],
-            **kwargs,
+            **{**kwargs, "stream": True},
         )
 
         if not mdx_headers:
@@ -4457,7 +5694,8 @@ class CellService(ObjectService):
         max_entries_per_row = 0
         least_entries_per_row = 1_000
 
-        parser = ijson.parse(cellset_response.content)
+        # parse straight from the socket. The connection is released once the body is read to the end
+        parser = ijson.parse(RestService.response_body_stream(cellset_response))
         prefixes_of_interest = [
             "Cells.item.Value",
             "Axes.item.Tuples.item.Members.item.Name",
@@ -4555,6 +5793,149 @@ class CellService(ObjectService):
         cellset_response.close()
         return csv_header.getvalue() + csv_body.getvalue().strip()
 
+    def iter_cellset_cells(
+        self,
+        cellset_id: str,
+        chunk_size: int = 100_000,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        element_unique_names: bool = False,
+        sandbox_name: str = None,
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> Iterator[Tuple[Tuple[str, ...], Union[str, float, None]]]:
+        """Lazily iterate over the cells of an existing cellset with constant memory.
+
+        Cells are requested in `$top/$skip` pages of `chunk_size` and every response is parsed incrementally
+        from the socket. Column tuples are retrieved once, row tuples in a moving window of `chunk_size`.
+
+        :param cellset_id: String; ID of existing cellset
+        :param chunk_size: number of cells (and row tuples) per request
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param sandbox_name: str
+        :param delete_cellset: delete cellset once the generator is exhausted or closed
+        :return: generator of (row elements + column elements, value)
+        """
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be a positive int")
+
+        member_property = "UniqueName" if element_unique_names else "Name"
+
+        filter_cells = ""
+        if skip_zeros or skip_consolidated_cells or skip_rule_derived_cells:
+            filters = []
+            if skip_zeros:
+                filters.append("Value ne 0 and Value ne null and Value ne ''")
+            if skip_consolidated_cells:
+                filters.append("Consolidated eq false")
+            if skip_rule_derived_cells:
+                filters.append("RuleDerived eq false")
+
+            filter_cells = " and ".join(filters)
+
+        try:
+            url = "/Cellsets('{}')?$expand=Axes($filter=Ordinal ne 2;$select=Ordinal,Cardinality)".format(cellset_id)
+            url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+            axes = self._get_json(url=url, **kwargs)["Axes"]
+            has_rows = any(axis["Ordinal"] == 1 for axis in axes)
+
+            columns = list(
+                self._iter_cellset_axis_tuples(
+                    cellset_id, axis=0, member_property=member_property, sandbox_name=sandbox_name, **kwargs
+                )
+            )
+            if not columns:
+                return
+
+            row_window = []
+            row_window_start = 0
+            skip = 0
+            while True:
+                url = "/Cellsets('{cellset_id}')?$expand=Cells($select=Ordinal,Value;$top={top}{skip}{filter})".format(
+                    cellset_id=cellset_id,
+                    top=chunk_size,
+                    skip=f";$skip={skip}" if skip else "",
+                    filter=f";$filter={filter_cells}" if filter_cells else "",
+                )
+                url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+
+                received = 0
+                for cell in self._iter_streamed_json_items(url, "Cells.item", **kwargs):
+                    received += 1
+                    row_ordinal, column_ordinal = divmod(cell["Ordinal"], len(columns))
+                    if not has_rows:
+                        yield columns[column_ordinal], cell["Value"]
+                        continue
+
+                    # ordinals are ascending: the window only ever moves forward
+                    if not row_window_start <= row_ordinal < row_window_start + len(row_window):
+                        row_window_start = row_ordinal
+                        row_window = list(
+                            self._iter_cellset_axis_tuples(
+                                cellset_id,
+                                axis=1,
+                                member_property=member_property,
+                                top=chunk_size,
+                                skip=row_ordinal,
+                                sandbox_name=sandbox_name,
+                                **kwargs,
+                            )
+                        )
+                    yield row_window[row_ordinal - row_window_start] + columns[column_ordinal], cell["Value"]
+
+                if received < chunk_size:
+                    break
+                skip += chunk_size
+
+        finally:
+            if delete_cellset:
+                try:
+                    self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+                except TM1pyRestException as ex:
+                    # Fail silently if cellset is already removed
+                    if not ex.status_code == 404:
+                        raise ex
+
+    def _iter_cellset_axis_tuples(
+        self,
+        cellset_id: str,
+        axis: int,
+        member_property: str = "Name",
+        top: int = None,
+        skip: int = None,
+        sandbox_name: str = None,
+        **kwargs,
+    ) -> Iterator[Tuple[str, ...]]:
+        url = (
+            "/Cellsets('{cellset_id}')?$expand=Axes($filter=Ordinal eq {axis};"
+            "$expand=Tuples($expand=Members($select={member_property}){top}{skip}))".format(
+                cellset_id=cellset_id,
+                axis=axis,
+                member_property=member_property,
+                top=f";$top={top}" if top else "",
+                skip=f";$skip={skip}" if skip else "",
+            )
+        )
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        for axis_tuple in self._iter_streamed_json_items(url, "Axes.item.Tuples.item", **kwargs):
+            yield tuple(member[member_property] for member in axis_tuple["Members"])
+
+    def _iter_streamed_json_items(self, url: str, prefix: str, **kwargs) -> Iterator[Any]:
+        """GET url with a streamed body and incrementally yield the JSON items under prefix"""
+        response = self._rest.GET(url=url, stream=True, **kwargs)
+        try:
+            yield from ijson.items(RestService.response_body_stream(response), prefix, use_float=True)
+        finally:
+            response.close()
+
+    def _get_json(self, url: str, **kwargs) -> Any:
+        """GET url and parse the JSON body straight from the socket bytes"""
+        return RestService.read_json(self._rest.GET(url=url, stream=True, **kwargs))
+
     @require_pandas
     def extract_cellset_dataframe(
         self,
@@ -4574,6 +5955,9 @@ class CellService(ObjectService):
         fillna_numeric_attributes_value: Any = 0,
         fillna_string_attributes: bool = False,
         fillna_string_attributes_value: Any = "",
+        use_columnar: bool = False,
+        categorical_dimensions: bool = False,
+        max_workers: int = 1,
         **kwargs,
     ) -> "pd.DataFrame":
         """Build pandas data frame from cellset_id
@@ -4589,12 +5973,46 @@ class CellService(ObjectService):
         :param use_iterative_json: use iterative json parsing to reduce memory consumption significantly.
         Comes at a cost of 3-5% performance.
         :param use_compact_json: bool
+        :param use_columnar: decode cellset column-wise with vectorized operations, skipping the CSV round trip.
+        Must not be combined with use_iterative_json or include_attributes.
+        :param categorical_dimensions: return dimension columns as pd.Categorical to reduce memory footprint.
+        With use_columnar, categories are built from the axis tuples, in axis order. Other reads (incl. use_blob)
+        categorize the element names of the result, in order of first appearance.
+        :param max_workers: Int, number of concurrent requests. Values > 1 retrieve the cellset in partitions.
+        With skip_zeros, skip_consolidated_cells or skip_rule_derived_cells, filtered cells are paged in windows.
+        Must not be combined with use_iterative_json or use_compact_json.
         :param kwargs:
         :return:
         """
         if use_iterative_json and use_compact_json:
             raise ValueError("Iterative JSON parsing must not be used together with compact JSON")
 
+        if max_workers > 1 and (use_iterative_json or use_compact_json):
+            raise ValueError(
+                "'max_workers' > 1 must not be used together with 'use_iterative_json' or 'use_compact_json'"
+            )
+
+        if use_columnar:
+            if use_iterative_json or include_attributes:
+                raise ValueError(
+                    "'use_columnar' must not be used together with 'use_iterative_json' or 'include_attributes'"
+                )
+            return self._extract_cellset_dataframe_columnar(
+                cellset_id,
+                top=top,
+                skip=skip,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                use_compact_json=use_compact_json,
+                shaped=shaped,
+                mdx_headers=mdx_headers,
+                categorical_dimensions=categorical_dimensions,
+                max_workers=max_workers,
+                **kwargs,
+            )
+
         if use_iterative_json:
             raw_csv = self.extract_cellset_csv_iter_json(
                 cellset_id=cellset_id,
@@ -4622,6 +6040,7 @@ class CellService(ObjectService):
                 include_attributes=include_attributes,
                 use_compact_json=use_compact_json,
                 mdx_headers=mdx_headers,
+                max_workers=max_workers,
                 # dont delete cellset if attribute types must be retrieved later
                 delete_cellset=not any([fillna_string_attributes, fillna_string_attributes]),
                 **kwargs,
@@ -4642,6 +6061,105 @@ class CellService(ObjectService):
             fillna_numeric_attributes_value=fillna_numeric_attributes_value,
             fillna_string_attributes_value=fillna_string_attributes_value,
             attribute_types_by_dimension=attribute_types_by_dimension,
+            categorical_dimensions=categorical_dimensions,
+            **kwargs,
+        )
+
+    def _extract_cellset_dataframe_columnar(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        use_compact_json: bool = False,
+        shaped: bool = False,
+        mdx_headers: bool = False,
+        categorical_dimensions: bool = False,
+        max_workers: int = 1,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        delete_cellset = kwargs.pop("delete_cellset", True)
+
+        _, _, rows, columns = self.extract_cellset_composition(
+            cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
+        )
+
+        cellset_dict = self._extract_cellset_raw_for_builder(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=delete_cellset,
+            sandbox_name=sandbox_name,
+            use_compact_json=use_compact_json,
+            max_workers=max_workers,
+            **kwargs,
+        )
+
+        # raw cellset positional: require_pandas wrapper binds the first argument
+        return build_dataframe_from_cellset_columnar(
+            cellset_dict,
+            row_dimensions=rows,
+            column_dimensions=columns,
+            top=top,
+            shaped=shaped,
+            mdx_headers=mdx_headers,
+            categorical_dimensions=categorical_dimensions,
+        )
+
+    def _extract_cellset_raw_for_builder(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        delete_cellset: bool = True,
+        sandbox_name: str = None,
+        member_properties: Iterable[str] = None,
+        use_compact_json: bool = False,
+        max_workers: int = 1,
+        **kwargs,
+    ) -> Dict:
+        """Values and element names without contexts, as input for the csv and DataFrame builders"""
+        if max_workers > 1:
+            return self.extract_cellset_raw_parallel(
+                cellset_id,
+                cell_properties=["Value"],
+                elem_properties=["Name"],
+                member_properties=member_properties,
+                top=top,
+                skip=skip,
+                skip_contexts=True,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                delete_cellset=delete_cellset,
+                sandbox_name=sandbox_name,
+                max_workers=max_workers,
+                **kwargs,
+            )
+
+        return self.extract_cellset_raw(
+            cellset_id,
+            cell_properties=["Value"],
+            top=top,
+            skip=skip,
+            skip_contexts=True,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=delete_cellset,
+            sandbox_name=sandbox_name,
+            elem_properties=["Name"],
+            member_properties=member_properties,
+            use_compact_json=use_compact_json,
             **kwargs,
         )
 
@@ -4718,8 +6236,7 @@ class CellService(ObjectService):
         )
 
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-        response_json = response.json()
+        response_json = self._get_json(url=url, **kwargs)
 
         column_headers = list()
         for column_tuple in response_json["Axes"][0]["Tuples"]:
@@ -4979,7 +6496,7 @@ class CellService(ObjectService):
         url = "/ExecuteMDX"
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
         data = {"MDX": mdx.to_mdx() if isinstance(mdx, MdxBuilder) else mdx}
-        response = self._rest.POST(url=url, data=json.dumps(data, ensure_ascii=False), **kwargs)
+        response = self._rest.POST(url=url, data=json_dumps(data), **kwargs)
         cellset_id = response.json()["ID"]
         return cellset_id
 
@@ -5049,7 +6566,7 @@ class CellService(ObjectService):
 
         url = "/EndChangeSet"
         data = {"ChangeSetID": change_set}
-        return self._rest.POST(url, data=json.dumps(data, ensure_ascii=False))
+        return self._rest.POST(url, data=json_dumps(data))
 
     def undo_changeset(self, changeset: str) -> Response:
         """undo a changeset. Similar to rolling back transactions.
@@ -5059,7 +6576,7 @@ class CellService(ObjectService):
 
         url = "/UndoChangeSet"
         data = {"ChangeSetID": changeset}
-        return self._rest.POST(url, data=json.dumps(data, ensure_ascii=False))
+        return self._rest.POST(url, data=json_dumps(data))
 
     def delete_cellset(self, cellset_id: str, sandbox_name: str = None, **kwargs) -> Response:
         """Delete a cellset
@@ -12,8 +12,11 @@ from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.ViewService import ViewService
 from TM1py.Utils import (
+    cache_metadata_read,
     case_and_space_insensitive_equals,
+    coalesce_concurrent_reads,
     format_url,
+    invalidate_metadata,
     require_data_admin,
     require_version,
 )
@@ -31,6 +34,7 @@ class CubeService(ObjectService):
         self.views = ViewService(rest)
         self.annotations = AnnotationService(rest)
 
+    @invalidate_metadata("cube")
     def create(self, cube: Cube, **kwargs) -> Response:
         """create new cube on TM1 Server
 
@@ -59,6 +63,15 @@ class CubeService(ObjectService):
         response = self._rest.GET(url=url, **kwargs)
         return response.text
 
+    def get_last_data_updates(self, **kwargs) -> Dict[str, str]:
+        """Get the LastDataUpdate of all cubes, including control cubes, in one request
+
+        :return: dictionary of cube name and LastDataUpdate
+        """
+        url = "/Cubes?$select=Name,LastDataUpdate"
+        response = self._rest.GET(url=url, **kwargs)
+        return {cube["Name"]: cube["LastDataUpdate"] for cube in response.json()["value"]}
+
     def get_all(self, **kwargs) -> List[Cube]:
         """get all cubes from TM1 Server as TM1py.Cube instances
 
@@ -102,6 +115,8 @@ class CubeService(ObjectService):
         return int(self._rest.GET(url=format_url("/Cubes/$count"), **kwargs).text)
 
     @require_version(version="11.8.018")
+    @cache_metadata_read("cube")
+    @coalesce_concurrent_reads
     def get_measure_dimension(self, cube_name: str, **kwargs) -> str:
         """Get the measures dimension of a cube.
 
@@ -139,6 +154,7 @@ class CubeService(ObjectService):
 
     @require_data_admin
     @require_version(version="11.8.018")
+    @invalidate_metadata("cube")
     def set_measure_dimension(self, cube_name: str, dimension_name: str, **kwargs) -> Response:
         """Set the measures dimension of a cube.
 
@@ -177,6 +193,7 @@ class CubeService(ObjectService):
         if not any(case_and_space_insensitive_equals(dimension_name, dim) for dim in dimension_names):
             raise ValueError(f"'{dimension_name}' is not a dimension of cube '{cube_name}'")
 
+    @invalidate_metadata("cube")
     def update(self, cube: Cube, **kwargs) -> Response:
         """Update existing cube on TM1 Server
 
@@ -186,6 +203,7 @@ class CubeService(ObjectService):
         url = format_url("/Cubes('{}')", cube.name)
         return self._rest.PATCH(url, cube.body, **kwargs)
 
+    @invalidate_metadata("cube")
     def update_or_create(self, cube: Cube, **kwargs) -> Response:
         """update if exists else create
 
@@ -226,6 +244,7 @@ class CubeService(ObjectService):
         return response
 
     @require_data_admin
+    @invalidate_metadata("cube")
     def delete(self, cube_name: str, **kwargs) -> Response:
         """Delete a cube in TM1
 
@@ -284,6 +303,8 @@ class CubeService(ObjectService):
         cubes = list(cube["Name"] for cube in response.json()["value"])
         return cubes
 
+    @cache_metadata_read("cube")
+    @coalesce_concurrent_reads
     def get_dimension_names(self, cube_name: str, skip_sandbox_dimension: bool = True, **kwargs) -> List[str]:
         """get name of the dimensions of a cube in their correct order
 
@@ -16,6 +16,7 @@ from TM1py.Utils.Utils import (
     CaseAndSpaceInsensitiveSet,
     case_and_space_insensitive_equals,
     format_url,
+    invalidate_metadata,
 )
 
 
@@ -27,6 +28,7 @@ class DimensionService(ObjectService):
         self.hierarchies = HierarchyService(rest)
         self.subsets = SubsetService(rest)
 
+    @invalidate_metadata("dimension")
     def create(self, dimension: Dimension, **kwargs) -> Response:
         """Create a dimension
 
@@ -62,6 +64,7 @@ class DimensionService(ObjectService):
         response = self._rest.GET(url, **kwargs)
         return Dimension.from_json(response.text)
 
+    @invalidate_metadata("dimension")
     def update(self, dimension: Dimension, keep_existing_attributes=False, **kwargs):
         """Update an existing dimension
 
@@ -104,6 +107,7 @@ class DimensionService(ObjectService):
             if not case_and_space_insensitive_equals(hierarchy_name, "Leaves"):
                 self.hierarchies.delete(dimension_name=dimension.name, hierarchy_name=hierarchy_name, **kwargs)
 
+    @invalidate_metadata("dimension")
     def update_or_create(self, dimension: Dimension, **kwargs):
         """update if exists else create
 
@@ -115,6 +119,7 @@ class DimensionService(ObjectService):
         else:
             self.create(dimension=dimension, **kwargs)
 
+    @invalidate_metadata("dimension")
     def delete(self, dimension_name: str, **kwargs) -> Response:
         """Delete a dimension
 
@@ -191,6 +196,7 @@ class DimensionService(ObjectService):
         raw_dict = response.json()
         return [row_tuple["Members"][0]["Element"]["Name"] for row_tuple in raw_dict["Axes"][0]["Tuples"]]
 
+    @invalidate_metadata("dimension")
     def create_element_attributes_through_ti(self, dimension: Dimension, **kwargs):
         """
 
@@ -35,10 +35,14 @@ from TM1py.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveSet,
     CaseAndSpaceInsensitiveTuplesDict,
+    HierarchyIndex,
     build_element_unique_names,
     build_url_friendly_object_name,
+    cache_metadata_read,
+    coalesce_concurrent_reads,
     dimension_hierarchy_element_tuple_from_unique_name,
     format_url,
+    invalidate_metadata,
     require_data_admin,
     require_ops_admin,
     require_pandas,
@@ -65,10 +69,12 @@ class ElementService(ObjectService):
         response = self._rest.GET(url, **kwargs)
         return Element.from_dict(response.json())
 
+    @invalidate_metadata("hierarchy")
     def create(self, dimension_name: str, hierarchy_name: str, element: Element, **kwargs) -> Response:
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements", dimension_name, hierarchy_name)
         return self._rest.POST(url, element.body, **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def update(self, dimension_name: str, hierarchy_name: str, element: Element, **kwargs) -> Response:
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements('{}')", dimension_name, hierarchy_name, element.name
@@ -81,6 +87,7 @@ class ElementService(ObjectService):
         )
         return self._exists(url, **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def update_or_create(self, dimension_name: str, hierarchy_name: str, element: Element, **kwargs) -> Response:
         if self.exists(
             dimension_name=dimension_name, hierarchy_name=hierarchy_name, element_name=element.name, **kwargs
@@ -89,6 +96,7 @@ class ElementService(ObjectService):
 
         return self.create(dimension_name=dimension_name, hierarchy_name=hierarchy_name, element=element, **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def delete(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> Response:
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements('{}')", dimension_name, hierarchy_name, element_name
@@ -96,6 +104,7 @@ class ElementService(ObjectService):
         return self._rest.DELETE(url, **kwargs)
 
     @require_version("11.4")
+    @invalidate_metadata("hierarchy")
     def delete_elements(
         self, dimension_name: str, hierarchy_name: str, element_names: List[str] = None, use_ti: bool = False, **kwargs
     ):
@@ -108,6 +117,7 @@ class ElementService(ObjectService):
             h.remove_element(ele)
         h_service.update(h, **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def delete_elements_use_ti(
         self, dimension_name: str, hierarchy_name: str, element_names: List[str] = None, **kwargs
     ):
@@ -129,6 +139,7 @@ class ElementService(ObjectService):
             subset_service.delete(subset_name, dimension_name, hierarchy_name, private=False, **kwargs)
 
     @require_version("11.4")
+    @invalidate_metadata("hierarchy")
     def delete_edges(
         self,
         dimension_name: str,
@@ -167,6 +178,7 @@ class ElementService(ObjectService):
             h.remove_edge(parent=edge[0], component=edge[1])
         h_service.update(h, **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def delete_edges_use_ti(
         self,
         dimension_name: str,
@@ -216,6 +228,7 @@ class ElementService(ObjectService):
 
     @require_data_admin
     @require_ops_admin
+    @invalidate_metadata("hierarchy")
     def delete_edges_use_blob(
         self,
         dimension_name: str,
@@ -744,6 +757,20 @@ class ElementService(ObjectService):
 
         return {(edge["ParentName"], edge["ComponentName"]): edge["Weight"] for edge in response.json()["value"]}
 
+    def get_hierarchy_index(self, dimension_name: str, hierarchy_name: str, **kwargs) -> HierarchyIndex:
+        """Get the structure of a hierarchy as an in-memory index
+
+        Takes two requests. Afterwards ancestor checks, parents, leaves under consolidations and levels
+        are evaluated locally, e.g. `index.element_is_ancestor("Total", "Jan")`
+
+        :param dimension_name: name of the dimension
+        :param hierarchy_name: name of the hierarchy
+        :return: HierarchyIndex
+        """
+        element_types = self.get_element_types(dimension_name, hierarchy_name, **kwargs)
+        edges = self.get_edges(dimension_name, hierarchy_name, **kwargs)
+        return HierarchyIndex(element_types, edges, dimension_name, hierarchy_name)
+
     def get_leaf_elements(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[Element]:
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements?$expand=*&$filter=Type ne 3", dimension_name, hierarchy_name
@@ -1072,6 +1099,8 @@ class ElementService(ObjectService):
         response = self._rest.GET(url, **kwargs)
         return int(response.text)
 
+    @cache_metadata_read("hierarchy")
+    @coalesce_concurrent_reads
     def get_element_types(
         self, dimension_name: str, hierarchy_name: str, skip_consolidations: bool = False, **kwargs
     ) -> CaseAndSpaceInsensitiveDict:
@@ -1087,6 +1116,8 @@ class ElementService(ObjectService):
             result[element["Name"]] = element["Type"]
         return result
 
+    @cache_metadata_read("dimension")
+    @coalesce_concurrent_reads
     def get_element_types_from_all_hierarchies(
         self, dimension_name: str, skip_consolidations: bool = False, **kwargs
     ) -> CaseAndSpaceInsensitiveDict:
@@ -1126,6 +1157,7 @@ class ElementService(ObjectService):
         attributes = self.get_element_attributes(dimension_name, hierarchy_name, **kwargs)
         return [attr.name for attr in attributes if attr.attribute_type == "Alias"]
 
+    @cache_metadata_read("hierarchy")
     def get_element_attributes(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[ElementAttribute]:
         """Get element attributes from hierarchy
 
@@ -1138,6 +1170,7 @@ class ElementService(ObjectService):
         element_attributes = [ElementAttribute.from_dict(ea) for ea in response.json()["value"]]
         return element_attributes
 
+    @cache_metadata_read("hierarchy")
     def get_element_attribute_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
         """Get element attributes from hierarchy
 
@@ -1189,6 +1222,7 @@ class ElementService(ObjectService):
         )
         return [elem[0]["Name"] for elem in elems]
 
+    @invalidate_metadata("hierarchy")
     def create_element_attribute(
         self, dimension_name: str, hierarchy_name: str, element_attribute: ElementAttribute, **kwargs
     ) -> Response:
@@ -1202,6 +1236,7 @@ class ElementService(ObjectService):
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/ElementAttributes", dimension_name, hierarchy_name)
         return self._rest.POST(url, element_attribute.body, **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def delete_element_attribute(
         self, dimension_name: str, hierarchy_name: str, element_attribute: str, **kwargs
     ) -> Response:
@@ -1428,6 +1463,7 @@ class ElementService(ObjectService):
             raw_dict = response.json()
             return [tuples["Members"] for tuples in raw_dict["Tuples"]]
 
+    @invalidate_metadata("hierarchy")
     def remove_edge(self, dimension_name: str, hierarchy_name: str, parent: str, component: str, **kwargs) -> Response:
         """Remove one edge from hierarchy. Fails if parent or child element doesn't exist.
 
@@ -1449,6 +1485,7 @@ class ElementService(ObjectService):
 
         return self._rest.DELETE(url=url, **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def add_edges(
         self,
         dimension_name: str,
@@ -1491,6 +1528,7 @@ class ElementService(ObjectService):
     @require_data_admin
     @require_ops_admin
     @require_version(version="11.4")
+    @invalidate_metadata("hierarchy")
     def add_edges_use_blob(
         self,
         dimension_name: str,
@@ -1542,6 +1580,7 @@ class ElementService(ObjectService):
         )
         return process
 
+    @invalidate_metadata("hierarchy")
     def add_elements(
         self,
         dimension_name: str,
@@ -1578,6 +1617,7 @@ class ElementService(ObjectService):
     @require_data_admin
     @require_ops_admin
     @require_version(version="11.4")
+    @invalidate_metadata("hierarchy")
     def add_elements_use_blob(
         self,
         dimension_name: str,
@@ -1625,6 +1665,7 @@ class ElementService(ObjectService):
         )
         return process
 
+    @invalidate_metadata("hierarchy")
     def add_element_attributes(
         self, dimension_name: str, hierarchy_name: str, element_attributes: List[ElementAttribute], **kwargs
     ):
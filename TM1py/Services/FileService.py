@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 import concurrent.futures
+import itertools
 import json
+import tempfile
 import time
 import warnings
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable, List, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from TM1py.Exceptions import TM1pyVersionException
 from TM1py.Services import RestService
@@ -65,7 +67,8 @@ class FileService(ObjectService):
 
         url = self._construct_content_url(path=path, exclude_path_end=False, extension="Content")
 
-        return self._rest.GET(url, **kwargs).content
+        # read the body in one go from the socket, instead of assembling it from small chunks
+        return self._rest.read_body(self._rest.GET(url, stream=True, **kwargs))
 
     def _create_folder(self, folder_name: Union[str, Path], **kwargs):
         """Create folder
@@ -143,7 +146,7 @@ class FileService(ObjectService):
     def _upload_file_content(
         self,
         path: Path,
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
@@ -151,7 +154,7 @@ class FileService(ObjectService):
     ):
         """
         :param path: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes (streamed, never fully in memory)
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards)
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
@@ -160,8 +163,13 @@ class FileService(ObjectService):
 
         url = self._construct_content_url(path, exclude_path_end=False, extension="Content")
 
+        if not isinstance(file_content, (bytes, BytesIO)):
+            file_content = self._peek_file_content(file_content)
+            if file_content is None:
+                return self._upload_file_content_without_mpu(url, b"", **kwargs)
+
         # empty files must be created without MPU
-        if self._file_content_is_empty(file_content):
+        elif self._file_content_is_empty(file_content):
             return self._upload_file_content_without_mpu(url, file_content, **kwargs)
 
         if multi_part_upload is None:
@@ -173,12 +181,17 @@ class FileService(ObjectService):
         return self._upload_file_content_without_mpu(url, file_content, **kwargs)
 
     def _upload_file_content_without_mpu(self, url, file_content, **kwargs):
+        # RestService re-sends the body after a re-connect, so it must be readable more than once
+        if isinstance(file_content, BytesIO):
+            file_content = file_content.read()
+        elif not isinstance(file_content, bytes):
+            file_content = _ReplayableChunks(file_content)
         return self._rest.PUT(url=url, data=file_content, headers=self.binary_http_header, **kwargs)
 
     def _upload_file_content_with_mpu(
         self,
         content_url: str,
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         max_mb_per_part: float,
         max_workers: int = 1,
         **kwargs,
@@ -190,8 +203,12 @@ class FileService(ObjectService):
         )
         upload_id = response.json()["UploadID"]
 
-        # Split the file content into parts
-        parts_to_upload = self._split_into_parts(data=file_content, max_chunk_size=int(max_mb_per_part * 1024 * 1024))
+        # Split the file content into parts. Streamed content is regrouped lazily
+        max_chunk_size = int(max_mb_per_part * 1024 * 1024)
+        if isinstance(file_content, (bytes, BytesIO)):
+            parts_to_upload = self._split_into_parts(data=file_content, max_chunk_size=max_chunk_size)
+        else:
+            parts_to_upload = self._regroup_into_parts(chunks=file_content, max_chunk_size=max_chunk_size)
 
         part_numbers_and_etags = []
 
@@ -214,12 +231,15 @@ class FileService(ObjectService):
                         raise e from None
 
         if max_workers > 1:
-            # upload parts concurrently
+            # upload parts concurrently. At most max_workers parts are held in memory at any time
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
 
-                futures = {
-                    executor.submit(upload_part_with_retry, i, part, 3): i for i, part in enumerate(parts_to_upload)
-                }
+                futures = set()
+                for i, part in enumerate(parts_to_upload):
+                    if len(futures) >= max_workers:
+                        done, futures = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                        part_numbers_and_etags.extend(future.result() for future in done)
+                    futures.add(executor.submit(upload_part_with_retry, i, part, 3))
 
                 for future in concurrent.futures.as_completed(futures):
                     part_index, part_number, odata_etag = future.result()
@@ -248,7 +268,7 @@ class FileService(ObjectService):
     def create(
         self,
         file_name: Union[str, Path],
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
@@ -259,7 +279,7 @@ class FileService(ObjectService):
         Folders in file_name (e.g. folderA/folderB/file.csv) will be created implicitly
 
         :param file_name: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes (streamed, never fully in memory)
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards)
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
@@ -287,7 +307,7 @@ class FileService(ObjectService):
     def update(
         self,
         file_name: Union[str, Path],
-        file_content: Union[bytes, BytesIO],
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
@@ -296,7 +316,7 @@ class FileService(ObjectService):
         """Update existing file
 
         :param file_name: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes (streamed, never fully in memory)
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards)
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
@@ -313,7 +333,7 @@ class FileService(ObjectService):
     def update_or_create(
         self,
         file_name: Union[str, Path],
-        file_content: bytes,
+        file_content: Union[bytes, BytesIO, Iterable[bytes]],
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
@@ -322,7 +342,7 @@ class FileService(ObjectService):
         """Create file or update file if it already exists
 
         :param file_name: file name in root or path to file
-        :param file_content: file_content as bytes or BytesIO
+        :param file_content: file_content as bytes, BytesIO or iterable of bytes (streamed, never fully in memory)
         :param multi_part_upload: boolean use multipart upload or not (only available from TM1 12 onwards).
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
@@ -423,6 +443,28 @@ class FileService(ObjectService):
 
         return parts
 
+    @staticmethod
+    def _regroup_into_parts(chunks: Iterable[bytes], max_chunk_size: int = 200 * 1024 * 1024) -> Iterator[bytes]:
+        """Regroup a stream of byte chunks into parts of exactly max_chunk_size bytes (last part may be smaller)"""
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= max_chunk_size:
+                yield bytes(buffer[:max_chunk_size])
+                del buffer[:max_chunk_size]
+
+        if buffer:
+            yield bytes(buffer)
+
+    @staticmethod
+    def _peek_file_content(chunks: Iterable[bytes]) -> Optional[Iterator[bytes]]:
+        """Return iterator over all chunks, or None if the stream holds no bytes at all"""
+        chunks = iter(chunks)
+        for chunk in chunks:
+            if chunk:
+                return itertools.chain([chunk], chunks)
+        return None
+
     @staticmethod
     def _file_content_is_empty(file_content: Union[bytes, BytesIO]):
         if isinstance(file_content, bytes):
@@ -433,3 +475,34 @@ class FileService(ObjectService):
 
         else:
             raise TypeError("Expected 'bytes' or 'BytesIO'.")
+
+
+class _ReplayableChunks:
+    """Iterable over a stream of byte chunks that can be iterated more than once
+
+    Chunks are spooled to a temporary file as they are consumed, so a re-sent request body starts from the first
+    chunk again without holding the whole stream in memory
+    """
+
+    def __init__(self, chunks: Iterable[bytes], max_memory_size: int = 8 * 1024 * 1024, read_size: int = 1024 * 1024):
+        self._chunks = iter(chunks)
+        self._spool = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+        self._spooled_size = 0
+        self._read_size = read_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        position = 0
+        while position < self._spooled_size:
+            self._spool.seek(position)
+            chunk = self._spool.read(min(self._read_size, self._spooled_size - position))
+            position += len(chunk)
+            yield chunk
+
+        for chunk in self._chunks:
+            self._spool.seek(self._spooled_size)
+            self._spool.write(chunk)
+            self._spooled_size += len(chunk)
+            yield chunk
+
+    def __del__(self):
+        self._spool.close()
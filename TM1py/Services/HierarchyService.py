@@ -23,8 +23,10 @@ from TM1py.Utils.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveSet,
     CaseAndSpaceInsensitiveTuplesDict,
+    cache_metadata_read,
     case_and_space_insensitive_equals,
     format_url,
+    invalidate_metadata,
     require_data_admin,
     require_ops_admin,
     require_pandas,
@@ -118,6 +120,7 @@ class HierarchyService(ObjectService):
                 # Register e.g. 'Deutschand' -> 'Germany'
                 seen_values[value] = element_name
 
+    @invalidate_metadata("hierarchy")
     def create(self, hierarchy: Hierarchy, **kwargs):
         """Create a hierarchy in an existing dimension
 
@@ -146,6 +149,7 @@ class HierarchyService(ObjectService):
         response = self._rest.GET(url, **kwargs)
         return Hierarchy.from_dict(response.json())
 
+    @cache_metadata_read("dimension")
     def get_all_names(self, dimension_name: str, **kwargs) -> List[str]:
         """get all names of existing Hierarchies in a dimension
 
@@ -156,6 +160,7 @@ class HierarchyService(ObjectService):
         response = self._rest.GET(url, **kwargs)
         return [hierarchy["Name"] for hierarchy in response.json()["value"]]
 
+    @invalidate_metadata("hierarchy")
     def update(self, hierarchy: Hierarchy, keep_existing_attributes=False, **kwargs) -> List[Response]:
         """update a hierarchy. It's a two step process:
         1. Update Hierarchy
@@ -199,6 +204,7 @@ class HierarchyService(ObjectService):
 
         return responses
 
+    @invalidate_metadata("hierarchy")
     def update_or_create(self, hierarchy: Hierarchy, **kwargs):
         """update if exists else create
 
@@ -229,6 +235,7 @@ class HierarchyService(ObjectService):
         existing_hierarchies = CaseAndSpaceInsensitiveSet([hierarchy["Name"] for hierarchy in response.json()["value"]])
         return hierarchy_name in existing_hierarchies
 
+    @invalidate_metadata("hierarchy")
     def delete(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Response:
         url = format_url("/Dimensions('{}')/Hierarchies('{}')", dimension_name, hierarchy_name)
         return self._rest.DELETE(url, **kwargs)
@@ -248,6 +255,7 @@ class HierarchyService(ObjectService):
             for hierarchy_property in hierarchy_properties
         }
 
+    @invalidate_metadata("hierarchy")
     def update_element_attributes(self, hierarchy: Hierarchy, keep_existing_attributes=False, **kwargs):
         """Update the elementattributes of a hierarchy
 
@@ -382,6 +390,7 @@ class HierarchyService(ObjectService):
         else:
             return self._update_default_member_via_props_cube(dimension_name, hierarchy_name, member_name)
 
+    @invalidate_metadata("hierarchy")
     def remove_all_edges(self, dimension_name: str, hierarchy_name: str = None, **kwargs) -> Response:
         if not hierarchy_name:
             hierarchy_name = dimension_name
@@ -389,6 +398,7 @@ class HierarchyService(ObjectService):
         body = {"Edges": []}
         return self._rest.PATCH(url=url, data=json.dumps(body), **kwargs)
 
+    @invalidate_metadata("hierarchy")
     def remove_edges_under_consolidation(
         self, dimension_name: str, hierarchy_name: str, consolidation_element: str, **kwargs
     ) -> List[Response]:
@@ -467,6 +477,7 @@ class HierarchyService(ObjectService):
     @require_pandas
     @require_data_admin
     @require_ops_admin
+    @invalidate_metadata("hierarchy")
     def update_or_create_hierarchy_from_dataframe(
         self,
         dimension_name: str,
@@ -3,7 +3,8 @@
 import json
 import time
 import uuid
-from typing import Dict, Iterable, List, Tuple
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from requests import Response
 from requests.structures import CaseInsensitiveDict
@@ -13,13 +14,61 @@ from TM1py.Objects.Process import Process
 from TM1py.Objects.ProcessDebugBreakpoint import ProcessDebugBreakpoint
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.RestService import RestService
+from TM1py.Services.SessionService import SessionService
 from TM1py.Utils import format_url, require_data_admin
 from TM1py.Utils.Utils import deprecated_in_version, require_version
 
 
+class ProcessRun:
+    """Execution of a process with parameters in a graph of runs, as scheduled by ProcessService.execute_graph
+
+    After the execution, a run holds its status, timing and the concurrency limit it was started with.
+    """
+
+    # status of runs that did not execute, because a run they depend on was not successful
+    SKIPPED = "Skipped"
+    # status of runs that could not be started or polled, e.g. because the process does not exist
+    FAILED = "Failed"
+
+    def __init__(
+        self, process_name: str, parameters: Dict = None, depends_on: Iterable[str] = None, run_id: str = None
+    ):
+        """
+        :param process_name: name of the TI process
+        :param parameters: process parameters and values, e.g. {"pYear": "2024"}
+        :param depends_on: ids of the runs that must complete successfully before this run starts
+        :param run_id: unique id of the run in the graph. Defaults to the process name
+        """
+        self.process_name = process_name
+        self.parameters = dict(parameters or {})
+        self.depends_on = list(depends_on or [])
+        self.run_id = run_id or process_name
+
+        self.success: Optional[bool] = None
+        self.status: Optional[str] = None
+        self.error_log_file: Optional[str] = None
+        self.error: Optional[str] = None
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.concurrency: Optional[int] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds from the start of the execution until its result was retrieved"""
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def __repr__(self):
+        return f"ProcessRun({self.run_id!r}, status={self.status!r}, duration={self.duration})"
+
+
 class ProcessService(ObjectService):
     """Service to handle Object Updates for TI Processes"""
 
+    # thread states of TM1 that indicate that a thread waits for a lock or rolls back because of one
+    LOCK_CONTENTION_THREAD_STATES = ("Wait", "CommitWait", "Rollback")
+
     def __init__(self, rest: RestService):
         super().__init__(rest)
 
@@ -398,6 +447,152 @@ class ProcessService(ObjectService):
         )
         return success, status, error_log_file
 
+    def execute_graph(
+        self,
+        runs: Iterable[ProcessRun],
+        max_workers: int = 4,
+        poll_interval: float = 0.5,
+        detect_lock_contention: bool = True,
+        lock_contention_check_interval: float = 5,
+    ) -> Dict[str, ProcessRun]:
+        """Execute processes with bounded concurrency, in the order their dependencies require
+
+        Runs are started through ExecuteWithReturn with `return_async_id` and polled with
+        `poll_execute_with_return`. A run starts when all runs it depends on completed successfully.
+        Runs that depend on a failed run are not executed and get the status 'Skipped'.
+
+        When threads of the session wait for locks or roll back, the number of concurrent runs is halved.
+        It grows by one with every check without lock contention, up to `max_workers`.
+
+        runs = [
+            ProcessRun("Clear.Actuals", {"pYear": "2024"}),
+            ProcessRun("Load.Actuals", {"pYear": "2024", "pRegion": "EU"}, ["Clear.Actuals"], run_id="Load.EU"),
+            ProcessRun("Load.Actuals", {"pYear": "2024", "pRegion": "US"}, ["Clear.Actuals"], run_id="Load.US"),
+            ProcessRun("Calculate.Margin", depends_on=["Load.EU", "Load.US"]),
+        ]
+        for run in tm1.processes.execute_graph(runs, max_workers=8).values():
+            print(run.run_id, run.status, run.duration)
+
+        :param runs: ProcessRun objects. Dependencies refer to the run_id of other runs
+        :param max_workers: maximum number of processes that run at the same time
+        :param poll_interval: seconds between polls when no run completed
+        :param detect_lock_contention: reduce the concurrency when threads of the session wait for locks
+        :param lock_contention_check_interval: seconds between lock contention checks
+        :return: run_id -> ProcessRun with status and timing, in the order of the runs
+        """
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be at least 1")
+
+        runs = self._validate_graph(runs)
+        dependents = {run_id: [] for run_id in runs}
+        pending_dependencies = {}
+        for run in runs.values():
+            pending_dependencies[run.run_id] = len(set(run.depends_on))
+            for dependency in set(run.depends_on):
+                dependents[dependency].append(run.run_id)
+
+        ready = deque(run_id for run_id, count in pending_dependencies.items() if count == 0)
+        running: Dict[str, ProcessRun] = {}
+        concurrency = max_workers
+        next_lock_contention_check = time.monotonic() + lock_contention_check_interval
+
+        def complete(run: ProcessRun):
+            run.end_time = time.time()
+            for run_id in dependents[run.run_id]:
+                if not run.success:
+                    skip(runs[run_id])
+                    continue
+                pending_dependencies[run_id] -= 1
+                if pending_dependencies[run_id] == 0:
+                    ready.append(run_id)
+
+        def skip(run: ProcessRun):
+            skipped = [run]
+            while skipped:
+                run = skipped.pop()
+                if run.status is not None:
+                    continue
+                run.success = False
+                run.status = ProcessRun.SKIPPED
+                skipped.extend(runs[run_id] for run_id in dependents[run.run_id])
+
+        while ready or running:
+            while ready and len(running) < concurrency:
+                run = runs[ready.popleft()]
+                run.concurrency = concurrency
+                run.start_time = time.time()
+                try:
+                    async_id = self.execute_with_return(
+                        process_name=run.process_name, return_async_id=True, **run.parameters
+                    )
+                except TM1pyException as e:
+                    run.success, run.status, run.error = False, ProcessRun.FAILED, str(e)
+                    complete(run)
+                    continue
+                running[async_id] = run
+
+            completed = False
+            for async_id, run in list(running.items()):
+                try:
+                    result = self.poll_execute_with_return(async_id)
+                except TM1pyException as e:
+                    run.success, run.status, run.error = False, ProcessRun.FAILED, str(e)
+                else:
+                    if result is None:
+                        continue
+                    run.success, run.status, run.error_log_file = result
+                del running[async_id]
+                complete(run)
+                completed = True
+
+            if detect_lock_contention and running and time.monotonic() >= next_lock_contention_check:
+                next_lock_contention_check = time.monotonic() + lock_contention_check_interval
+                waiting_threads = self._count_lock_waiting_threads()
+                if waiting_threads is None:
+                    # threads can't be queried, e.g. in TM1 v12
+                    detect_lock_contention = False
+                elif waiting_threads:
+                    concurrency = max(1, concurrency // 2)
+                elif concurrency < max_workers:
+                    concurrency += 1
+
+            if running and not completed:
+                time.sleep(poll_interval)
+
+        return runs
+
+    @staticmethod
+    def _validate_graph(runs: Iterable[ProcessRun]) -> Dict[str, ProcessRun]:
+        runs_by_id = {}
+        for run in runs:
+            if run.run_id in runs_by_id:
+                raise ValueError(f"Duplicate run_id: '{run.run_id}'")
+            runs_by_id[run.run_id] = run
+
+        for run in runs_by_id.values():
+            for dependency in run.depends_on:
+                if dependency not in runs_by_id:
+                    raise ValueError(f"Run '{run.run_id}' depends on unknown run: '{dependency}'")
+
+        # a graph is acyclic if all runs can be visited in dependency order
+        visited = set()
+        remaining = list(runs_by_id.values())
+        while remaining:
+            visitable = [run for run in remaining if visited.issuperset(run.depends_on)]
+            if not visitable:
+                raise ValueError(f"Circular dependency between runs: {sorted(run.run_id for run in remaining)}")
+            visited.update(run.run_id for run in visitable)
+            remaining = [run for run in remaining if run.run_id not in visited]
+        return runs_by_id
+
+    def _count_lock_waiting_threads(self) -> Optional[int]:
+        """Number of threads of the session that wait for locks or roll back. None if threads can't be queried"""
+        try:
+            threads = SessionService(self._rest).get_threads_for_current(exclude_idle=True)
+        except TM1pyRestException:
+            return None
+        return sum(thread.get("State") in self.LOCK_CONTENTION_THREAD_STATES for thread in threads)
+
     @require_data_admin
     def execute_ti_code(self, lines_prolog: Iterable[str], lines_epilog: Iterable[str] = None, **kwargs) -> Response:
         """Execute lines of code on the TM1 Server
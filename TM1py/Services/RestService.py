@@ -3,16 +3,18 @@ import gzip
 import json
 import re
 import socket
+import threading
 import time
 import warnings
 from ast import literal_eval
 from base64 import b64decode, b64encode
+from contextlib import contextmanager
 from enum import Enum
 from http.client import HTTPResponse
 from http.cookies import SimpleCookie
 from io import BytesIO
 from json import JSONDecodeError
-from typing import Dict, Optional, Tuple, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple, Union
 
 import requests
 import urllib3
@@ -27,6 +29,11 @@ from TM1py.Utils import (
     case_and_space_insensitive_equals,
     verify_version,
 )
+from TM1py.Utils.Compression import ACCEPT_ENCODING, ContentDecodingReader
+from TM1py.Utils.Instrumentation import RequestMetrics
+from TM1py.Utils.JsonCodec import json_loads
+from TM1py.Utils.MetadataCache import MetadataCache
+from TM1py.Utils.SingleFlight import SingleFlight
 
 try:
     from requests_negotiate_sspi import HttpNegotiateAuth
@@ -42,6 +49,9 @@ from TM1py.Exceptions import (
     TM1pyVersionDeprecationException,
 )
 
+# metrics of the requests in flight on the current thread. Nested requests (e.g. async polls) push on top
+_request_metrics_scope = threading.local()
+
 
 class AuthenticationMode(Enum):
     BASIC = 1
@@ -83,11 +93,16 @@ class RestService:
         "User-Agent": "TM1py",
         "Content-Type": "application/json; odata.streaming=true; charset=utf-8",
         "Accept": "application/json;odata.metadata=none,text/plain",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "TM1-SessionContext": "TM1py",
     }
 
     DEFAULT_CONNECTION_POOL_SIZE = 10
     DEFAULT_POOL_CONNECTIONS = 1
+    # replaced, never mutated, so requests can iterate it without a lock
+    _request_hooks: Tuple[Callable[[RequestMetrics], None], ...] = ()
+    _single_flight: Optional[SingleFlight] = None
+    _metadata_cache: Optional[MetadataCache] = None
 
     def __init__(self, **kwargs):
         """Create an instance of RESTService
@@ -143,6 +158,10 @@ class RestService:
         - **compress_request_body** (bool): Gzip-compress request bodies at the transport seam. Opt-in. Default: False.
         - **gzip_min_bytes** (int): Minimum (encoded) request body size in bytes to compress. Default: 1024.
         - **gzip_compress_level** (int): Gzip compression level, 1 (fastest) to 9 (smallest). Default: 6.
+        - **compress_response** (bool): Ask TM1 to compress response bodies (gzip, deflate and br if brotli is installed). Default: True.
+        - **request_hooks** (list): Callables that receive a RequestMetrics object after every request. See `add_request_hook`.
+        - **coalesce_requests** (bool): Concurrent identical metadata reads (e.g. dimension names of a cube) share one in-flight request. Default: False.
+        - **metadata_cache_ttl** (float): Cache cube dimensions, hierarchy names, element types and element attributes for this many seconds. Default: None (no cache).
 
         :param kwargs: See description above for all supported arguments
         """
@@ -188,6 +207,15 @@ class RestService:
         # inside gzip.compress at request time, which is harder to trace back to this kwarg.
         if not 1 <= self._gzip_compress_level <= 9:
             raise ValueError("'gzip_compress_level' must be an int between 1 and 9")
+        # single-flight for concurrent identical metadata reads (opt-in)
+        if self.translate_to_boolean(kwargs.get("coalesce_requests", False)):
+            self._single_flight = SingleFlight()
+        # client side metadata cache (opt-in)
+        if kwargs.get("metadata_cache_ttl") is not None:
+            self._metadata_cache = MetadataCache(ttl=float(kwargs["metadata_cache_ttl"]))
+        # per request instrumentation (opt-in)
+        for hook in kwargs.get("request_hooks") or []:
+            self.add_request_hook(hook)
         # is retrieved on demand and then cached
         self._sandboxing_disabled = None
         # optional verbose logging to stdout
@@ -215,6 +243,8 @@ class RestService:
         self._headers = self.HEADERS.copy()
         if "session_context" in kwargs:
             self._headers["TM1-SessionContext"] = kwargs["session_context"]
+        if not self.translate_to_boolean(kwargs.get("compress_response", True)):
+            self._headers["Accept-Encoding"] = "identity"
 
         self.disable_http_warnings()
 
@@ -295,6 +325,70 @@ class RestService:
         """
         Execute a request to TM1 REST API
         """
+        if not self._request_hooks:
+            return self._request(
+                method,
+                url,
+                data,
+                encoding,
+                async_requests_mode,
+                return_async_id,
+                timeout,
+                cancel_at_timeout,
+                idempotent,
+                verify_response,
+                **kwargs,
+            )
+
+        metrics = RequestMetrics(method=method, url=url)
+        stream = kwargs.get("stream", False)
+        # download the body here instead of in requests, to count the bytes before and after decompression
+        kwargs["stream"] = True
+        started = time.perf_counter()
+        try:
+            with self._metrics_scope(metrics):
+                response = self._request(
+                    method,
+                    url,
+                    data,
+                    encoding,
+                    async_requests_mode,
+                    return_async_id,
+                    timeout,
+                    cancel_at_timeout,
+                    idempotent,
+                    verify_response,
+                    **kwargs,
+                )
+            if isinstance(response, Response):
+                metrics.status_code = response.status_code
+                metrics.time_to_first_byte = response.elapsed.total_seconds()
+                self._account_response_body(metrics, response, stream)
+            return response
+
+        except Exception as e:
+            metrics.error = type(e).__name__
+            metrics.status_code = getattr(e, "status_code", None)
+            raise
+
+        finally:
+            metrics.latency = time.perf_counter() - started
+            self._call_request_hooks(metrics)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        data: str,
+        encoding: str,
+        async_requests_mode: Optional[bool],
+        return_async_id: bool,
+        timeout: float,
+        cancel_at_timeout: bool,
+        idempotent: bool,
+        verify_response: bool,
+        **kwargs,
+    ):
         url, data = self._url_and_body(url=url, data=data, encoding=encoding)
 
         # Compress the request body once, before any retry path, so that the sync, async and
@@ -302,6 +396,10 @@ class RestService:
         if self._compress_request_body:
             data, kwargs["headers"] = self._maybe_compress_body(data, kwargs.get("headers") or {})
 
+        metrics = self._current_request_metrics()
+        if metrics is not None:
+            metrics.bytes_sent = self._request_body_size(data)
+
         timeout = timeout if timeout else self._timeout
 
         try:
@@ -377,6 +475,8 @@ class RestService:
 
         # Handle session timeout
         if self._re_connect_on_session_timeout and response.status_code == 401:
+            response.close()
+            self._count_request_retry()
             self.connect()
             response = self._s.request(
                 method=method, url=url, data=data, verify=self._verify, timeout=timeout, **kwargs
@@ -404,6 +504,8 @@ class RestService:
 
         # Handle session timeout
         if self._re_connect_on_session_timeout and response.status_code == 401:
+            response.close()
+            self._count_request_retry()
             self.connect()
             response = self._s.request(
                 method=method, url=url, data=data, verify=self._verify, timeout=timeout, **kwargs
@@ -416,6 +518,7 @@ class RestService:
 
         # Handle async response
         async_id = response.headers.get("Location").split("'")[1]
+        response.close()
         if return_async_id:
             return async_id
 
@@ -431,7 +534,10 @@ class RestService:
         """
         Poll for async operation completion
         """
+        metrics = self._current_request_metrics()
         for wait in self.wait_time_generator(timeout):
+            if metrics is not None:
+                metrics.async_polls += 1
             response = self.retrieve_async_response(async_id)
             if response.status_code in [200, 201]:
                 return response
@@ -491,6 +597,7 @@ class RestService:
             )
 
             time.sleep(current_delay)
+            self._count_request_retry()
 
             try:
                 # Reconnect
@@ -702,6 +809,7 @@ class RestService:
         encoding: str = "utf-8",
         idempotent: bool = True,
         verify_response: bool = True,
+        stream: bool = False,
         **kwargs,
     ):
         """Perform a GET request against TM1 instance
@@ -713,6 +821,7 @@ class RestService:
         :param timeout: Number of seconds that the client will wait to receive the first byte.
         :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
         :param encoding:
+        :param stream: do not download the body upfront. Read it incrementally through `response_body_stream`
         :return: response object or async_id
         """
 
@@ -728,8 +837,90 @@ class RestService:
             encoding=encoding,
             idempotent=idempotent,
             verify_response=verify_response,
+            stream=stream,
         )
 
+    @contextmanager
+    def GET_stream(
+        self,
+        url: str,
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        **kwargs,
+    ) -> Iterator[BinaryIO]:
+        """GET url and provide the response body as readable binary file object, without buffering it
+
+        >>> with tm1_rest.GET_stream("/Cellsets('...')?$expand=Cells") as body:
+        >>>     cells = ijson.items(body, "Cells.item")
+
+        The connection is released when the context exits. The body is decompressed on the fly. The yielded reader
+        counts the bytes read from the wire (`compressed_bytes`) and after decompression (`uncompressed_bytes`).
+
+        :param url:
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :return: file object, see `response_body_stream`
+        """
+        response = self.GET(
+            url=url,
+            headers=headers,
+            async_requests_mode=async_requests_mode,
+            timeout=timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            stream=True,
+            **kwargs,
+        )
+        try:
+            yield self.response_body_stream(response)
+        finally:
+            response.close()
+
+    @staticmethod
+    def response_body_stream(response: Response) -> BinaryIO:
+        """Body of a `stream=True` response as binary file object
+
+        :return: ContentDecodingReader, decompressing the body while reading straight from the socket. Bodies that
+        are already downloaded (e.g. polled async responses) are wrapped in a BytesIO, which shares the memory of the
+        bytes object
+        """
+        # requests marks a body that has not been downloaded yet with _content = False
+        if response._content is False:
+            return ContentDecodingReader(response.raw, response.headers.get("Content-Encoding"))
+        return BytesIO(response.content)
+
+    @staticmethod
+    def read_body(response: Response) -> bytes:
+        """Read the body of a `stream=True` response in one read from the socket and release the connection
+
+        Unlike `response.content` the body is not assembled from small chunks and never decoded to str.
+        """
+        if response._content is False:
+            RestService._download_body(response)
+        return response.content
+
+    @staticmethod
+    def _download_body(response: Response) -> ContentDecodingReader:
+        """Read the body of a `stream=True` response into `response.content` and release the connection
+
+        :return: the reader, holding the compressed and uncompressed byte counts
+        """
+        reader = RestService.response_body_stream(response)
+        try:
+            response._content = reader.read()
+            response._content_consumed = True
+        finally:
+            response.close()
+        return reader
+
+    @staticmethod
+    def read_json(response: Response) -> Any:
+        """Parse the JSON body of a `stream=True` response straight from bytes, skipping the decode to str"""
+        return json_loads(RestService.read_body(response))
+
     def POST(
         self,
         url: str,
@@ -1127,7 +1318,7 @@ class RestService:
         if self._is_admin is None:
             response = self.GET("/ActiveUser/Groups")
             self._is_admin = "ADMIN" in CaseAndSpaceInsensitiveSet(
-                *[group["Name"] for group in response.json()["value"]]
+                *[group["Name"] for group in self.read_json(response)["value"]]
             )
 
         return self._is_admin
@@ -1137,7 +1328,7 @@ class RestService:
         if self._is_data_admin is None:
             response = self.GET("/ActiveUser/Groups")
             self._is_data_admin = any(
-                g in CaseAndSpaceInsensitiveSet(*[group["Name"] for group in response.json()["value"]])
+                g in CaseAndSpaceInsensitiveSet(*[group["Name"] for group in self.read_json(response)["value"]])
                 for g in ["Admin", "DataAdmin"]
             )
 
@@ -1148,7 +1339,7 @@ class RestService:
         if self._is_security_admin is None:
             response = self.GET("/ActiveUser/Groups")
             self._is_security_admin = any(
-                g in CaseAndSpaceInsensitiveSet(*[group["Name"] for group in response.json()["value"]])
+                g in CaseAndSpaceInsensitiveSet(*[group["Name"] for group in self.read_json(response)["value"]])
                 for g in ["Admin", "SecurityAdmin"]
             )
 
@@ -1159,7 +1350,7 @@ class RestService:
         if self._is_ops_admin is None:
             response = self.GET("/ActiveUser/Groups")
             self._is_ops_admin = any(
-                g in CaseAndSpaceInsensitiveSet(*[group["Name"] for group in response.json()["value"]])
+                g in CaseAndSpaceInsensitiveSet(*[group["Name"] for group in self.read_json(response)["value"]])
                 for g in ["Admin", "OperationsAdmin"]
             )
 
@@ -1172,7 +1363,7 @@ class RestService:
 
         elif self._sandboxing_disabled is None:
             response = self.GET("/ActiveConfiguration/Administration/DisableSandboxing")
-            self._sandboxing_disabled = response.json().get("value", False)
+            self._sandboxing_disabled = self.read_json(response).get("value", False)
 
         return self._sandboxing_disabled
 
@@ -1286,6 +1477,87 @@ class RestService:
         # disable HTTP verification warnings from requests library
         requests.packages.urllib3.disable_warnings()
 
+    def add_request_hook(self, hook: Callable[[RequestMetrics], None]):
+        """Register a callable that receives a RequestMetrics object after every request
+
+        Hooks run synchronously on the requesting thread and must be fast and thread-safe.
+        Requests sent through an AsyncRestService on this RestService are reported too. Their hooks run on the
+        thread of the event loop.
+        Exceptions raised by hooks are turned into warnings.
+
+        :param hook: callable, e.g. an instance of TM1py.Utils.RequestStatistics
+        """
+        self._request_hooks = self._request_hooks + (hook,)
+
+    def remove_request_hook(self, hook: Callable[[RequestMetrics], None]):
+        self._request_hooks = tuple(registered for registered in self._request_hooks if registered != hook)
+
+    def _call_request_hooks(self, metrics: RequestMetrics):
+        for hook in self._request_hooks:
+            try:
+                hook(metrics)
+            except Exception as e:
+                warnings.warn(f"Request hook {hook!r} failed: {e}")
+
+    @staticmethod
+    @contextmanager
+    def _metrics_scope(metrics: Optional[RequestMetrics]):
+        """Make metrics the current request metrics of this thread, e.g. to count retries and async polls"""
+        if metrics is None:
+            yield
+            return
+        if not hasattr(_request_metrics_scope, "stack"):
+            _request_metrics_scope.stack = []
+        _request_metrics_scope.stack.append(metrics)
+        try:
+            yield
+        finally:
+            _request_metrics_scope.stack.pop()
+
+    @staticmethod
+    def _current_request_metrics() -> Optional[RequestMetrics]:
+        stack = getattr(_request_metrics_scope, "stack", None)
+        return stack[-1] if stack else None
+
+    def _count_request_retry(self):
+        metrics = self._current_request_metrics()
+        if metrics is not None:
+            metrics.retries += 1
+
+    @staticmethod
+    def _request_body_size(data) -> Optional[int]:
+        if isinstance(data, (bytes, bytearray)):
+            return len(data)
+        if isinstance(data, BytesIO):
+            return data.getbuffer().nbytes - data.tell()
+        return None
+
+    @staticmethod
+    def _account_response_body(metrics: RequestMetrics, response: Response, stream: bool):
+        content_encoding = response.headers.get("Content-Encoding")
+        compressed = bool(content_encoding) and content_encoding.lower() != "identity"
+        metrics.content_encoding = content_encoding
+
+        # don't touch the body of streamed responses. It belongs to the caller
+        if stream:
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit():
+                metrics.bytes_received_compressed = int(content_length)
+                if not compressed:
+                    metrics.bytes_received = int(content_length)
+            return
+
+        if response._content is False:
+            reader = RestService._download_body(response)
+            metrics.bytes_received = reader.uncompressed_bytes
+            metrics.bytes_received_compressed = reader.compressed_bytes
+            return
+
+        # body was downloaded and decompressed by requests, e.g. in verify_response or by async polls
+        metrics.bytes_received = len(response.content)
+        if not compressed:
+            metrics.bytes_received_compressed = metrics.bytes_received
+
     def get_http_header(self, key: str) -> str:
         return self._headers[key]
 
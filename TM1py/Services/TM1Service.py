@@ -1,5 +1,6 @@
 import pickle
 import warnings
+from typing import Optional
 
 from TM1py.Services import (
     AnnotationService,
@@ -32,6 +33,7 @@ from TM1py.Services.SessionService import SessionService
 from TM1py.Services.ThreadService import ThreadService
 from TM1py.Services.TransactionLogService import TransactionLogService
 from TM1py.Services.UserService import UserService
+from TM1py.Utils.MetadataCache import MetadataCache
 
 
 class TM1Service:
@@ -95,6 +97,8 @@ class TM1Service:
         - **compress_request_body** (bool): Gzip-compress request bodies at the transport seam. Opt-in. Default: False.
         - **gzip_min_bytes** (int): Minimum (encoded) request body size in bytes to compress. Default: 1024.
         - **gzip_compress_level** (int): Gzip compression level, 1 (fastest) to 9 (smallest). Default: 6.
+        - **coalesce_requests** (bool): Concurrent identical metadata reads share one in-flight request. Default: False.
+        - **metadata_cache_ttl** (float): Cache model metadata for this many seconds. See `enable_metadata_cache`.
 
         :param kwargs: See description above for all supported arguments
 
@@ -172,6 +176,26 @@ class TM1Service:
     def connection(self):
         return self._tm1_rest
 
+    @property
+    def metadata_cache(self) -> Optional[MetadataCache]:
+        return self._tm1_rest._metadata_cache
+
+    def enable_metadata_cache(self, ttl: Optional[float] = 300) -> MetadataCache:
+        """Cache dimensions of cubes, hierarchies of dimensions, element types and element attributes on the client
+
+        All services of this TM1Service share the cache. Creates, updates and deletes of cubes, dimensions,
+        hierarchies, elements, edges and attributes through TM1py drop the affected entries. Changes made by others
+        (e.g. TI processes or other clients) become visible after `ttl` seconds or through `metadata_cache.clear()`.
+
+        :param ttl: seconds a cached value stays valid. None: until invalidated
+        :return: MetadataCache
+        """
+        self._tm1_rest._metadata_cache = MetadataCache(ttl=ttl)
+        return self._tm1_rest._metadata_cache
+
+    def disable_metadata_cache(self):
+        self._tm1_rest._metadata_cache = None
+
     def save_to_file(self, file_name):
         with open(file_name, "wb") as file:
             pickle.dump(self, file)
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from requests import ConnectionError
+
+from TM1py.Exceptions import TM1pyNetworkException
+from TM1py.Services.RestService import RestService
+
+
+class TM1SessionPool:
+    """Pool of independently authenticated TM1 sessions
+
+    TM1 serializes some work per session. Every pooled session is a RestService of its own, with its own login,
+    TM1SessionId and HTTP connections, so work that is spread over the pool runs in parallel on the server.
+    Sessions are logged in on demand, up to `size`. Sessions that are idle for more than `max_idle` seconds are
+    logged out. Sessions that are idle for more than `health_check_interval` seconds are checked before they
+    are handed out and re-login through `connect` if the server dropped them.
+
+    >>> with TM1SessionPool(size=4, address="localhost", port=12354, user="admin", password="apple") as pool:
+    >>>     with pool.session() as tm1_rest:
+    >>>         ProcessService(tm1_rest).execute_with_return("load")
+
+    """
+
+    def __init__(self, size: int = 4, max_idle: float = 600, health_check_interval: float = 60, **kwargs):
+        """
+        :param size: max number of sessions
+        :param max_idle: seconds after which an idle session is logged out. None: never
+        :param health_check_interval: seconds of idleness after which a session is checked before checkout.
+        None: never
+        :param kwargs: arguments for the RestService of each session. See RestService
+        """
+        if size < 1:
+            raise ValueError("'size' must be a positive int")
+        if kwargs.get("session_id"):
+            raise ValueError("'session_id' can not be pooled. Each session in the pool must log in on its own")
+        self._size = int(size)
+        self._max_idle = max_idle
+        self._health_check_interval = health_check_interval
+        self._kwargs = kwargs
+
+        self._condition = threading.Condition()
+        # idle sessions with the time they were checked in. Most recently used last
+        self._idle: List[Tuple[RestService, float]] = []
+        # sessions that are logged in or currently logging in
+        self._count = 0
+        self._closed = False
+
+    @classmethod
+    def from_rest_service(cls, rest: RestService, size: int = 4, **kwargs) -> "TM1SessionPool":
+        """Pool of sessions with the same connection arguments as an existing RestService
+
+        :param rest: RestService that was created with credentials
+        :param size: max number of sessions
+        :param kwargs: further arguments for the pool, e.g. max_idle
+        """
+        return cls(size=size, **{**rest._kwargs, **kwargs})
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def available(self) -> int:
+        """number of sessions that can be checked out without waiting"""
+        with self._condition:
+            return len(self._idle) + self._size - self._count
+
+    @property
+    def in_use(self) -> int:
+        with self._condition:
+            return self._count - len(self._idle)
+
+    def _create_session(self) -> RestService:
+        return RestService(**self._kwargs)
+
+    def _pop_expired(self, now: float) -> List[RestService]:
+        if self._max_idle is None:
+            return []
+        expired = [rest for rest, last_used in self._idle if now - last_used > self._max_idle]
+        if expired:
+            self._idle = [(rest, last_used) for rest, last_used in self._idle if now - last_used <= self._max_idle]
+            self._count -= len(expired)
+            self._condition.notify(len(expired))
+        return expired
+
+    @staticmethod
+    def _logout(sessions: List[RestService]):
+        for rest in sessions:
+            try:
+                rest.logout()
+            except Exception as e:
+                warnings.warn(f"Logout of pooled session failed due to Exception: {e}")
+
+    def checkout(self, timeout: float = None) -> RestService:
+        """Take a session from the pool. Must be returned through `checkin`
+
+        :param timeout: seconds to wait for a free session. None: wait forever
+        :return: connected RestService
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        expired = []
+        rest, last_used, timed_out = None, None, False
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("TM1SessionPool is closed")
+                now = time.monotonic()
+                expired += self._pop_expired(now)
+                if self._idle:
+                    rest, last_used = self._idle.pop()
+                    break
+                if self._count < self._size:
+                    self._count += 1
+                    break
+                if deadline is not None and now >= deadline:
+                    timed_out = True
+                    break
+                self._condition.wait(None if deadline is None else deadline - now)
+
+        # logouts, logins and health checks happen outside the lock, so other threads don't wait for the network
+        self._logout(expired)
+        if timed_out:
+            raise TimeoutError(f"No session available in TM1SessionPool after {timeout} seconds")
+
+        try:
+            if rest is None:
+                return self._create_session()
+            if self._health_check_interval is not None and now - last_used > self._health_check_interval:
+                if not rest.is_connected():
+                    rest.connect()
+            return rest
+        except Exception:
+            self._discard()
+            raise
+
+    def checkin(self, rest: RestService, discard: bool = False):
+        """Return a session to the pool
+
+        :param rest: RestService from `checkout`
+        :param discard: log out the session instead of reusing it, e.g. after a connection failure
+        """
+        with self._condition:
+            if not (discard or self._closed):
+                self._idle.append((rest, time.monotonic()))
+                self._condition.notify()
+                return
+        self._discard()
+        self._logout([rest])
+
+    def _discard(self):
+        with self._condition:
+            self._count -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout: float = None) -> Iterator[RestService]:
+        """Check out a session for the duration of the context
+
+        Sessions that fail with a connection error are discarded instead of returned to the pool.
+
+        :param timeout: seconds to wait for a free session. None: wait forever
+        """
+        rest = self.checkout(timeout=timeout)
+        discard = False
+        try:
+            yield rest
+        except (ConnectionError, TM1pyNetworkException):
+            discard = True
+            raise
+        finally:
+            self.checkin(rest, discard=discard)
+
+    def close(self):
+        """Log out all idle sessions. Sessions in use are logged out when they are checked in"""
+        with self._condition:
+            self._closed = True
+            sessions = [rest for rest, _ in self._idle]
+            self._idle = []
+            self._count -= len(sessions)
+            self._condition.notify_all()
+        self._logout(sessions)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
@@ -12,6 +12,7 @@ from TM1py.Utils import (
     utc_localize_time,
     verify_version,
 )
+from TM1py.Utils.JsonCodec import json_loads
 
 
 class TransactionLogService(ObjectService):
@@ -31,16 +32,16 @@ class TransactionLogService(ObjectService):
         url = "/TailTransactionLog()"
         if filter:
             url += "?$filter={}".format(filter)
-        response = self._rest.GET(url=url, **kwargs)
+        body = RestService.read_body(self._rest.GET(url=url, stream=True, **kwargs))
         # Read the next delta-request-url from the response
-        self.last_delta_request = response.text[response.text.rfind("TransactionLogEntries/!delta('") : -2]
+        self.last_delta_request = body[body.rfind(b"TransactionLogEntries/!delta('") : -2].decode("utf-8")
 
     @deprecated_in_version(version="12.0.0")
     @odata_track_changes_header
     def execute_delta_request(self, **kwargs) -> Dict:
-        response = self._rest.GET(url="/" + self.last_delta_request, **kwargs)
-        self.last_delta_request = response.text[response.text.rfind("TransactionLogEntries/!delta('") : -2]
-        return response.json()["value"]
+        body = RestService.read_body(self._rest.GET(url="/" + self.last_delta_request, stream=True, **kwargs))
+        self.last_delta_request = body[body.rfind(b"TransactionLogEntries/!delta('") : -2].decode("utf-8")
+        return json_loads(body)["value"]
 
     @deprecated_in_version(version="12.0.0")
     @require_data_admin
@@ -103,5 +104,5 @@ class TransactionLogService(ObjectService):
         # top limit
         if top:
             url += "&$top={}".format(top)
-        response = self._rest.GET(url, **kwargs)
-        return response.json()["value"]
+        response = self._rest.GET(url, stream=True, **kwargs)
+        return RestService.read_json(response)["value"]
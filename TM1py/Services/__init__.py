@@ -8,13 +8,16 @@ from TM1py.Services.DimensionService import DimensionService
 from TM1py.Services.ElementService import ElementService
 from TM1py.Services.GitService import GitService
 from TM1py.Services.HierarchyService import HierarchyService
-from TM1py.Services.ProcessService import ProcessService
+from TM1py.Services.ProcessService import ProcessRun, ProcessService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.SandboxService import SandboxService
 from TM1py.Services.SecurityService import SecurityService
 from TM1py.Services.SubsetService import SubsetService
 from TM1py.Services.ViewService import ViewService
 from TM1py.Services.TM1Service import TM1Service
+from TM1py.Services.TM1SessionPool import TM1SessionPool
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Services.AsyncTM1Service import AsyncTM1Service
 
 
 from TM1py.Services.ManageService import ManageService
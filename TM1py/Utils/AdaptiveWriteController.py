@@ -0,0 +1,149 @@
+import threading
+from typing import Dict, List, Optional
+
+
+class AdaptiveWriteController:
+    """AIMD controller for slice size and number of parallel TI processes in asynchronous writes.
+
+    The number of concurrent executions grows additively (by one per window of successful chunks) and is halved
+    when a chunk fails or when its time per cell exceeds `latency_tolerance` times the best time per cell seen so far,
+    which is how lock contention on the server shows. Only chunks started after the last decrease can trigger the next
+    decrease, so one congestion event halves the concurrency once.
+
+    The slice size follows the same pattern: it grows by a fixed step while chunks finish in less than half of
+    `target_seconds` and is halved when a chunk takes more than twice as long or fails.
+
+    Chunks that complete with minor errors (e.g. rejected element names) are counted as failures in the report,
+    but only their latency feeds into the decisions. Data errors say nothing about the load on the server.
+
+    Slices are cut when a chunk enters the write pipeline, while up to
+    `encode_workers + upload_workers + 2 * max_workers` chunks are queued or executing ahead of it. A new slice size
+    therefore only reaches the server that many chunks later.
+    """
+
+    def __init__(
+        self,
+        slice_size: int = 250_000,
+        max_workers: int = 8,
+        initial_workers: int = None,
+        min_slice_size: int = 10_000,
+        max_slice_size: int = 2_000_000,
+        target_seconds: float = 10.0,
+        latency_tolerance: float = 1.5,
+    ):
+        """
+        :param slice_size: initial number of cells per chunk
+        :param max_workers: upper bound for parallel TI processes
+        :param initial_workers: parallel TI processes to start with. Default: half of max_workers
+        :param min_slice_size: lower bound for the slice size
+        :param max_slice_size: upper bound for the slice size
+        :param target_seconds: desired execution time of a single chunk on the server
+        :param latency_tolerance: factor over the best observed time per cell that is treated as contention
+        """
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be a positive int")
+        if not 1 <= min_slice_size <= max_slice_size:
+            raise ValueError("'min_slice_size' must be positive and not greater than 'max_slice_size'")
+
+        self._max_workers = max_workers
+        self._window = float(min(max_workers, initial_workers or max(1, max_workers // 2)))
+        self._min_slice_size = min_slice_size
+        self._max_slice_size = max_slice_size
+        self._slice_size = min(max(slice_size, min_slice_size), max_slice_size)
+        self._slice_step = max(min_slice_size, self._slice_size // 4)
+        self._target_seconds = target_seconds
+        self._latency_tolerance = latency_tolerance
+
+        self._condition = threading.Condition()
+        self._running = 0
+        self._best_seconds_per_cell: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._chunks = 0
+        self._cells = 0
+        self._failures = 0
+        self._first_started: Optional[float] = None
+        self._last_finished: Optional[float] = None
+        self._history: List[Dict] = []
+
+    @property
+    def workers(self) -> int:
+        return int(self._window)
+
+    @property
+    def slice_size(self) -> int:
+        return self._slice_size
+
+    def acquire(self):
+        """Block until fewer than `workers` chunks are executing"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._running < self.workers)
+            self._running += 1
+
+    def release(self):
+        with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
+
+    def record(self, cells: int, started: float, finished: float, success: bool, minor_errors: bool = False):
+        """Feed back the outcome of one chunk and adjust slice size and workers
+
+        :param cells: number of cells in the chunk
+        :param started: monotonic timestamp when the execution started
+        :param finished: monotonic timestamp when the execution finished
+        :param success: False if the TI process did not complete successfully
+        :param minor_errors: the TI process completed, but rejected some cells. Not treated as a hard failure
+        """
+        seconds = max(finished - started, 1e-9)
+        seconds_per_cell = seconds / max(cells, 1)
+
+        with self._condition:
+            self._chunks += 1
+            self._cells += cells
+            self._first_started = started if self._first_started is None else min(self._first_started, started)
+            self._last_finished = finished if self._last_finished is None else max(self._last_finished, finished)
+            if not success:
+                self._failures += 1
+            hard_failure = not success and not minor_errors
+
+            contention = (
+                self._best_seconds_per_cell is not None
+                and seconds_per_cell > self._best_seconds_per_cell * self._latency_tolerance
+            )
+            if success and (self._best_seconds_per_cell is None or seconds_per_cell < self._best_seconds_per_cell):
+                self._best_seconds_per_cell = seconds_per_cell
+
+            if (hard_failure or contention) and started >= self._last_decrease:
+                self._window = max(1.0, self._window / 2)
+                self._last_decrease = finished
+            elif not hard_failure and not contention:
+                self._window = min(float(self._max_workers), self._window + 1 / self._window)
+
+            if hard_failure or seconds > 2 * self._target_seconds:
+                self._slice_size = max(self._min_slice_size, self._slice_size // 2)
+            elif seconds < self._target_seconds / 2:
+                self._slice_size = min(self._max_slice_size, self._slice_size + self._slice_step)
+
+            self._history.append(
+                {
+                    "cells": cells,
+                    "seconds": seconds,
+                    "success": success,
+                    "workers": self.workers,
+                    "slice_size": self._slice_size,
+                }
+            )
+            self._condition.notify_all()
+
+    def report(self) -> Dict:
+        """Settings chosen by the controller and throughput statistics of the write"""
+        with self._condition:
+            elapsed = self._last_finished - self._first_started if self._chunks else 0
+            return {
+                "slice_size": self._slice_size,
+                "workers": self.workers,
+                "chunks": self._chunks,
+                "cells": self._cells,
+                "failures": self._failures,
+                "cells_per_second": self._cells / elapsed if elapsed > 0 else None,
+                "history": list(self._history),
+            }
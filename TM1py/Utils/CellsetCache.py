@@ -0,0 +1,137 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class CellsetCache:
+    """Thread-safe LRU cache for cellset read results, bounded by the pickled size of its entries.
+
+    Entries are stored pickled, so every hit returns an independent copy that callers may mutate.
+    With a `directory`, entries are also written to disk and survive the process.
+    Entries that are evicted from memory are removed from disk as well.
+    Files in `directory` are loaded with `pickle`, which can execute arbitrary code. The directory must be
+    trusted: only writable by this application and not shared with other users.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024**2, directory: Optional[str] = None):
+        """
+        :param max_bytes: upper bound for the summed size of all pickled entries
+        :param directory: optional folder for disk persistence. Created if it does not exist
+        """
+        if max_bytes < 1:
+            raise ValueError("'max_bytes' must be a positive int")
+        self._max_bytes = max_bytes
+        self._directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (self._directory is not None and os.path.isfile(self._path(key)))
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Stable key from arbitrary parts, e.g. function name, arguments and last data update
+
+        :return: sha256 hex digest
+        """
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            elif self._directory:
+                payload = self._read_file(key)
+                if payload is not None:
+                    self._store(key, payload, persist=False)
+
+            if payload is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+
+        return pickle.loads(payload)
+
+    def put(self, key: str, value: Any):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        # an entry larger than the whole cache would only evict everything else
+        if len(payload) > self._max_bytes:
+            return
+        with self._lock:
+            self._store(key, payload, persist=True)
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            if self._directory:
+                for file_name in os.listdir(self._directory):
+                    if file_name.endswith(".pickle"):
+                        os.remove(os.path.join(self._directory, file_name))
+            self.hits = 0
+            self.misses = 0
+
+    def statistics(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "size_bytes": self._size_bytes, "hits": self.hits, "misses": self.misses}
+
+    def _store(self, key: str, payload: bytes, persist: bool):
+        self._remove(key, from_disk=False)
+        self._entries[key] = payload
+        self._size_bytes += len(payload)
+        if persist and self._directory:
+            self._write_file(key, payload)
+
+        while self._size_bytes > self._max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def _remove(self, key: str, from_disk: bool = True):
+        payload = self._entries.pop(key, None)
+        if payload is not None:
+            self._size_bytes -= len(payload)
+        if from_disk and self._directory:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + ".pickle")
+
+    def _read_file(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_file(self, key: str, payload: bytes):
+        # write to temp file first, so concurrent readers never see a partial entry
+        temp_path = self._path(key) + f".{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(payload)
+        os.replace(temp_path, self._path(key))
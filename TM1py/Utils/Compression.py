@@ -0,0 +1,165 @@
+import io
+import zlib
+from typing import List, Optional
+
+try:
+    import brotli
+
+    _has_brotli = True
+except ImportError:
+    try:
+        import brotlicffi as brotli
+
+        _has_brotli = True
+    except ImportError:
+        _has_brotli = False
+
+# content codings offered to the server. br only if a brotli library is installed
+ACCEPT_ENCODING = "gzip, deflate, br" if _has_brotli else "gzip, deflate"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _IdentityDecoder:
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _GzipDecoder:
+    def __init__(self):
+        self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def decompress(self, data: bytes) -> bytes:
+        output = self._obj.decompress(data)
+        # a gzip body may consist of several members
+        while self._obj.eof and self._obj.unused_data:
+            unused_data = self._obj.unused_data
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            output += self._obj.decompress(unused_data)
+        return output
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _DeflateDecoder:
+    """'deflate' is zlib wrapped deflate per RFC 9110, but some servers send raw deflate"""
+
+    def __init__(self):
+        self._obj = zlib.decompressobj(zlib.MAX_WBITS)
+        self._first_data: Optional[bytes] = b""
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._first_data is None:
+            return self._obj.decompress(data)
+
+        self._first_data += data
+        try:
+            output = self._obj.decompress(data)
+        except zlib.error:
+            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            output = self._obj.decompress(self._first_data)
+        # the wrapper is detected once some output came through
+        if output:
+            self._first_data = None
+        return output
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliDecoder:
+    def __init__(self):
+        self._obj = brotli.Decompressor()
+        # brotli calls it process, brotlicffi decompress
+        self.decompress = getattr(self._obj, "process", None) or self._obj.decompress
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def _decoder(content_coding: str):
+    if content_coding in ("gzip", "x-gzip"):
+        return _GzipDecoder()
+    if content_coding == "deflate":
+        return _DeflateDecoder()
+    if content_coding == "br" and _has_brotli:
+        return _BrotliDecoder()
+    # unknown codings are passed through, like urllib3 does
+    return _IdentityDecoder()
+
+
+class ContentDecodingReader(io.RawIOBase):
+    """Readable binary file object that decompresses the body of a streamed urllib3 response on the fly
+
+    Reads the body in chunks of `chunk_size` bytes, so it can be fed into iterative parsers (e.g. ijson) without
+    holding the compressed or the decompressed body in memory. Counts the bytes that arrived on the wire
+    (`compressed_bytes`) and the bytes handed out (`uncompressed_bytes`).
+    """
+
+    def __init__(self, raw, content_encoding: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        :param raw: urllib3.HTTPResponse with preload_content=False
+        :param content_encoding: value of the Content-Encoding response header, e.g. 'gzip'
+        :param chunk_size: number of bytes read from the wire at once
+        """
+        super().__init__()
+        self._raw = raw
+        self._chunk_size = chunk_size
+        self.content_encoding = content_encoding
+        codings = [coding.strip().lower() for coding in (content_encoding or "").split(",")]
+        # codings are listed in the order they were applied
+        self._decoders: List = [_decoder(coding) for coding in reversed(codings) if coding and coding != "identity"]
+        self._buffer = bytearray()
+        self._eof = False
+        self.compressed_bytes = 0
+        self.uncompressed_bytes = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _pull(self) -> bytes:
+        chunk = self._raw.read(self._chunk_size, decode_content=False)
+        if not chunk:
+            self._eof = True
+            data = b""
+            for decoder in self._decoders:
+                data = decoder.decompress(data) + decoder.flush()
+        else:
+            self.compressed_bytes += len(chunk)
+            data = chunk
+            for decoder in self._decoders:
+                data = decoder.decompress(data)
+        self.uncompressed_bytes += len(data)
+        return data
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+        while len(self._buffer) < size and not self._eof:
+            self._buffer += self._pull()
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def readall(self) -> bytes:
+        chunks = [bytes(self._buffer)]
+        self._buffer.clear()
+        while not self._eof:
+            chunks.append(self._pull())
+        return b"".join(chunks)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """uncompressed / compressed bytes read so far, None before the first byte"""
+        if not self.compressed_bytes:
+            return None
+        return self.uncompressed_bytes / self.compressed_bytes
@@ -0,0 +1,330 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+_CONSOLIDATED = 3
+
+
+def _normalize(name: str) -> str:
+    return name.replace(" ", "").lower()
+
+
+def _zeros(size: int) -> array:
+    return array("l", [0]) * size
+
+
+def _is_consolidated(element_type: Any) -> bool:
+    # accepts 'Consolidated', 3 and Element.Types.CONSOLIDATED
+    element_type = getattr(element_type, "value", element_type)
+    if isinstance(element_type, str):
+        return _normalize(element_type) == "consolidated"
+    return element_type == _CONSOLIDATED
+
+
+class HierarchyIndex:
+    """Read-only in-memory index of the structure of a hierarchy
+
+    Elements are numbered by their position in `element_types`. Children and parents are stored as CSR arrays
+    (offsets into one flat array of ids per direction). A depth first traversal from the top elements assigns
+    every element an interval [entry, exit] in the traversal order, that contains the intervals of all elements
+    below it. This makes ancestor checks O(1) and leaf expansion O(number of leaves) for elements with a single
+    parent. Elements with several parents are resolved by walking up only through those shared elements.
+
+    Names are case and space insensitive, like in TM1.
+
+    >>> index = HierarchyIndex.from_hierarchy(hierarchy)
+    >>> index.element_is_ancestor("Total Year", "Jan")
+    >>> index.get_leaves_under_consolidation("Q1")
+    """
+
+    def __init__(
+        self,
+        element_types: Mapping[str, Any],
+        edges: Mapping[Tuple[str, str], float],
+        dimension_name: Optional[str] = None,
+        hierarchy_name: Optional[str] = None,
+    ):
+        """
+        :param element_types: element name -> element type (e.g. from ElementService.get_element_types)
+        :param edges: (parent name, component name) -> weight (e.g. from ElementService.get_edges)
+        :param dimension_name: name of the dimension, for messages only
+        :param hierarchy_name: name of the hierarchy, for messages only
+        """
+        self.dimension_name = dimension_name
+        self.hierarchy_name = hierarchy_name or dimension_name
+
+        self._names: List[str] = []
+        types = []
+        for name, element_type in element_types.items():
+            self._names.append(name)
+            types.append(element_type)
+        self._ids: Dict[str, int] = {_normalize(name): i for i, name in enumerate(self._names)}
+        consolidated_types = {element_type: _is_consolidated(element_type) for element_type in set(types)}
+        self._consolidated = bytearray(consolidated_types[element_type] for element_type in types)
+        size = len(self._names)
+
+        # edges usually spell names exactly like the elements. Saves normalizing every name
+        exact_ids = {name: i for i, name in enumerate(self._names)}
+        parent_ids, child_ids, weights = array("l"), array("l"), array("d")
+        for (parent, component), weight in edges.items():
+            parent_id = exact_ids.get(parent)
+            parent_ids.append(self._element_id(parent) if parent_id is None else parent_id)
+            child_id = exact_ids.get(component)
+            child_ids.append(self._element_id(component) if child_id is None else child_id)
+            weights.append(weight)
+
+        self._child_offsets, self._children, self._weights = self._build_csr(size, parent_ids, child_ids, weights)
+        self._parent_offsets, self._parents, _ = self._build_csr(size, child_ids, parent_ids, weights)
+        self._traverse()
+
+    @classmethod
+    def from_hierarchy(cls, hierarchy) -> "HierarchyIndex":
+        """Index of a TM1py Hierarchy object"""
+        element_types = {element.name: element.element_type for element in hierarchy.elements.values()}
+        return cls(element_types, hierarchy.edges, hierarchy.dimension_name, hierarchy.name)
+
+    @staticmethod
+    def _build_csr(size: int, sources: array, targets: array, weights: array) -> Tuple[array, array, array]:
+        # counting sort by source keeps the order of the edges per source
+        offsets = _zeros(size + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+
+        position = array("l", offsets[:size])
+        sorted_targets = _zeros(len(targets))
+        sorted_weights = array("d", [0.0]) * len(targets)
+        for source, target, weight in zip(sources, targets, weights):
+            sorted_targets[position[source]] = target
+            sorted_weights[position[source]] = weight
+            position[source] += 1
+        return offsets, sorted_targets, sorted_weights
+
+    def _traverse(self):
+        size = len(self._names)
+        child_offsets, children = self._child_offsets, self._children
+        parent_offsets = self._parent_offsets
+
+        self._entry = _zeros(size)
+        self._exit = _zeros(size)
+        self._order = _zeros(size)
+        self._levels = _zeros(size)
+        # element and all its ancestors have at most one parent: the traversal interval tells all ancestors
+        self._single_path = bytearray(size)
+        # element or an element below it has a child that was reached through another parent first
+        self._shared_below = bytearray(size)
+        # children that were reached through another parent first
+        self._shared_children: Dict[int, List[int]] = {}
+
+        # 0: not visited, 1: on the traversal path, 2: done
+        state = bytearray(size)
+        position = 0
+        for root in range(size):
+            if parent_offsets[root + 1] > parent_offsets[root]:
+                continue
+            state[root] = 1
+            self._single_path[root] = 1
+            self._entry[root] = position
+            self._order[position] = root
+            position += 1
+            stack = [(root, child_offsets[root])]
+            while stack:
+                element, cursor = stack[-1]
+                if cursor < child_offsets[element + 1]:
+                    stack[-1] = (element, cursor + 1)
+                    child = children[cursor]
+                    if state[child] == 0:
+                        state[child] = 1
+                        self._single_path[child] = self._single_path[element] and (
+                            parent_offsets[child + 1] - parent_offsets[child] == 1
+                        )
+                        self._entry[child] = position
+                        self._order[position] = child
+                        position += 1
+                        stack.append((child, child_offsets[child]))
+                    elif state[child] == 1:
+                        raise ValueError(
+                            f"Circular reference between '{self._names[element]}' and '{self._names[child]}' "
+                            f"in hierarchy: '{self.hierarchy_name}'"
+                        )
+                    else:
+                        self._shared_children.setdefault(element, []).append(child)
+                        self._shared_below[element] = 1
+                        self._levels[element] = max(self._levels[element], self._levels[child] + 1)
+                    continue
+
+                stack.pop()
+                state[element] = 2
+                self._exit[element] = position - 1
+                if stack:
+                    parent = stack[-1][0]
+                    self._levels[parent] = max(self._levels[parent], self._levels[element] + 1)
+                    self._shared_below[parent] |= self._shared_below[element]
+
+        if position < size:
+            element = next(i for i in range(size) if not state[i])
+            raise ValueError(
+                f"Circular reference including '{self._names[element]}' in hierarchy: '{self.hierarchy_name}'"
+            )
+
+        # leaves in traversal order. leaves under an element are a slice of it
+        self._leaf_rank = _zeros(size + 1)
+        self._leaf_order = array("l")
+        for position, element in enumerate(self._order):
+            self._leaf_rank[position + 1] = self._leaf_rank[position]
+            if not self._consolidated[element]:
+                self._leaf_rank[position + 1] += 1
+                self._leaf_order.append(element)
+
+    def _element_id(self, element_name: str) -> int:
+        try:
+            return self._ids[_normalize(element_name)]
+        except KeyError:
+            raise ValueError(f"Element: '{element_name}' not found in hierarchy: '{self.hierarchy_name}'") from None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, element_name: str) -> bool:
+        return _normalize(element_name) in self._ids
+
+    @property
+    def element_names(self) -> List[str]:
+        return list(self._names)
+
+    def get_element_id(self, element_name: str) -> int:
+        return self._element_id(element_name)
+
+    def get_element_name(self, element_id: int) -> str:
+        return self._names[element_id]
+
+    def is_leaf(self, element_name: str) -> bool:
+        """Numeric and String elements are leaves"""
+        return not self._consolidated[self._element_id(element_name)]
+
+    def get_level(self, element_name: str) -> int:
+        """Level like ELLEV in TI: 0 for leaves, 1 + max level of the children for consolidations"""
+        return self._levels[self._element_id(element_name)]
+
+    def get_levels_count(self) -> int:
+        return max(self._levels) + 1 if self._names else 0
+
+    def get_elements_by_level(self, level: int) -> List[str]:
+        return [name for name, element_level in zip(self._names, self._levels) if element_level == level]
+
+    def get_top_elements(self) -> List[str]:
+        """Elements without parents"""
+        offsets = self._parent_offsets
+        return [name for i, name in enumerate(self._names) if offsets[i + 1] == offsets[i]]
+
+    def get_children(self, element_name: str) -> List[str]:
+        element = self._element_id(element_name)
+        offsets = self._child_offsets
+        return [self._names[child] for child in self._children[offsets[element] : offsets[element + 1]]]
+
+    def get_edges(self, element_name: str) -> Dict[str, float]:
+        """Components of a consolidation with their weights"""
+        element = self._element_id(element_name)
+        start, end = self._child_offsets[element], self._child_offsets[element + 1]
+        return {
+            self._names[child]: weight for child, weight in zip(self._children[start:end], self._weights[start:end])
+        }
+
+    def get_parents(self, element_name: str) -> List[str]:
+        element = self._element_id(element_name)
+        offsets = self._parent_offsets
+        return [self._names[parent] for parent in self._parents[offsets[element] : offsets[element + 1]]]
+
+    def element_is_parent(self, parent_name: str, element_name: str) -> bool:
+        if parent_name not in self or element_name not in self:
+            return False
+        parent, element = self._element_id(parent_name), self._element_id(element_name)
+        offsets = self._parent_offsets
+        return parent in self._parents[offsets[element] : offsets[element + 1]]
+
+    def element_is_ancestor(self, ancestor_name: str, element_name: str) -> bool:
+        """Like ElementIsAncestor in TI. False if one of the elements doesn't exist"""
+        if ancestor_name not in self or element_name not in self:
+            return False
+        return self._is_ancestor(self._element_id(ancestor_name), self._element_id(element_name))
+
+    def _is_ancestor(self, ancestor: int, element: int) -> bool:
+        entry = self._entry
+        start, end = entry[ancestor], self._exit[ancestor]
+        if start < entry[element] <= end:
+            return True
+        if self._single_path[element]:
+            return False
+
+        # the ancestor is above one of the shared elements on the way up
+        parent_offsets, parents = self._parent_offsets, self._parents
+        stack, visited = [element], {element}
+        while stack:
+            current = stack.pop()
+            for parent in parents[parent_offsets[current] : parent_offsets[current + 1]]:
+                if start <= entry[parent] <= end:
+                    return True
+                if not self._single_path[parent] and parent not in visited:
+                    visited.add(parent)
+                    stack.append(parent)
+        return False
+
+    def get_ancestors(self, element_name: str) -> List[str]:
+        element = self._element_id(element_name)
+        parent_offsets, parents = self._parent_offsets, self._parents
+        ancestors, stack = [], [element]
+        visited = {element}
+        while stack:
+            current = stack.pop()
+            for parent in parents[parent_offsets[current] : parent_offsets[current + 1]]:
+                if parent not in visited:
+                    visited.add(parent)
+                    ancestors.append(parent)
+                    stack.append(parent)
+        return [self._names[ancestor] for ancestor in ancestors]
+
+    def _descendant_ids(self, element: int) -> Iterable[int]:
+        order = self._order
+        if not self._shared_below[element]:
+            return order[self._entry[element] + 1 : self._exit[element] + 1]
+
+        # shared elements are in the traversal interval of the parent that reached them first
+        descendants, visited, stack = [], {element}, [element]
+        while stack:
+            top = stack.pop()
+            for position in range(self._entry[top] + 1, self._exit[top] + 1):
+                current = order[position]
+                if current not in visited:
+                    visited.add(current)
+                    descendants.append(current)
+            for position in range(self._entry[top], self._exit[top] + 1):
+                for shared in self._shared_children.get(order[position], ()):
+                    if shared not in visited:
+                        visited.add(shared)
+                        descendants.append(shared)
+                        stack.append(shared)
+        return descendants
+
+    def get_members_under_consolidation(self, consolidation: str, leaves_only: bool = False) -> List[str]:
+        """All elements below a consolidation, each element once"""
+        if leaves_only:
+            return self.get_leaves_under_consolidation(consolidation)
+        element = self._element_id(consolidation)
+        return [self._names[descendant] for descendant in self._descendant_ids(element)]
+
+    def get_leaves_under_consolidation(self, consolidation: str) -> List[str]:
+        """All leaves below a consolidation, each leaf once"""
+        element = self._element_id(consolidation)
+        if not self._shared_below[element]:
+            rank = self._leaf_rank
+            leaves = self._leaf_order[rank[self._entry[element] + 1] : rank[self._exit[element] + 1]]
+        else:
+            leaves = [leaf for leaf in self._descendant_ids(element) if not self._consolidated[leaf]]
+        return [self._names[leaf] for leaf in leaves]
+
+    def count_leaves_under_consolidation(self, consolidation: str) -> int:
+        element = self._element_id(consolidation)
+        if not self._shared_below[element]:
+            rank = self._leaf_rank
+            return rank[self._exit[element] + 1] - rank[self._entry[element] + 1]
+        return sum(1 for leaf in self._descendant_ids(element) if not self._consolidated[leaf])
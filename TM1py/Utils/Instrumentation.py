@@ -0,0 +1,159 @@
+import math
+import re
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+_QUOTED_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMERIC_KEY = re.compile(r"\((\d+)\)")
+
+
+def url_template(url: str) -> str:
+    """Reduce a request URL to its endpoint, e.g. /Cubes('Sales')/Views('Q1')?$expand=x -> /Cubes('{}')/Views('{}')
+
+    :param url: URL with or without base url
+    :return: path without query string, where quoted keys and numeric keys are replaced by {}
+    """
+    path = url.split("?", 1)[0]
+    api_root = path.find("/api/v1/")
+    if api_root > -1:
+        path = path[api_root + len("/api/v1") :]
+    path = _QUOTED_LITERAL.sub("'{}'", path)
+    return _NUMERIC_KEY.sub("({})", path)
+
+
+class RequestMetrics:
+    """Timings and sizes of one call to `RestService.request`, passed to every registered request hook"""
+
+    __slots__ = (
+        "method",
+        "url",
+        "url_template",
+        "status_code",
+        "bytes_sent",
+        "bytes_received",
+        "bytes_received_compressed",
+        "content_encoding",
+        "time_to_first_byte",
+        "latency",
+        "retries",
+        "async_polls",
+        "error",
+    )
+
+    def __init__(self, method: str, url: str):
+        self.method = method.upper()
+        self.url = url
+        self.url_template = url_template(url)
+        self.status_code: Optional[int] = None
+        # None when unknown, e.g. for streamed bodies
+        self.bytes_sent: Optional[int] = None
+        self.bytes_received: Optional[int] = None
+        # response body size on the wire, before decompression
+        self.bytes_received_compressed: Optional[int] = None
+        self.content_encoding: Optional[str] = None
+        self.time_to_first_byte: Optional[float] = None
+        self.latency: Optional[float] = None
+        self.retries = 0
+        self.async_polls = 0
+        # name of the exception class, if the request failed
+        self.error: Optional[str] = None
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.method} {self.url_template}"
+
+    def as_dict(self) -> Dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self):
+        return f"RequestMetrics({self.endpoint}, status_code={self.status_code}, latency={self.latency})"
+
+
+class RequestStatistics:
+    """In-memory aggregator for request metrics. Register it as request hook on a RestService.
+
+    Keeps the latest `max_samples` latencies per endpoint and summarizes them as p50 / p95 / p99.
+    """
+
+    def __init__(self, max_samples: int = 10_000):
+        """
+        :param max_samples: number of latencies kept per endpoint for the percentiles
+        """
+        if max_samples < 1:
+            raise ValueError("'max_samples' must be a positive int")
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._totals: Dict[str, Dict[str, int]] = {}
+
+    def __call__(self, metrics: RequestMetrics):
+        endpoint = metrics.endpoint
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self._max_samples)
+                self._totals[endpoint] = {
+                    "count": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "async_polls": 0,
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "bytes_received_compressed": 0,
+                }
+            totals = self._totals[endpoint]
+            if metrics.latency is not None:
+                latencies.append(metrics.latency)
+            totals["count"] += 1
+            totals["errors"] += bool(metrics.error or (metrics.status_code or 0) >= 400)
+            totals["retries"] += metrics.retries
+            totals["async_polls"] += metrics.async_polls
+            totals["bytes_sent"] += metrics.bytes_sent or 0
+            totals["bytes_received"] += metrics.bytes_received or 0
+            totals["bytes_received_compressed"] += metrics.bytes_received_compressed or 0
+
+    @staticmethod
+    def _percentile(ordered: List[float], percentile: float) -> Optional[float]:
+        if not ordered:
+            return None
+        # nearest-rank method
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict[str, Dict]:
+        """Statistics per endpoint, e.g. {"POST /ExecuteMDX": {"count": 3, "p50": 0.2, "p95": 0.9, ...}}
+
+        :return: dictionary of endpoints, sorted by p95 latency in descending order
+        """
+        with self._lock:
+            snapshot = {
+                endpoint: (sorted(self._latencies[endpoint]), dict(totals)) for endpoint, totals in self._totals.items()
+            }
+
+        summary = {}
+        for endpoint, (ordered, totals) in snapshot.items():
+            summary[endpoint] = {
+                **totals,
+                "p50": self._percentile(ordered, 50),
+                "p95": self._percentile(ordered, 95),
+                "p99": self._percentile(ordered, 99),
+                "max": ordered[-1] if ordered else None,
+            }
+        return dict(sorted(summary.items(), key=lambda item: -(item[1]["p95"] or 0)))
+
+    def dump(self) -> str:
+        """Summary as text table, slowest endpoints (by p95) first"""
+        lines = [f"{'endpoint':<60} {'count':>8} {'errors':>6} {'p50':>9} {'p95':>9} {'p99':>9}"]
+        for endpoint, statistics in self.summary().items():
+            percentiles = (
+                f"{statistics[key]:9.3f}" if statistics[key] is not None else f"{'':>9}"
+                for key in ("p50", "p95", "p99")
+            )
+            lines.append(f"{endpoint:<60} {statistics['count']:>8} {statistics['errors']:>6} {' '.join(percentiles)}")
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._latencies.clear()
+            self._totals.clear()
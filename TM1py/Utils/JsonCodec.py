@@ -0,0 +1,110 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+try:
+    import ujson
+
+    _has_ujson = True
+except ImportError:
+    _has_ujson = False
+
+JSON_BACKENDS = ("orjson", "ujson", "json")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # compact separators, so every backend produces the same bytes
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _stdlib_loads(data: Union[str, bytes, bytearray]) -> Any:
+    return json.loads(data)
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    except TypeError:
+        # e.g. int beyond 64 bit or type unknown to orjson
+        return _stdlib_dumps(obj)
+
+
+def _orjson_loads(data: Union[str, bytes, bytearray]) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # e.g. int beyond 64 bit. For malformed JSON the stdlib raises the same JSONDecodeError
+        return json.loads(data)
+
+
+def _ujson_dumps(obj: Any) -> bytes:
+    # ujson output is compact by default
+    try:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+    except (TypeError, OverflowError):
+        return _stdlib_dumps(obj)
+
+
+def _ujson_loads(data: Union[str, bytes, bytearray]) -> Any:
+    try:
+        return ujson.loads(data)
+    except ValueError:
+        return json.loads(data)
+
+
+_CODECS = {
+    "orjson": (_orjson_dumps, _orjson_loads),
+    "ujson": (_ujson_dumps, _ujson_loads),
+    "json": (_stdlib_dumps, _stdlib_loads),
+}
+_AVAILABLE = {"orjson": _has_orjson, "ujson": _has_ujson, "json": True}
+
+_backend = "json"
+_dumps, _loads = _CODECS[_backend]
+
+
+def get_json_backend() -> str:
+    """Name of the library that serializes and parses JSON bodies: 'orjson', 'ujson' or 'json'"""
+    return _backend
+
+
+def set_json_backend(backend: Optional[str] = None):
+    """Select the JSON library for request and response bodies
+
+    :param backend: 'orjson', 'ujson' or 'json'. Default: fastest installed library
+    """
+    global _backend, _dumps, _loads
+
+    if backend is None:
+        backend = next(name for name in JSON_BACKENDS if _AVAILABLE[name])
+    if backend not in _CODECS:
+        raise ValueError(f"'backend' must be one of: {', '.join(JSON_BACKENDS)}")
+    if not _AVAILABLE[backend]:
+        raise ImportError(f"JSON backend '{backend}' requires the '{backend}' package")
+
+    _backend = backend
+    _dumps, _loads = _CODECS[backend]
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON. Non-ASCII characters are not escaped, like json.dumps with ensure_ascii=False"""
+    return _dumps(obj).decode("utf-8")
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 encoded JSON, ready to be sent as request body"""
+    return _dumps(obj)
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON from str or UTF-8 encoded bytes"""
+    return _loads(data)
+
+
+set_json_backend()
@@ -0,0 +1,137 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+# scope of a cached value: ("cube", cube), ("dimension", dimension) or ("hierarchy", dimension, hierarchy)
+Scope = Tuple[str, ...]
+
+
+def _normalize(name: str) -> str:
+    return name.lower().replace(" ", "")
+
+
+def metadata_scope(scope: str, arguments: Mapping[str, Any]) -> Optional[Scope]:
+    """Scope of a call from its (bound) arguments
+
+    Names are taken from the arguments cube_name, dimension_name and hierarchy_name or from the Cube, Dimension
+    and Hierarchy objects passed as cube, dimension and hierarchy.
+
+    :param scope: 'cube', 'dimension' or 'hierarchy'
+    :param arguments: arguments of the call by name
+    :return: normalized scope or None, if the names can't be determined from the arguments
+    """
+    if scope == "cube":
+        cube_name = arguments.get("cube_name") or getattr(arguments.get("cube"), "name", None)
+        return ("cube", _normalize(cube_name)) if isinstance(cube_name, str) else None
+
+    hierarchy = arguments.get("hierarchy")
+    if hierarchy is not None and not isinstance(hierarchy, str):
+        dimension_name = getattr(hierarchy, "dimension_name", None)
+        hierarchy_name = getattr(hierarchy, "name", None)
+    else:
+        dimension_name = arguments.get("dimension_name") or getattr(arguments.get("dimension"), "name", None)
+        hierarchy_name = arguments.get("hierarchy_name") or dimension_name
+    if not isinstance(dimension_name, str):
+        return None
+
+    if scope == "dimension":
+        return "dimension", _normalize(dimension_name)
+    if scope == "hierarchy":
+        return "hierarchy", _normalize(dimension_name), _normalize(hierarchy_name)
+    raise ValueError(f"Invalid scope: '{scope}'. Must be 'cube', 'dimension' or 'hierarchy'")
+
+
+class MetadataCache:
+    """Thread-safe cache for model metadata (dimensions of cubes, hierarchies of dimensions, element types and
+    element attributes of hierarchies) with a time to live.
+
+    Values are stored per scope. Invalidating a dimension drops the values of all its hierarchies. Invalidating
+    a hierarchy drops the values that span all hierarchies of its dimension and the Leaves hierarchy as well.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300):
+        """
+        :param ttl: seconds a value stays valid. None: until invalidated
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("'ttl' must be a positive number or None")
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[Scope, float, Any]] = {}
+        # incremented by every invalidation. Values read before an invalidation are not stored after it
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # entries expire on the monotonic clock of this process. Only the settings are pickled
+        return {"ttl": self._ttl}
+
+    def __setstate__(self, state):
+        self.__init__(ttl=state["ttl"])
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] >= time.monotonic():
+                    self.hits += 1
+                    return entry[2]
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, scope: Scope, value: Any, generation: int = None):
+        """
+        :param generation: value of `generation` before the value was read. Skips values that may be outdated
+        """
+        expires = time.monotonic() + self._ttl if self._ttl is not None else float("inf")
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (scope, expires, value)
+
+    def _drop(self, predicate):
+        with self._lock:
+            self._generation += 1
+            for key in [key for key, (scope, _, _) in self._entries.items() if predicate(scope)]:
+                del self._entries[key]
+
+    def invalidate(self, scope: Scope):
+        """Drop all values that depend on the object identified by the scope"""
+        kind = scope[0]
+        if kind == "cube":
+            self._drop(lambda cached: cached == scope)
+        elif kind == "dimension":
+            self._drop(lambda cached: cached[0] != "cube" and cached[1] == scope[1])
+        elif kind == "hierarchy":
+            # the Leaves hierarchy mirrors the leaves of all other hierarchies
+            affected = {scope, ("dimension", scope[1]), ("hierarchy", scope[1], "leaves")}
+            self._drop(lambda cached: cached in affected)
+        else:
+            raise ValueError(f"Invalid scope: '{kind}'. Must be 'cube', 'dimension' or 'hierarchy'")
+
+    def invalidate_cube(self, cube_name: str):
+        self.invalidate(("cube", _normalize(cube_name)))
+
+    def invalidate_dimension(self, dimension_name: str):
+        self.invalidate(("dimension", _normalize(dimension_name)))
+
+    def invalidate_hierarchy(self, dimension_name: str, hierarchy_name: str = None):
+        self.invalidate(("hierarchy", _normalize(dimension_name), _normalize(hierarchy_name or dimension_name)))
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
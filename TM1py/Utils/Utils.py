@@ -1,7 +1,9 @@
 import collections
+import copy
 import csv
 import functools
 import http.client as http_client
+import inspect
 import json
 import math
 import re
@@ -36,6 +38,7 @@ from TM1py.Exceptions.Exceptions import (
     TM1pyVersionDeprecationException,
     TM1pyVersionException,
 )
+from TM1py.Utils.MetadataCache import metadata_scope
 
 try:
     import numpy as np
@@ -155,17 +158,131 @@ def deprecated_in_version(version):
 @decohints
 def require_pandas(func):
     @functools.wraps(func)
-    def wrapper(self, *args, **kwargs):
+    def wrapper(*args, **kwargs):
         try:
             import pandas  # noqa: F401
 
-            return func(self, *args, **kwargs)
+            return func(*args, **kwargs)
         except ImportError:
             raise ImportError(f"Function '{func.__name__}' requires pandas")
 
     return wrapper
 
 
+@decohints
+def coalesce_concurrent_reads(func):
+    """Higher order function to let concurrent identical calls share one in-flight request and its parsed result
+
+    Active if the RestService of the service was created with `coalesce_requests=True`. Callers of a shared
+    result receive independent copies, so they may mutate it.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        single_flight = getattr(self._rest, "_single_flight", None)
+        if single_flight is None:
+            return func(self, *args, **kwargs)
+
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return func(self, *args, **kwargs)
+
+        result, shared = single_flight.do(key, lambda: func(self, *args, **kwargs))
+        return copy.deepcopy(result) if shared else result
+
+    return wrapper
+
+
+_METADATA_CACHE_MISS = object()
+
+
+@decohints
+def cache_metadata_read(scope: str):
+    """Higher order function to serve metadata reads from the metadata cache of the RestService, if enabled
+
+    :param scope: 'cube', 'dimension' or 'hierarchy'. The object the result depends on. Writes to that object through
+    functions decorated with `invalidate_metadata` drop the cached result
+    """
+
+    def wrap(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self._rest, "_metadata_cache", None)
+            if cache is None:
+                return func(self, *args, **kwargs)
+
+            arguments = signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            cache_scope = metadata_scope(scope, arguments.arguments)
+            # extra kwargs (e.g. timeout) don't affect the result
+            key = (
+                func.__qualname__,
+                cache_scope,
+                tuple(
+                    (name, value)
+                    for name, value in arguments.arguments.items()
+                    if name not in ("self", "kwargs", "cube_name", "dimension_name", "hierarchy_name")
+                ),
+            )
+            try:
+                hash(key)
+            except TypeError:
+                return func(self, *args, **kwargs)
+            if cache_scope is None:
+                return func(self, *args, **kwargs)
+
+            result = cache.get(key, _METADATA_CACHE_MISS)
+            if result is not _METADATA_CACHE_MISS:
+                return copy.deepcopy(result)
+
+            generation = cache.generation
+            result = func(self, *args, **kwargs)
+            cache.put(key, cache_scope, copy.deepcopy(result), generation)
+            return result
+
+        return wrapper
+
+    return wrap
+
+
+@decohints
+def invalidate_metadata(scope: str):
+    """Higher order function to drop cached metadata of the object a function creates, updates or deletes
+
+    :param scope: 'cube', 'dimension' or 'hierarchy'. If the object can't be determined from the arguments,
+    the whole metadata cache is cleared
+    """
+
+    def wrap(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self._rest, "_metadata_cache", None)
+            if cache is None:
+                return func(self, *args, **kwargs)
+
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                # also after failures. The object may have been changed partially
+                arguments = signature.bind(self, *args, **kwargs)
+                arguments.apply_defaults()
+                cache_scope = metadata_scope(scope, arguments.arguments)
+                if cache_scope is None:
+                    cache.clear()
+                else:
+                    cache.invalidate(cache_scope)
+
+        return wrapper
+
+    return wrap
+
+
 def get_all_servers_from_adminhost(adminhost="localhost", port=None, use_ssl=False) -> List:
     from TM1py.Objects import Server
 
@@ -566,6 +683,7 @@ def build_dataframe_from_csv(
     fillna_string_attributes: bool = False,
     fillna_string_attributes_value: Any = "",
     attribute_types_by_dimension: Dict[str, Dict[str, str]] = None,
+    categorical_dimensions: bool = False,
     **kwargs,
 ) -> "pd.DataFrame":
     if not raw_csv:
@@ -615,8 +733,36 @@ def build_dataframe_from_csv(
         )
 
     if not shaped:
+        if categorical_dimensions:
+            df = _categorize_columns(df, df.columns[:-1])
         return df
 
+    # convert after pivoting: categorical keys would otherwise expand to the cartesian product
+    dimension_count = len(df.columns) - 2
+    df = _shape_dataframe(df)
+    if categorical_dimensions:
+        df = _categorize_columns(df, df.columns[:dimension_count])
+    return df
+
+
+def _categorize_columns(df: "pd.DataFrame", columns: Iterable) -> "pd.DataFrame":
+    """Categories in order of first appearance, which is axis order for the tuples that have cells"""
+    columns = set(columns)
+    data = {}
+    for position, column in enumerate(df.columns):
+        series = df.iloc[:, position]
+        # numeric attribute columns keep their dtype
+        if column in columns and not pd.api.types.is_numeric_dtype(series):
+            codes, categories = pd.factorize(series)
+            series = pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=df.index)
+        data[position] = series
+    # rebuild by position: headers are not necessarily unique
+    categorized = pd.DataFrame(data, index=df.index)
+    categorized.columns = df.columns
+    return categorized
+
+
+def _shape_dataframe(df: "pd.DataFrame") -> "pd.DataFrame":
     # due to csv creation logic, last column is bottom dimension from the column selection
     idx_cols = list(df.columns[:-2])
     col_col = df.columns[-2]
@@ -639,6 +785,81 @@ def build_dataframe_from_csv(
     return df.rename_axis(None, axis=1)
 
 
+@require_pandas
+def build_dataframe_from_cellset_columnar(
+    raw_cellset_as_dict: Dict,
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    top: Optional[int] = None,
+    shaped: bool = False,
+    mdx_headers: bool = False,
+    categorical_dimensions: bool = False,
+) -> "pd.DataFrame":
+    """Decode a raw cellset into a DataFrame column by column, without a per-cell Python dict or CSV round trip.
+
+    Tuple indexes are computed from the cell ordinals with a vectorized divmod per axis.
+    Element names are collected once per axis tuple and then gathered with the tuple indexes.
+    Result has the same layout as `build_dataframe_from_csv(build_csv_from_cellset_dict(...))`:
+    row dimensions, column dimensions, Value
+
+    :param raw_cellset_as_dict: raw cellset with Axes (without contexts) and Cells
+    :param row_dimensions: hierarchies on rows, e.g. ['[d1].[h1]']
+    :param column_dimensions: hierarchies on columns, e.g. ['[d2].[h2]']
+    :param top: Int, number of cells to decode (counting from top)
+    :param shaped: preserve shape of view/mdx in data frame
+    :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+    :param categorical_dimensions: dimension columns as pd.Categorical, with categories in axis order
+    :return: pandas DataFrame
+    """
+    cells = raw_cellset_as_dict["Cells"][: top or None]
+    # empty cellsets produce empty DataFrame in line with `build_dataframe_from_csv`
+    if len(cells) == 0:
+        return pd.DataFrame()
+
+    if "Ordinal" in cells[0]:
+        ordinals = np.fromiter((cell["Ordinal"] for cell in cells), dtype=np.int64, count=len(cells))
+    else:
+        ordinals = np.arange(len(cells), dtype=np.int64)
+
+    # axis 0 is columns, axis 1 is rows
+    columns_by_axis = []
+    remainder = ordinals
+    # shaped frames are categorized after pivoting: categorical keys would otherwise expand to the cartesian product
+    categorize_axes = categorical_dimensions and not shaped
+    for axis in extract_axes_from_cellset(raw_cellset_as_dict=raw_cellset_as_dict):
+        remainder, tuple_indexes = np.divmod(remainder, axis["Cardinality"])
+        names_by_tuple = [extract_element_names_from_members(axis_tuple["Members"]) for axis_tuple in axis["Tuples"]]
+        # one element-name array per member position, gathered by the tuple index of every cell
+        axis_columns = []
+        for names in zip(*names_by_tuple):
+            if categorize_axes:
+                codes, categories = pd.factorize(np.array(names, dtype=object))
+                axis_columns.append(pd.Categorical.from_codes(codes.take(tuple_indexes), categories=categories))
+            else:
+                axis_columns.append(np.array(names, dtype=object).take(tuple_indexes))
+        columns_by_axis.append(axis_columns)
+
+    headers = [
+        dimension if mdx_headers else dimension_name_from_element_unique_name(dimension)
+        for dimension in list(row_dimensions) + list(column_dimensions)
+    ]
+    # rows before columns, as in the csv layout
+    data = [column for axis_columns in reversed(columns_by_axis) for column in axis_columns]
+    data.append(pd.Series([cell["Value"] for cell in cells]))
+    # build by position: headers are not necessarily unique (e.g. same dimension with multiple hierarchies)
+    df = pd.DataFrame(dict(enumerate(data)))
+    df.columns = headers + ["Value"]
+
+    if not shaped:
+        return df
+
+    dimension_count = len(df.columns) - 2
+    df = _shape_dataframe(df)
+    if categorical_dimensions:
+        df = _categorize_columns(df, df.columns[:dimension_count])
+    return df
+
+
 def _build_csv_line_items_from_axis_tuple(members: Dict, include_attributes: bool = False) -> List[str]:
     if not include_attributes:
         return extract_element_names_from_members(members)
@@ -968,10 +1189,77 @@ def build_dataframe_aggregate_intersections(df: "pd.DataFrame", sum_numeric_dupl
     return df
 
 
+@require_pandas
+def build_changed_cells_mask(data: "pd.DataFrame", current: "pd.DataFrame") -> "np.ndarray":
+    """
+    Flag the rows in `data` whose value differs from the current value in the cube.
+    Intersections are matched case and space insensitive. Intersections missing in `current` count as 0 or ''.
+
+    :param data: A Dataframe, with dimension-column mapping in correct order and the new values in the last column
+    :param current: A Dataframe of the same shape with the current values, e.g. from `execute_mdx_dataframe`
+    :return: boolean array with one entry per row in `data`
+    """
+    dimension_count = len(data.columns) - 1
+    keys = [f"key{i}" for i in range(dimension_count)]
+
+    def _normalize(df: "pd.DataFrame") -> "pd.DataFrame":
+        normalized = pd.DataFrame(
+            {
+                key: df.iloc[:, i].astype(str).str.lower().str.replace(" ", "", regex=False).to_numpy()
+                for i, key in enumerate(keys)
+            }
+        )
+        normalized["value"] = df.iloc[:, -1].to_numpy()
+        return normalized
+
+    # left merge on unique right keys preserves the row order of data
+    merged = _normalize(data).merge(
+        _normalize(current).drop_duplicates(subset=keys), how="left", on=keys, suffixes=("", "_current")
+    )
+    new_values, current_values = merged["value"], merged["value_current"]
+
+    numeric_changed = pd.to_numeric(new_values, errors="coerce").to_numpy() != pd.to_numeric(
+        current_values, errors="coerce"
+    ).fillna(0).to_numpy(dtype=float)
+    if pd.api.types.is_numeric_dtype(new_values):
+        return numeric_changed
+
+    string_changed = (new_values.astype(str) != current_values.fillna("").astype(str)).to_numpy()
+    return np.where(new_values.apply(np.isreal).to_numpy(dtype=bool), numeric_changed, string_changed)
+
+
 def aggregate_duplicate_intersections(df, dimension_headers, value_header):
-    for col in dimension_headers:
-        df[col] = df[col].str.lower().str.replace(" ", "")
-    return df.groupby([*dimension_headers])[value_header].sum().reset_index()
+    """Sum the values of intersections that are equal case and space insensitive
+
+    Element names are normalized once per distinct name and rows are grouped by integer codes in a single groupby.
+    The first spelling of an intersection is kept. Rows with missing element names are dropped.
+    """
+    dimension_headers = list(dimension_headers)
+    keys = {}
+    for i, col in enumerate(dimension_headers):
+        codes, uniques = pd.factorize(df[col])
+        normalized_codes, _ = pd.factorize(pd.Index(uniques).astype(str).str.lower().str.replace(" ", "", regex=False))
+        keys[f"__key{i}"] = np.where(codes >= 0, normalized_codes[codes] if len(uniques) else codes, -1)
+
+    complete = np.logical_and.reduce([codes >= 0 for codes in keys.values()]) if keys else slice(None)
+    keyed = df.assign(**keys)[complete]
+    aggregations = {col: "first" for col in dimension_headers}
+    aggregations[value_header] = "sum"
+    return keyed.groupby(list(keys), sort=False).agg(aggregations).reset_index(drop=True)
+
+
+def drop_duplicate_intersections(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Keep only the last row of intersections that are equal case and space insensitive
+
+    Same outcome as building a CaseAndSpaceInsensitiveTuplesDict from the rows: the last value wins
+    """
+    keys = pd.DataFrame(
+        {
+            i: df.iloc[:, i].astype(str).str.lower().str.replace(" ", "", regex=False).to_numpy()
+            for i in range(df.shape[1] - 1)
+        }
+    )
+    return df[~keys.duplicated(keep="last").to_numpy()]
 
 
 def lower_and_drop_spaces(item: str) -> str:
@@ -1765,6 +2053,11 @@ def build_mdx_and_values_from_cellset(cells: Dict, cube_name: str, dimensions: I
 
 
 def frame_to_significant_digits(x, digits=15):
+    if digits == 15 and type(x) is float:
+        # shortest repr of a float with up to 15 significant digits is what rounding would produce
+        text = repr(x)
+        if len(text) <= 16 and "e" not in text and "n" not in text:
+            return text
     if x == 0 or not math.isfinite(x):
         return str(x).replace("e+", "E")
     digits -= math.ceil(math.log10(abs(x)))
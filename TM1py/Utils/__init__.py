@@ -1,2 +1,16 @@
+from TM1py.Utils.AdaptiveWriteController import AdaptiveWriteController  # noqa: F401
+from TM1py.Utils.CellsetCache import CellsetCache  # noqa: F401
+from TM1py.Utils.Compression import ContentDecodingReader  # noqa: F401
+from TM1py.Utils.HierarchyIndex import HierarchyIndex  # noqa: F401
+from TM1py.Utils.Instrumentation import RequestMetrics, RequestStatistics, url_template  # noqa: F401
+from TM1py.Utils.JsonCodec import (  # noqa: F401
+    get_json_backend,
+    json_dumps,
+    json_dumps_bytes,
+    json_loads,
+    set_json_backend,
+)
 from TM1py.Utils.MDXUtils import *
+from TM1py.Utils.MetadataCache import MetadataCache  # noqa: F401
+from TM1py.Utils.SingleFlight import SingleFlight  # noqa: F401
 from TM1py.Utils.Utils import *
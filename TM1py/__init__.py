@@ -44,6 +44,8 @@ from TM1py.Objects.User import User
 from TM1py.Objects.View import View
 from TM1py.Services.AnnotationService import AnnotationService
 from TM1py.Services.ApplicationService import ApplicationService
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Services.AsyncTM1Service import AsyncTM1Service
 from TM1py.Services.AuditLogService import AuditLogService
 from TM1py.Services.CellService import CellService
 from TM1py.Services.ChoreService import ChoreService
@@ -61,7 +63,7 @@ from TM1py.Services.MetricService import MetricService
 from TM1py.Services.MonitoringService import MonitoringService
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.PowerBiService import PowerBiService
-from TM1py.Services.ProcessService import ProcessService
+from TM1py.Services.ProcessService import ProcessRun, ProcessService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.SandboxService import SandboxService
 from TM1py.Services.SecurityService import SecurityService
@@ -70,6 +72,7 @@ from TM1py.Services.SessionService import SessionService
 from TM1py.Services.SubsetService import SubsetService
 from TM1py.Services.ThreadService import ThreadService
 from TM1py.Services.TM1Service import TM1Service
+from TM1py.Services.TM1SessionPool import TM1SessionPool
 from TM1py.Services.TransactionLogService import TransactionLogService
 from TM1py.Services.UserService import UserService
 from TM1py.Services.ViewService import ViewService
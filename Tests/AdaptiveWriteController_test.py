@@ -0,0 +1,99 @@
+import threading
+import unittest
+
+from TM1py.Utils import AdaptiveWriteController
+
+
+class TestAdaptiveWriteController(unittest.TestCase):
+
+    def test_additive_increase_up_to_max_workers(self):
+        controller = AdaptiveWriteController(slice_size=100_000, max_workers=4, initial_workers=1, target_seconds=10)
+
+        for n in range(20):
+            controller.record(cells=100_000, started=n, finished=n + 5, success=True)
+
+        self.assertEqual(4, controller.workers)
+        self.assertEqual(100_000, controller.slice_size)
+
+    def test_failure_halves_workers_and_slice_size_once(self):
+        controller = AdaptiveWriteController(slice_size=100_000, max_workers=8, initial_workers=8, target_seconds=10)
+
+        controller.record(cells=100_000, started=0, finished=5, success=False)
+        # started before the first decrease: same congestion event
+        controller.record(cells=100_000, started=1, finished=6, success=False)
+
+        self.assertEqual(4, controller.workers)
+        self.assertEqual(25_000, controller.slice_size)
+
+    def test_minor_errors_are_not_treated_as_contention(self):
+        controller = AdaptiveWriteController(slice_size=100_000, max_workers=8, initial_workers=8, target_seconds=10)
+
+        controller.record(cells=100_000, started=0, finished=5, success=True)
+        controller.record(cells=100_000, started=5, finished=10, success=False, minor_errors=True)
+
+        self.assertEqual(8, controller.workers)
+        self.assertEqual(100_000, controller.slice_size)
+        self.assertEqual(1, controller.report()["failures"])
+
+    def test_minor_errors_with_high_latency_are_treated_as_contention(self):
+        controller = AdaptiveWriteController(slice_size=100_000, max_workers=8, initial_workers=8, target_seconds=10)
+
+        controller.record(cells=100_000, started=0, finished=5, success=True)
+        controller.record(cells=100_000, started=5, finished=14, success=False, minor_errors=True)
+
+        self.assertEqual(4, controller.workers)
+
+    def test_latency_increase_is_treated_as_contention(self):
+        controller = AdaptiveWriteController(slice_size=100_000, max_workers=8, initial_workers=8, target_seconds=10)
+
+        controller.record(cells=100_000, started=0, finished=5, success=True)
+        controller.record(cells=100_000, started=5, finished=14, success=True)
+
+        self.assertEqual(4, controller.workers)
+
+    def test_slice_size_follows_target_seconds(self):
+        controller = AdaptiveWriteController(
+            slice_size=100_000, max_workers=2, min_slice_size=10_000, max_slice_size=150_000, target_seconds=10
+        )
+
+        controller.record(cells=100_000, started=0, finished=1, success=True)
+        controller.record(cells=125_000, started=1, finished=2, success=True)
+        self.assertEqual(150_000, controller.slice_size)
+
+        controller.record(cells=150_000, started=2, finished=30, success=True)
+        self.assertEqual(75_000, controller.slice_size)
+
+    def test_acquire_blocks_beyond_workers(self):
+        controller = AdaptiveWriteController(max_workers=4, initial_workers=1)
+        controller.acquire()
+        acquired = threading.Event()
+
+        thread = threading.Thread(target=lambda: (controller.acquire(), acquired.set()), daemon=True)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+
+        controller.release()
+        self.assertTrue(acquired.wait(1))
+
+    def test_report(self):
+        controller = AdaptiveWriteController(slice_size=50_000, max_workers=2, initial_workers=1)
+        controller.record(cells=50_000, started=0, finished=2, success=True)
+        controller.record(cells=50_000, started=1, finished=4, success=False)
+
+        report = controller.report()
+
+        self.assertEqual(2, report["chunks"])
+        self.assertEqual(100_000, report["cells"])
+        self.assertEqual(1, report["failures"])
+        self.assertEqual(25_000, report["cells_per_second"])
+        self.assertEqual(controller.slice_size, report["slice_size"])
+        self.assertEqual(controller.workers, report["workers"])
+        self.assertEqual(2, len(report["history"]))
+
+    def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            AdaptiveWriteController(max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
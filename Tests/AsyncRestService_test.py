@@ -0,0 +1,356 @@
+import asyncio
+import json
+import threading
+import unittest
+from datetime import timedelta
+
+from requests import Response
+
+from TM1py import TM1Service
+from TM1py.Exceptions import TM1pyTimeout
+from TM1py.Objects import Process
+from TM1py.Services.AsyncRestService import AsyncRestService, _has_httpx
+from TM1py.Services.AsyncTM1Service import (
+    AsyncElementService,
+    AsyncTM1Service,
+    _AsyncServiceFacade,
+)
+from TM1py.Services.RestService import RestService
+
+from .MockTM1Server import MockTM1Server
+
+
+class _FakeResponse:
+    """Minimal stand-in for a requests.Response"""
+
+    def __init__(self, status_code: int, headers: dict = None, text: str = ""):
+        self.status_code = status_code
+        self.ok = 200 <= status_code < 300
+        self.headers = headers or {}
+        self.text = text
+        self.reason = "OK" if self.ok else "ERROR"
+        self.encoding = None
+        self.content = text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def close(self):
+        pass
+
+
+def _response(status_code: int, content: bytes = b"", headers: dict = None, elapsed: float = 0.01) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+class _RecordingSession:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self._lock = threading.Lock()
+        self.calls = []
+
+    def request(self, method, url, data=None, verify=None, timeout=None, **kwargs):
+        with self._lock:
+            self.calls.append({"method": method, "url": url, "data": data, "headers": kwargs.get("headers")})
+            return self._responses.pop(0)
+
+
+def _rest(responses) -> RestService:
+    rest = object.__new__(RestService)
+    rest._base_url = "https://tm1.example/api/v1"
+    rest._headers = {"Content-Type": "application/json; charset=utf-8"}
+    rest._compress_request_body = False
+    rest._timeout = None
+    rest._cancel_at_timeout = False
+    rest._async_requests_mode = False
+    rest._re_connect_on_session_timeout = True
+    rest._re_connect_on_remote_disconnect = False
+    rest._async_polling_initial_delay = 0.01
+    rest._async_polling_max_delay = 0.01
+    rest._async_polling_backoff_factor = 1
+    rest._connection_pool_size = 4
+    rest._verify = False
+    rest._s = _RecordingSession(responses)
+    rest.connects = 0
+
+    def connect():
+        rest.connects += 1
+
+    rest.connect = connect
+    return rest
+
+
+class TestAsyncRestService(unittest.TestCase):
+
+    def test_get_merges_headers_and_sets_encoding(self):
+        rest = _rest([_FakeResponse(200, text='{"value": []}')])
+        async_rest = AsyncRestService(rest, native=False)
+
+        response = asyncio.run(async_rest.GET("/Cubes", headers={"X-Test": "1"}))
+
+        self.assertEqual("utf-8", response.encoding)
+        call = rest._s.calls[0]
+        self.assertEqual("https://tm1.example/api/v1/Cubes", call["url"])
+        self.assertEqual("1", call["headers"]["X-Test"])
+        self.assertEqual("application/json; charset=utf-8", call["headers"]["Content-Type"])
+        async_rest.close()
+
+    def test_session_timeout_reconnects_and_retries(self):
+        rest = _rest([_FakeResponse(401), _FakeResponse(200)])
+        async_rest = AsyncRestService(rest, native=False)
+
+        asyncio.run(async_rest.POST("/Cubes", data="{}"))
+
+        self.assertEqual(1, rest.connects)
+        self.assertEqual(2, len(rest._s.calls))
+        async_rest.close()
+
+    def test_async_mode_polls_until_done(self):
+        rest = _rest(
+            [
+                _FakeResponse(202, headers={"Location": "/_async('abc')"}),
+                _FakeResponse(202),
+                _FakeResponse(200, text='{"ID": "1"}'),
+            ]
+        )
+        async_rest = AsyncRestService(rest, native=False)
+
+        response = asyncio.run(async_rest.POST("/ExecuteMDX", data="{}", async_requests_mode=True))
+
+        self.assertEqual({"ID": "1"}, response.json())
+        first, poll1, poll2 = rest._s.calls
+        self.assertEqual("respond-async,wait=55", first["headers"]["Prefer"])
+        self.assertEqual("https://tm1.example/api/v1/_async('abc')", poll1["url"])
+        self.assertNotIn("Prefer", poll2["headers"])
+        async_rest.close()
+
+    def test_return_async_id(self):
+        rest = _rest([_FakeResponse(202, headers={"Location": "/_async('xyz')"})])
+        async_rest = AsyncRestService(rest, native=False)
+
+        async_id = asyncio.run(async_rest.POST("/Processes('p')/tm1.ExecuteWithReturn", return_async_id=True))
+
+        self.assertEqual("xyz", async_id)
+        self.assertEqual("respond-async", rest._s.calls[0]["headers"]["Prefer"])
+        async_rest.close()
+
+    def test_polling_timeout_raises_tm1py_timeout(self):
+        rest = _rest([_FakeResponse(202, headers={"Location": "/_async('abc')"})] + [_FakeResponse(202)] * 10)
+        async_rest = AsyncRestService(rest, native=False)
+
+        with self.assertRaises(TM1pyTimeout):
+            asyncio.run(async_rest.POST("/ExecuteMDX", async_requests_mode=True, timeout=0.03))
+        async_rest.close()
+
+    def test_many_concurrent_requests_bounded_threads(self):
+        rest = _rest([_FakeResponse(200, text="{}") for _ in range(200)])
+        async_rest = AsyncRestService(rest, max_concurrency=3, native=False)
+
+        async def fan_out():
+            return await asyncio.gather(*[async_rest.GET(f"/Cubes('{i}')") for i in range(200)])
+
+        responses = asyncio.run(fan_out())
+
+        self.assertEqual(200, len(responses))
+        self.assertLessEqual(len(async_rest._executor._threads), 3)
+        async_rest.close()
+
+    def test_max_concurrency_enlarges_http_pool(self):
+        rest = _rest([])
+        mounts = []
+        rest._manage_http_adapter = lambda: mounts.append(rest._connection_pool_size)
+
+        async_rest = AsyncRestService(rest, max_concurrency=50, native=False)
+
+        self.assertEqual(50, async_rest.max_concurrency)
+        self.assertEqual(50, async_rest._executor._max_workers)
+        self.assertEqual([50], mounts)
+        async_rest.close()
+
+    def test_max_concurrency_keeps_larger_http_pool(self):
+        rest = _rest([])
+        rest._manage_http_adapter = lambda: self.fail("pool must not be re-mounted")
+
+        async_rest = AsyncRestService(rest, max_concurrency=2, native=False)
+
+        self.assertEqual(4, rest._connection_pool_size)
+        async_rest.close()
+
+    def test_request_hook_receives_metrics(self):
+        rest = _rest([_response(200, b'{"value": []}', elapsed=0.25)])
+        events = []
+        rest.add_request_hook(events.append)
+        async_rest = AsyncRestService(rest, native=False)
+
+        asyncio.run(async_rest.GET("/Cubes('Sales')/Views?$select=Name"))
+
+        (metrics,) = events
+        self.assertEqual("GET /Cubes('{}')/Views", metrics.endpoint)
+        self.assertEqual(200, metrics.status_code)
+        self.assertEqual(0, metrics.bytes_sent)
+        self.assertEqual(13, metrics.bytes_received)
+        self.assertEqual(0.25, metrics.time_to_first_byte)
+        self.assertGreaterEqual(metrics.latency, 0)
+        self.assertIsNone(metrics.error)
+        async_rest.close()
+
+    def test_request_hook_counts_retries_and_async_polls(self):
+        rest = _rest(
+            [
+                _response(401),
+                _response(202, headers={"Location": "/api/v1/_async('id1')"}),
+                _response(202),
+                _response(200, b"{}"),
+            ]
+        )
+        events = []
+        rest.add_request_hook(events.append)
+        async_rest = AsyncRestService(rest, native=False)
+
+        asyncio.run(async_rest.POST("/Processes('p')/tm1.ExecuteWithReturn", data="{}", async_requests_mode=True))
+
+        # the polls are reported on their own and counted on the outer request
+        self.assertEqual(["GET /_async('{}')"] * 2, [metrics.endpoint for metrics in events[:2]])
+        self.assertEqual("POST /Processes('{}')/tm1.ExecuteWithReturn", events[2].endpoint)
+        self.assertEqual(1, events[2].retries)
+        self.assertEqual(2, events[2].async_polls)
+        self.assertEqual(2, events[2].bytes_sent)
+        async_rest.close()
+
+    def test_failed_request_is_reported_to_hooks(self):
+        rest = _rest([_response(404, b"not found")])
+        events = []
+        rest.add_request_hook(events.append)
+        async_rest = AsyncRestService(rest, native=False)
+
+        with self.assertRaises(Exception):
+            asyncio.run(async_rest.GET("/Cubes('missing')"))
+
+        self.assertEqual("TM1pyRestException", events[0].error)
+        self.assertEqual(404, events[0].status_code)
+        async_rest.close()
+
+    def test_invalid_max_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncRestService(_rest([]), max_concurrency=-1, native=False)
+
+
+class TestAsyncServiceFacade(unittest.TestCase):
+
+    def test_fallback_runs_sync_method_on_executor(self):
+        class Service:
+            def get_names(self, prefix):
+                return [prefix + "1", prefix + "2"]
+
+        async_rest = AsyncRestService(_rest([]), native=False)
+        facade = _AsyncServiceFacade(Service(), async_rest)
+
+        self.assertEqual(["e1", "e2"], asyncio.run(facade.get_names("e")))
+        async_rest.close()
+
+    def test_native_element_names(self):
+        rest = _rest([_FakeResponse(200, text='{"value": [{"Name": "a"}, {"Name": "b"}]}')])
+        async_rest = AsyncRestService(rest, native=False)
+        elements = AsyncElementService(None, async_rest)
+
+        names = asyncio.run(elements.get_element_names("d", "h"))
+
+        self.assertEqual(["a", "b"], names)
+        self.assertIn("/Dimensions('d')/Hierarchies('h')/Elements?$select=Name", rest._s.calls[0]["url"])
+        async_rest.close()
+
+
+@unittest.skipUnless(_has_httpx, "httpx is not installed")
+class TestAsyncRestServiceNative(unittest.TestCase):
+    """native httpx transport against the MockTM1Server"""
+
+    server: MockTM1Server
+    tm1: TM1Service
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTM1Server(async_duration=0.05).start()
+        cls.server.add_dimension("Region", ["North", "South", "East"])
+        cls.server.add_dimension("Measure", ["Revenue", "Cost"])
+        cls.server.add_cube("Sales", ["Region", "Measure"])
+        cls.tm1 = TM1Service(**cls.server.connection_kwargs)
+        cls.tm1.processes.create(Process(name="Load"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.logout()
+        cls.server.stop()
+
+    def test_native_is_default(self):
+        async_rest = AsyncRestService(self.tm1.connection)
+
+        self.assertTrue(async_rest.native)
+        async_rest.close()
+
+    def test_many_concurrent_reads_without_threads(self):
+        async def fan_out():
+            async with AsyncRestService(self.tm1.connection, max_concurrency=20) as async_rest:
+                responses = await asyncio.gather(*[async_rest.GET("/Cubes('Sales')?$select=Name") for _ in range(200)])
+                return responses, len(async_rest._executor._threads)
+
+        responses, threads = asyncio.run(fan_out())
+
+        self.assertEqual({"Sales"}, {response.json()["Name"] for response in responses})
+        self.assertEqual(0, threads)
+
+    def test_session_timeout_reconnects(self):
+        events = []
+        self.tm1.connection.add_request_hook(events.append)
+        self.addCleanup(self.tm1.connection.remove_request_hook, events.append)
+
+        async def read_twice():
+            async with AsyncRestService(self.tm1.connection) as async_rest:
+                await async_rest.GET("/Cubes('Sales')")
+                # expire the session. The requests session forgets it too, so connect starts from an empty cookie jar
+                self.server.sessions.clear()
+                self.tm1.connection._s.cookies.clear()
+                return await async_rest.GET("/Cubes('Sales')?$select=Name")
+
+        response = asyncio.run(read_twice())
+
+        self.assertEqual("Sales", response.json()["Name"])
+        self.assertEqual(1, events[-1].retries)
+        # the sync transport picks up the new session too
+        self.assertEqual(["Sales"], self.tm1.cubes.get_all_names())
+
+    def test_async_requests_mode_polls(self):
+        async def execute():
+            async with AsyncRestService(self.tm1.connection) as async_rest:
+                return await async_rest.POST(
+                    "/Processes('Load')/tm1.ExecuteWithReturn", data="{}", async_requests_mode=True
+                )
+
+        response = asyncio.run(execute())
+
+        self.assertEqual("CompletedSuccessfully", response.json()["ProcessExecuteStatusCode"])
+
+    def test_async_tm1_service(self):
+        async def read():
+            async with AsyncTM1Service(tm1=self.tm1) as tm1:
+                self.assertTrue(tm1.connection.native)
+                return await tm1.elements.get_element_names("Region", "Region")
+
+        self.assertEqual(["North", "South", "East"], asyncio.run(read()))
+
+    def test_falls_back_to_executor_with_proxies(self):
+        rest = _rest([])
+        rest._s.proxies = {"https": "http://proxy:8080"}
+
+        self.assertFalse(AsyncRestService(rest).native)
+        with self.assertRaises(ValueError):
+            AsyncRestService(rest, native=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
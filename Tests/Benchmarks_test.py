@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import runner
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_parse_size(self):
+        self.assertEqual(10_000, runner.parse_size("10k"))
+        self.assertEqual(1_000_000, runner.parse_size("1M"))
+        self.assertEqual(2_500_000, runner.parse_size("2.5m"))
+        self.assertEqual(250, runner.parse_size("250"))
+
+    def test_all_benchmarks_run(self):
+        benchmarks = runner.select()
+        self.assertGreaterEqual(len(benchmarks), 11)
+
+        results = runner.run(benchmarks, sizes=["100"], repeat=1)
+        self.assertEqual({bench.name for bench in benchmarks}, set(results))
+        for name, sizes in results.items():
+            self.assertGreater(sizes["100"]["median"], 0, name)
+
+    def test_select(self):
+        names = [bench.name for bench in runner.select("execute_mdx_csv")]
+        self.assertEqual(
+            [
+                "cells.execute_mdx_csv[default]",
+                "cells.execute_mdx_csv[iterative_json]",
+                "cells.execute_mdx_csv[compact_json]",
+            ],
+            names,
+        )
+
+    def test_save_and_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file = os.path.join(directory, "2.3.1.json")
+            runner.save_results({"cells.a": {"10k": {"median": 1.0}}}, file)
+            runner.save_results({"cells.b": {"10k": {"median": 2.0}}}, file)
+            with open(file) as f:
+                stored = json.load(f)
+            self.assertIn("tm1py", stored["environment"])
+            self.assertEqual({"cells.a", "cells.b"}, set(stored["results"]))
+
+            results = {"cells.a": {"10k": {"median": 1.1}}, "cells.b": {"10k": {"median": 3.0}}}
+            comparison = runner.compare(results, runner.load_results(file)["results"], tolerance=0.2)
+            self.assertEqual(
+                [("cells.a", "10k", 1.0, 1.1, False), ("cells.b", "10k", 2.0, 3.0, True)],
+                [(name, size, before, after, regression) for name, size, before, after, _, regression in comparison],
+            )
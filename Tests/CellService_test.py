@@ -1,7 +1,15 @@
 import configparser
+import csv
+import json
+import re
+import threading
+import time
 import unittest
+from io import BytesIO, StringIO
 from pathlib import Path
+from unittest.mock import patch
 
+import urllib3
 from mdxpy import (
     CalculatedMember,
     DimensionProperty,
@@ -9,6 +17,7 @@ from mdxpy import (
     MdxHierarchySet,
     Member,
 )
+from requests import Response
 
 from TM1py import Sandbox
 from TM1py.Exceptions.Exceptions import (
@@ -27,9 +36,14 @@ from TM1py.Objects import (
     Hierarchy,
     MDXView,
     NativeView,
+    Process,
 )
-from TM1py.Services import TM1Service
+from TM1py.Services import CellService, TM1Service
+from TM1py.Services.FileService import FileService
+from TM1py.Services.ProcessService import ProcessService
+from TM1py.Services.TM1SessionPool import TM1SessionPool
 from TM1py.Utils import (
+    AdaptiveWriteController,
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveTuplesDict,
     Utils,
@@ -37,6 +51,7 @@ from TM1py.Utils import (
     verify_version,
 )
 
+from .MockTM1Server import MockTM1Server
 from .Utils import (
     skip_if_no_pandas,
     skip_if_version_higher_or_equal_than,
@@ -5435,5 +5450,1080 @@ class TestCellService(unittest.TestCase):
         cls.tm1.logout()
 
 
+class _StreamingRest:
+    """Serves canned JSON bodies by URL fragment. Responses are streamable like requests' stream=True"""
+
+    version = "11.8.0"
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    @staticmethod
+    def _response(body: dict) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.raw = urllib3.HTTPResponse(body=BytesIO(json.dumps(body).encode("utf-8")), preload_content=False)
+        return response
+
+    def GET(self, url, stream=False, **kwargs):
+        self.calls.append(("GET", url, stream))
+        for fragment, body in self.routes:
+            if fragment in url:
+                return self._response(body)
+        raise AssertionError(f"unexpected url: {url}")
+
+    def DELETE(self, url, **kwargs):
+        self.calls.append(("DELETE", url, False))
+
+
+class TestCellServiceStreaming(unittest.TestCase):
+    @staticmethod
+    def _cell_service(routes) -> CellService:
+        cell_service = object.__new__(CellService)
+        cell_service._rest = _StreamingRest(routes)
+        return cell_service
+
+    @staticmethod
+    def _tuples(*names):
+        return {"Axes": [{"Tuples": [{"Members": [{"Name": name}]} for name in names]}]}
+
+    def test_iter_cellset_cells_pages_and_windows(self):
+        cells_page_1 = {"Cells": [{"Ordinal": 0, "Value": 1.0}, {"Ordinal": 3, "Value": 2.5}]}
+        cells_page_2 = {"Cells": [{"Ordinal": 5, "Value": "x"}]}
+        cell_service = self._cell_service(
+            [
+                (
+                    "$select=Ordinal,Cardinality",
+                    {"Axes": [{"Ordinal": 0, "Cardinality": 2}, {"Ordinal": 1, "Cardinality": 3}]},
+                ),
+                ("Ordinal eq 0", self._tuples("c1", "c2")),
+                ("Ordinal eq 1;$expand=Tuples($expand=Members($select=Name);$top=2))", self._tuples("r1", "r2")),
+                ("Ordinal eq 1;$expand=Tuples($expand=Members($select=Name);$top=2;$skip=2))", self._tuples("r3")),
+                ("$top=2;$skip=2)", cells_page_2),
+                ("$top=2)", cells_page_1),
+            ]
+        )
+
+        cells = list(cell_service.iter_cellset_cells("abc", chunk_size=2))
+
+        self.assertEqual([(("r1", "c1"), 1.0), (("r2", "c2"), 2.5), (("r3", "c2"), "x")], cells)
+        self.assertTrue(all(stream for method, url, stream in cell_service._rest.calls if "Tuples" in url))
+        self.assertEqual("DELETE", cell_service._rest.calls[-1][0])
+
+    def test_iter_cellset_cells_columns_only(self):
+        cell_service = self._cell_service(
+            [
+                ("$select=Ordinal,Cardinality", {"Axes": [{"Ordinal": 0, "Cardinality": 2}]}),
+                ("Ordinal eq 0", self._tuples("c1", "c2")),
+                ("$expand=Cells", {"Cells": [{"Ordinal": 0, "Value": 1}, {"Ordinal": 1, "Value": None}]}),
+            ]
+        )
+
+        cells = list(cell_service.iter_cellset_cells("abc", chunk_size=10, delete_cellset=False))
+
+        self.assertEqual([(("c1",), 1), (("c2",), None)], cells)
+        self.assertNotIn("DELETE", [method for method, _, _ in cell_service._rest.calls])
+
+    def test_iter_cellset_cells_invalid_chunk_size(self):
+        cell_service = self._cell_service([])
+        with self.assertRaises(ValueError):
+            list(cell_service.iter_cellset_cells("abc", chunk_size=0, delete_cellset=False))
+
+
+class _PartitionedRest(_StreamingRest):
+    """Serves a dense columns x rows cellset. Honors $top / $skip on cells and axis tuples"""
+
+    def __init__(self, columns, rows):
+        super().__init__(routes=[])
+        self.columns = columns
+        self.rows = rows
+        self.cells = [{"Value": float(ordinal + 1), "Ordinal": ordinal} for ordinal in range(len(columns) * len(rows))]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _slice(items, url):
+        top = re.search(r"\$top=(\d+)", url)
+        skip = re.search(r"\$skip=(\d+)", url)
+        start = int(skip.group(1)) if skip else 0
+        return items[start : start + int(top.group(1))] if top else items[start:]
+
+    def GET(self, url, stream=False, **kwargs):
+        with self._lock:
+            self.calls.append(("GET", url, stream))
+        if "/Cells/$count" in url:
+            return self._response(len(self.cells))
+        if "Axes($select=Ordinal,Cardinality)" in url:
+            return self._response(
+                {
+                    "Axes": [
+                        {"Ordinal": 0, "Cardinality": len(self.columns)},
+                        {"Ordinal": 1, "Cardinality": len(self.rows)},
+                    ]
+                }
+            )
+        if "Axes($expand=Hierarchies" in url:
+            return self._response(
+                {
+                    "Cube": {"Name": "c"},
+                    "Axes": [
+                        {"Hierarchies": [{"UniqueName": "[d2].[d2]"}]},
+                        {"Hierarchies": [{"UniqueName": "[d1].[d1]"}]},
+                    ],
+                }
+            )
+        if "Cube($select=Name;$expand=Dimensions" in url:
+            return self._response({"Cube": {"Name": "c", "Dimensions": [{"Name": "d1"}, {"Name": "d2"}]}})
+        if "Ordinal eq 0" in url or "Ordinal eq 1" in url:
+            names = self.columns if "Ordinal eq 0" in url else self.rows
+            tuples = [{"Members": [{"Name": name, "Element": {"Name": name}}]} for name in names]
+            return self._response({"Axes": [{"Tuples": self._slice(tuples, url)}]})
+        if "Cells($select=" in url:
+            cells = [cell for cell in self.cells if cell["Value"]] if "Value ne 0" in url else self.cells
+            return self._response({"Cells": self._slice(cells, url)})
+        raise AssertionError(f"unexpected url: {url}")
+
+
+class TestCellServiceParallelRead(unittest.TestCase):
+    @staticmethod
+    def _cell_service(rest) -> CellService:
+        cell_service = object.__new__(CellService)
+        cell_service._rest = rest
+        return cell_service
+
+    def test_plan_partitions(self):
+        self.assertEqual([], CellService._plan_partitions(0, 4, 10))
+        self.assertEqual([(0, 10)], CellService._plan_partitions(10, 4, 100))
+        self.assertEqual(
+            [(0, 3), (3, 3), (6, 3), (9, 1)], CellService._plan_partitions(10, 4, 100, min_partition_size=1)
+        )
+        # never larger than max_partition_size, even if that requires more partitions than workers
+        self.assertEqual(5, len(CellService._plan_partitions(10, 2, 2, min_partition_size=1)))
+
+    def test_extract_cellset_raw_parallel_merges_in_ordinal_order(self):
+        rest = _PartitionedRest(columns=["c1", "c2", "c3"], rows=[f"r{i}" for i in range(7)])
+        cell_service = self._cell_service(rest)
+
+        # 96 bytes per request => 2 cells (Value, Ordinal) and 1 tuple per request
+        raw = cell_service.extract_cellset_raw_parallel(
+            "abc", max_workers=4, target_bytes_per_request=96, skip_contexts=True, delete_cellset=False
+        )
+
+        self.assertEqual(list(range(21)), [cell["Ordinal"] for cell in raw["Cells"]])
+        self.assertEqual(["c1", "c2", "c3"], [t["Members"][0]["Name"] for t in raw["Axes"][0]["Tuples"]])
+        self.assertEqual([f"r{i}" for i in range(7)], [t["Members"][0]["Name"] for t in raw["Axes"][1]["Tuples"]])
+        cell_requests = [url for _, url, _ in rest.calls if "Cells($select=" in url]
+        self.assertEqual(11, len(cell_requests))
+
+    def test_extract_cellset_raw_parallel_top_and_skip(self):
+        rest = _PartitionedRest(columns=["c1", "c2"], rows=["r1", "r2", "r3"])
+        cell_service = self._cell_service(rest)
+
+        raw = cell_service.extract_cellset_raw_parallel(
+            "abc", top=3, skip=2, max_workers=2, target_bytes_per_request=48, delete_cellset=False
+        )
+
+        self.assertEqual([2, 3, 4], [cell["Ordinal"] for cell in raw["Cells"]])
+
+    def test_extract_cellset_raw_parallel_sizes_filtered_reads_by_pages(self):
+        rest = _PartitionedRest(columns=["c1", "c2", "c3"], rows=[f"r{i}" for i in range(7)])
+        for cell in rest.cells:
+            cell["Value"] = cell["Value"] if cell["Ordinal"] in (4, 9, 15) else 0
+        cell_service = self._cell_service(rest)
+
+        # 96 bytes per request => 2 cells per page
+        raw = cell_service.extract_cellset_raw_parallel(
+            "abc", max_workers=4, target_bytes_per_request=96, skip_zeros=True, delete_cellset=False
+        )
+
+        self.assertEqual([4, 9, 15], [cell["Ordinal"] for cell in raw["Cells"]])
+        self.assertNotIn("/Cells/$count", " ".join(url for _, url, _ in rest.calls))
+        # one window of 4 pages instead of 11 partitions of the dense cellset
+        cell_requests = [url for _, url, _ in rest.calls if "Cells($select=" in url]
+        self.assertEqual(4, len(cell_requests))
+
+    def test_extract_cellset_raw_parallel_filtered_top_and_skip(self):
+        rest = _PartitionedRest(columns=["c1", "c2"], rows=[f"r{i}" for i in range(10)])
+        for cell in rest.cells:
+            cell["Value"] = cell["Value"] if cell["Ordinal"] % 2 else 0
+        cell_service = self._cell_service(rest)
+
+        raw = cell_service.extract_cellset_raw_parallel(
+            "abc", top=5, skip=1, max_workers=2, target_bytes_per_request=96, skip_zeros=True, delete_cellset=False
+        )
+
+        self.assertEqual([3, 5, 7, 9, 11], [cell["Ordinal"] for cell in raw["Cells"]])
+
+    def test_extract_cellset_csv_parallel_equals_serial_layout(self):
+        rest = _PartitionedRest(columns=["c1", "c2"], rows=["r1", "r2", "r3"])
+        cell_service = self._cell_service(rest)
+
+        csv = cell_service.extract_cellset_csv("abc", skip_zeros=False, max_workers=3, value_separator="~")
+
+        self.assertEqual(
+            "d1~d2~Value\r\nr1~c1~1.0\r\nr1~c2~2.0\r\nr2~c1~3.0\r\nr2~c2~4.0\r\nr3~c1~5.0\r\nr3~c2~6.0", csv
+        )
+        self.assertIn(("DELETE", "/Cellsets('abc')", False), rest.calls)
+
+    @skip_if_no_pandas
+    def test_extract_cellset_dataframe_parallel_columnar(self):
+        cell_service = self._cell_service(_PartitionedRest(columns=["c1", "c2"], rows=["r1", "r2", "r3"]))
+
+        df = cell_service.extract_cellset_dataframe("abc", max_workers=3, use_columnar=True)
+
+        self.assertEqual(["d1", "d2", "Value"], list(df.columns))
+        self.assertEqual(["r1", "r1", "r2", "r2", "r3", "r3"], df["d1"].tolist())
+        self.assertEqual([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], df["Value"].tolist())
+
+    def test_extract_cellset_dataframe_rejects_parallel_iterative_json(self):
+        cell_service = self._cell_service(_PartitionedRest(columns=["c1"], rows=["r1"]))
+
+        with self.assertRaises(ValueError):
+            cell_service.extract_cellset_dataframe("abc", use_iterative_json=True, max_workers=2)
+
+
+class TestCellServiceCellsetCache(unittest.TestCase):
+    @staticmethod
+    def _cell_service(last_data_update: list, rules: str = None, other_cubes: dict = None) -> CellService:
+        cell_service = object.__new__(CellService)
+        cell_service._rest = _PartitionedRest(columns=["c1", "c2"], rows=["r1"])
+        cell_service._cellset_cache = None
+        original_get = cell_service._rest.GET
+
+        def get(url, **kwargs):
+            if url == "/Cubes?$select=Name,LastDataUpdate":
+                cell_service._rest.calls.append(("GET", url, False))
+                cubes = {"c": last_data_update[0], **(other_cubes or {})}
+                return _PartitionedRest._response(
+                    {"value": [{"Name": name, "LastDataUpdate": update} for name, update in cubes.items()]}
+                )
+            if "LastDataUpdate" in url:
+                cell_service._rest.calls.append(("GET", url, False))
+                return _PartitionedRest._response({"LastDataUpdate": last_data_update[0], "Rules": rules})
+            return original_get(url, **kwargs)
+
+        cell_service._rest.GET = get
+        cell_service._rest.POST = lambda url, data, **kwargs: _PartitionedRest._response({"ID": "abc"})
+        return cell_service
+
+    def test_repeated_read_is_served_from_cache_until_data_changes(self):
+        last_data_update = ["2024-01-01T00:00:00Z"]
+        cell_service = self._cell_service(last_data_update)
+        cell_service.enable_cellset_cache()
+        mdx = "SELECT {[d2].[c1],[d2].[c2]} ON 0, {[d1].[r1]} ON 1 FROM [c]"
+
+        first = cell_service.execute_mdx_values(mdx)
+        requests_after_first_read = len(cell_service._rest.calls)
+        # whitespace does not matter
+        second = cell_service.execute_mdx_values(mdx.replace(" ON", "\n  ON"))
+
+        self.assertEqual([1.0, 2.0], first)
+        self.assertEqual(first, second)
+        self.assertEqual(requests_after_first_read + 1, len(cell_service._rest.calls))
+        self.assertIn("/Cubes('c')?$select=LastDataUpdate,Rules", cell_service._rest.calls[-1][1])
+        self.assertEqual(1, cell_service.cellset_cache.hits)
+
+        last_data_update[0] = "2024-01-01T00:00:01Z"
+        cell_service.execute_mdx_values(mdx)
+
+        self.assertEqual(2, cell_service.cellset_cache.misses)
+
+    def test_rule_cube_reads_are_not_cached_by_default(self):
+        cell_service = self._cell_service(["t"], rules="['c1'] = N: DB('other', !d1, 'c2');")
+        cell_service.enable_cellset_cache()
+        mdx = "SELECT {[d2].[c1],[d2].[c2]} ON 0, {[d1].[r1]} ON 1 FROM [c]"
+
+        cell_service.execute_mdx_values(mdx)
+        cell_service.execute_mdx_values(mdx)
+
+        self.assertEqual(0, cell_service.cellset_cache.hits)
+        self.assertEqual(0, len(cell_service.cellset_cache))
+
+    def test_rule_cube_reads_depend_on_every_cube(self):
+        other_cubes = {"other": "2024-01-01T00:00:00Z"}
+        cell_service = self._cell_service(["t"], rules="['c1'] = N: DB('other', !d1, 'c2');", other_cubes=other_cubes)
+        cell_service.enable_cellset_cache(cache_rule_cubes=True)
+        mdx = "SELECT {[d2].[c1],[d2].[c2]} ON 0, {[d1].[r1]} ON 1 FROM [c]"
+
+        cell_service.execute_mdx_values(mdx)
+        cell_service.execute_mdx_values(mdx)
+        self.assertEqual(1, cell_service.cellset_cache.hits)
+
+        # a write to the cube the rule reads from invalidates the cached result
+        other_cubes["other"] = "2024-01-01T00:00:01Z"
+        cell_service.execute_mdx_values(mdx)
+
+        self.assertEqual(1, cell_service.cellset_cache.hits)
+        self.assertEqual(2, cell_service.cellset_cache.misses)
+
+    def test_sandbox_reads_are_not_cached(self):
+        cell_service = self._cell_service(["t"])
+        cell_service.enable_cellset_cache()
+        mdx = "SELECT {[d2].[c1],[d2].[c2]} ON 0, {[d1].[r1]} ON 1 FROM [c]"
+
+        cell_service.execute_mdx_values(mdx, sandbox_name="s1")
+        cell_service.execute_mdx_values(mdx, sandbox_name="s1")
+
+        self.assertEqual(0, cell_service.cellset_cache.hits)
+        self.assertEqual(0, cell_service.cellset_cache.misses)
+        self.assertFalse(any("LastDataUpdate" in url for _, url, _ in cell_service._rest.calls))
+
+    def test_cache_bypassed_per_read(self):
+        cell_service = self._cell_service(["t"])
+        cell_service.enable_cellset_cache()
+        mdx = "SELECT {[d2].[c1],[d2].[c2]} ON 0, {[d1].[r1]} ON 1 FROM [c]"
+        cell_service.execute_mdx_values(mdx)
+
+        values = cell_service.execute_mdx_values(mdx, use_cellset_cache=False)
+
+        self.assertEqual([1.0, 2.0], values)
+        self.assertEqual(0, cell_service.cellset_cache.hits)
+        self.assertEqual(1, sum("LastDataUpdate" in url for _, url, _ in cell_service._rest.calls))
+
+    def test_cache_disabled_by_default(self):
+        cell_service = self._cell_service(["t"])
+        mdx = "SELECT {[d2].[c1],[d2].[c2]} ON 0, {[d1].[r1]} ON 1 FROM [c]"
+
+        cell_service.execute_mdx_values(mdx)
+
+        self.assertIsNone(cell_service.cellset_cache)
+        self.assertFalse(any("LastDataUpdate" in url for _, url, _ in cell_service._rest.calls))
+
+
+class TestCellServiceBlobCsv(unittest.TestCase):
+
+    def test_iter_blob_csv_parts_from_dict(self):
+        cells = {("a", "b"): 1.5, ("c", "d"): "line\r\nbreak"}
+
+        content = b"".join(CellService._iter_blob_csv_parts(cells))
+
+        self.assertEqual(b'"a","b","1.5"\r\n"c","d","linebreak"\r\n', content)
+
+    def test_iter_blob_csv_parts_is_lazy_and_chunked(self):
+        consumed = []
+
+        def cells():
+            for n in range(30_000):
+                consumed.append(n)
+                yield ("e", str(n)), n
+
+        parts = CellService._iter_blob_csv_parts(cells(), part_size=64 * 1024)
+        first_part = next(parts)
+
+        self.assertLess(len(consumed), 30_000)
+        self.assertTrue(first_part.startswith(b'"e","0","0"\r\n'))
+        self.assertEqual(30_000, b"".join([first_part, *parts]).count(b"\r\n"))
+
+    @skip_if_no_pandas
+    def test_iter_blob_csv_parts_from_dataframe_chunks(self):
+        chunks = [
+            pd.DataFrame({"d1": ["a"], "d2": ["b"], "Value": [1.0]}),
+            pd.DataFrame({"d1": ["c"], "d2": ["d"], "Value": [2.5]}),
+        ]
+
+        content = b"".join(CellService._iter_blob_csv_parts(chunks))
+
+        self.assertEqual(b'"a","b","1.0"\r\n"c","d","2.5"\r\n', content)
+
+    @skip_if_no_pandas
+    def test_iter_blob_csv_parts_dataframe_matches_csv_writer(self):
+        df = pd.DataFrame(
+            {
+                "d1": ['quote"d', None, "c", "c"],
+                "d2": [1, 2, 3, 3],
+                "Value": ["multi\r\nline", None, 0.1 + 0.2, float("nan")],
+            }
+        )
+        buffer = StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_ALL).writerows(
+            row[:-1] + (row[-1].replace("\r\n", "") if isinstance(row[-1], str) else row[-1],)
+            for row in df.itertuples(index=False, name=None)
+        )
+
+        content = b"".join(CellService._iter_blob_csv_parts([df]))
+
+        self.assertEqual(buffer.getvalue().encode("utf-8"), content)
+
+    @skip_if_no_pandas
+    def test_iter_blob_csv_parts_slices_large_dataframes(self):
+        df = pd.DataFrame({"d1": [f"e{n}" for n in range(1_000)], "Value": [float(n) for n in range(1_000)]})
+
+        parts = list(CellService._iter_blob_csv_parts([df], part_size=1024, frame_slice_size=100))
+
+        self.assertEqual(10, len(parts))
+        self.assertEqual(b'"e0","0.0"\r\n', parts[0][:12])
+        self.assertEqual(1_000, b"".join(parts).count(b"\r\n"))
+
+    @staticmethod
+    def decode_compact(content: bytes, dimensions: int) -> list:
+        """what the TI of the compact layout does: empty element names are taken from the row above"""
+        rows, previous = [], [""] * dimensions
+        for row in csv.reader(StringIO(content.decode("utf-8"))):
+            previous = [element or before for element, before in zip(row[:dimensions], previous)]
+            rows.append(previous + row[dimensions:])
+        return rows
+
+    def test_iter_blob_csv_parts_compact(self):
+        cells = {("a", "x"): 1.5, ("a", "y"): 'q,"t"\r\n', ("b", "y"): None, (" c", "y"): 2}
+
+        content = b"".join(CellService._iter_blob_csv_parts(cells, compact=True))
+
+        self.assertEqual(b'a,x,1.5\r\n,y,"q,""t"""\r\nb,,\r\n" c",,2\r\n', content)
+        self.assertEqual(
+            [["a", "x", "1.5"], ["a", "y", 'q,"t"'], ["b", "y", ""], [" c", "y", "2"]],
+            self.decode_compact(content, 2),
+        )
+
+    @skip_if_no_pandas
+    def test_iter_blob_csv_parts_compact_dataframe(self):
+        df = pd.DataFrame(
+            {
+                "d1": ["a"] * 6 + ["b"] * 6,
+                "d2": ["x", "x", "y", "y", "z", "z"] * 2,
+                "d3": ["m1", "m2"] * 6,
+                "Value": [1.0, "s", 2.5, None, 3.0, 4.0] * 2,
+            }
+        )
+
+        compact = b"".join(CellService._iter_blob_csv_parts([df], compact=True, frame_slice_size=5))
+        default = b"".join(CellService._iter_blob_csv_parts([df]))
+
+        self.assertEqual([row for row in csv.reader(StringIO(default.decode()))], self.decode_compact(compact, 3))
+        self.assertLess(len(compact), len(default) * 0.6)
+        # same layout as for dicts, except that every frame slice starts with a complete row
+        cells = [(row[:-1], row[-1]) for row in df.itertuples(index=False, name=None)]
+        self.assertEqual(
+            b"".join(CellService._iter_blob_csv_parts(cells[:5], compact=True))
+            + b"".join(CellService._iter_blob_csv_parts(cells[5:10], compact=True))
+            + b"".join(CellService._iter_blob_csv_parts(cells[10:], compact=True)),
+            compact,
+        )
+
+    @skip_if_no_pandas
+    def test_iter_blob_csv_parts_compact_rejects_empty_elements(self):
+        with self.assertRaises(ValueError):
+            b"".join(CellService._iter_blob_csv_parts({("a", ""): 1}, compact=True))
+        with self.assertRaises(ValueError):
+            b"".join(CellService._iter_blob_csv_parts([pd.DataFrame({"d": ["a", None], "v": [1, 2]})], compact=True))
+
+
+class _AdminRest:
+    version = "12.0.0"
+    session_id = "session"
+    is_data_admin = True
+    is_ops_admin = True
+    sandboxing_disabled = True
+
+
+class TestCellServiceWritePipeline(unittest.TestCase):
+    def setUp(self):
+        self.cell_service = object.__new__(CellService)
+        self.cell_service._rest = _AdminRest()
+        self.blobs = {}
+        self.deleted = []
+        self.executed = []
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.release_execution = threading.Event()
+        self.release_execution.set()
+        self.status_by_blob = {}
+        self.sessions = []
+
+        def create(file_service, file_name, file_content, **kwargs):
+            with self.lock:
+                self.blobs[file_name] = file_content
+
+        def delete(file_service, file_name, **kwargs):
+            with self.lock:
+                self.deleted.append(file_name)
+
+        def execute_process_with_return(process_service, process, **kwargs):
+            with self.lock:
+                self.sessions.append(process_service._rest)
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            self.release_execution.wait()
+            with self.lock:
+                self.running -= 1
+                self.executed.append(process.datasource_data_source_name_for_server)
+            content = self.blobs[process.datasource_data_source_name_for_server]
+            status = self.status_by_blob.get(content.split(b",")[0], "CompletedSuccessfully")
+            if isinstance(status, Exception):
+                raise status
+            return status == "CompletedSuccessfully", status, "log.txt" if status != "CompletedSuccessfully" else None
+
+        for target, name, function in (
+            (FileService, "create", create),
+            (FileService, "delete", delete),
+            (ProcessService, "execute_process_with_return", execute_process_with_return),
+        ):
+            patcher = patch.object(target, name, function)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_write_async_loads_every_slice_and_removes_blobs(self):
+        cells = {("e" + str(n), "m"): n for n in range(10)}
+
+        self.cell_service.write_async("c", cells, slice_size=3, max_workers=2, dimensions=["d", "Measure"])
+
+        self.assertEqual(4, len(self.executed))
+        self.assertLessEqual(self.max_running, 2)
+        self.assertCountEqual(self.blobs, self.deleted)
+        self.assertEqual(10, b"".join(self.blobs.values()).count(b"\r\n"))
+
+    def test_write_async_spreads_processes_over_session_pool(self):
+        class _Pool(TM1SessionPool):
+            def _create_session(pool):
+                return _AdminRest()
+
+        pool = _Pool(size=2)
+        cells = {("e" + str(n), "m"): n for n in range(10)}
+
+        self.cell_service.write_async(
+            "c", cells, slice_size=3, max_workers=2, dimensions=["d", "Measure"], session_pool=pool
+        )
+
+        self.assertEqual(4, len(self.sessions))
+        self.assertNotIn(self.cell_service._rest, self.sessions)
+        self.assertLessEqual(len(set(map(id, self.sessions))), 2)
+        self.assertEqual(0, pool.in_use)
+
+    def test_write_async_merges_failures(self):
+        self.status_by_blob = {b'"e0"': "HasMinorErrors", b'"e6"': "Aborted"}
+        cells = {("e" + str(n), "m"): n for n in range(9)}
+
+        with self.assertRaises(TM1pyWritePartialFailureException) as context:
+            self.cell_service.write_async("c", cells, slice_size=3, dimensions=["d", "Measure"])
+
+        self.assertCountEqual(["HasMinorErrors", "Aborted"], context.exception.statuses)
+        self.assertEqual(2, context.exception.attempts)
+        self.assertEqual(3, len(self.deleted))
+
+    def test_pipeline_applies_backpressure(self):
+        self.release_execution.clear()
+        self.addCleanup(self.release_execution.set)
+        pulled = []
+
+        def chunks():
+            for n in range(100):
+                pulled.append(n)
+                yield {(str(n), "m"): n}
+
+        writer = threading.Thread(
+            target=self.cell_service._write_through_blob_pipeline,
+            kwargs=dict(
+                cube_name="c",
+                chunks=chunks(),
+                dimensions=["d", "Measure"],
+                encode_workers=1,
+                upload_workers=1,
+                execute_workers=2,
+            ),
+            daemon=True,
+        )
+        writer.start()
+        for _ in range(500):
+            if self.running == 2:
+                break
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.1)
+
+        # 1 encode + 1 upload + 2 * 2 execute slots, plus the chunk waiting for a free slot
+        self.assertLessEqual(len(pulled), 7)
+        self.assertEqual(2, self.max_running)
+
+        self.release_execution.set()
+        writer.join()
+        self.assertEqual(100, len(self.executed))
+
+    def test_pipeline_stops_after_hard_error(self):
+        self.status_by_blob = {b'"0"': TM1pyRestException("Not Found", 404, "Not Found", {})}
+        pulled = []
+
+        def chunks():
+            for n in range(100):
+                pulled.append(n)
+                yield {(str(n), "m"): n}
+
+        with self.assertRaises(TM1pyRestException):
+            self.cell_service._write_through_blob_pipeline(
+                cube_name="c",
+                chunks=chunks(),
+                dimensions=["d", "Measure"],
+                encode_workers=1,
+                upload_workers=1,
+                execute_workers=2,
+            )
+
+        # only the chunks in flight when the error occurred are written
+        self.assertLessEqual(len(pulled), 7)
+        self.assertCountEqual(self.blobs, self.deleted)
+
+    def test_pipeline_continues_after_write_failure(self):
+        self.status_by_blob = {b'"0"': "Aborted"}
+
+        failures = self.cell_service._write_through_blob_pipeline(
+            cube_name="c",
+            chunks=({(str(n), "m"): n} for n in range(20)),
+            dimensions=["d", "Measure"],
+        )
+
+        self.assertEqual(1, len(failures))
+        self.assertEqual(20, len(self.executed))
+
+    def test_write_async_adaptive_reports_settings(self):
+        cells = {("e" + str(n), "m"): n for n in range(25_000)}
+
+        report = self.cell_service.write_async(
+            "c", cells, slice_size=10_000, max_workers=4, dimensions=["d", "Measure"], adaptive=True
+        )
+
+        self.assertEqual(25_000, report["cells"])
+        self.assertEqual(len(self.executed), report["chunks"])
+        self.assertLessEqual(self.max_running, 4)
+        self.assertGreaterEqual(report["slice_size"], 10_000)
+        self.assertIn(report["workers"], range(1, 5))
+
+    def test_adaptive_pipeline_reports_minor_errors_separately(self):
+        self.status_by_blob = {b'"0"': "HasMinorErrors", b'"1"': "Aborted"}
+        controller = AdaptiveWriteController(max_workers=2)
+        outcomes = []
+
+        def record(cells, started, finished, success, minor_errors=False):
+            outcomes.append((success, minor_errors))
+
+        controller.record = record
+
+        failures = self.cell_service._write_through_blob_pipeline(
+            cube_name="c",
+            chunks=({(str(n), "m"): n} for n in range(3)),
+            dimensions=["d", "Measure"],
+            execute_workers=1,
+            controller=controller,
+        )
+
+        self.assertEqual(2, len(failures))
+        self.assertCountEqual([(False, True), (False, False), (True, False)], outcomes)
+
+    @skip_if_no_pandas
+    def test_write_dataframe_async_through_pipeline(self):
+        df = pd.DataFrame({"d": ["a", "b", "a"], "Measure": ["m", "m", "m"], "Value": [1.0, 2.0, 3.0]})
+
+        self.cell_service.write_dataframe_async(
+            "c", df, slice_size_of_dataframe=2, increment=True, dimensions=["d", "Measure"]
+        )
+
+        self.assertCountEqual([b'"a","m","4.0"\r\n"b","m","2.0"\r\n'], [b"".join(self.blobs.values())])
+        self.assertEqual(1, len(self.executed))
+
+
+class TestCellServiceDeltaWrite(unittest.TestCase):
+    def setUp(self):
+        self.cell_service = object.__new__(CellService)
+        self.cell_service._rest = _AdminRest()
+        self.queries = []
+        self.written = []
+
+        def execute_mdx_dataframe(mdx, **kwargs):
+            self.queries.append(mdx)
+            return pd.DataFrame({"d": ["a", "b"], "Measure": ["m", "m"], "Value": [1.0, 2.0]})
+
+        self.cell_service.execute_mdx_dataframe = execute_mdx_dataframe
+        self.cell_service.write_through_cellset = lambda cube_name, cells, *args, **kwargs: self.written.append(cells)
+        self.cell_service.write_through_blob = lambda cube_name, cellset_as_dict, **kwargs: self.written.append(
+            cellset_as_dict
+        )
+
+    @skip_if_no_pandas
+    def test_write_only_changed(self):
+        cells = {("a", "m"): 1.0, ("b", "m"): 3.0, ("c", "m"): 4.0, ("d", "m"): 0}
+
+        self.cell_service.write("c", cells, dimensions=["d", "Measure"], only_changed=True)
+
+        self.assertEqual(1, len(self.queries))
+        self.assertIn("NON EMPTY", self.queries[0])
+        self.assertEqual({("b", "m"): 3.0, ("c", "m"): 4.0}, dict(self.written[0]))
+
+    @skip_if_no_pandas
+    def test_write_only_changed_skips_write_without_changes(self):
+        self.cell_service.write("c", {("A", "m"): 1.0}, dimensions=["d", "Measure"], only_changed=True)
+
+        self.assertEqual([], self.written)
+
+    @skip_if_no_pandas
+    def test_write_dataframe_only_changed_through_blob(self):
+        df = pd.DataFrame({"d": ["a", "b", "b"], "Measure": ["m", "m", "m"], "Value": [1.0, 1.0, 1.0]})
+
+        self.cell_service.write_dataframe("c", df, dimensions=["d", "Measure"], use_blob=True, only_changed=True)
+
+        # duplicates are summed before comparing: b = 2.0 is unchanged
+        self.assertEqual([], self.written)
+
+        df.loc[0, "Value"] = 7.0
+        self.cell_service.write_dataframe("c", df, dimensions=["d", "Measure"], use_blob=True, only_changed=True)
+
+        (frames,) = self.written
+        self.assertEqual([["a", "m", 7.0]], frames[0].values.tolist())
+
+    def test_only_changed_with_increment(self):
+        with self.assertRaises(ValueError):
+            self.cell_service.write(
+                "c", {("a", "m"): 1.0}, dimensions=["d", "Measure"], increment=True, only_changed=True
+            )
+
+
+class _MockSalesCubeTestCase(unittest.TestCase):
+    """Sales cube with Region and Measure dimensions on a MockTM1Server, shared by all tests of a class"""
+
+    regions = ["North", "South", "East"]
+    initial_cells = {}
+
+    server: MockTM1Server
+    tm1: TM1Service
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTM1Server().start()
+        cls.server.add_dimension("Region", cls.regions)
+        cls.server.add_dimension("Measure", ["Revenue", "Cost"])
+        cls.server.add_cube("Sales", ["Region", "Measure"])
+        cls.tm1 = TM1Service(**cls.server.connection_kwargs)
+        if cls.initial_cells:
+            cls.tm1.cells.write("Sales", cls.initial_cells)
+        cls.mdx = (
+            MdxBuilder.from_cube("Sales")
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(MdxHierarchySet.all_leaves("Region"))
+            .add_hierarchy_set_to_column_axis(MdxHierarchySet.all_leaves("Measure"))
+            .to_mdx()
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.logout()
+        cls.server.stop()
+
+
+class TestCellServiceIterMdxCells(_MockSalesCubeTestCase):
+    """Cellset lifecycle of iter_mdx_cells against the MockTM1Server"""
+
+    initial_cells = {("North", "Revenue"): 1, ("South", "Cost"): 2, ("East", "Revenue"): 3}
+
+    def test_no_cellset_before_first_next(self):
+        cells = self.tm1.cells.iter_mdx_cells(self.mdx)
+
+        self.assertEqual({}, self.server.cellsets)
+        cells.close()
+        self.assertEqual({}, self.server.cellsets)
+
+    def test_cellset_deleted_when_closed_early(self):
+        cells = self.tm1.cells.iter_mdx_cells(self.mdx, chunk_size=1)
+
+        self.assertEqual((("North", "Revenue"), 1), next(cells))
+        self.assertEqual(1, len(self.server.cellsets))
+        cells.close()
+        self.assertEqual({}, self.server.cellsets)
+
+    def test_cellset_deleted_when_exhausted(self):
+        cells = list(self.tm1.cells.iter_mdx_cells(self.mdx, chunk_size=2, skip_zeros=True))
+
+        self.assertEqual(
+            [(("North", "Revenue"), 1), (("South", "Cost"), 2), (("East", "Revenue"), 3)],
+            cells,
+        )
+        self.assertEqual({}, self.server.cellsets)
+
+    def test_cellset_deleted_on_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(self.tm1.cells.iter_mdx_cells(self.mdx, chunk_size=0))
+
+        self.assertEqual({}, self.server.cellsets)
+
+
+class TestCellServiceColumnarDataframe(_MockSalesCubeTestCase):
+    """execute_mdx_dataframe with use_columnar against the MockTM1Server"""
+
+    initial_cells = {("North", "Revenue"): 1, ("South", "Cost"): 2, ("East", "Revenue"): 3}
+
+    def test_execute_mdx_dataframe_use_columnar(self):
+        expected = self.tm1.cells.execute_mdx_dataframe(self.mdx)
+
+        df = self.tm1.cells.execute_mdx_dataframe(self.mdx, use_columnar=True)
+
+        self.assertEqual(["Region", "Measure", "Value"], list(df.columns))
+        self.assertEqual(
+            [["North", "Revenue", 1.0], ["South", "Cost", 2.0], ["East", "Revenue", 3.0]], df.values.tolist()
+        )
+        self.assertEqual(expected.values.tolist(), df.values.tolist())
+        self.assertEqual({}, self.server.cellsets)
+
+    def test_execute_mdx_dataframe_use_columnar_shaped(self):
+        expected = self.tm1.cells.execute_mdx_dataframe(self.mdx, shaped=True)
+
+        df = self.tm1.cells.execute_mdx_dataframe(self.mdx, use_columnar=True, shaped=True)
+
+        self.assertEqual(list(expected.columns), list(df.columns))
+        self.assertEqual(list(expected["Region"]), list(df["Region"]))
+        self.assertEqual([3.0, 1.0, 0.0], list(df["Revenue"]))
+
+
+class TestCellServiceBlobLoader(_MockSalesCubeTestCase):
+    """use_persistent_loader against the MockTM1Server"""
+
+    regions = ["North", "South"]
+
+    def setUp(self):
+        self.tm1.cells.delete_blob_loaders()
+        self.server.process_calls.clear()
+        self.blobs = []
+
+        def handler(process, parameters):
+            # the blob still exists while the loader runs. v11 adds the .blb extension
+            self.blobs.append(self.server.file(parameters["pFile"][: -len(".blb")]))
+
+        self.server.add_process_handler(CellService.BLOB_LOADER_PREFIX + "*", handler)
+
+    def loaders(self):
+        return [name for name in self.server.processes if name.startswith(CellService.BLOB_LOADER_PREFIX)]
+
+    def test_loader_is_installed_once_and_called_with_parameters(self):
+        cells = {("North", "Revenue"): 1.5, ("South", "Cost"): 2}
+
+        self.tm1.cells.write("Sales", cells, use_blob=True, use_persistent_loader=True)
+        self.tm1.cells.write("Sales", cells, use_blob=True, increment=True, use_persistent_loader=True)
+
+        (loader,) = self.loaders()
+        self.assertEqual([loader, loader], [call.name for call in self.server.process_calls])
+        first, second = [call.parameters for call in self.server.process_calls]
+        self.assertEqual((0, 1), (first["pIncrement"], second["pIncrement"]))
+        self.assertEqual("", first["pSandbox"])
+        self.assertTrue(first["pFile"].endswith(".csv.blb"))
+        self.assertNotEqual(first["pFile"], second["pFile"])
+        self.assertEqual(b'"North","Revenue","1.5"\r\n"South","Cost","2"\r\n', self.blobs[0])
+        self.assertIn("CellIncrementN", self.server.processes[loader]["DataProcedure"])
+
+    def test_loader_name_depends_on_cube_shape(self):
+        cells = {("North", "Revenue"): 1}
+
+        self.tm1.cells.write("Sales", cells, use_blob=True, use_persistent_loader=True)
+        self.tm1.cells.write("Sales", cells, use_blob=True, skip_non_updateable=True, use_persistent_loader=True)
+
+        self.assertEqual(2, len(self.loaders()))
+
+    def test_deleted_loader_is_reinstalled(self):
+        cells = {("North", "Revenue"): 1}
+        self.tm1.cells.write("Sales", cells, use_blob=True, use_persistent_loader=True)
+        self.tm1.processes.delete(self.loaders()[0])
+
+        self.tm1.cells.write("Sales", cells, use_blob=True, use_persistent_loader=True)
+
+        self.assertEqual(1, len(self.loaders()))
+        self.assertEqual(2, len(self.server.process_calls))
+
+    @skip_if_no_pandas
+    def test_write_dataframe_async(self):
+        df = pd.DataFrame({"Region": ["North", "South"] * 50, "Measure": "Cost", "Value": range(100)})
+
+        self.tm1.cells.write_dataframe_async(
+            "Sales", df, slice_size_of_dataframe=10, max_workers=4, increment=False, use_persistent_loader=True
+        )
+
+        self.assertEqual(1, len(self.loaders()))
+        self.assertEqual(10, len(self.server.process_calls))
+        self.assertEqual({0}, {call.parameters["pIncrement"] for call in self.server.process_calls})
+
+    @skip_if_no_pandas
+    def test_write_dataframe_increment_without_summing_duplicates(self):
+        df = pd.DataFrame({"Region": ["North", "NOR TH", "South"], "Measure": "Revenue", "Value": [1.0, 2.0, 3.0]})
+
+        self.tm1.cells.write_dataframe(
+            "Sales", df, use_blob=True, increment=True, sum_numeric_duplicates=False, use_persistent_loader=True
+        )
+
+        # like the dict path: one value per intersection, the last one wins
+        self.assertEqual([b'"NOR TH","Revenue","2.0"\r\n"South","Revenue","3.0"\r\n'], self.blobs)
+
+    def test_delete_blob_loaders(self):
+        self.tm1.cells.write("Sales", {("North", "Revenue"): 1}, use_blob=True, use_persistent_loader=True)
+
+        deleted = self.tm1.cells.delete_blob_loaders()
+
+        self.assertEqual(1, len(deleted))
+        self.assertEqual([], self.loaders())
+
+    def test_compact_blob(self):
+        cells = {("North", "Revenue"): 1, ("North", "Cost"): 2}
+
+        self.tm1.cells.write("Sales", cells, use_blob=True, use_compact_blob=True)
+        self.tm1.cells.write("Sales", cells, use_blob=True, use_compact_blob=True, use_persistent_loader=True)
+
+        unbound, persistent = [call.process for call in self.server.process_calls]
+        for process in (unbound, persistent):
+            self.assertIn("sPrevious2 = '';", process["PrologProcedure"])
+            self.assertIn("v1 = sPrevious1;", process["DataProcedure"])
+        # blob as read by the persistent loader
+        self.assertEqual([b"North,Revenue,1\r\n,Cost,2\r\n"], self.blobs)
+
+    def test_persistent_loader_requires_blob(self):
+        with self.assertRaises(ValueError):
+            self.tm1.cells.write("Sales", {("North", "Revenue"): 1}, use_persistent_loader=True)
+
+
+class TestCellServiceUnboundProcessWrite(_MockSalesCubeTestCase):
+    """write_through_unbound_process against the MockTM1Server"""
+
+    regions = [f"R'{i}" for i in range(20)]
+
+    def setUp(self):
+        self.server.process_calls.clear()
+        self.lock = threading.Lock()
+        self.executions = 0
+        self.statuses = {}
+        self.server.add_process_handler("*", self.handler)
+        self.measures = {"Revenue": "Numeric", "Cost": "Numeric"}
+
+    def handler(self, process, parameters):
+        with self.lock:
+            self.executions += 1
+            execution = self.executions
+        return self.statuses.get(execution)
+
+    def written(self):
+        statements = []
+        for call in self.server.process_calls:
+            for procedure in (call.prolog, call.process["EpilogProcedure"]):
+                statements += re.findall(r"CellPutN\(.*?\);", procedure)
+        return statements
+
+    def cells(self, count: int):
+        return {(f"R'{i % 20}", ("Revenue", "Cost")[i // 20]): float(i) for i in range(count)}
+
+    def test_statements_are_cut_into_processes(self):
+        with patch.object(Process, "max_statements", lambda version: 5):
+            self.tm1.cells.write_through_unbound_process(
+                "Sales", self.cells(23), measure_dimension_elements=self.measures
+            )
+
+        self.assertEqual(3, len(self.server.process_calls))
+        self.assertEqual(5, self.server.process_calls[0].process["EpilogProcedure"].count("CellPutN"))
+        self.assertEqual(
+            [f"CellPutN({i}.0,'Sales','R''{i % 20}','{('Revenue', 'Cost')[i // 20]}');" for i in range(23)],
+            self.written(),
+        )
+
+    def test_parallel_on_pooled_sessions(self):
+        execute = self.tm1.cells._execute_write_statements
+        connections = set()
+
+        def record(statements, enable_sandbox, kwargs, rest=None):
+            # batches are sent on the sessions of the pool, not on the connection of the service
+            connections.add(id(rest))
+            time.sleep(0.05)
+            return execute(statements, enable_sandbox, kwargs, rest)
+
+        pool = TM1SessionPool(size=3, **self.server.connection_kwargs)
+        try:
+            with patch.object(Process, "max_statements", lambda version: 2), patch.object(
+                self.tm1.cells, "_execute_write_statements", side_effect=record
+            ):
+                self.tm1.cells.write_through_unbound_process(
+                    "Sales", self.cells(40), measure_dimension_elements=self.measures, max_workers=3, session_pool=pool
+                )
+        finally:
+            pool.close()
+
+        self.assertEqual(10, len(self.server.process_calls))
+        self.assertEqual(3, len(connections))
+        self.assertNotIn(id(self.tm1.cells._rest), connections)
+        self.assertEqual(40, len(set(self.written())))
+
+    def test_statements_are_built_lazily(self):
+        consumed = []
+
+        def cells():
+            for coordinates, value in self.cells(40).items():
+                consumed.append(coordinates)
+                yield coordinates, value
+
+        first_call = []
+        self.server.add_process_handler("*", lambda process, parameters: first_call.append(len(consumed)) or None)
+        with patch.object(Process, "max_statements", lambda version: 5):
+            self.tm1.cells.write_through_unbound_process("Sales", cells(), measure_dimension_elements=self.measures)
+
+        self.assertEqual(4, len(self.server.process_calls))
+        self.assertLessEqual(first_call[0], 11)
+
+    def test_parallel_batches_in_memory_are_bounded(self):
+        execute = self.tm1.cells._execute_write_statements
+        consumed = []
+        done = []
+        in_memory = []
+
+        def cells():
+            for coordinates, value in self.cells(40).items():
+                consumed.append(coordinates)
+                yield coordinates, value
+
+        def record(statements, enable_sandbox, kwargs, rest=None):
+            with self.lock:
+                # batches of 2 statements built so far, minus the batches already written
+                in_memory.append(-(-len(consumed) // 2) - len(done))
+            time.sleep(0.02)
+            result = execute(statements, enable_sandbox, kwargs, rest)
+            with self.lock:
+                done.append(statements)
+            return result
+
+        with patch.object(Process, "max_statements", lambda version: 1), patch.object(
+            self.tm1.cells, "_execute_write_statements", side_effect=record
+        ):
+            self.tm1.cells.write_through_unbound_process(
+                "Sales", cells(), measure_dimension_elements=self.measures, max_workers=2
+            )
+
+        self.assertEqual(20, len(self.server.process_calls))
+        self.assertLessEqual(max(in_memory), 2)
+
+    def test_parallel_stops_submitting_after_error(self):
+        calls = []
+
+        def fail_first(statements, enable_sandbox, kwargs, rest=None):
+            with self.lock:
+                calls.append(statements)
+                first = len(calls) == 1
+            if first:
+                raise TM1pyException("Connection lost")
+            time.sleep(0.1)
+            return True, "CompletedSuccessfully", None
+
+        with patch.object(Process, "max_statements", lambda version: 1), patch.object(
+            self.tm1.cells, "_execute_write_statements", side_effect=fail_first
+        ):
+            with self.assertRaises(TM1pyException):
+                self.tm1.cells.write_through_unbound_process(
+                    "Sales", self.cells(40), measure_dimension_elements=self.measures, max_workers=2
+                )
+
+        self.assertLessEqual(len(calls), 2)
+
+    def test_partial_failure(self):
+        self.statuses = {2: "HasMinorErrors"}
+
+        with patch.object(Process, "max_statements", lambda version: 5):
+            with self.assertRaises(TM1pyWritePartialFailureException) as context:
+                self.tm1.cells.write_through_unbound_process(
+                    "Sales", self.cells(30), measure_dimension_elements=self.measures, max_workers=2
+                )
+
+        self.assertEqual(["HasMinorErrors"], context.exception.statuses)
+        self.assertEqual(3, context.exception.attempts)
+
+    def test_no_cells(self):
+        self.tm1.cells.write_through_unbound_process("Sales", {}, measure_dimension_elements=self.measures)
+
+        self.assertEqual([], self.server.process_calls)
+
+
 if __name__ == "__main__":
     unittest.main()
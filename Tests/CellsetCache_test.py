@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+from TM1py.Utils import CellsetCache
+
+
+class TestCellsetCache(unittest.TestCase):
+
+    def test_get_put(self):
+        cache = CellsetCache()
+        cache.put("k", {"a": [1, 2]})
+
+        self.assertEqual({"a": [1, 2]}, cache.get("k"))
+        self.assertIsNone(cache.get("other"))
+        self.assertEqual({"entries": 1, "size_bytes": cache.size_bytes, "hits": 1, "misses": 1}, cache.statistics())
+
+    def test_hits_are_copies(self):
+        cache = CellsetCache()
+        cache.put("k", {"a": [1, 2]})
+
+        cache.get("k")["a"].append(3)
+
+        self.assertEqual({"a": [1, 2]}, cache.get("k"))
+
+    def test_lru_eviction_by_size(self):
+        cache = CellsetCache(max_bytes=250)
+        cache.put("a", "x" * 100)
+        cache.put("b", "y" * 100)
+        # touch a, so b is least recently used
+        cache.get("a")
+        cache.put("c", "z" * 100)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertLessEqual(cache.size_bytes, 250)
+
+    def test_oversized_entry_is_not_cached(self):
+        cache = CellsetCache(max_bytes=50)
+        cache.put("a", "x" * 10)
+        cache.put("big", "x" * 100)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("big", cache)
+
+    def test_make_key_is_stable(self):
+        self.assertEqual(
+            CellsetCache.make_key("f", [("mdx", "SELECT")], "t1"), CellsetCache.make_key("f", [("mdx", "SELECT")], "t1")
+        )
+        self.assertNotEqual(CellsetCache.make_key("f", "t1"), CellsetCache.make_key("f", "t2"))
+
+    def test_disk_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            CellsetCache(directory=directory).put("k", [1.0, 2.0])
+
+            cache = CellsetCache(directory=directory)
+            self.assertEqual([1.0, 2.0], cache.get("k"))
+
+            cache.clear()
+            self.assertEqual([], os.listdir(directory))
+            self.assertIsNone(cache.get("k"))
+
+    def test_invalid_max_bytes(self):
+        with self.assertRaises(ValueError):
+            CellsetCache(max_bytes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
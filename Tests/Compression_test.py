@@ -0,0 +1,79 @@
+import gzip
+import unittest
+import zlib
+from io import BytesIO
+
+import ijson
+import urllib3
+
+from TM1py.Utils.Compression import ContentDecodingReader
+
+
+def _raw(body: bytes) -> urllib3.HTTPResponse:
+    return urllib3.HTTPResponse(body=BytesIO(body), preload_content=False, decode_content=False)
+
+
+class TestContentDecodingReader(unittest.TestCase):
+    body = b'{"Cells": [' + b",".join(b'{"Ordinal": %d, "Value": %d}' % (n, n * 2) for n in range(5000)) + b"]}"
+
+    def test_identity(self):
+        reader = ContentDecodingReader(_raw(self.body))
+
+        self.assertEqual(self.body, reader.read())
+        self.assertEqual(len(self.body), reader.compressed_bytes)
+        self.assertEqual(len(self.body), reader.uncompressed_bytes)
+
+    def test_gzip(self):
+        compressed = gzip.compress(self.body)
+        reader = ContentDecodingReader(_raw(compressed), "gzip", chunk_size=1024)
+
+        self.assertEqual(self.body, reader.read())
+        self.assertEqual(len(compressed), reader.compressed_bytes)
+        self.assertEqual(len(self.body), reader.uncompressed_bytes)
+        self.assertGreater(reader.compression_ratio, 1)
+
+    def test_gzip_multiple_members(self):
+        reader = ContentDecodingReader(_raw(gzip.compress(b"abc") + gzip.compress(b"def")), "gzip")
+
+        self.assertEqual(b"abcdef", reader.read())
+
+    def test_deflate_zlib_wrapped(self):
+        reader = ContentDecodingReader(_raw(zlib.compress(self.body)), "deflate", chunk_size=512)
+
+        self.assertEqual(self.body, reader.read())
+
+    def test_deflate_raw(self):
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        compressed = compressor.compress(self.body) + compressor.flush()
+        reader = ContentDecodingReader(_raw(compressed), "deflate", chunk_size=512)
+
+        self.assertEqual(self.body, reader.read())
+
+    def test_small_reads(self):
+        reader = ContentDecodingReader(_raw(gzip.compress(self.body)), "gzip", chunk_size=100)
+
+        chunks = []
+        while True:
+            chunk = reader.read(7)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        self.assertEqual(self.body, b"".join(chunks))
+
+    def test_ijson(self):
+        reader = ContentDecodingReader(_raw(gzip.compress(self.body)), "gzip", chunk_size=1024)
+
+        cells = list(ijson.items(reader, "Cells.item"))
+
+        self.assertEqual(5000, len(cells))
+        self.assertEqual({"Ordinal": 4999, "Value": 9998}, cells[-1])
+
+    def test_unknown_encoding_is_passed_through(self):
+        reader = ContentDecodingReader(_raw(b"abc"), "unknown")
+
+        self.assertEqual(b"abc", reader.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,15 @@
 import configparser
+import json
 import unittest
+from io import BytesIO
 from pathlib import Path
 
 from TM1py import TM1Service
 from TM1py.Exceptions import TM1pyVersionException
+from TM1py.Services.FileService import FileService, _ReplayableChunks
+from TM1py.Services.RestService import RestService
 
+from .MockTM1Server import MockTM1Server
 from .Utils import (
     skip_if_version_higher_or_equal_than,
     skip_if_version_lower_than,
@@ -284,3 +289,174 @@ class TestFileService(unittest.TestCase):
         if self.tm1.files.exists(self.NESTED_FOLDER_PATH.parts[0]):
             self.tm1.files.delete(self.NESTED_FOLDER_PATH.parts[0])
         self.tm1.logout()
+
+
+class TestFileServiceGet(unittest.TestCase):
+    """FileService.get against the MockTM1Server"""
+
+    server: MockTM1Server
+    tm1: TM1Service
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTM1Server(compress_responses=True).start()
+        cls.tm1 = TM1Service(**cls.server.connection_kwargs)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.logout()
+        cls.server.stop()
+
+    def test_get(self):
+        self.tm1.files.create("get.csv", b"a,b\r\n1,2\r\n")
+
+        self.assertEqual(b"a,b\r\n1,2\r\n", self.tm1.files.get("get.csv"))
+
+    def test_get_compressed_body(self):
+        content = b"x" * 100_000
+        self.tm1.files.create("compressed.csv", content)
+
+        self.assertEqual(content, self.tm1.files.get("compressed.csv"))
+
+    def test_get_empty_file(self):
+        self.tm1.files.create("empty.csv", b"")
+
+        self.assertEqual(b"", self.tm1.files.get("empty.csv"))
+
+
+class _UploadRecordingRest:
+    version = "12.4.0"
+
+    class _Response:
+        def __init__(self, body):
+            self._body = body
+
+        def json(self):
+            return self._body
+
+    def __init__(self):
+        self.parts = []
+        self.calls = []
+
+    def POST(self, url, data, **kwargs):
+        self.calls.append(("POST", url))
+        if url.endswith("mpu.CreateMultipartUpload"):
+            return self._Response({"UploadID": "u1"})
+        if url.endswith("/Parts"):
+            self.parts.append(data)
+            return self._Response({"PartNumber": len(self.parts), "@odata.etag": f"e{len(self.parts)}"})
+        self.completed = json.loads(data)
+
+    def PUT(self, url, data, **kwargs):
+        self.calls.append(("PUT", url))
+        self.put_data = data if isinstance(data, bytes) else b"".join(data)
+
+
+class _ExpiringSession:
+    """Answers the first request with 401 and reads the body of every request like requests would"""
+
+    class _Response:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.ok = status_code < 400
+            self.headers = {}
+            self.encoding = None
+
+        def close(self):
+            pass
+
+    def __init__(self):
+        self.bodies = []
+
+    def request(self, method, url, data=None, **kwargs):
+        if isinstance(data, BytesIO):
+            self.bodies.append(data.read())
+        else:
+            self.bodies.append(data if isinstance(data, bytes) else b"".join(data))
+        return self._Response(401 if len(self.bodies) == 1 else 204)
+
+
+def _rest_with_expired_session(version: str = "11.8.02000.1") -> RestService:
+    rest = object.__new__(RestService)
+    rest._base_url = "https://tm1.example/api/v1"
+    rest._headers = {}
+    rest._version = version
+    rest._request_hooks = []
+    rest._compress_request_body = False
+    rest._timeout = None
+    rest._async_requests_mode = False
+    rest._re_connect_on_session_timeout = True
+    rest._re_connect_on_remote_disconnect = False
+    rest._s = _ExpiringSession()
+    rest._count_request_retry = lambda: None
+    rest.connect = lambda: None
+    rest._verify = False
+    return rest
+
+
+class TestFileServiceStreamingUpload(unittest.TestCase):
+    @staticmethod
+    def _file_service(rest) -> FileService:
+        return FileService(rest)
+
+    def test_regroup_into_parts(self):
+        parts = list(FileService._regroup_into_parts(iter([b"abc", b"defgh", b"", b"ij"]), max_chunk_size=4))
+
+        self.assertEqual([b"abcd", b"efgh", b"ij"], parts)
+
+    def test_peek_file_content(self):
+        self.assertIsNone(FileService._peek_file_content(iter([b"", b""])))
+        self.assertEqual([b"a", b"b"], list(FileService._peek_file_content(iter([b"", b"a", b"b"]))))
+
+    def test_streamed_multipart_upload(self):
+        rest = _UploadRecordingRest()
+        file_service = self._file_service(rest)
+        chunks = (bytes([65 + n]) * 3 for n in range(5))
+
+        file_service._upload_file_content(
+            Path("f.csv"), chunks, multi_part_upload=True, max_mb_per_part=4 / 1024 / 1024, max_workers=2
+        )
+
+        self.assertEqual(4, len(rest.parts))
+        self.assertEqual(b"AAABBBCCCDDDEEE", b"".join(sorted(rest.parts, key=lambda part: part[0:1])))
+        self.assertEqual([1, 2, 3, 4], sorted(part["PartNumber"] for part in rest.completed["Parts"]))
+
+    def test_streamed_upload_without_mpu(self):
+        rest = _UploadRecordingRest()
+        file_service = self._file_service(rest)
+
+        file_service._upload_file_content(Path("f.csv"), iter([b"a,b", b"\r\n"]), multi_part_upload=False)
+
+        self.assertEqual(b"a,b\r\n", rest.put_data)
+
+    def test_streamed_upload_without_mpu_resent_after_session_timeout(self):
+        rest = _rest_with_expired_session()
+        file_service = self._file_service(rest)
+        chunks = (bytes([65 + n]) * 3 for n in range(5))
+
+        file_service._upload_file_content(Path("f.csv"), chunks, multi_part_upload=False)
+
+        self.assertEqual([b"AAABBBCCCDDDEEE", b"AAABBBCCCDDDEEE"], rest._s.bodies)
+
+    def test_replayable_chunks_spill_to_disk(self):
+        chunks = _ReplayableChunks(iter([b"abc", b"defgh", b"ij"]), max_memory_size=4, read_size=3)
+
+        self.assertEqual(b"abcdefghij", b"".join(chunks))
+        self.assertEqual([b"abc", b"def", b"ghi", b"j"], list(chunks))
+
+    def test_bytesio_upload_without_mpu_resent_after_session_timeout(self):
+        rest = _rest_with_expired_session()
+        file_service = self._file_service(rest)
+
+        file_service._upload_file_content(Path("f.csv"), BytesIO(b"a,b\r\n"), multi_part_upload=False)
+
+        self.assertEqual([b"a,b\r\n", b"a,b\r\n"], rest._s.bodies)
+
+    def test_empty_stream_uploads_empty_file(self):
+        rest = _UploadRecordingRest()
+        file_service = self._file_service(rest)
+
+        file_service._upload_file_content(Path("f.csv"), iter([]), multi_part_upload=True)
+
+        self.assertEqual(b"", rest.put_data)
+        self.assertEqual([("PUT", "/Contents('Files')/Contents('f.csv')/Content")], rest.calls)
@@ -0,0 +1,150 @@
+import random
+import unittest
+
+from TM1py import Element, Hierarchy
+from TM1py.Utils import HierarchyIndex
+
+
+class TestHierarchyIndex(unittest.TestCase):
+    element_types = {
+        "Total": "Consolidated",
+        "Europe": "Consolidated",
+        "DACH": "Consolidated",
+        "Germany": "Numeric",
+        "Switzerland": "Numeric",
+        "Austria": "Numeric",
+        "France": "Numeric",
+        "German Speaking": "Consolidated",
+        "Empty": "Consolidated",
+        "Comment": "String",
+    }
+    edges = {
+        ("Total", "Europe"): 1,
+        ("Europe", "DACH"): 1,
+        ("Europe", "France"): 1,
+        ("DACH", "Germany"): 1,
+        ("DACH", "Switzerland"): 1,
+        ("DACH", "Austria"): 1,
+        ("German Speaking", "Germany"): 1,
+        ("German Speaking", "Austria"): 0.5,
+    }
+
+    def setUp(self):
+        self.index = HierarchyIndex(self.element_types, self.edges, "Region", "Region")
+
+    def test_element_is_ancestor(self):
+        self.assertTrue(self.index.element_is_ancestor("Total", "Germany"))
+        self.assertTrue(self.index.element_is_ancestor("europe", "dach"))
+        self.assertTrue(self.index.element_is_ancestor("German Speaking", "Austria"))
+        self.assertFalse(self.index.element_is_ancestor("German Speaking", "Switzerland"))
+        self.assertFalse(self.index.element_is_ancestor("Germany", "Total"))
+        self.assertFalse(self.index.element_is_ancestor("Total", "Total"))
+        self.assertFalse(self.index.element_is_ancestor("Total", "Not Existing"))
+
+    def test_element_is_parent(self):
+        self.assertTrue(self.index.element_is_parent("DACH", "Germany"))
+        self.assertFalse(self.index.element_is_parent("Europe", "Germany"))
+
+    def test_get_parents(self):
+        self.assertEqual(["DACH", "German Speaking"], self.index.get_parents("Germany"))
+        self.assertEqual([], self.index.get_parents("Total"))
+
+    def test_get_ancestors(self):
+        self.assertEqual({"DACH", "Europe", "Total", "German Speaking"}, set(self.index.get_ancestors("Austria")))
+
+    def test_get_edges(self):
+        self.assertEqual({"Germany": 1, "Austria": 0.5}, self.index.get_edges("German Speaking"))
+
+    def test_get_leaves_under_consolidation(self):
+        self.assertEqual(
+            ["Germany", "Switzerland", "Austria", "France"], self.index.get_leaves_under_consolidation("Total")
+        )
+        self.assertEqual(["Germany", "Austria"], self.index.get_leaves_under_consolidation("German Speaking"))
+        self.assertEqual([], self.index.get_leaves_under_consolidation("Empty"))
+        self.assertEqual(4, self.index.count_leaves_under_consolidation("Total"))
+
+    def test_get_members_under_consolidation(self):
+        self.assertEqual(
+            ["Europe", "DACH", "Germany", "Switzerland", "Austria", "France"],
+            self.index.get_members_under_consolidation("Total"),
+        )
+        self.assertEqual(["France"], self.index.get_members_under_consolidation("Europe", leaves_only=True)[-1:])
+
+    def test_levels(self):
+        self.assertEqual(3, self.index.get_level("Total"))
+        self.assertEqual(1, self.index.get_level("German Speaking"))
+        self.assertEqual(0, self.index.get_level("Empty"))
+        self.assertEqual(0, self.index.get_level("Comment"))
+        self.assertEqual(4, self.index.get_levels_count())
+        self.assertEqual(["DACH", "German Speaking"], self.index.get_elements_by_level(1))
+
+    def test_get_top_elements(self):
+        self.assertEqual(["Total", "German Speaking", "Empty", "Comment"], self.index.get_top_elements())
+
+    def test_unknown_element(self):
+        self.assertNotIn("Italy", self.index)
+        with self.assertRaises(ValueError):
+            self.index.get_leaves_under_consolidation("Italy")
+
+    def test_edge_to_unknown_element(self):
+        with self.assertRaises(ValueError):
+            HierarchyIndex({"Total": "Consolidated"}, {("Total", "Italy"): 1})
+
+    def test_circular_reference(self):
+        with self.assertRaises(ValueError):
+            HierarchyIndex({"A": "Consolidated", "B": "Consolidated"}, {("A", "B"): 1, ("B", "A"): 1})
+
+    def test_from_hierarchy(self):
+        hierarchy = Hierarchy(
+            name="Region",
+            dimension_name="Region",
+            elements=[Element(name, element_type) for name, element_type in self.element_types.items()],
+            edges=self.edges,
+        )
+
+        index = HierarchyIndex.from_hierarchy(hierarchy)
+
+        self.assertEqual(len(self.element_types), len(index))
+        self.assertEqual(
+            {element.name for element in hierarchy.get_descendants("Total", recursive=True, leaves_only=True)},
+            set(index.get_leaves_under_consolidation("Total")),
+        )
+
+    def test_matches_edge_traversal_with_shared_elements(self):
+        rng = random.Random(1)
+        names = [f"e{i}" for i in range(300)]
+        element_types = {name: "Consolidated" if i < 100 else "Numeric" for i, name in enumerate(names)}
+        # parents always have a lower number, so the structure is free of cycles
+        edges = {}
+        for i in range(1, 300):
+            for parent in rng.sample(range(min(i, 100)), k=min(i, 100, rng.choice([1, 1, 1, 2, 3]))):
+                edges[(names[parent], names[i])] = 1
+
+        index = HierarchyIndex(element_types, edges)
+
+        children = {name: [] for name in names}
+        for parent, child in edges:
+            children[parent].append(child)
+
+        def descendants(name):
+            found = set()
+            for child in children[name]:
+                found.add(child)
+                found |= descendants(child)
+            return found
+
+        for name in names[:100]:
+            expected = descendants(name)
+            members = index.get_members_under_consolidation(name)
+            self.assertEqual(len(expected), len(members))
+            self.assertEqual(expected, set(members))
+            self.assertEqual(
+                {member for member in expected if element_types[member] == "Numeric"},
+                set(index.get_leaves_under_consolidation(name)),
+            )
+            for other in rng.sample(names, 30):
+                self.assertEqual(other in expected, index.element_is_ancestor(name, other))
+
+
+if __name__ == "__main__":
+    unittest.main()
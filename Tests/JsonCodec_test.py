@@ -0,0 +1,94 @@
+import json
+import unittest
+from collections import OrderedDict
+
+from TM1py.Objects import ElementAttribute, Sandbox
+from TM1py.Utils import (
+    JsonCodec,
+    get_json_backend,
+    json_dumps,
+    json_dumps_bytes,
+    json_loads,
+    set_json_backend,
+)
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(set_json_backend, get_json_backend())
+
+    def available_backends(self):
+        return [backend for backend in JsonCodec.JSON_BACKENDS if JsonCodec._AVAILABLE[backend]]
+
+    def test_default_backend_is_fastest_installed(self):
+        set_json_backend()
+
+        self.assertEqual(self.available_backends()[0], get_json_backend())
+
+    def test_round_trip(self):
+        payload = OrderedDict(
+            [("Name", "Ölpreis / €"), ("Value", 1.5), ("Count", 3), ("Flag", True), ("Empty", None), ("List", [1, "a"])]
+        )
+        for backend in self.available_backends():
+            with self.subTest(backend=backend):
+                set_json_backend(backend)
+
+                text = json_dumps(payload)
+                self.assertIsInstance(text, str)
+                self.assertIn("Ölpreis / €", text)
+                self.assertEqual(payload, json.loads(text))
+                self.assertEqual(text.encode("utf-8"), json_dumps_bytes(payload))
+                self.assertEqual(payload, json_loads(text))
+                self.assertEqual(payload, json_loads(text.encode("utf-8")))
+
+    def test_backends_produce_same_bytes(self):
+        payload = {"Name": "Ölpreis / €", "Cells": [{"Ordinal": 0, "Value": 1.5}, {"Ordinal": 1, "Value": "a"}]}
+        expected = '{"Name":"Ölpreis / €","Cells":[{"Ordinal":0,"Value":1.5},{"Ordinal":1,"Value":"a"}]}'
+        for backend in self.available_backends():
+            with self.subTest(backend=backend):
+                set_json_backend(backend)
+
+                self.assertEqual(expected, json_dumps(payload))
+
+    def test_non_str_keys_and_big_ints_fall_back(self):
+        for backend in self.available_backends():
+            with self.subTest(backend=backend):
+                set_json_backend(backend)
+
+                self.assertEqual({"1": 2**70}, json.loads(json_dumps({1: 2**70})))
+                self.assertEqual({"a": 2**70}, json_loads('{"a": %d}' % 2**70))
+
+    def test_malformed_json_raises_json_decode_error(self):
+        for backend in self.available_backends():
+            with self.subTest(backend=backend):
+                set_json_backend(backend)
+
+                with self.assertRaises(json.JSONDecodeError):
+                    json_loads(b'{"a": ')
+
+    def test_object_bodies(self):
+        for backend in self.available_backends():
+            with self.subTest(backend=backend):
+                set_json_backend(backend)
+
+                sandbox = Sandbox("sändbox", True)
+                self.assertEqual('{"Name":"sändbox","IncludeInSandboxDimension":true}', sandbox.body)
+                attribute = ElementAttribute("Beschreibung", "String")
+                self.assertEqual(attribute, ElementAttribute.from_json(attribute.body))
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            set_json_backend("simplejson")
+
+    def test_missing_backend(self):
+        missing = [backend for backend in JsonCodec.JSON_BACKENDS if not JsonCodec._AVAILABLE[backend]]
+        if not missing:
+            self.skipTest("all JSON backends installed")
+
+        with self.assertRaises(ImportError):
+            set_json_backend(missing[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
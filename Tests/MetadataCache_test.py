@@ -0,0 +1,174 @@
+import json
+import pickle
+import time
+import unittest
+
+from requests import Response
+
+from TM1py.Objects import Cube, Element
+from TM1py.Services.CubeService import CubeService
+from TM1py.Services.ElementService import ElementService
+from TM1py.Utils import MetadataCache
+
+
+def _response(body: dict) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode("utf-8")
+    response._content_consumed = True
+    return response
+
+
+class _MetadataRest:
+    """Answers metadata GETs from a dict of url fragment -> body and records every request"""
+
+    version = "12.0.0"
+    session_id = "session"
+    is_data_admin = True
+    is_ops_admin = True
+
+    def __init__(self, bodies: dict, cache: MetadataCache = None):
+        self._bodies = bodies
+        self._metadata_cache = cache
+        self.requests = []
+
+    def _request(self, method, url):
+        self.requests.append((method, url))
+        for fragment, body in self._bodies.items():
+            if fragment in url:
+                return _response(body)
+        return _response({})
+
+    def GET(self, url, **kwargs):
+        return self._request("GET", url)
+
+    def POST(self, url, data="", **kwargs):
+        return self._request("POST", url)
+
+    def PATCH(self, url, data="", **kwargs):
+        return self._request("PATCH", url)
+
+    def DELETE(self, url, **kwargs):
+        return self._request("DELETE", url)
+
+
+class TestMetadataCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = MetadataCache(ttl=60)
+        cache.put("key", ("cube", "sales"), ["d1", "d2"])
+
+        self.assertEqual(["d1", "d2"], cache.get("key"))
+        self.assertIsNone(cache.get("other"))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_entries_expire(self):
+        cache = MetadataCache(ttl=0.01)
+        cache.put("key", ("cube", "sales"), 1)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(0, len(cache))
+
+    def test_invalidate_dimension_drops_its_hierarchies(self):
+        cache = MetadataCache()
+        cache.put("cube", ("cube", "sales"), 1)
+        cache.put("dimension", ("dimension", "region"), 2)
+        cache.put("hierarchy", ("hierarchy", "region", "region"), 3)
+        cache.put("other", ("hierarchy", "product", "product"), 4)
+
+        cache.invalidate_dimension("Region")
+
+        self.assertEqual(1, cache.get("cube"))
+        self.assertIsNone(cache.get("dimension"))
+        self.assertIsNone(cache.get("hierarchy"))
+        self.assertEqual(4, cache.get("other"))
+
+    def test_invalidate_hierarchy_drops_dimension_wide_values(self):
+        cache = MetadataCache()
+        cache.put("dimension", ("dimension", "region"), 1)
+        cache.put("hierarchy", ("hierarchy", "region", "region"), 2)
+        cache.put("leaves", ("hierarchy", "region", "leaves"), 3)
+        cache.put("alternate", ("hierarchy", "region", "alternate"), 4)
+
+        cache.invalidate_hierarchy("Region")
+
+        self.assertIsNone(cache.get("dimension"))
+        self.assertIsNone(cache.get("hierarchy"))
+        self.assertIsNone(cache.get("leaves"))
+        self.assertEqual(4, cache.get("alternate"))
+
+    def test_outdated_value_is_not_stored(self):
+        cache = MetadataCache()
+        generation = cache.generation
+        cache.invalidate_cube("Sales")
+
+        cache.put("key", ("cube", "sales"), 1, generation)
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_pickle_keeps_settings_only(self):
+        cache = MetadataCache(ttl=60)
+        cache.put("key", ("cube", "sales"), 1)
+
+        restored = pickle.loads(pickle.dumps(cache))
+
+        self.assertEqual(60, restored.ttl)
+        self.assertEqual(0, len(restored))
+
+    def test_invalid_ttl(self):
+        with self.assertRaises(ValueError):
+            MetadataCache(ttl=0)
+
+
+class TestMetadataCacheServices(unittest.TestCase):
+    bodies = {
+        "/Dimensions?$select=Name": {"value": [{"Name": "Region"}, {"Name": "Measure"}]},
+        "/Elements?$select=Name,Type": {"value": [{"Name": "Revenue", "Type": "Numeric"}]},
+    }
+
+    def test_reads_without_cache_always_request(self):
+        rest = _MetadataRest(self.bodies)
+        cube_service = CubeService(rest)
+
+        cube_service.get_dimension_names("Sales")
+        cube_service.get_dimension_names("Sales")
+
+        self.assertEqual(2, len(rest.requests))
+
+    def test_cube_dimensions_are_cached(self):
+        rest = _MetadataRest(self.bodies, MetadataCache())
+        cube_service = CubeService(rest)
+
+        first = cube_service.get_dimension_names("Sales")
+        first.append("mutated")
+        second = cube_service.get_dimension_names(" sales ", timeout=10)
+
+        self.assertEqual(["Region", "Measure"], second)
+        self.assertEqual(1, len(rest.requests))
+
+    def test_cube_update_invalidates(self):
+        rest = _MetadataRest(self.bodies, MetadataCache())
+        cube_service = CubeService(rest)
+
+        cube_service.get_dimension_names("Sales")
+        cube_service.update(Cube("Sales", ["Region", "Measure"]))
+        cube_service.get_dimension_names("Sales")
+
+        self.assertEqual(["GET", "PATCH", "GET"], [method for method, _ in rest.requests])
+
+    def test_element_changes_invalidate_element_types(self):
+        rest = _MetadataRest(self.bodies, MetadataCache())
+        element_service = ElementService(rest)
+
+        element_service.get_element_types("Measure", "Measure")
+        element_service.get_element_types("Measure", "Measure")
+        element_service.create("Measure", "Measure", Element("Cost", "Numeric"))
+        element_types = element_service.get_element_types("Measure", "Measure")
+
+        self.assertEqual(["GET", "POST", "GET"], [method for method, _ in rest.requests])
+        self.assertEqual("Numeric", element_types["revenue"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,1933 @@
+"""In-process stand-in for the TM1 REST API
+
+Serves the subset of the API that TM1py uses over HTTP on localhost, so TM1py can be tested and benchmarked
+without a TM1 instance:
+
+- Login through Basic authentication, TM1SessionId cookie, ActiveSession/tm1.Close
+- Cubes, Dimensions, Hierarchies, Elements, Edges with $select, $expand, $filter, $top, $skip and $count
+- ExecuteMDX and Cellsets for MDX as generated by mdxpy, including compact JSON (tm1.compact=v0),
+  Cells/$count, tm1.Update and cellset updates
+- Contents('Blobs') / Contents('Files') with plain and multipart uploads
+- Processes, tm1.Execute, tm1.ExecuteWithReturn and ExecuteProcessWithReturn with canned results
+- 'Prefer: respond-async' with polling through _async('...')
+- ActiveSession/Threads with the threads that a test sets in `threads`
+
+Latency per request, bandwidth and response compression are configurable, so client throughput can be
+measured reproducibly.
+
+>>> with MockTM1Server(latency=0.002) as server:
+>>>     server.generate_dimension("Region", leaves=100)
+>>>     server.generate_dimension("Measure", leaves=5)
+>>>     server.generate_cube("Sales", ["Region", "Measure"], cells=300, seed=1)
+>>>     with TM1Service(**server.connection_kwargs) as tm1:
+>>>         tm1.cells.execute_mdx_values("SELECT ... FROM [Sales]")
+
+"""
+
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlsplit
+
+from TM1py.Utils.HierarchyIndex import HierarchyIndex
+
+ELEMENT_TYPES = {"numeric": 1, "string": 2, "consolidated": 3}
+
+
+def _normalize(name: str) -> str:
+    return name.replace(" ", "").lower()
+
+
+class MockTM1Error(Exception):
+    def __init__(self, status: int, message: str, code: str = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.code = code or str(status)
+
+
+def _not_found(kind: str, name: str) -> MockTM1Error:
+    return MockTM1Error(404, f"{kind} '{name}' can not be found", "278")
+
+
+# ---------------------------------------------------------------------------
+# OData query options
+# ---------------------------------------------------------------------------
+
+
+def _split_top_level(text: str, separator: str) -> List[str]:
+    """split at separators outside of parentheses and quotes"""
+    parts, depth, quoted, start = [], 0, False, 0
+    for i, char in enumerate(text):
+        if char == "'":
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+class QueryOptions:
+    """$select, $expand, $filter, $top and $skip of a request or of a nested $expand"""
+
+    def __init__(self, options: Dict[str, str] = None):
+        options = {key.lstrip("$").lower(): value for key, value in (options or {}).items()}
+        self.select = [name.strip() for name in options["select"].split(",")] if options.get("select") else None
+        self.expand: Dict[str, "QueryOptions"] = OrderedDict()
+        for item in _split_top_level(options.get("expand", ""), ","):
+            match = re.match(r"^([^()]+)(?:\((.*)\))?$", item, re.DOTALL)
+            name, nested = match.group(1).strip(), match.group(2) or ""
+            self.expand[name] = QueryOptions(dict(_split_option(part) for part in _split_top_level(nested, ";")))
+        self.filter = _compile_filter(options["filter"]) if options.get("filter") else None
+        self.top = int(options["top"]) if options.get("top") else None
+        self.skip = int(options["skip"]) if options.get("skip") else None
+
+    @classmethod
+    def from_query_string(cls, query: str) -> "QueryOptions":
+        options = {}
+        for part in query.split("&"):
+            if part:
+                key, value = _split_option(unquote(part))
+                options[key] = value
+        return cls(options)
+
+
+def _split_option(part: str) -> Tuple[str, str]:
+    key, _, value = part.partition("=")
+    return key.strip(), value.strip()
+
+
+class Collection:
+    """Lazy navigation property with many entities"""
+
+    def __init__(
+        self,
+        items: Callable[[], List[Dict]],
+        get: Callable[[str], Optional[Dict]] = None,
+        shape: Callable[["QueryOptions"], List[Dict]] = None,
+    ):
+        """
+        :param items: all entities
+        :param get: entity by key
+        :param shape: applies query options without materializing all entities. Used for large collections
+        """
+        self._items = items
+        self._get = get
+        self._shape = shape
+
+    @classmethod
+    def of(cls, items: List[Dict], key: str = "Name") -> "Collection":
+        return cls(lambda: items, lambda name: next((i for i in items if _normalize(i[key]) == _normalize(name)), None))
+
+    def items(self) -> List[Dict]:
+        return self._items()
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._get(key) if self._get else None
+
+    def shape(self, options: "QueryOptions") -> List[Dict]:
+        return self._shape(options) if self._shape else shape_collection(self.items(), options)
+
+
+def shape_entity(entity: Dict, options: QueryOptions) -> Dict:
+    """apply $select and $expand. Values that are callables are navigation properties"""
+    result = OrderedDict()
+    for key, value in entity.items():
+        if callable(value) or isinstance(value, Collection):
+            continue
+        if options.select is None or key in options.select or key.startswith("@"):
+            result[key] = value
+
+    expand = options.expand
+    if "*" in expand:
+        expand = OrderedDict((key, QueryOptions()) for key, value in entity.items() if callable(value))
+    for name, nested in expand.items():
+        if name not in entity:
+            raise MockTM1Error(400, f"Could not find navigation property '{name}'")
+        value = entity[name]
+        value = value() if callable(value) else value
+        if isinstance(value, Collection):
+            result[name] = value.shape(nested)
+        elif isinstance(value, list):
+            result[name] = shape_collection(value, nested)
+        elif isinstance(value, dict):
+            result[name] = shape_entity(value, nested)
+        elif not isinstance(value, bytes):
+            result[name] = value
+    return result
+
+
+def shape_collection(entities: Iterable[Dict], options: QueryOptions) -> List[Dict]:
+    if options.filter:
+        entities = [entity for entity in entities if options.filter(entity)]
+    entities = list(entities)
+    if options.skip:
+        entities = entities[options.skip :]
+    if options.top is not None:
+        entities = entities[: options.top]
+    return [shape_entity(entity, options) for entity in entities]
+
+
+# ---------------------------------------------------------------------------
+# $filter
+# ---------------------------------------------------------------------------
+
+_FILTER_TOKEN = re.compile(r"\s*(?:(\()|(\))|(,)|('(?:[^']|'')*')|(-?\d+(?:\.\d+)?)|([A-Za-z_][\w/]*))")
+
+
+def _compile_filter(expression: str) -> Callable[[Dict], bool]:
+    tokens = []
+    position = 0
+    while position < len(expression):
+        match = _FILTER_TOKEN.match(expression, position)
+        if not match:
+            if expression[position:].strip():
+                raise MockTM1Error(400, f"Unsupported $filter: '{expression}'")
+            break
+        position = match.end()
+        open_, close, comma, string, number, word = match.groups()
+        if string is not None:
+            tokens.append(("literal", string[1:-1].replace("''", "'")))
+        elif number is not None:
+            tokens.append(("literal", float(number) if "." in number else int(number)))
+        elif word is not None:
+            lowered = word.lower()
+            if lowered in ("true", "false"):
+                tokens.append(("literal", lowered == "true"))
+            elif lowered == "null":
+                tokens.append(("literal", None))
+            elif lowered in ("and", "or", "not", "eq", "ne", "gt", "ge", "lt", "le"):
+                tokens.append(("op", lowered))
+            else:
+                tokens.append(("name", word))
+        else:
+            tokens.append(("punct", open_ or close or comma))
+
+    parser = _FilterParser(tokens, expression)
+    predicate = parser.parse_or()
+    if parser.position != len(tokens):
+        raise MockTM1Error(400, f"Unsupported $filter: '{expression}'")
+    return lambda entity: bool(predicate(entity))
+
+
+def _comparable(left, right):
+    # element types compare with their names or numbers
+    if isinstance(left, str) and isinstance(right, int) and _normalize(left) in ELEMENT_TYPES:
+        return ELEMENT_TYPES[_normalize(left)], right
+    if isinstance(right, str) and isinstance(left, int) and _normalize(right) in ELEMENT_TYPES:
+        return left, ELEMENT_TYPES[_normalize(right)]
+    return left, right
+
+
+_COMPARISONS = {
+    "eq": lambda a, b: a == b,
+    "ne": lambda a, b: a != b,
+    "gt": lambda a, b: a is not None and b is not None and a > b,
+    "ge": lambda a, b: a is not None and b is not None and a >= b,
+    "lt": lambda a, b: a is not None and b is not None and a < b,
+    "le": lambda a, b: a is not None and b is not None and a <= b,
+}
+
+_FUNCTIONS = {
+    "tolower": lambda value: value.lower(),
+    "toupper": lambda value: value.upper(),
+    "contains": lambda value, part: part in value,
+    "startswith": lambda value, part: value.startswith(part),
+    "endswith": lambda value, part: value.endswith(part),
+}
+
+
+class _FilterParser:
+    def __init__(self, tokens: List[Tuple[str, Any]], expression: str):
+        self.tokens = tokens
+        self.expression = expression
+        self.position = 0
+
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _take(self, kind: str = None, value: Any = None):
+        token = self._peek()
+        if (kind and token[0] != kind) or (value is not None and token[1] != value):
+            raise MockTM1Error(400, f"Unsupported $filter: '{self.expression}'")
+        self.position += 1
+        return token
+
+    def parse_or(self):
+        left = self.parse_and()
+        while self._peek() == ("op", "or"):
+            self._take()
+            right, first = self.parse_and(), left
+            left = lambda entity, a=first, b=right: a(entity) or b(entity)  # noqa: E731
+        return left
+
+    def parse_and(self):
+        left = self.parse_not()
+        while self._peek() == ("op", "and"):
+            self._take()
+            right, first = self.parse_not(), left
+            left = lambda entity, a=first, b=right: a(entity) and b(entity)  # noqa: E731
+        return left
+
+    def parse_not(self):
+        if self._peek() == ("op", "not"):
+            self._take()
+            operand = self.parse_not()
+            return lambda entity: not operand(entity)
+        return self.parse_comparison()
+
+    def parse_comparison(self):
+        left = self.parse_value()
+        kind, operator = self._peek()
+        if kind == "op" and operator in _COMPARISONS:
+            self._take()
+            right, compare = self.parse_value(), _COMPARISONS[operator]
+            return lambda entity: compare(*_comparable(left(entity), right(entity)))
+        return left
+
+    def parse_value(self):
+        kind, value = self._take()
+        if kind == "literal":
+            return lambda entity: value
+        if (kind, value) == ("punct", "("):
+            inner = self.parse_or()
+            self._take("punct", ")")
+            return inner
+        if kind == "name" and self._peek() == ("punct", "("):
+            function = _FUNCTIONS.get(value.lower())
+            if function is None:
+                raise MockTM1Error(400, f"Unsupported function '{value}' in $filter")
+            self._take()
+            arguments = [self.parse_or()]
+            while self._peek() == ("punct", ","):
+                self._take()
+                arguments.append(self.parse_or())
+            self._take("punct", ")")
+            return lambda entity: function(*(argument(entity) for argument in arguments))
+        if kind == "name":
+            path = value.split("/")
+
+            def resolve(entity):
+                for key in path:
+                    entity = entity.get(key) if isinstance(entity, dict) else None
+                    entity = entity() if callable(entity) else entity
+                return entity
+
+            return resolve
+        raise MockTM1Error(400, f"Unsupported $filter: '{self.expression}'")
+
+
+# ---------------------------------------------------------------------------
+# Model
+# ---------------------------------------------------------------------------
+
+
+class MockHierarchy:
+    def __init__(self, dimension_name: str, name: str):
+        self.dimension_name = dimension_name
+        self.name = name
+        # canonical element name -> type name ('Numeric', 'String', 'Consolidated')
+        self.elements: Dict[str, str] = OrderedDict()
+        self.edges: Dict[Tuple[str, str], float] = OrderedDict()
+        self.attributes: Dict[str, Dict[str, Any]] = {}
+        self.attribute_types: Dict[str, str] = OrderedDict()
+        self._lookup: Dict[str, str] = {}
+        self._index: Optional[HierarchyIndex] = None
+        self._weighted_leaves: Dict[str, Dict[str, float]] = {}
+
+    def _changed(self):
+        self._index = None
+        self._weighted_leaves = {}
+
+    def add_element(self, name: str, element_type: Union[str, int] = "Numeric"):
+        if isinstance(element_type, int):
+            element_type = {1: "Numeric", 2: "String", 3: "Consolidated"}[element_type]
+        element_type = element_type.capitalize()
+        if _normalize(name) in self._lookup:
+            raise MockTM1Error(400, f"Element '{name}' already exists in hierarchy '{self.name}'")
+        self._lookup[_normalize(name)] = name
+        self.elements[name] = element_type
+        self._changed()
+
+    def remove_element(self, name: str):
+        name = self.element_name(name)
+        del self.elements[name]
+        del self._lookup[_normalize(name)]
+        self.attributes.pop(name, None)
+        for edge in [edge for edge in self.edges if name in edge]:
+            del self.edges[edge]
+        self._changed()
+
+    def add_edge(self, parent: str, component: str, weight: float = 1):
+        parent, component = self.element_name(parent), self.element_name(component)
+        if self.elements[parent] != "Consolidated":
+            raise MockTM1Error(400, f"Element '{parent}' is not a consolidation")
+        self.edges[(parent, component)] = weight
+        self._changed()
+
+    def remove_edge(self, parent: str, component: str):
+        self.edges.pop((self.element_name(parent), self.element_name(component)), None)
+        self._changed()
+
+    def element_name(self, name: str) -> str:
+        try:
+            return self._lookup[_normalize(name)]
+        except KeyError:
+            raise _not_found("Element", name) from None
+
+    def has_element(self, name: str) -> bool:
+        return _normalize(name) in self._lookup
+
+    @property
+    def index(self) -> HierarchyIndex:
+        if self._index is None:
+            self._index = HierarchyIndex(self.elements, self.edges, self.dimension_name, self.name)
+        return self._index
+
+    def weighted_leaves(self, element: str) -> Dict[str, float]:
+        """leaves below an element with the product of the weights on the way, summed over all ways"""
+        if element in self._weighted_leaves:
+            return self._weighted_leaves[element]
+        if self.elements[element] != "Consolidated":
+            leaves = {element: 1.0}
+        else:
+            leaves = {}
+            for component, weight in self.index.get_edges(element).items():
+                for leaf, leaf_weight in self.weighted_leaves(component).items():
+                    leaves[leaf] = leaves.get(leaf, 0.0) + weight * leaf_weight
+        self._weighted_leaves[element] = leaves
+        return leaves
+
+    @property
+    def unique_name(self) -> str:
+        return f"[{self.dimension_name}].[{self.name}]"
+
+    def element_unique_name(self, element: str) -> str:
+        return f"[{self.dimension_name}].[{self.name}].[{element}]"
+
+    def element_entity(self, name: str, position: int = None) -> Dict:
+        index = self.index
+        entity = OrderedDict(
+            [
+                ("Name", name),
+                ("UniqueName", self.element_unique_name(name)),
+                ("Type", self.elements[name]),
+                ("Level", index.get_level(name)),
+                ("Index", (position if position is not None else index.get_element_id(name)) + 1),
+                ("Attributes", dict(self.attributes.get(name, {}))),
+            ]
+        )
+        entity["Parents"] = lambda: Collection.of([self.element_entity(p) for p in index.get_parents(name)])
+        entity["Components"] = lambda: Collection.of([self.element_entity(c) for c in index.get_children(name)])
+        entity["Hierarchy"] = lambda: self.entity()
+        return entity
+
+    def entity(self) -> Dict:
+        def elements():
+            return [self.element_entity(name, position) for position, name in enumerate(self.elements)]
+
+        def element(name):
+            return self.element_entity(self._lookup[_normalize(name)]) if self.has_element(name) else None
+
+        def edges():
+            return [
+                OrderedDict([("ParentName", parent), ("ComponentName", component), ("Weight", weight)])
+                for (parent, component), weight in self.edges.items()
+            ]
+
+        return OrderedDict(
+            [
+                ("Name", self.name),
+                ("UniqueName", self.unique_name),
+                ("Cardinality", len(self.elements)),
+                ("Structure", 0),
+                ("Visible", True),
+                ("Elements", lambda: Collection(elements, element)),
+                ("Edges", lambda: Collection(edges)),
+                (
+                    "ElementAttributes",
+                    lambda: Collection.of(
+                        [
+                            {"Name": name, "Type": attribute_type}
+                            for name, attribute_type in self.attribute_types.items()
+                        ]
+                    ),
+                ),
+                ("Subsets", lambda: Collection.of([])),
+                ("DefaultMember", lambda: element(next(iter(self.elements))) if self.elements else None),
+                ("Dimension", lambda: {"Name": self.dimension_name, "UniqueName": f"[{self.dimension_name}]"}),
+            ]
+        )
+
+
+class MockDimension:
+    def __init__(self, name: str):
+        self.name = name
+        self.hierarchies: Dict[str, MockHierarchy] = OrderedDict()
+        self.add_hierarchy(name)
+
+    def add_hierarchy(self, name: str) -> MockHierarchy:
+        hierarchy = MockHierarchy(self.name, name)
+        self.hierarchies[_normalize(name)] = hierarchy
+        return hierarchy
+
+    def hierarchy(self, name: str = None) -> MockHierarchy:
+        try:
+            return self.hierarchies[_normalize(name or self.name)]
+        except KeyError:
+            raise _not_found("Hierarchy", name) from None
+
+    def entity(self) -> Dict:
+        hierarchies = lambda: Collection(  # noqa: E731
+            lambda: [hierarchy.entity() for hierarchy in self.hierarchies.values()],
+            lambda name: self.hierarchies[_normalize(name)].entity() if _normalize(name) in self.hierarchies else None,
+        )
+        return OrderedDict(
+            [
+                ("Name", self.name),
+                ("UniqueName", f"[{self.name}]"),
+                ("AllLeavesHierarchyName", "Leaves"),
+                ("Hierarchies", hierarchies),
+                ("DefaultHierarchy", lambda: self.hierarchy().entity()),
+            ]
+        )
+
+
+class MockCube:
+    def __init__(self, name: str, dimensions: List[MockDimension]):
+        self.name = name
+        self.dimensions = dimensions
+        # tuple of canonical leaf element names -> value
+        self.cells: Dict[Tuple[str, ...], Any] = {}
+        # incremented by every write
+        self.version = 0
+        self.last_data_update = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+    def entity(self) -> Dict:
+        return OrderedDict(
+            [
+                ("Name", self.name),
+                ("Rules", None),
+                ("LastDataUpdate", self.last_data_update),
+                ("Dimensions", lambda: Collection.of([dimension.entity() for dimension in self.dimensions])),
+                ("Views", lambda: Collection.of([])),
+                ("PrivateViews", lambda: Collection.of([])),
+            ]
+        )
+
+    def is_string_cell(self, coordinates: Tuple[str, ...]) -> bool:
+        return self.dimensions[-1].hierarchy().elements[coordinates[-1]] == "String"
+
+    def value(self, coordinates: Tuple[str, ...]) -> Any:
+        if self.is_string_cell(coordinates):
+            return self.cells.get(coordinates, "")
+        hierarchies = [dimension.hierarchy() for dimension in self.dimensions]
+        if all(h.elements[c] != "Consolidated" for h, c in zip(hierarchies, coordinates)):
+            return self.cells.get(coordinates, 0)
+
+        expansions = [h.weighted_leaves(c) for h, c in zip(hierarchies, coordinates)]
+        total = 0.0
+        for leaf_coordinates, value in self.cells.items():
+            if isinstance(value, str):
+                continue
+            weight = 1.0
+            for expansion, leaf in zip(expansions, leaf_coordinates):
+                factor = expansion.get(leaf)
+                if factor is None:
+                    break
+                weight *= factor
+            else:
+                total += weight * value
+        return total
+
+    def values(self, coordinates: List[Tuple[str, ...]]) -> Tuple[List[Any], List[bool]]:
+        """values and consolidated flags of many cells"""
+        element_types = [dimension.hierarchy().elements for dimension in self.dimensions]
+        measures = element_types[-1]
+        cells = self.cells
+        values, consolidated = [], []
+        for cell in coordinates:
+            is_consolidated = any(types[e] == "Consolidated" for types, e in zip(element_types, cell))
+            consolidated.append(is_consolidated)
+            if measures[cell[-1]] == "String":
+                values.append(cells.get(cell, ""))
+            elif is_consolidated:
+                values.append(self.value(cell))
+            else:
+                values.append(cells.get(cell, 0))
+        return values, consolidated
+
+    def is_consolidated(self, coordinates: Tuple[str, ...]) -> bool:
+        return any(
+            dimension.hierarchy().elements[element] == "Consolidated"
+            for dimension, element in zip(self.dimensions, coordinates)
+        )
+
+    def write(self, coordinates: Tuple[str, ...], value: Any, increment: bool = False):
+        if self.is_consolidated(coordinates) and not self.name.startswith("}ElementAttributes_"):
+            raise MockTM1Error(400, f"Cell {coordinates} in cube '{self.name}' is not updateable")
+        if self.is_string_cell(coordinates):
+            if value in (None, ""):
+                self.cells.pop(coordinates, None)
+            else:
+                self.cells[coordinates] = str(value)
+        else:
+            value = float(value) if value not in (None, "") else 0.0
+            if increment:
+                value += self.cells.get(coordinates, 0)
+            if value == 0:
+                self.cells.pop(coordinates, None)
+            else:
+                self.cells[coordinates] = value
+        self.version += 1
+        self.last_data_update = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+        if self.name.startswith("}ElementAttributes_"):
+            # attributes of members and elements are read from the hierarchy
+            element, attribute = coordinates
+            self.dimensions[0].hierarchy().attributes.setdefault(element, {})[attribute] = self.cells.get(coordinates)
+
+
+# ---------------------------------------------------------------------------
+# MDX
+# ---------------------------------------------------------------------------
+
+
+class MdxSet:
+    def __init__(self, hierarchies: List[MockHierarchy], tuples: List[Tuple[str, ...]]):
+        self.hierarchies = hierarchies
+        self.tuples = tuples
+
+
+_MDX_TOKEN = re.compile(r"\s*(?:(\[(?:[^\]]|\]\])*\])|([A-Za-z_][\w]*)|(-?\d+)|([{}(),.*]))")
+
+
+class MdxEvaluator:
+    """Evaluates MDX queries as generated by mdxpy against the model
+
+    Supports NON EMPTY axes, WHERE, crossjoins through '*' and CROSSJOIN, explicit members and tuples,
+    TM1SUBSETALL, TM1FILTERBYLEVEL, TM1DRILLDOWNMEMBER, .MEMBERS, .CHILDREN, .DEFAULTMEMBER, UNION, EXCEPT
+    and INTERSECT
+    """
+
+    def __init__(self, server: "MockTM1Server", mdx: str):
+        self.server = server
+        self.mdx = mdx
+        self.tokens = []
+        position = 0
+        while position < len(mdx):
+            match = _MDX_TOKEN.match(mdx, position)
+            if not match:
+                if mdx[position:].strip():
+                    self._fail()
+                break
+            position = match.end()
+            bracket, word, number, punct = match.groups()
+            if bracket is not None:
+                self.tokens.append(("name", bracket[1:-1].replace("]]", "]")))
+            elif word is not None:
+                self.tokens.append(("word", word.upper()))
+            elif number is not None:
+                self.tokens.append(("number", int(number)))
+            else:
+                self.tokens.append(("punct", punct))
+        self.position = 0
+
+    def _fail(self, message: str = None):
+        raise MockTM1Error(400, message or f"Unsupported MDX: '{self.mdx}'", "MDX")
+
+    def _peek(self, offset: int = 0):
+        position = self.position + offset
+        return self.tokens[position] if position < len(self.tokens) else (None, None)
+
+    def _accept(self, kind: str, value: Any = None) -> bool:
+        token = self._peek()
+        if token[0] == kind and (value is None or token[1] == value):
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: Any = None):
+        token = self._peek()
+        if token[0] != kind or (value is not None and token[1] != value):
+            self._fail()
+        self.position += 1
+        return token[1]
+
+    def evaluate_set(self) -> MdxSet:
+        mdx_set = self.parse_set()
+        if self._peek()[0] is not None:
+            self._fail()
+        return mdx_set
+
+    def evaluate(self) -> Tuple[MockCube, List[Tuple[MdxSet, bool]], Optional[MdxSet]]:
+        self._expect("word", "SELECT")
+        axes = {}
+        while True:
+            non_empty = False
+            if self._accept("word", "NON"):
+                self._expect("word", "EMPTY")
+                non_empty = True
+            axis_set = self.parse_set()
+            if self._accept("word", "DIMENSION"):
+                self._expect("word", "PROPERTIES")
+                while self._peek()[0] is not None and self._peek() != ("word", "ON"):
+                    self.position += 1
+            self._expect("word", "ON")
+            axis = self._peek()
+            self.position += 1
+            if axis == ("word", "COLUMNS"):
+                ordinal = 0
+            elif axis == ("word", "ROWS"):
+                ordinal = 1
+            elif axis[0] == "number":
+                ordinal = axis[1]
+            elif axis == ("word", "AXIS"):
+                self._expect("punct", "(")
+                ordinal = self._expect("number")
+                self._expect("punct", ")")
+            else:
+                self._fail()
+            axes[ordinal] = (axis_set, non_empty)
+            if not self._accept("punct", ","):
+                break
+        self._expect("word", "FROM")
+        cube = self.server.cube(self._expect("name"))
+        where = None
+        if self._accept("word", "WHERE"):
+            where = self.parse_set()
+        if self._peek()[0] is not None or sorted(axes) != list(range(len(axes))) or len(axes) > 2:
+            self._fail()
+        return cube, [axes[ordinal] for ordinal in sorted(axes)], where
+
+    def parse_set(self) -> MdxSet:
+        result = self.parse_term()
+        while self._accept("punct", "*"):
+            result = self._crossjoin(result, self.parse_term())
+        return result
+
+    @staticmethod
+    def _crossjoin(left: MdxSet, right: MdxSet) -> MdxSet:
+        return MdxSet(left.hierarchies + right.hierarchies, [a + b for a in left.tuples for b in right.tuples])
+
+    def _union(self, sets: List[MdxSet]) -> MdxSet:
+        sets = [s for s in sets if s.hierarchies or s.tuples]
+        if not sets:
+            return MdxSet([], [])
+        for other in sets[1:]:
+            if len(other.hierarchies) != len(sets[0].hierarchies):
+                self._fail("Sets in a union must have the same dimensionality")
+        return MdxSet(sets[0].hierarchies, [t for s in sets for t in s.tuples])
+
+    def _arguments(self) -> List[Any]:
+        self._expect("punct", "(")
+        arguments = []
+        if not self._accept("punct", ")"):
+            while True:
+                if self._peek()[0] == "number":
+                    arguments.append(self._expect("number"))
+                elif self._peek()[0] == "word" and self._peek(1) != ("punct", "("):
+                    arguments.append(self._expect("word"))
+                else:
+                    arguments.append(self.parse_set())
+                if self._accept("punct", ")"):
+                    break
+                self._expect("punct", ",")
+        return arguments
+
+    def parse_term(self) -> MdxSet:
+        kind, value = self._peek()
+        if (kind, value) == ("punct", "{"):
+            self.position += 1
+            sets = []
+            if not self._accept("punct", "}"):
+                while True:
+                    sets.append(self.parse_set())
+                    if self._accept("punct", "}"):
+                        break
+                    self._expect("punct", ",")
+            return self._union(sets)
+
+        if (kind, value) == ("punct", "("):
+            self.position += 1
+            members = [self.parse_set()]
+            while self._accept("punct", ","):
+                members.append(self.parse_set())
+            self._expect("punct", ")")
+            result = members[0]
+            for member in members[1:]:
+                result = self._crossjoin(result, member)
+            return result
+
+        if kind == "word":
+            self.position += 1
+            arguments = self._arguments()
+            if value == "TM1SUBSETALL":
+                hierarchy = self._single_hierarchy(arguments[0])
+                return MdxSet([hierarchy], [(element,) for element in hierarchy.elements])
+            if value == "TM1FILTERBYLEVEL":
+                source, levels = arguments[0], set(arguments[1:])
+                hierarchy = self._single_hierarchy(source)
+                return MdxSet(
+                    source.hierarchies, [t for t in source.tuples if hierarchy.index.get_level(t[0]) in levels]
+                )
+            if value == "TM1DRILLDOWNMEMBER":
+                hierarchy = self._single_hierarchy(arguments[0])
+                recursive = "RECURSIVE" in arguments[1:]
+                tuples = []
+                for (element,) in arguments[0].tuples:
+                    tuples.append((element,))
+                    if recursive:
+                        members = hierarchy.index.get_members_under_consolidation(element)
+                    else:
+                        members = hierarchy.index.get_children(element)
+                    tuples.extend((member,) for member in members)
+                return MdxSet([hierarchy], tuples)
+            if value == "CROSSJOIN":
+                return self._crossjoin(arguments[0], arguments[1])
+            if value == "UNION":
+                return self._union(arguments)
+            if value in ("EXCEPT", "INTERSECT"):
+                right = set(arguments[1].tuples)
+                keep = (lambda t: t not in right) if value == "EXCEPT" else (lambda t: t in right)
+                return MdxSet(arguments[0].hierarchies, [t for t in arguments[0].tuples if keep(t)])
+            self._fail(f"Unsupported MDX function: '{value}'")
+
+        if kind == "name":
+            return self.parse_path()
+        self._fail()
+
+    def _single_hierarchy(self, mdx_set: Any) -> MockHierarchy:
+        if not isinstance(mdx_set, MdxSet) or len(mdx_set.hierarchies) != 1:
+            self._fail()
+        return mdx_set.hierarchies[0]
+
+    def parse_path(self) -> MdxSet:
+        names = [self._expect("name")]
+        suffix = None
+        while self._accept("punct", "."):
+            kind, value = self._peek()
+            self.position += 1
+            if kind == "name":
+                names.append(value)
+            elif kind == "word":
+                suffix = value
+                break
+            else:
+                self._fail()
+
+        dimension = self.server.dimension(names[0])
+        if len(names) == 1:
+            hierarchy, element = dimension.hierarchy(), None
+        elif len(names) == 2 and _normalize(names[1]) in dimension.hierarchies:
+            # [dimension].[hierarchy] takes precedence over [dimension].[element]
+            hierarchy, element = dimension.hierarchy(names[1]), None
+        elif len(names) == 2:
+            hierarchy, element = dimension.hierarchy(), names[1]
+        else:
+            hierarchy, element = dimension.hierarchy(names[1]), names[-1]
+
+        if element is not None:
+            element = hierarchy.element_name(element)
+        if suffix in ("MEMBERS", "ALLMEMBERS") and element is None:
+            return MdxSet([hierarchy], [(e,) for e in hierarchy.elements])
+        if suffix == "DEFAULTMEMBER" and element is None:
+            return MdxSet([hierarchy], [(next(iter(hierarchy.elements)),)] if hierarchy.elements else [])
+        if suffix == "CHILDREN" and element is not None:
+            return MdxSet([hierarchy], [(child,) for child in hierarchy.index.get_children(element)])
+        if suffix is None and element is not None:
+            return MdxSet([hierarchy], [(element,)])
+        if suffix is None:
+            # a hierarchy as set is its default member
+            return MdxSet([hierarchy], [(next(iter(hierarchy.elements)),)] if hierarchy.elements else [])
+        self._fail()
+
+
+class MockCellset:
+    def __init__(self, cellset_id: str, cube: MockCube, axes: List[MdxSet], title: Optional[MdxSet]):
+        self.id = cellset_id
+        self.cube = cube
+        self.axes = axes
+        self.title = title
+        self.coordinates: List[Tuple[str, ...]] = []
+        self._values: Tuple[int, List[Any], List[bool]] = (-1, [], [])
+
+    @classmethod
+    def from_mdx(cls, server: "MockTM1Server", mdx: str) -> "MockCellset":
+        cube, axes, where = MdxEvaluator(server, mdx).evaluate()
+        dimensions = [_normalize(dimension.name) for dimension in cube.dimensions]
+
+        # dimensions that are on no axis end up in the title axis with their default member
+        on_axes = {_normalize(h.dimension_name) for axis, _ in axes for h in axis.hierarchies}
+        title_hierarchies, title_tuple = [], ()
+        where_members = {}
+        if where is not None and where.tuples:
+            for hierarchy, element in zip(where.hierarchies, where.tuples[0]):
+                where_members[_normalize(hierarchy.dimension_name)] = (hierarchy, element)
+        for dimension in cube.dimensions:
+            key = _normalize(dimension.name)
+            if key in on_axes:
+                continue
+            hierarchy, element = where_members.get(key, (dimension.hierarchy(), None))
+            if element is None:
+                element = next(iter(hierarchy.elements))
+            title_hierarchies.append(hierarchy)
+            title_tuple += (element,)
+        title = MdxSet(title_hierarchies, [title_tuple]) if title_hierarchies else None
+
+        def coordinates_of(*tuples_and_sets) -> Tuple[str, ...]:
+            members = {}
+            for mdx_set, member_tuple in tuples_and_sets:
+                for hierarchy, element in zip(mdx_set.hierarchies, member_tuple):
+                    members[_normalize(hierarchy.dimension_name)] = element
+            return tuple(members[dimension] for dimension in dimensions)
+
+        axis_sets = [axis for axis, _ in axes]
+        extra = [(title, title.tuples[0])] if title else []
+        if len(axis_sets) == 1:
+            grid = [[coordinates_of((axis_sets[0], t), *extra) for t in axis_sets[0].tuples]]
+        else:
+            columns, rows = axis_sets
+            grid = [[coordinates_of((columns, c), (rows, r), *extra) for c in columns.tuples] for r in rows.tuples]
+
+        # NON EMPTY drops tuples whose cells are all empty
+        if axes[0][1] or (len(axes) > 1 and axes[1][1]):
+            width = len(grid[0]) if grid else 0
+            values, _ = cube.values([coordinates for row in grid for coordinates in row])
+            empty = [
+                [value in (0, "", None) for value in values[r * width : (r + 1) * width]] for r in range(len(grid))
+            ]
+            if axes[0][1]:
+                keep = [i for i in range(width) if not all(row[i] for row in empty)]
+                axis_sets[0] = MdxSet(axis_sets[0].hierarchies, [axis_sets[0].tuples[i] for i in keep])
+                grid = [[row[i] for i in keep] for row in grid]
+                empty = [[row[i] for i in keep] for row in empty]
+            if len(axes) > 1 and axes[1][1]:
+                keep = [i for i, row in enumerate(empty) if not all(row)]
+                axis_sets[1] = MdxSet(axis_sets[1].hierarchies, [axis_sets[1].tuples[i] for i in keep])
+                grid = [grid[i] for i in keep]
+
+        cellset = cls(uuid.uuid4().hex, cube, axis_sets, title)
+        cellset.coordinates = [coordinates for row in grid for coordinates in row]
+        return cellset
+
+    def member_entity(self, hierarchy: MockHierarchy, element: str) -> Dict:
+        entity = OrderedDict(
+            [
+                ("Name", element),
+                ("UniqueName", hierarchy.element_unique_name(element)),
+                ("Type", hierarchy.elements[element]),
+                ("Ordinal", hierarchy.index.get_element_id(element)),
+                ("IsPlaceholder", False),
+                ("Weight", 1),
+                ("Attributes", dict(hierarchy.attributes.get(element, {}))),
+                ("DisplayInfo", 0),
+                ("DisplayInfoAbove", 0),
+                ("Level", hierarchy.index.get_level(element)),
+            ]
+        )
+        entity["Element"] = lambda: hierarchy.element_entity(element)
+        return entity
+
+    def axis_entity(self, ordinal: int, mdx_set: MdxSet) -> Dict:
+        def tuples():
+            return [
+                OrderedDict(
+                    [
+                        ("Ordinal", i),
+                        (
+                            "Members",
+                            Collection.of(
+                                [self.member_entity(h, e) for h, e in zip(mdx_set.hierarchies, member_tuple)]
+                            ),
+                        ),
+                    ]
+                )
+                for i, member_tuple in enumerate(mdx_set.tuples)
+            ]
+
+        def hierarchies():
+            return [
+                OrderedDict(
+                    [
+                        ("Name", h.name),
+                        ("UniqueName", h.unique_name),
+                        ("Dimension", lambda h=h: {"Name": h.dimension_name, "UniqueName": f"[{h.dimension_name}]"}),
+                    ]
+                )
+                for h in mdx_set.hierarchies
+            ]
+
+        return OrderedDict(
+            [
+                ("Ordinal", ordinal),
+                ("Cardinality", len(mdx_set.tuples)),
+                ("Hierarchies", lambda: Collection.of(hierarchies())),
+                ("Tuples", lambda: Collection(tuples)),
+            ]
+        )
+
+    def _cell_values(self) -> Tuple[List[Any], List[bool]]:
+        # values are computed once per version of the cube
+        version, values, consolidated = self._values
+        if version != self.cube.version:
+            values, consolidated = self.cube.values(self.coordinates)
+            self._values = (self.cube.version, values, consolidated)
+        return values, consolidated
+
+    def _cell_properties(self) -> Dict[str, Callable[[int], Any]]:
+        values, consolidated = self._cell_values()
+        return OrderedDict(
+            [
+                ("Ordinal", lambda i: i),
+                ("Value", values.__getitem__),
+                ("FormattedValue", lambda i: values[i] if isinstance(values[i], str) else f"{values[i]:,.2f}"),
+                ("Updateable", lambda i: (1 << 28) + 2 if consolidated[i] else 2),
+                ("Consolidated", consolidated.__getitem__),
+                ("RuleDerived", lambda i: False),
+                ("Annotated", lambda i: False),
+                ("HasPicklist", lambda i: False),
+                ("HasDrillthrough", lambda i: False),
+            ]
+        )
+
+    def cell_entity(self, ordinal: int) -> Dict:
+        return OrderedDict((name, get(ordinal)) for name, get in self._cell_properties().items())
+
+    def shape_cells(self, options: QueryOptions) -> List[Dict]:
+        """Cells with query options applied, column by column"""
+        properties = self._cell_properties()
+        ordinals = range(len(self.coordinates))
+        if options.filter:
+            getters = list(properties.items())
+            ordinals = [i for i in ordinals if options.filter({name: get(i) for name, get in getters})]
+        if options.skip:
+            ordinals = ordinals[options.skip :]
+        if options.top is not None:
+            ordinals = ordinals[: options.top]
+        names = [name for name in (options.select or properties) if name in properties]
+        columns = [[properties[name](i) for i in ordinals] for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)] if names else [{} for _ in ordinals]
+
+    def entity(self) -> Dict:
+        axes = [self.axis_entity(i, axis) for i, axis in enumerate(self.axes)]
+        if self.title is not None:
+            axes.append(self.axis_entity(2, self.title))
+        return OrderedDict(
+            [
+                ("ID", self.id),
+                ("Cube", lambda: self.cube.entity()),
+                ("Axes", lambda: Collection.of(axes, key="Ordinal")),
+                (
+                    "Cells",
+                    lambda: Collection(
+                        lambda: [self.cell_entity(i) for i in range(len(self.coordinates))], shape=self.shape_cells
+                    ),
+                ),
+            ]
+        )
+
+
+# ---------------------------------------------------------------------------
+# Contents, processes, async operations
+# ---------------------------------------------------------------------------
+
+
+class MockFolder:
+    def __init__(self, name: str):
+        self.name = name
+        # normalized name -> MockFolder or MockDocument
+        self.children: Dict[str, Union["MockFolder", "MockDocument"]] = OrderedDict()
+
+    def entity(self) -> Dict:
+        return OrderedDict(
+            [
+                ("@odata.type", "#ibm.tm1.api.v1.Folder"),
+                ("ID", self.name),
+                ("Name", self.name),
+                ("Contents", lambda: Collection.of([child.entity() for child in self.children.values()])),
+            ]
+        )
+
+
+class MockDocument:
+    def __init__(self, name: str, content: bytes = b""):
+        self.name = name
+        self.content = content
+        # upload id -> {part number: bytes}
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+
+    def entity(self) -> Dict:
+        return OrderedDict(
+            [
+                ("@odata.type", "#ibm.tm1.api.v1.Document"),
+                ("ID", self.name),
+                ("Name", self.name),
+                ("Size", len(self.content)),
+                ("Content", lambda: self.content),
+            ]
+        )
+
+
+ProcessHandler = Callable[[Dict, Dict[str, Any]], Union[str, Tuple[str, Optional[str]], None]]
+
+
+class ProcessCall:
+    """Execution of a process as recorded by the server"""
+
+    def __init__(self, name: str, process: Dict, parameters: Dict[str, Any]):
+        self.name = name
+        self.process = process
+        self.parameters = parameters
+
+    @property
+    def prolog(self) -> str:
+        return self.process.get("PrologProcedure", "")
+
+    @property
+    def metadata(self) -> str:
+        return self.process.get("MetadataProcedure", "")
+
+    @property
+    def data(self) -> str:
+        return self.process.get("DataProcedure", "")
+
+    @property
+    def epilog(self) -> str:
+        return self.process.get("EpilogProcedure", "")
+
+    def __repr__(self):
+        return f"ProcessCall({self.name!r}, {self.parameters!r})"
+
+
+class _Response:
+    def __init__(self, status: int = 200, body: Union[bytes, str, Dict, List, None] = None, headers: Dict = None):
+        self.status = status
+        self.headers = dict(headers or {})
+        if isinstance(body, (dict, list)):
+            self.body = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.headers.setdefault("Content-Type", "application/json; odata.metadata=minimal; charset=utf-8")
+        elif isinstance(body, str):
+            self.body = body.encode("utf-8")
+            self.headers.setdefault("Content-Type", "text/plain; charset=utf-8")
+        else:
+            self.body = body or b""
+            if body is not None:
+                self.headers.setdefault("Content-Type", "application/octet-stream")
+
+
+def _error_response(error: MockTM1Error) -> _Response:
+    return _Response(error.status, {"error": {"code": error.code, "message": error.message}})
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockTM1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            body = b"".join(chunks)
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def _handle(self):
+        mock: MockTM1Server = self.server.mock
+        started = time.perf_counter()
+        body = self._read_body()
+        response = mock.handle_request(self.command, self.path, dict(self.headers.items()), body)
+
+        payload = response.body
+        if (
+            mock.compress_responses
+            and len(payload) >= mock.compress_min_size
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+        ):
+            payload = gzip.compress(payload, compresslevel=1)
+            response.headers["Content-Encoding"] = "gzip"
+
+        # latency and bandwidth are simulated per request, independent of the time the handler took
+        delay = mock.latency + (len(payload) / mock.bandwidth if mock.bandwidth else 0)
+        remaining = delay - (time.perf_counter() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+        self.send_response(response.status)
+        for key, value in response.headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = do_HEAD = _handle
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+_SEGMENT = re.compile(r"([^/(]+)(?:\(((?:'(?:[^']|'')*'|[^)'])*)\))?(?:/|$)")
+
+
+def _parse_path(path: str) -> List[Tuple[str, Optional[str]]]:
+    """'Dimensions('a')/Hierarchies('b')' -> [('Dimensions', 'a'), ('Hierarchies', 'b')]"""
+    segments, position = [], 0
+    while position < len(path):
+        match = _SEGMENT.match(path, position)
+        if not match or match.end() == position:
+            raise MockTM1Error(400, f"Invalid URL: '{path}'")
+        name, key = match.group(1), match.group(2)
+        if key is not None and key.startswith("'") and key.endswith("'"):
+            key = key[1:-1].replace("''", "'")
+        segments.append((name, key))
+        position = match.end()
+    return segments
+
+
+def _named_keys(key: str) -> Dict[str, str]:
+    """ "ParentName='a',ComponentName='b'" -> {'ParentName': 'a', 'ComponentName': 'b'}"""
+    return {name: value.replace("''", "'") for name, value in re.findall(r"(\w+)\s*=\s*'((?:[^']|'')*)'", key or "")}
+
+
+class MockTM1Server:
+    """TM1 REST API stand-in on localhost. See module docstring"""
+
+    def __init__(
+        self,
+        version: str = "11.8.02300.3",
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        compress_responses: bool = False,
+        compress_min_size: int = 1024,
+        async_duration: float = 0.0,
+        port: int = 0,
+    ):
+        """
+        :param version: product version. From '12' on, FileService uses 'Files' and multipart uploads
+        :param latency: seconds added to every response
+        :param bandwidth: bytes per second for response bodies. None: unlimited
+        :param compress_responses: gzip response bodies for clients that accept it
+        :param compress_min_size: smallest body in bytes that is compressed
+        :param async_duration: seconds an async operation stays pending before its result can be polled
+        :param port: 0 picks a free port
+        """
+        self.version = version
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.compress_responses = compress_responses
+        self.compress_min_size = compress_min_size
+        self.async_duration = async_duration
+        self.server_name = "MockTM1"
+
+        self._lock = threading.RLock()
+        self.cubes: Dict[str, MockCube] = OrderedDict()
+        self.dimensions: Dict[str, MockDimension] = OrderedDict()
+        self.cellsets: Dict[str, MockCellset] = {}
+        self.processes: Dict[str, Dict] = OrderedDict()
+        self.contents: Dict[str, MockFolder] = {"blobs": MockFolder("Blobs"), "files": MockFolder("Files")}
+        self.error_logs: Dict[str, str] = OrderedDict()
+        self.sessions: Dict[str, float] = {}
+        # threads of the active session, e.g. {"ID": 1, "State": "Wait", "Function": "POST /api/v1/Processes"}
+        self.threads: List[Dict] = []
+        self._async: Dict[str, Tuple[float, threading.Event, List[_Response]]] = {}
+        self._process_handlers: List[Tuple[str, ProcessHandler]] = []
+
+        self.requests: List[Tuple[str, str]] = []
+        self.process_calls: List[ProcessCall] = []
+        self.bytes_received = 0
+
+        self._httpd = _HTTPServer(("127.0.0.1", port), _RequestHandler)
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    # --- lifecycle ---------------------------------------------------------
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/api/v1"
+
+    @property
+    def connection_kwargs(self) -> Dict[str, Any]:
+        """arguments for TM1Service or RestService"""
+        return {"address": "127.0.0.1", "port": self.port, "user": "admin", "password": "apple", "ssl": False}
+
+    def start(self) -> "MockTM1Server":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="MockTM1Server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockTM1Server":
+        return self.start()
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.stop()
+
+    def reset_statistics(self):
+        with self._lock:
+            self.requests.clear()
+            self.process_calls.clear()
+            self.bytes_received = 0
+
+    # --- model setup -------------------------------------------------------
+
+    def add_dimension(
+        self,
+        name: str,
+        elements: Union[Dict[str, str], Iterable[str]],
+        edges: Dict[Tuple[str, str], float] = None,
+        attributes: Dict[str, Dict[str, Any]] = None,
+    ) -> MockDimension:
+        """
+        :param elements: element names (numeric) or element name -> type
+        :param edges: (parent, component) -> weight
+        :param attributes: element name -> {attribute name: value}
+        """
+        with self._lock:
+            dimension = MockDimension(name)
+            hierarchy = dimension.hierarchy()
+            if not isinstance(elements, dict):
+                elements = OrderedDict((element, "Numeric") for element in elements)
+            for element, element_type in elements.items():
+                hierarchy.add_element(element, element_type)
+            for (parent, component), weight in (edges or {}).items():
+                hierarchy.add_edge(parent, component, weight)
+            self.dimensions[_normalize(name)] = dimension
+            if attributes:
+                for values in attributes.values():
+                    for attribute, value in values.items():
+                        attribute_type = "String" if isinstance(value, str) else "Numeric"
+                        hierarchy.attribute_types.setdefault(attribute, attribute_type)
+                self._update_attribute_cube(dimension)
+                cube = self.cube("}ElementAttributes_" + name)
+                for element, values in attributes.items():
+                    for attribute, value in values.items():
+                        cube.write((hierarchy.element_name(element), attribute), value)
+            return dimension
+
+    def generate_dimension(self, name: str, leaves: int, fan_out: int = 10, string_elements: int = 0) -> MockDimension:
+        """Dimension with `leaves` numeric elements under a balanced tree of consolidations
+
+        :param fan_out: components per consolidation
+        :param string_elements: string elements (without parents) added at the end
+        """
+        elements = OrderedDict([(f"Total {name}", "Consolidated")])
+        edges = OrderedDict()
+        level = [f"{name} {i:0{len(str(leaves))}d}" for i in range(leaves)]
+        for element in level:
+            elements[element] = "Numeric"
+        depth = 1
+        while len(level) > fan_out:
+            parents = []
+            for start in range(0, len(level), fan_out):
+                parent = f"{name} L{depth} {start // fan_out}"
+                elements[parent] = "Consolidated"
+                parents.append(parent)
+                for child in level[start : start + fan_out]:
+                    edges[(parent, child)] = 1
+            level, depth = parents, depth + 1
+        for child in level:
+            edges[(f"Total {name}", child)] = 1
+        for i in range(string_elements):
+            elements[f"{name} Text {i}"] = "String"
+        return self.add_dimension(name, elements, edges)
+
+    def add_cube(self, name: str, dimensions: List[str]) -> MockCube:
+        with self._lock:
+            cube = MockCube(name, [self.dimension(dimension) for dimension in dimensions])
+            self.cubes[_normalize(name)] = cube
+            return cube
+
+    def generate_cube(self, name: str, dimensions: List[str], cells: int, seed: int = 0) -> MockCube:
+        """Cube with `cells` random numeric leaf cells. Deterministic for a seed"""
+        cube = self.add_cube(name, dimensions)
+        rng = random.Random(seed)
+        leaves = [
+            [element for element, element_type in d.hierarchy().elements.items() if element_type == "Numeric"]
+            for d in cube.dimensions
+        ]
+        capacity = 1
+        for elements in leaves:
+            capacity *= len(elements)
+        with self._lock:
+            while len(cube.cells) < min(cells, capacity):
+                coordinates = tuple(rng.choice(elements) for elements in leaves)
+                cube.cells[coordinates] = float(rng.randint(1, 1000))
+        return cube
+
+    def add_process_handler(self, name: str, handler: ProcessHandler):
+        """Canned result for processes
+
+        :param name: process name, or a prefix ending with '*'. '*' applies to all processes. Exact names
+            win over prefixes, longer prefixes over shorter ones, later handlers over earlier ones
+        :param handler: called with the process as dict and the parameters as dict. Returns the
+            ProcessExecuteStatusCode, or a tuple of status code and error log content, or None for
+            'CompletedSuccessfully'
+        """
+        self._process_handlers.insert(0, (name, handler))
+
+    def cube(self, name: str) -> MockCube:
+        try:
+            return self.cubes[_normalize(name)]
+        except KeyError:
+            raise _not_found("Cube", name) from None
+
+    def dimension(self, name: str) -> MockDimension:
+        try:
+            return self.dimensions[_normalize(name)]
+        except KeyError:
+            raise _not_found("Dimension", name) from None
+
+    def file(self, name: str, folder: str = "Blobs") -> bytes:
+        return self.contents[_normalize(folder)].children[_normalize(name)].content
+
+    # --- requests ----------------------------------------------------------
+
+    def handle_request(self, method: str, raw_url: str, headers: Dict[str, str], body: bytes) -> _Response:
+        headers = {key.lower(): value for key, value in headers.items()}
+        split = urlsplit(raw_url)
+        path = unquote(split.path)
+        with self._lock:
+            self.requests.append((method, unquote(raw_url)))
+            self.bytes_received += len(body)
+
+        prefix = "/api/v1/"
+        if not path.startswith(prefix):
+            return _error_response(MockTM1Error(404, f"Unknown resource: '{path}'"))
+        path = path[len(prefix) :]
+
+        session_cookie = self._session_cookie(headers)
+        set_cookie = None
+        if session_cookie not in self.sessions:
+            if "authorization" not in headers:
+                return _error_response(MockTM1Error(401, "Unauthorized", "Unauthorized"))
+            session_cookie = uuid.uuid4().hex
+            self.sessions[session_cookie] = time.time()
+            set_cookie = f"TM1SessionId={session_cookie}; Path=/; HttpOnly"
+
+        try:
+            if "respond-async" in headers.get("prefer", "") and not path.startswith("_async"):
+                response = self._start_async(method, path, split.query, headers, body)
+            else:
+                response = self._dispatch(method, path, split.query, headers, body, session_cookie)
+        except MockTM1Error as error:
+            response = _error_response(error)
+        except (KeyError, ValueError, TypeError, IndexError) as error:
+            response = _error_response(MockTM1Error(400, f"{type(error).__name__}: {error}"))
+        except Exception as error:
+            response = _error_response(MockTM1Error(500, f"{type(error).__name__}: {error}"))
+
+        if set_cookie:
+            response.headers["Set-Cookie"] = set_cookie
+        return response
+
+    @staticmethod
+    def _session_cookie(headers: Dict[str, str]) -> Optional[str]:
+        for cookie in headers.get("cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == "TM1SessionId":
+                return value
+        return None
+
+    def _start_async(self, method, path, query, headers, body) -> _Response:
+        async_id = uuid.uuid4().hex
+        done = threading.Event()
+        result: List[_Response] = []
+        ready_at = time.monotonic() + self.async_duration
+
+        def run():
+            try:
+                result.append(self._dispatch(method, path, query, headers, body, None))
+            except MockTM1Error as error:
+                result.append(_error_response(error))
+            except Exception as error:
+                result.append(_error_response(MockTM1Error(500, str(error))))
+            done.set()
+
+        with self._lock:
+            self._async[async_id] = (ready_at, done, result)
+        threading.Thread(target=run, daemon=True).start()
+        return _Response(202, b"", {"Location": f"_async('{async_id}')"})
+
+    def _poll_async(self, method: str, async_id: str) -> _Response:
+        with self._lock:
+            if async_id not in self._async:
+                raise _not_found("Async operation", async_id)
+            ready_at, done, result = self._async[async_id]
+            if method == "DELETE":
+                del self._async[async_id]
+                return _Response(204)
+        if time.monotonic() < ready_at or not done.is_set():
+            return _Response(202, b"")
+        with self._lock:
+            self._async.pop(async_id, None)
+        inner = result[0]
+        # like TM1 12: the status of the operation is in the asyncresult header
+        headers = dict(inner.headers)
+        headers["asyncresult"] = f"{inner.status} {'OK' if inner.status < 400 else 'Error'}"
+        return _Response(200 if inner.status < 400 else inner.status, inner.body, headers)
+
+    def _dispatch(self, method, path, query, headers, body, session_cookie) -> _Response:
+        segments = _parse_path(path)
+        first = segments[0][0]
+
+        if first == "_async":
+            return self._poll_async(method, segments[0][1])
+        if first == "ActiveSession" and segments[-1][0] == "tm1.Close":
+            with self._lock:
+                self.sessions.pop(session_cookie, None)
+            return _Response(204)
+
+        with self._lock:
+            if method == "GET":
+                return self._get(segments, query, headers)
+            if method == "DELETE":
+                return self._delete(segments)
+            data = json.loads(body.decode("utf-8")) if body and not self._is_binary(segments) else body
+            if method == "POST":
+                return self._post(segments, query, headers, data)
+            if method == "PATCH":
+                return self._patch(segments, data)
+            if method == "PUT":
+                return self._put(segments, data)
+        raise MockTM1Error(405, f"Method {method} not allowed")
+
+    @staticmethod
+    def _is_binary(segments) -> bool:
+        return segments[-1][0] in ("Content", "Parts")
+
+    # --- GET ---------------------------------------------------------------
+
+    def _root(self) -> Dict:
+        return OrderedDict(
+            [
+                ("Configuration", lambda: {"ProductVersion": self.version, "ServerName": self.server_name}),
+                ("ActiveConfiguration", lambda: {"Administration": {"DisableSandboxing": False}}),
+                ("ActiveUser", lambda: {"Name": "admin", "Groups": Collection.of([{"Name": "ADMIN"}])}),
+                ("ActiveSession", lambda: {"Threads": Collection.of(list(self.threads), key="ID")}),
+                (
+                    "Cubes",
+                    lambda: Collection(
+                        lambda: [cube.entity() for cube in self.cubes.values()],
+                        lambda name: self.cubes[_normalize(name)].entity() if _normalize(name) in self.cubes else None,
+                    ),
+                ),
+                (
+                    "Dimensions",
+                    lambda: Collection(
+                        lambda: [dimension.entity() for dimension in self.dimensions.values()],
+                        lambda name: (
+                            self.dimensions[_normalize(name)].entity() if _normalize(name) in self.dimensions else None
+                        ),
+                    ),
+                ),
+                (
+                    "Cellsets",
+                    lambda: Collection(
+                        lambda: [cellset.entity() for cellset in self.cellsets.values()],
+                        lambda cellset_id: (
+                            self.cellsets[cellset_id].entity() if cellset_id in self.cellsets else None
+                        ),
+                    ),
+                ),
+                ("Processes", lambda: Collection.of(list(self.processes.values()))),
+                ("Contents", lambda: Collection.of([folder.entity() for folder in self.contents.values()])),
+                (
+                    "ErrorLogFiles",
+                    lambda: Collection.of(
+                        [
+                            {"Filename": name, "Content": lambda content=content: content.encode("utf-8")}
+                            for name, content in self.error_logs.items()
+                        ],
+                        key="Filename",
+                    ),
+                ),
+            ]
+        )
+
+    def _navigate(self, segments) -> Any:
+        node: Any = self._root()
+        for name, key in segments:
+            if name in ("$count", "$value"):
+                break
+            if not isinstance(node, dict) or name not in node:
+                raise MockTM1Error(404, f"Resource not found: '{name}'")
+            node = node[name]
+            node = node() if callable(node) else node
+            if key is not None:
+                if not isinstance(node, Collection):
+                    raise MockTM1Error(404, f"Resource not found: '{name}'")
+                entity = node.get(key)
+                if entity is None:
+                    raise _not_found(name.rstrip("s"), key)
+                node = entity
+        return node
+
+    def _get(self, segments, query: str, headers) -> _Response:
+        node = self._navigate(segments)
+        last = segments[-1][0]
+        if last == "$count":
+            items = node.items() if isinstance(node, Collection) else node
+            return _Response(200, str(len(items)))
+        if isinstance(node, bytes):
+            return _Response(200, node)
+        if last == "$value":
+            return _Response(200, "" if node is None else str(node))
+        if not isinstance(node, (dict, Collection, list)):
+            return _Response(200, {"@odata.context": "$metadata#" + last, "value": node})
+
+        options = QueryOptions.from_query_string(query)
+        if isinstance(node, (Collection, list)):
+            value = node.shape(options) if isinstance(node, Collection) else shape_collection(node, options)
+            return _Response(200, {"@odata.context": "$metadata#" + last, "value": value})
+
+        result = shape_entity(node, options)
+        if segments[0][0] == "Cellsets" and "tm1.compact=v0" in headers.get("accept", ""):
+            return self._compact_cellset(result, options)
+        result["@odata.context"] = "$metadata#" + segments[0][0] + "/$entity"
+        result.move_to_end("@odata.context", last=False)
+        return _Response(200, result)
+
+    @staticmethod
+    def _compact_cellset(result: Dict, options: QueryOptions) -> _Response:
+        cells_options = options.expand.get("Cells")
+        if cells_options is None or cells_options.select is None or len(options.expand) != 1:
+            raise MockTM1Error(400, "Compact JSON is only supported for Cells with $select")
+        properties = cells_options.select
+        context = f"$metadata#Cellsets(Cells({','.join(properties)}))/$entity"
+        cells = [[cell[p] for p in properties] for cell in result["Cells"]]
+        return _Response(200, {"@odata.context": context, "value": [result.get("ID"), cells]})
+
+    # --- POST, PATCH, PUT, DELETE -----------------------------------------
+
+    def _post(self, segments, query, headers, data) -> _Response:
+        names = [name for name, _ in segments]
+        last = names[-1]
+
+        if names == ["ExecuteMDX"]:
+            cellset = MockCellset.from_mdx(self, data["MDX"])
+            self.cellsets[cellset.id] = cellset
+            return _Response(201, {"@odata.context": "$metadata#Cellsets/$entity", "ID": cellset.id})
+
+        if names == ["ExecuteMDXSetExpression"]:
+            return self._execute_set_expression(data["MDX"], query)
+
+        if names[0] == "Cubes" and last == "tm1.Update":
+            cube = self.cube(segments[0][1])
+            for update in data if isinstance(data, list) else [data]:
+                for cell in update["Cells"]:
+                    cube.write(self._bound_coordinates(cube, cell["Tuple@odata.bind"]), update["Value"])
+            return _Response(204)
+
+        if names == ["Cubes"]:
+            dimensions = [_parse_path(bind)[0][1] for bind in data["Dimensions@odata.bind"]]
+            self.add_cube(data["Name"], dimensions)
+            return _Response(201, {"Name": data["Name"]})
+
+        if names == ["Dimensions"]:
+            return self._create_dimension(data)
+
+        if names[0] == "Dimensions" and last == "Elements":
+            hierarchy = self._hierarchy(segments)
+            hierarchy.add_element(data["Name"], data.get("Type", "Numeric"))
+            for component in data.get("Components", []):
+                hierarchy.add_edge(data["Name"], component["Name"], component.get("Weight", 1))
+            return _Response(201, {"Name": data["Name"]})
+
+        if names[0] == "Dimensions" and last == "ElementAttributes":
+            hierarchy = self._hierarchy(segments)
+            for attribute in data if isinstance(data, list) else [data]:
+                hierarchy.attribute_types[attribute["Name"]] = attribute.get("Type", "String")
+            self._update_attribute_cube(self.dimension(segments[0][1]))
+            return _Response(201)
+
+        if names[0] == "Dimensions" and last == "Edges":
+            hierarchy = self._hierarchy(segments)
+            for edge in data if isinstance(data, list) else [data]:
+                hierarchy.add_edge(edge["ParentName"], edge["ComponentName"], edge.get("Weight", 1))
+            return _Response(201)
+
+        if names == ["Processes"]:
+            if _normalize(data["Name"]) in {_normalize(name) for name in self.processes}:
+                raise MockTM1Error(400, f"Process '{data['Name']}' already exists")
+            self.processes[data["Name"]] = data
+            return _Response(201, data)
+
+        if names[0] == "Processes" and last in ("tm1.Execute", "tm1.ExecuteWithReturn"):
+            process = self._process(segments[0][1])
+            parameters = {p["Name"]: p.get("Value") for p in (data or {}).get("Parameters", [])}
+            summary = self._execute_process(process, parameters)
+            if last == "tm1.Execute":
+                if summary["ProcessExecuteStatusCode"] not in ("CompletedSuccessfully", "CompletedWithMessages"):
+                    raise MockTM1Error(400, f"Process '{process['Name']}' failed")
+                return _Response(204)
+            return _Response(201, summary)
+
+        if names == ["ExecuteProcessWithReturn"]:
+            process = data["Process"]
+            parameters = {p["Name"]: p.get("Value") for p in process.get("Parameters", [])}
+            return _Response(201, self._execute_process(process, parameters))
+
+        if names[0] == "Contents":
+            return self._post_contents(segments, data)
+
+        raise MockTM1Error(404, f"Unsupported action: '{'/'.join(names)}'")
+
+    def _patch(self, segments, data) -> _Response:
+        names = [name for name, _ in segments]
+        if names == ["Cellsets", "Cells"]:
+            cellset = self._cellset(segments[0][1])
+            for cell in data:
+                cellset.cube.write(cellset.coordinates[cell["Ordinal"]], cell["Value"])
+            return _Response(204)
+
+        if names == ["Dimensions", "Hierarchies"]:
+            hierarchy = self._hierarchy(segments)
+            if "Elements" in data:
+                for element in list(hierarchy.elements):
+                    hierarchy.remove_element(element)
+                for element in data["Elements"]:
+                    hierarchy.add_element(element["Name"], element.get("Type", "Numeric"))
+            for edge in data.get("Edges", []):
+                hierarchy.add_edge(edge["ParentName"], edge["ComponentName"], edge.get("Weight", 1))
+            return _Response(204)
+
+        raise MockTM1Error(404, f"Unsupported update: '{'/'.join(names)}'")
+
+    def _put(self, segments, data) -> _Response:
+        if segments[0][0] == "Contents" and segments[-1][0] == "Content":
+            document = self._content_node(segments[:-1])
+            if not isinstance(document, MockDocument):
+                raise MockTM1Error(404, "Document not found")
+            document.content = data
+            return _Response(204)
+        raise MockTM1Error(404, "Unsupported resource")
+
+    def _delete(self, segments) -> _Response:
+        names = [name for name, _ in segments]
+        if names == ["Cellsets"]:
+            self._cellset(segments[0][1])
+            del self.cellsets[segments[0][1]]
+        elif names == ["Processes"]:
+            process = self._process(segments[0][1])
+            del self.processes[process["Name"]]
+        elif names == ["Cubes"]:
+            del self.cubes[_normalize(self.cube(segments[0][1]).name)]
+        elif names == ["Dimensions"]:
+            del self.dimensions[_normalize(self.dimension(segments[0][1]).name)]
+        elif names[0] == "Dimensions" and names[-1] == "Elements":
+            self._hierarchy(segments).remove_element(segments[-1][1])
+        elif names[0] == "Dimensions" and names[-1] == "ElementAttributes":
+            hierarchy = self._hierarchy(segments)
+            attribute = next(
+                (a for a in hierarchy.attribute_types if _normalize(a) == _normalize(segments[-1][1])), None
+            )
+            if attribute is None:
+                raise _not_found("Attribute", segments[-1][1])
+            del hierarchy.attribute_types[attribute]
+            self._update_attribute_cube(self.dimension(segments[0][1]))
+        elif names[0] == "Dimensions" and names[-1] == "Edges":
+            keys = _named_keys(segments[-1][1])
+            self._hierarchy(segments).remove_edge(keys["ParentName"], keys["ComponentName"])
+        elif names[0] == "Contents":
+            parent = self._content_node(segments[:-1])
+            if not isinstance(parent, MockFolder) or _normalize(segments[-1][1]) not in parent.children:
+                raise _not_found("Document", segments[-1][1])
+            del parent.children[_normalize(segments[-1][1])]
+        else:
+            raise MockTM1Error(404, f"Unsupported resource: '{'/'.join(names)}'")
+        return _Response(204)
+
+    # --- helpers -----------------------------------------------------------
+
+    def _hierarchy(self, segments) -> MockHierarchy:
+        dimension = self.dimension(segments[0][1])
+        return dimension.hierarchy(segments[1][1] if len(segments) > 1 and segments[1][0] == "Hierarchies" else None)
+
+    def _cellset(self, cellset_id: str) -> MockCellset:
+        try:
+            return self.cellsets[cellset_id]
+        except KeyError:
+            raise _not_found("Cellset", cellset_id) from None
+
+    def _process(self, name: str) -> Dict:
+        for process_name, process in self.processes.items():
+            if _normalize(process_name) == _normalize(name):
+                return process
+        raise _not_found("Process", name)
+
+    def _update_attribute_cube(self, dimension: MockDimension):
+        """}ElementAttributes_ dimension and cube, as TM1 maintains them for the attributes of a dimension"""
+        name = "}ElementAttributes_" + dimension.name
+        attribute_types = dimension.hierarchy().attribute_types
+        elements = OrderedDict(
+            (attribute, "Numeric" if attribute_type == "Numeric" else "String")
+            for attribute, attribute_type in attribute_types.items()
+        )
+        if _normalize(name) in self.dimensions:
+            hierarchy = self.dimensions[_normalize(name)].hierarchy()
+            for element in [e for e in hierarchy.elements if e not in elements]:
+                hierarchy.remove_element(element)
+            for element, element_type in elements.items():
+                if not hierarchy.has_element(element):
+                    hierarchy.add_element(element, element_type)
+        else:
+            self.add_dimension(name, elements)
+        if _normalize(name) not in self.cubes:
+            self.add_cube(name, [dimension.name, name])
+
+    def _execute_set_expression(self, mdx: str, query: str) -> _Response:
+        mdx_set = MdxEvaluator(self, mdx).evaluate_set()
+        dummy = MockCellset("", None, [], None)
+
+        def tuples():
+            return [
+                OrderedDict(
+                    [
+                        ("Ordinal", i),
+                        (
+                            "Members",
+                            Collection.of([dummy.member_entity(h, e) for h, e in zip(mdx_set.hierarchies, t)]),
+                        ),
+                    ]
+                )
+                for i, t in enumerate(mdx_set.tuples)
+            ]
+
+        entity = OrderedDict([("Cardinality", len(mdx_set.tuples)), ("Tuples", lambda: Collection(tuples))])
+        return _Response(201, shape_entity(entity, QueryOptions.from_query_string(query)))
+
+    def _bound_coordinates(self, cube: MockCube, binds: List[str]) -> Tuple[str, ...]:
+        members = {}
+        for bind in binds:
+            segments = _parse_path(bind)
+            hierarchy = self._hierarchy(segments)
+            members[_normalize(hierarchy.dimension_name)] = hierarchy.element_name(segments[-1][1])
+        return tuple(members[_normalize(dimension.name)] for dimension in cube.dimensions)
+
+    def _create_dimension(self, data: Dict) -> _Response:
+        if _normalize(data["Name"]) in self.dimensions:
+            raise MockTM1Error(400, f"Dimension '{data['Name']}' already exists")
+        dimension = MockDimension(data["Name"])
+        dimension.hierarchies.clear()
+        for hierarchy_data in data.get("Hierarchies") or [{"Name": data["Name"]}]:
+            hierarchy = dimension.add_hierarchy(hierarchy_data["Name"])
+            for element in hierarchy_data.get("Elements", []):
+                hierarchy.add_element(element["Name"], element.get("Type", "Numeric"))
+            for edge in hierarchy_data.get("Edges", []):
+                hierarchy.add_edge(edge["ParentName"], edge["ComponentName"], edge.get("Weight", 1))
+            for attribute in hierarchy_data.get("ElementAttributes", []):
+                hierarchy.attribute_types[attribute["Name"]] = attribute.get("Type", "String")
+        self.dimensions[_normalize(data["Name"])] = dimension
+        return _Response(201, {"Name": data["Name"]})
+
+    def _execute_process(self, process: Dict, parameters: Dict[str, Any]) -> Dict:
+        name = process.get("Name", "")
+        self.process_calls.append(ProcessCall(name, process, parameters))
+
+        def priority(pattern: str) -> int:
+            if _normalize(pattern) == _normalize(name):
+                return 0
+            if pattern.endswith("*") and _normalize(name).startswith(_normalize(pattern[:-1])):
+                # longer prefixes first, '*' last
+                return 1 + 1000 - len(pattern)
+            return -1
+
+        matches = [(priority(pattern), handler) for pattern, handler in self._process_handlers]
+        matches = sorted((match for match in matches if match[0] >= 0), key=lambda match: match[0])
+        outcome = matches[0][1](process, parameters) if matches else None
+
+        status, error_log = outcome if isinstance(outcome, tuple) else (outcome or "CompletedSuccessfully", None)
+        error_log_file = None
+        if error_log is not None:
+            file_name = f"TM1ProcessError_{time.strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}_{name}.log"
+            self.error_logs[file_name] = error_log
+            error_log_file = {"Filename": file_name}
+        return {"ProcessExecuteStatusCode": status, "ErrorLogFile": error_log_file}
+
+    def _content_node(self, segments) -> Union[MockFolder, MockDocument]:
+        node = self.contents.get(_normalize(segments[0][1]))
+        if node is None:
+            raise _not_found("Folder", segments[0][1])
+        for name, key in segments[1:]:
+            if name == "Content":
+                continue
+            if name != "Contents" or not isinstance(node, MockFolder) or _normalize(key) not in node.children:
+                raise _not_found("Content", key)
+            node = node.children[_normalize(key)]
+        return node
+
+    def _post_contents(self, segments, data) -> _Response:
+        last_name, last_key = segments[-1]
+        if last_name == "Contents" and last_key is None:
+            folder = self._content_node(segments[:-1])
+            if data.get("@odata.type", "").endswith("Folder"):
+                folder.children[_normalize(data["Name"])] = MockFolder(data["Name"])
+            else:
+                folder.children[_normalize(data["Name"])] = MockDocument(data["Name"])
+            return _Response(201, {"Name": data["Name"]})
+
+        if last_name == "mpu.CreateMultipartUpload":
+            document = self._content_node(segments[:-1])
+            upload_id = uuid.uuid4().hex
+            document.uploads[upload_id] = {}
+            return _Response(201, {"UploadID": upload_id})
+
+        if last_name == "Parts" and segments[-2][0] == "!uploads":
+            document = self._content_node(segments[:-2])
+            parts = document.uploads[segments[-2][1]]
+            part_number = len(parts) + 1
+            parts[part_number] = data
+            return _Response(201, {"PartNumber": part_number, "@odata.etag": f'W/"{uuid.uuid4().hex}"'})
+
+        if last_name == "mpu.Complete" and segments[-2][0] == "!uploads":
+            document = self._content_node(segments[:-2])
+            parts = document.uploads.pop(segments[-2][1])
+            document.content = b"".join(parts[part["PartNumber"]] for part in data["Parts"])
+            return _Response(204)
+
+        raise MockTM1Error(404, f"Unsupported action: '{last_name}'")
@@ -0,0 +1,153 @@
+import time
+import unittest
+
+import requests
+
+from TM1py import TM1Service
+from TM1py.Services import RestService
+
+from .MockTM1Server import MockTM1Server, QueryOptions, shape_collection
+
+MDX = """
+SELECT
+NON EMPTY {TM1FILTERBYLEVEL({TM1SUBSETALL([region].[region])},0)} DIMENSION PROPERTIES MEMBER_NAME ON 0,
+{[measure].[measure].[revenue],[measure].[measure].[cost]} DIMENSION PROPERTIES MEMBER_NAME ON 1
+FROM [sales]
+"""
+
+
+class TestMockTM1Server(unittest.TestCase):
+    server: MockTM1Server
+    tm1: TM1Service
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTM1Server().start()
+        cls.server.generate_dimension("Region", leaves=20, fan_out=5)
+        cls.server.add_dimension("Measure", ["Revenue", "Cost"])
+        cls.server.add_dimension("Year", ["2024", "2025"])
+        cls.tm1 = TM1Service(**cls.server.connection_kwargs)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.logout()
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.generate_cube("Sales", ["Region", "Measure", "Year"], cells=30, seed=1)
+        self.server.latency = 0
+        self.server.async_duration = 0
+        self.server.reset_statistics()
+
+    def expected(self, region: str, measure: str, year: str = "2024") -> float:
+        return self.server.cube("Sales").cells.get((region, measure, year), 0)
+
+    def test_login(self):
+        self.assertEqual("11.8.02300.3", self.tm1.version)
+        self.assertTrue(self.tm1.connection.is_connected())
+        self.assertTrue(self.tm1.connection.is_admin)
+
+    def test_unauthorized_without_session(self):
+        self.assertEqual(401, requests.get(self.server.base_url + "/Cubes").status_code)
+        rest = RestService(**self.server.connection_kwargs)
+        session_id = rest.session_id
+        self.assertIn(session_id, self.server.sessions)
+        rest.logout()
+        self.assertNotIn(session_id, self.server.sessions)
+
+    def test_dimensions_and_elements(self):
+        self.assertEqual(["Region", "Measure", "Year"], self.tm1.dimensions.get_all_names())
+        element_types = self.tm1.elements.get_element_types("Region", "Region", skip_consolidations=True)
+        self.assertEqual(20, len(element_types))
+        self.assertTrue(self.tm1.elements.element_is_parent("Region", "Region", "Total Region", "Region L1 0"))
+        self.assertEqual(["Region", "Measure", "Year"], self.tm1.cubes.get_dimension_names("Sales"))
+
+    def test_filter_top_skip(self):
+        url = "/Dimensions('Region')/Hierarchies('Region')/Elements?$select=Name&$filter=Type ne 3&$skip=2&$top=3"
+        names = [element["Name"] for element in self.tm1.connection.GET(url).json()["value"]]
+        self.assertEqual(["Region 02", "Region 03", "Region 04"], names)
+
+    def test_execute_mdx(self):
+        cells = self.tm1.cells.execute_mdx(MDX)
+        for (region, measure, _), cell in cells.items():
+            self.assertEqual(self.expected(region.split("].[")[-1][:-1], measure.split("].[")[-1][:-1]), cell["Value"])
+        # NON EMPTY drops the regions without values in 2024
+        regions = {region for region, _, year in self.server.cube("Sales").cells if year == "2024"}
+        self.assertEqual(len(regions) * 2, len(cells))
+
+    def test_execute_mdx_values_compact_json(self):
+        plain = self.tm1.cells.execute_mdx_values(MDX)
+        compact = self.tm1.cells.execute_mdx_values(MDX, use_compact_json=True)
+        self.assertEqual(plain, compact)
+        self.assertTrue(any(method == "GET" and "Cellsets(" in url for method, url in self.server.requests))
+
+    def test_execute_mdx_top_skip(self):
+        values = [cell["Value"] for cell in self.tm1.cells.execute_mdx(MDX).values()]
+        page = self.tm1.cells.execute_mdx(MDX, top=3, skip=2)
+        self.assertEqual(values[2:5], [cell["Value"] for cell in page.values()])
+
+    def test_consolidated_value(self):
+        cells = self.server.cube("Sales").cells
+        total = sum(value for (_, measure, year), value in cells.items() if (measure, year) == ("Cost", "2025"))
+        self.assertEqual(total, self.tm1.cells.get_value("Sales", "Total Region,Cost,2025"))
+
+    def test_write(self):
+        self.tm1.cells.write("Sales", {("Region 01", "Cost", "2025"): 7, ("Region 02", "Cost", "2025"): 8})
+        self.tm1.cells.write_value(9, "Sales", ("Region 03", "Cost", "2025"))
+        self.assertEqual(7, self.expected("Region 01", "Cost", "2025"))
+        self.assertEqual(8, self.expected("Region 02", "Cost", "2025"))
+        self.assertEqual(9, self.expected("Region 03", "Cost", "2025"))
+
+    def test_files(self):
+        self.tm1.files.create("data.csv", b"a,b\n" * 1000)
+        self.assertTrue(self.tm1.files.exists("data.csv"))
+        self.assertEqual(b"a,b\n" * 1000, self.tm1.files.get("data.csv"))
+        self.tm1.files.delete("data.csv")
+        self.assertFalse(self.tm1.files.exists("data.csv"))
+
+    def test_files_multipart_upload_v12(self):
+        with MockTM1Server(version="12.0.0") as server, TM1Service(**server.connection_kwargs) as tm1:
+            tm1.files.create("data.csv", b"0123456789" * 10, multi_part_upload=True, max_mb_per_part=0.00005)
+            self.assertEqual(b"0123456789" * 10, server.file("data.csv", folder="Files"))
+            self.assertTrue(any("!uploads" in url for _, url in server.requests))
+
+    def test_execute_process_with_return(self):
+        self.server.add_process_handler("load*", lambda process, parameters: ("Aborted", "error in line 3"))
+        self.server.add_process_handler("*", lambda process, parameters: None)
+        self.tm1.processes.execute_ti_code(["x = 1;"])
+        self.assertEqual(["x = 1;"], self.server.process_calls[-1].prolog.splitlines()[-1:])
+
+        self.server.processes["load_sales"] = {"Name": "load_sales"}
+        success, status, error_log_file = self.tm1.processes.execute_with_return("load_sales", pYear=2024)
+        self.assertFalse(success)
+        self.assertEqual("Aborted", status)
+        self.assertEqual("error in line 3", self.tm1.processes.get_error_log_file_content(error_log_file))
+        self.assertEqual({"pYear": 2024}, self.server.process_calls[-1].parameters)
+
+    def test_async_requests_mode(self):
+        self.server.async_duration = 0.2
+        with TM1Service(**self.server.connection_kwargs, async_requests_mode=True) as tm1:
+            self.assertEqual(self.tm1.cells.execute_mdx_values(MDX), tm1.cells.execute_mdx_values(MDX))
+        polls = [url for method, url in self.server.requests if "_async" in url]
+        self.assertTrue(polls)
+
+    def test_latency(self):
+        self.server.latency = 0.05
+        start = time.perf_counter()
+        for _ in range(4):
+            self.tm1.connection.is_connected()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+    def test_compressed_responses(self):
+        self.server.compress_responses = True
+        try:
+            self.assertEqual(20, len(self.tm1.elements.get_element_types("Region", "Region", True)))
+        finally:
+            self.server.compress_responses = False
+
+    def test_shape_collection(self):
+        entities = [{"Name": "a", "Type": "Numeric", "Level": 0}, {"Name": "b", "Type": "Consolidated", "Level": 1}]
+        options = QueryOptions({"$select": "Name", "$filter": "Type eq 3 or tolower(Name) eq 'a'"})
+        self.assertEqual([{"Name": "a"}, {"Name": "b"}], shape_collection(entities, options))
+        options = QueryOptions({"$filter": "not (Level ge 1) and startswith(Name, 'a')", "$select": "Name"})
+        self.assertEqual([{"Name": "a"}], shape_collection(entities, options))
@@ -15,8 +15,10 @@ from TM1py.Objects import (
     Subset,
 )
 from TM1py.Services import TM1Service
+from TM1py.Services.ProcessService import ProcessRun
 from TM1py.Utils import verify_version
 
+from .MockTM1Server import MockTM1Server
 from .Utils import skip_if_version_higher_or_equal_than, skip_if_version_lower_than
 
 
@@ -717,5 +719,127 @@ class TestProcessService(unittest.TestCase):
         cls.tm1.logout()
 
 
+class TestProcessServiceExecuteGraph(unittest.TestCase):
+    """execute_graph against the MockTM1Server"""
+
+    server: MockTM1Server
+    tm1: TM1Service
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockTM1Server(async_duration=0.05).start()
+        cls.tm1 = TM1Service(**cls.server.connection_kwargs)
+        for name in ("Clear", "Load", "Calculate", "Export"):
+            cls.tm1.processes.create(Process(name=name))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.logout()
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.process_calls.clear()
+        self.server.threads = []
+
+    def test_dependencies_and_parameters(self):
+        runs = self.tm1.processes.execute_graph(
+            [
+                ProcessRun("Export", depends_on=["Load.EU", "Load.US"]),
+                ProcessRun("Load", {"pRegion": "EU"}, depends_on=["Clear"], run_id="Load.EU"),
+                ProcessRun("Load", {"pRegion": "US"}, depends_on=["Clear"], run_id="Load.US"),
+                ProcessRun("Clear"),
+            ],
+            poll_interval=0.01,
+        )
+
+        self.assertEqual(["Export", "Load.EU", "Load.US", "Clear"], list(runs))
+        calls = self.server.process_calls
+        self.assertEqual("Clear", calls[0].name)
+        self.assertEqual([{"pRegion": "EU"}, {"pRegion": "US"}], sorted((c.parameters for c in calls[1:3]), key=str))
+        self.assertEqual("Export", calls[3].name)
+        for run in runs.values():
+            self.assertTrue(run.success)
+            self.assertEqual("CompletedSuccessfully", run.status)
+            self.assertGreaterEqual(run.duration, 0.05)
+        self.assertGreaterEqual(runs["Export"].start_time, runs["Load.US"].end_time)
+
+    def test_bounded_concurrency(self):
+        runs = self.tm1.processes.execute_graph(
+            [ProcessRun("Load", {"pRegion": str(i)}, run_id=str(i)) for i in range(6)],
+            max_workers=2,
+            poll_interval=0.01,
+        )
+
+        intervals = [(run.start_time, run.end_time) for run in runs.values()]
+        overlap = max(sum(start <= moment < end for start, end in intervals) for moment, _ in intervals)
+        self.assertEqual(2, overlap)
+        self.assertEqual(6, len(self.server.process_calls))
+
+    def test_failure_skips_dependents(self):
+        self.server.add_process_handler("Load", lambda process, parameters: "Aborted")
+        self.addCleanup(self.server.add_process_handler, "Load", lambda process, parameters: None)
+
+        runs = self.tm1.processes.execute_graph(
+            [
+                ProcessRun("Load"),
+                ProcessRun("Calculate", depends_on=["Load"]),
+                ProcessRun("Export", depends_on=["Calculate"]),
+                ProcessRun("Clear"),
+                ProcessRun("Missing"),
+                ProcessRun("Export", depends_on=["Missing"], run_id="Export.Missing"),
+            ],
+            poll_interval=0.01,
+        )
+
+        self.assertEqual("Aborted", runs["Load"].status)
+        self.assertEqual(ProcessRun.SKIPPED, runs["Calculate"].status)
+        self.assertEqual(ProcessRun.SKIPPED, runs["Export"].status)
+        self.assertIsNone(runs["Export"].start_time)
+        self.assertTrue(runs["Clear"].success)
+        self.assertEqual(ProcessRun.FAILED, runs["Missing"].status)
+        self.assertIn("Missing", runs["Missing"].error)
+        self.assertEqual(ProcessRun.SKIPPED, runs["Export.Missing"].status)
+        self.assertEqual(["Load", "Clear"], [call.name for call in self.server.process_calls])
+
+    def test_lock_contention_shrinks_concurrency(self):
+        self.server.threads = [{"ID": 7, "State": "Wait", "Function": "POST /api/v1/Processes('Load')/tm1.Execute"}]
+
+        runs = self.tm1.processes.execute_graph(
+            [ProcessRun("Load", {"pRegion": str(i)}, run_id=str(i)) for i in range(8)],
+            max_workers=4,
+            poll_interval=0.01,
+            lock_contention_check_interval=0,
+        )
+
+        concurrency = [run.concurrency for run in runs.values()]
+        self.assertEqual(4, concurrency[0])
+        self.assertEqual(1, concurrency[-1])
+        self.assertTrue(all(run.success for run in runs.values()))
+
+    def test_concurrency_recovers_without_lock_contention(self):
+        runs = self.tm1.processes.execute_graph(
+            [ProcessRun("Load", {"pRegion": str(i)}, run_id=str(i)) for i in range(12)],
+            max_workers=4,
+            poll_interval=0.01,
+            lock_contention_check_interval=0,
+        )
+
+        self.assertEqual({4}, {run.concurrency for run in runs.values()})
+
+    def test_invalid_graph(self):
+        with self.assertRaises(ValueError):
+            self.tm1.processes.execute_graph([ProcessRun("Load"), ProcessRun("Load")])
+        with self.assertRaises(ValueError):
+            self.tm1.processes.execute_graph([ProcessRun("Load", depends_on=["Clear"])])
+        with self.assertRaises(ValueError):
+            self.tm1.processes.execute_graph(
+                [ProcessRun("Load", depends_on=["Calculate"]), ProcessRun("Calculate", depends_on=["Load"])]
+            )
+        with self.assertRaises(ValueError):
+            self.tm1.processes.execute_graph([ProcessRun("Load")], max_workers=0)
+
+        self.assertEqual([], self.server.process_calls)
+
+
 if __name__ == "__main__":
     unittest.main()
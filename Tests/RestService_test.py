@@ -2,12 +2,19 @@ import configparser
 import gzip
 import unittest
 import uuid
+import warnings
+from datetime import timedelta
 from io import BytesIO
 from pathlib import Path
 
+import urllib3
+from requests import Response
+
 from TM1py import TM1Service
 from TM1py.Objects import Process
 from TM1py.Services.RestService import RestService
+from TM1py.Utils import RequestMetrics, RequestStatistics, url_template
+from TM1py.Utils.Compression import ContentDecodingReader
 
 
 class TestRestService(unittest.TestCase):
@@ -253,6 +260,9 @@ class _FakeResponse:
         self.encoding = None
         self.content = text.encode("utf-8") if isinstance(text, str) else text
 
+    def close(self):
+        pass
+
 
 class _RecordingSession:
     """Captures the (data, headers) handed to the transport so tests can assert on the wire bytes."""
@@ -423,3 +433,234 @@ class TestRequestBodyCompressionInitValidation(unittest.TestCase):
                 with self.assertRaises(ValueError) as ctx:
                     RestService(gzip_compress_level=level)
                 self.assertIn("gzip_compress_level", str(ctx.exception))
+
+
+def _response(status_code: int, content: bytes = b"", headers: dict = None, elapsed: float = 0.01) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+class TestRequestInstrumentation(unittest.TestCase):
+    """Request hooks and the in-memory RequestStatistics aggregator (no server connection)."""
+
+    @staticmethod
+    def _rest(responses, async_requests_mode=False) -> RestService:
+        rest = TestRequestBodyCompressionSeam._rest(responses, compress=False)
+        rest._async_requests_mode = async_requests_mode
+        rest._async_polling_initial_delay = 0
+        rest._async_polling_max_delay = 0
+        rest._async_polling_backoff_factor = 1
+        rest.events = []
+        rest.add_request_hook(rest.events.append)
+        return rest
+
+    def test_hooks_are_opt_in(self):
+        rest = TestRequestBodyCompressionSeam._rest([_FakeResponse(200)], compress=False)
+
+        rest.POST(url="/Cubes", data="{}")
+
+        self.assertEqual((), rest._request_hooks)
+
+    def test_hook_receives_metrics(self):
+        rest = self._rest([_response(201, b'{"ID": "abc"}', elapsed=0.25)])
+
+        rest.POST(url="/Cubes('Sales')/tm1.ExecuteMDX?$expand=Cells", data='{"MDX": "SELECT"}')
+
+        (metrics,) = rest.events
+        self.assertEqual("POST /Cubes('{}')/tm1.ExecuteMDX", metrics.endpoint)
+        self.assertEqual(201, metrics.status_code)
+        self.assertEqual(17, metrics.bytes_sent)
+        self.assertEqual(13, metrics.bytes_received)
+        self.assertEqual(0.25, metrics.time_to_first_byte)
+        self.assertGreaterEqual(metrics.latency, 0)
+        self.assertEqual(0, metrics.retries)
+        self.assertIsNone(metrics.error)
+
+    def test_retry_after_401_is_counted(self):
+        rest = self._rest([_response(401), _response(200)])
+
+        rest.GET(url="/Cubes")
+
+        self.assertEqual(1, rest.events[0].retries)
+
+    def test_async_polls_are_counted(self):
+        rest = self._rest(
+            [
+                _response(202, headers={"Location": "/api/v1/_async('id1')"}),
+                _response(202),
+                _response(200, b"{}"),
+            ],
+            async_requests_mode=True,
+        )
+
+        rest.POST(url="/Processes('p')/tm1.ExecuteWithReturn", data="{}")
+
+        # the polls are reported on their own and counted on the outer request
+        self.assertEqual(["GET /_async('{}')"] * 2, [metrics.endpoint for metrics in rest.events[:2]])
+        self.assertEqual("POST /Processes('{}')/tm1.ExecuteWithReturn", rest.events[2].endpoint)
+        self.assertEqual(2, rest.events[2].async_polls)
+
+    def test_failed_request_is_reported(self):
+        rest = self._rest([_response(404, b"not found")])
+
+        with self.assertRaises(Exception):
+            rest.GET(url="/Cubes('missing')")
+
+        self.assertEqual("TM1pyRestException", rest.events[0].error)
+        self.assertEqual(404, rest.events[0].status_code)
+
+    def test_failing_hook_does_not_break_request(self):
+        rest = self._rest([_response(200)])
+        rest.add_request_hook(lambda metrics: 1 / 0)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            response = rest.GET(url="/Cubes")
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(any("ZeroDivisionError" in str(w.message) or "division" in str(w.message) for w in caught))
+
+    def test_remove_request_hook(self):
+        rest = self._rest([_response(200)])
+        rest.remove_request_hook(rest.events.append)
+        rest.GET(url="/Cubes")
+
+        self.assertEqual([], rest.events)
+
+    def test_url_template(self):
+        self.assertEqual(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements",
+            url_template("https://tm1:8001/api/v1/Dimensions('a''b')/Hierarchies('x')/Elements?$top=10"),
+        )
+        self.assertEqual("/Cellsets('{}')/Cells", url_template("/Cellsets('ID-1')/Cells"))
+        self.assertEqual("/Threads({})", url_template("/Threads(12)"))
+
+    def test_statistics_percentiles(self):
+        statistics = RequestStatistics()
+        for n in range(1, 101):
+            metrics = RequestMetrics("post", "/ExecuteMDX?$expand=Cells")
+            metrics.latency = n / 100
+            metrics.bytes_received = 10
+            statistics(metrics)
+        slow = RequestMetrics("get", "/Cubes('c')")
+        slow.latency = 5.0
+        slow.error = "TM1pyTimeout"
+        statistics(slow)
+
+        summary = statistics.summary()
+
+        self.assertEqual(["GET /Cubes('{}')", "POST /ExecuteMDX"], list(summary))
+        self.assertEqual(100, summary["POST /ExecuteMDX"]["count"])
+        self.assertEqual(0.5, summary["POST /ExecuteMDX"]["p50"])
+        self.assertEqual(0.95, summary["POST /ExecuteMDX"]["p95"])
+        self.assertEqual(0.99, summary["POST /ExecuteMDX"]["p99"])
+        self.assertEqual(1000, summary["POST /ExecuteMDX"]["bytes_received"])
+        self.assertEqual(1, summary["GET /Cubes('{}')"]["errors"])
+        self.assertIn("POST /ExecuteMDX", statistics.dump())
+
+        statistics.reset()
+        self.assertEqual({}, statistics.summary())
+
+
+def _streamed_response(body: bytes, headers: dict = None) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers.update(headers or {})
+    response.raw = urllib3.HTTPResponse(
+        body=BytesIO(body), headers=headers or {}, preload_content=False, decode_content=False
+    )
+    return response
+
+
+class TestResponseStreaming(unittest.TestCase):
+    """Streamed response bodies are read straight from the urllib3 stream (no server connection)."""
+
+    def test_read_json_from_stream(self):
+        response = _streamed_response(b'{"value": [1, 2]}')
+
+        self.assertEqual({"value": [1, 2]}, RestService.read_json(response))
+        # body stays accessible afterwards
+        self.assertEqual(b'{"value": [1, 2]}', response.content)
+
+    def test_read_body_decodes_gzip(self):
+        response = _streamed_response(gzip.compress(b"x" * 1000), headers={"Content-Encoding": "gzip"})
+
+        self.assertEqual(b"x" * 1000, RestService.read_body(response))
+
+    def test_body_stream_of_downloaded_response(self):
+        response = _response(200, b'{"a": 1}')
+
+        self.assertEqual(b'{"a": 1}', RestService.response_body_stream(response).read())
+
+    def test_get_stream(self):
+        rest = TestRequestBodyCompressionSeam._rest([_streamed_response(b'{"Cells": []}')], compress=False)
+
+        with rest.GET_stream("/Cellsets('abc')?$expand=Cells") as body:
+            self.assertIsInstance(body, ContentDecodingReader)
+            self.assertEqual(b'{"Cells": []}', body.read())
+
+
+class TestResponseCompression(unittest.TestCase):
+    """Response compression negotiation and size accounting (no server connection)."""
+
+    def test_accept_encoding_header(self):
+        self.assertIn("gzip", RestService.HEADERS["Accept-Encoding"])
+        self.assertIn("deflate", RestService.HEADERS["Accept-Encoding"])
+
+    def test_get_stream_decompresses(self):
+        body = b'{"Cells": [' + b",".join(b'{"Ordinal": %d}' % n for n in range(1000)) + b"]}"
+        compressed = gzip.compress(body)
+        rest = TestRequestBodyCompressionSeam._rest(
+            [_streamed_response(compressed, headers={"Content-Encoding": "gzip"})], compress=False
+        )
+
+        with rest.GET_stream("/Cellsets('abc')?$expand=Cells") as stream:
+            self.assertEqual(body, stream.read())
+
+        self.assertEqual(len(compressed), stream.compressed_bytes)
+        self.assertEqual(len(body), stream.uncompressed_bytes)
+
+    def test_metrics_count_compressed_and_uncompressed_bytes(self):
+        body = b'{"value": "' + b"x" * 5000 + b'"}'
+        compressed = gzip.compress(body)
+        rest = TestRequestInstrumentation._rest([_streamed_response(compressed, headers={"Content-Encoding": "gzip"})])
+
+        response = rest.GET(url="/Cubes")
+
+        self.assertEqual(body, response.content)
+        (metrics,) = rest.events
+        self.assertEqual(len(body), metrics.bytes_received)
+        self.assertEqual(len(compressed), metrics.bytes_received_compressed)
+        self.assertEqual("gzip", metrics.content_encoding)
+
+    def test_metrics_of_uncompressed_response(self):
+        rest = TestRequestInstrumentation._rest([_streamed_response(b'{"value": []}')])
+
+        rest.GET(url="/Cubes")
+
+        (metrics,) = rest.events
+        self.assertEqual(13, metrics.bytes_received)
+        self.assertEqual(13, metrics.bytes_received_compressed)
+        self.assertIsNone(metrics.content_encoding)
+
+    def test_metrics_of_streamed_response_use_content_length(self):
+        compressed = gzip.compress(b"x" * 1000)
+        rest = TestRequestInstrumentation._rest(
+            [
+                _streamed_response(
+                    compressed, headers={"Content-Encoding": "gzip", "Content-Length": str(len(compressed))}
+                )
+            ]
+        )
+
+        with rest.GET_stream("/Cellsets('abc')?$expand=Cells") as stream:
+            stream.read()
+
+        (metrics,) = rest.events
+        self.assertEqual(len(compressed), metrics.bytes_received_compressed)
+        self.assertIsNone(metrics.bytes_received)
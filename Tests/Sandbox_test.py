@@ -8,12 +8,12 @@ class TestSandboxMethods(unittest.TestCase):
     def test_body_include_in_sandbox_dimension_true(self):
         sandbox = Sandbox("sandbox", True)
 
-        self.assertEqual('{"Name": "sandbox", "IncludeInSandboxDimension": true}', sandbox.body)
+        self.assertEqual('{"Name":"sandbox","IncludeInSandboxDimension":true}', sandbox.body)
 
     def test_body_include_in_sandbox_dimension_false(self):
         sandbox = Sandbox("sandbox", False)
 
-        self.assertEqual('{"Name": "sandbox", "IncludeInSandboxDimension": false}', sandbox.body)
+        self.assertEqual('{"Name":"sandbox","IncludeInSandboxDimension":false}', sandbox.body)
 
     def test_from_json_include_in_sandbox_dimension_true(self):
         sandbox = Sandbox.from_dict(
@@ -47,10 +47,10 @@ class TestSandboxMethods(unittest.TestCase):
         sandbox = Sandbox("sandbox", True)
         sandbox.name = "new sandbox"
 
-        self.assertEqual('{"Name": "new sandbox", "IncludeInSandboxDimension": true}', sandbox.body)
+        self.assertEqual('{"Name":"new sandbox","IncludeInSandboxDimension":true}', sandbox.body)
 
     def test_change_include_in_sandbox_dimension_false(self):
         sandbox = Sandbox("sandbox", True)
         sandbox.include_in_sandbox_dimension = False
 
-        self.assertEqual('{"Name": "sandbox", "IncludeInSandboxDimension": false}', sandbox.body)
+        self.assertEqual('{"Name":"sandbox","IncludeInSandboxDimension":false}', sandbox.body)
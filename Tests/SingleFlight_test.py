@@ -0,0 +1,117 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from TM1py.Utils import (
+    CaseAndSpaceInsensitiveDict,
+    SingleFlight,
+    coalesce_concurrent_reads,
+)
+
+
+class _Rest:
+    def __init__(self, single_flight=None):
+        self._single_flight = single_flight
+
+
+class _Service:
+    def __init__(self, rest: _Rest):
+        self._rest = rest
+        self.requests = 0
+        self.release = threading.Event()
+
+    @coalesce_concurrent_reads
+    def get_element_types(self, dimension_name: str, **kwargs) -> CaseAndSpaceInsensitiveDict:
+        self.requests += 1
+        self.release.wait(5)
+        return CaseAndSpaceInsensitiveDict({dimension_name: "Numeric"})
+
+
+def _run_concurrently(func, n: int, release: threading.Event, single_flight: SingleFlight = None):
+    with ThreadPoolExecutor(n) as executor:
+        futures = [executor.submit(func) for _ in range(n)]
+        # wait until all callers joined the in-flight call
+        for _ in range(500):
+            if single_flight is None or single_flight.coalesced == n - 1:
+                break
+            threading.Event().wait(0.01)
+        release.set()
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        executions = []
+
+        def func():
+            executions.append(1)
+            release.wait(5)
+            return "result"
+
+        results = _run_concurrently(lambda: single_flight.do("key", func), 5, release, single_flight)
+
+        self.assertEqual(1, len(executions))
+        self.assertEqual([("result", True)] * 5, results)
+        self.assertEqual(1, single_flight.executed)
+        self.assertEqual(4, single_flight.coalesced)
+
+    def test_sequential_calls_execute_again(self):
+        single_flight = SingleFlight()
+
+        self.assertEqual((1, False), single_flight.do("key", lambda: 1))
+        self.assertEqual((2, False), single_flight.do("key", lambda: 2))
+
+    def test_exception_is_raised_in_all_callers(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def func():
+            release.wait(5)
+            raise ValueError("failed")
+
+        def call():
+            try:
+                single_flight.do("key", func)
+            except ValueError as e:
+                return str(e)
+
+        self.assertEqual(["failed"] * 3, _run_concurrently(call, 3, release, single_flight))
+        # the failed call is not remembered
+        self.assertEqual((1, False), single_flight.do("key", lambda: 1))
+
+
+class TestCoalesceConcurrentReads(unittest.TestCase):
+    def test_disabled_without_single_flight(self):
+        service = _Service(_Rest())
+        service.release.set()
+
+        service.get_element_types("d")
+        service.get_element_types("d")
+
+        self.assertEqual(2, service.requests)
+
+    def test_concurrent_identical_calls_are_coalesced(self):
+        single_flight = SingleFlight()
+        service = _Service(_Rest(single_flight))
+
+        results = _run_concurrently(lambda: service.get_element_types("d"), 4, service.release, single_flight)
+
+        self.assertEqual(1, service.requests)
+        self.assertEqual([{"d": "Numeric"}] * 4, [dict(result) for result in results])
+        # every caller receives its own copy
+        self.assertEqual(4, len(set(map(id, results))))
+
+    def test_different_arguments_are_not_coalesced(self):
+        service = _Service(_Rest(SingleFlight()))
+        service.release.set()
+
+        service.get_element_types("d1")
+        service.get_element_types("d2")
+
+        self.assertEqual(2, service.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
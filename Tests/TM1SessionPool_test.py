@@ -0,0 +1,143 @@
+import threading
+import unittest
+
+from requests import ConnectionError
+
+from TM1py.Services.TM1SessionPool import TM1SessionPool
+
+
+class _FakeRest:
+    def __init__(self, number: int):
+        self.number = number
+        self.connected = True
+        self.connects = 0
+        self.logged_out = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def connect(self):
+        self.connects += 1
+        self.connected = True
+
+    def logout(self):
+        self.logged_out = True
+
+
+class _FakePool(TM1SessionPool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created = []
+
+    def _create_session(self) -> _FakeRest:
+        rest = _FakeRest(len(self.created))
+        self.created.append(rest)
+        return rest
+
+
+class TestTM1SessionPool(unittest.TestCase):
+    def test_sessions_are_created_on_demand(self):
+        pool = _FakePool(size=3)
+
+        first = pool.checkout()
+        second = pool.checkout()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(2, len(pool.created))
+        self.assertEqual(2, pool.in_use)
+        self.assertEqual(1, pool.available)
+
+    def test_checked_in_session_is_reused(self):
+        pool = _FakePool(size=3)
+
+        with pool.session() as first:
+            pass
+        with pool.session() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(1, len(pool.created))
+        self.assertEqual(0, pool.in_use)
+
+    def test_checkout_waits_for_checkin(self):
+        pool = _FakePool(size=1)
+        rest = pool.checkout()
+        checked_out = []
+
+        waiter = threading.Thread(target=lambda: checked_out.append(pool.checkout(timeout=5)))
+        waiter.start()
+        pool.checkin(rest)
+        waiter.join()
+
+        self.assertEqual([rest], checked_out)
+
+    def test_checkout_timeout(self):
+        pool = _FakePool(size=1)
+        pool.checkout()
+
+        with self.assertRaises(TimeoutError):
+            pool.checkout(timeout=0.01)
+
+    def test_idle_sessions_expire(self):
+        pool = _FakePool(size=2, max_idle=0)
+        with pool.session() as first:
+            pass
+        threading.Event().wait(0.01)
+
+        with pool.session() as second:
+            pass
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.logged_out)
+
+    def test_health_check_reconnects(self):
+        pool = _FakePool(size=1, health_check_interval=0)
+        with pool.session() as rest:
+            rest.connected = False
+        threading.Event().wait(0.01)
+
+        with pool.session() as same:
+            pass
+
+        self.assertIs(rest, same)
+        self.assertEqual(1, rest.connects)
+
+    def test_session_is_discarded_after_connection_error(self):
+        pool = _FakePool(size=1)
+
+        with self.assertRaises(ConnectionError):
+            with pool.session() as broken:
+                raise ConnectionError("Connection aborted")
+
+        with pool.session() as rest:
+            pass
+
+        self.assertTrue(broken.logged_out)
+        self.assertIsNot(broken, rest)
+
+    def test_close_logs_out_idle_sessions(self):
+        pool = _FakePool(size=2)
+        in_use = pool.checkout()
+        with pool.session() as idle:
+            pass
+
+        pool.close()
+
+        self.assertTrue(idle.logged_out)
+        self.assertFalse(in_use.logged_out)
+        pool.checkin(in_use)
+        self.assertTrue(in_use.logged_out)
+        with self.assertRaises(RuntimeError):
+            pool.checkout()
+
+    def test_session_id_can_not_be_pooled(self):
+        with self.assertRaises(ValueError):
+            TM1SessionPool(size=2, session_id="q7O6e1w49AixeuLVxJ1GZg")
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            TM1SessionPool(size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,9 @@ from TM1py.Utils import (
     CellUpdateableProperty,
     Utils,
     add_url_parameters,
+    build_changed_cells_mask,
+    build_dataframe_aggregate_intersections,
+    build_dataframe_from_cellset_columnar,
     build_dataframe_from_csv,
     cell_is_updateable,
     drop_dimension_properties,
@@ -40,7 +43,7 @@ from TM1py.Utils import (
     verify_version,
 )
 
-from .Utils import skip_if_paoc, skip_if_version_higher_or_equal_than
+from .Utils import skip_if_no_pandas, skip_if_paoc, skip_if_version_higher_or_equal_than
 
 
 class TestUtilsMethods(unittest.TestCase):
@@ -728,6 +731,40 @@ class TestUtilsMethods(unittest.TestCase):
         cls.tm1.logout()
 
 
+class TestBuildDataframeFromCsvCategorical(unittest.TestCase):
+    """Server-free tests for categorical_dimensions in Utils.build_dataframe_from_csv"""
+
+    @skip_if_no_pandas
+    def test_build_dataframe_from_csv_categorical_dimensions(self):
+        raw_csv = "d1~d2~Value\r\n" "e1~e1~1.0\r\n" "e1~e2~2.0\r\n" "e2~e1~3.0\r\n" "e2~e2~4.0"
+        df = build_dataframe_from_csv(raw_csv, categorical_dimensions=True)
+
+        self.assertIsInstance(df["d1"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["d2"].dtype, pd.CategoricalDtype)
+        self.assertEqual(["e1", "e2"], list(df["d1"].cat.categories))
+        self.assertEqual(["e1", "e1", "e2", "e2"], df["d1"].tolist())
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], df["Value"].tolist())
+
+    @skip_if_no_pandas
+    def test_build_dataframe_from_csv_shaped_categorical_dimensions(self):
+        raw_csv = "Region~Product~Measure~Value\r\n" "r1~p1~Revenue~1.0\r\n" "r1~p2~Revenue~3.0\r\n" "r2~p2~Revenue~4.0"
+        df = build_dataframe_from_csv(raw_csv, dtype={"Revenue": float}, shaped=True, categorical_dimensions=True)
+
+        self.assertEqual(["Region", "Product", "Revenue"], list(df.columns))
+        self.assertIsInstance(df["Region"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["Product"].dtype, pd.CategoricalDtype)
+        self.assertEqual(["p1", "p2", "p2"], df["Product"].tolist())
+        self.assertEqual([1.0, 3.0, 4.0], df["Revenue"].tolist())
+
+    @skip_if_no_pandas
+    def test_build_dataframe_from_csv_categories_in_order_of_appearance(self):
+        raw_csv = "d1~d2~Value\r\n" "e2~x~1.0\r\n" "e10~x~2.0\r\n" "e1~x~3.0\r\n" "e2~y~4.0"
+        df = build_dataframe_from_csv(raw_csv, categorical_dimensions=True)
+
+        self.assertEqual(["e2", "e10", "e1"], list(df["d1"].cat.categories))
+        self.assertEqual(["x", "y"], list(df["d2"].cat.categories))
+
+
 class TestDatetimeToIso(unittest.TestCase):
     """Server-free tests for Utils.datetime_to_iso (TM1 Metrics API timestamps)."""
 
@@ -759,5 +796,167 @@ class TestDatetimeToIso(unittest.TestCase):
             Utils.datetime_to_iso("2026-05-08")
 
 
+def _raw_cellset(cells):
+    """2x2 cellset: [d1] x [d2] on rows, [d3] on columns"""
+    return {
+        "Axes": [
+            {
+                "Ordinal": 0,
+                "Cardinality": 2,
+                "Tuples": [{"Members": [{"Name": "c1"}]}, {"Members": [{"Name": "c2"}]}],
+            },
+            {
+                "Ordinal": 1,
+                "Cardinality": 2,
+                "Tuples": [
+                    {"Members": [{"Name": "a1"}, {"Name": "b1"}]},
+                    {"Members": [{"Name": "a2", "Element": {"Name": "a2 element"}}, {"Name": "b2"}]},
+                ],
+            },
+        ],
+        "Cells": cells,
+    }
+
+
+class TestBuildDataframeFromCellsetColumnar(unittest.TestCase):
+    """Server-free tests for Utils.build_dataframe_from_cellset_columnar"""
+
+    rows = ["[d1].[d1]", "[d2].[d2]"]
+    columns = ["[d3].[d3]"]
+
+    @skip_if_no_pandas
+    def test_dense_cellset(self):
+        raw = _raw_cellset([{"Value": 1.0}, {"Value": 2.0}, {"Value": 3.0}, {"Value": 4.5}])
+
+        df = build_dataframe_from_cellset_columnar(raw, self.rows, self.columns)
+
+        expected_df = pd.DataFrame(
+            {
+                "d1": ["a1", "a1", "a2 element", "a2 element"],
+                "d2": ["b1", "b1", "b2", "b2"],
+                "d3": ["c1", "c2", "c1", "c2"],
+                "Value": [1.0, 2.0, 3.0, 4.5],
+            }
+        )
+        pd._testing.assert_frame_equal(expected_df, df, check_column_type=False, check_dtype=False)
+
+    @skip_if_no_pandas
+    def test_sparse_cellset_uses_ordinals(self):
+        raw = _raw_cellset([{"Ordinal": 1, "Value": "x"}, {"Ordinal": 2, "Value": None}])
+
+        df = build_dataframe_from_cellset_columnar(raw, self.rows, self.columns, mdx_headers=True)
+
+        self.assertEqual(["[d1].[d1]", "[d2].[d2]", "[d3].[d3]", "Value"], list(df.columns))
+        self.assertEqual(
+            [("a1", "b1", "c2"), ("a2 element", "b2", "c1")], list(df.iloc[:, :-1].itertuples(index=False, name=None))
+        )
+        self.assertEqual("x", df["Value"][0])
+        self.assertTrue(pd.isna(df["Value"][1]))
+
+    @skip_if_no_pandas
+    def test_top(self):
+        raw = _raw_cellset([{"Value": 1}, {"Value": 2}, {"Value": 3}, {"Value": 4}])
+
+        df = build_dataframe_from_cellset_columnar(raw, self.rows, self.columns, top=3)
+
+        self.assertEqual([1, 2, 3], df["Value"].tolist())
+
+    @skip_if_no_pandas
+    def test_keyword_arguments(self):
+        raw = _raw_cellset([{"Value": 1}, {"Value": 2}, {"Value": 3}, {"Value": 4}])
+
+        df = build_dataframe_from_cellset_columnar(
+            raw_cellset_as_dict=raw, row_dimensions=self.rows, column_dimensions=self.columns
+        )
+
+        self.assertEqual([1, 2, 3, 4], df["Value"].tolist())
+
+    @skip_if_no_pandas
+    def test_empty_cellset(self):
+        df = build_dataframe_from_cellset_columnar(_raw_cellset([]), self.rows, self.columns)
+        self.assertTrue(df.empty)
+
+    @skip_if_no_pandas
+    def test_shaped(self):
+        raw = _raw_cellset([{"Value": 1.0}, {"Value": 2.0}, {"Value": 3.0}, {"Value": 4.0}])
+
+        df = build_dataframe_from_cellset_columnar(raw, self.rows, self.columns, shaped=True)
+
+        self.assertEqual(["d1", "d2", "c1", "c2"], list(df.columns))
+        self.assertEqual([1.0, 3.0], df["c1"].tolist())
+
+    @skip_if_no_pandas
+    def test_categorical_dimensions(self):
+        raw = _raw_cellset([{"Value": 1.0}, {"Value": 2.0}, {"Value": 3.0}, {"Value": 4.5}])
+
+        df = build_dataframe_from_cellset_columnar(raw, self.rows, self.columns, categorical_dimensions=True)
+
+        for dimension in ("d1", "d2", "d3"):
+            self.assertIsInstance(df[dimension].dtype, pd.CategoricalDtype)
+        # categories in axis order
+        self.assertEqual(["a1", "a2 element"], list(df["d1"].cat.categories))
+        self.assertEqual(["c1", "c2", "c1", "c2"], df["d3"].tolist())
+        self.assertEqual([1.0, 2.0, 3.0, 4.5], df["Value"].tolist())
+
+    @skip_if_no_pandas
+    def test_shaped_categorical_dimensions(self):
+        raw = _raw_cellset([{"Value": 1.0}, {"Value": 2.0}, {"Value": 3.0}, {"Value": 4.0}])
+
+        df = build_dataframe_from_cellset_columnar(
+            raw, self.rows, self.columns, shaped=True, categorical_dimensions=True
+        )
+
+        self.assertEqual(["d1", "d2", "c1", "c2"], list(df.columns))
+        self.assertIsInstance(df["d1"].dtype, pd.CategoricalDtype)
+        self.assertEqual(2, len(df))
+        self.assertEqual([2.0, 4.0], df["c2"].tolist())
+
+
+class TestBuildChangedCellsMask(unittest.TestCase):
+    """Server-free tests for Utils.build_changed_cells_mask"""
+
+    @skip_if_no_pandas
+    def test_numeric_values(self):
+        data = pd.DataFrame({"d1": ["a", "b", "c", "d"], "d2": ["m", "m", "m", "m"], "Value": [1.0, 2.0, 0.0, 4.0]})
+        current = pd.DataFrame({"d1": ["A", "b"], "d2": ["m", "m"], "Value": [1.0, 3.0]})
+
+        mask = build_changed_cells_mask(data, current)
+
+        # 'a' unchanged (case insensitive), 'b' changed, 'c' still zero, 'd' new
+        self.assertEqual([False, True, False, True], mask.tolist())
+
+    @skip_if_no_pandas
+    def test_mixed_values(self):
+        data = pd.DataFrame(
+            {"d1": ["a", "a", "a", "a"], "d2": ["n", "s 1", "s2", "s3"], "Value": [5, "text", "", "new"]},
+        )
+        current = pd.DataFrame({"d1": ["a", "a", "a"], "d2": ["n", "s1", "s3"], "Value": [5.0, "text", "old"]})
+
+        mask = build_changed_cells_mask(data, current)
+
+        self.assertEqual([False, False, False, True], mask.tolist())
+
+
+class TestBuildDataframeAggregateIntersections(unittest.TestCase):
+    """Server-free tests for Utils.build_dataframe_aggregate_intersections"""
+
+    @skip_if_no_pandas
+    def test_numeric_duplicates_case_and_space_insensitive(self):
+        df = pd.DataFrame({"d1": ["Sales A", "salesa", "b", None], "d2": ["x", "X", "y", "y"], "Value": [1, 2, 3, 4]})
+
+        aggregated = build_dataframe_aggregate_intersections(df)
+
+        # first spelling is kept, order of first appearance is kept, incomplete intersections are dropped
+        self.assertEqual([["Sales A", "x", 3], ["b", "y", 3]], aggregated.values.tolist())
+
+    @skip_if_no_pandas
+    def test_mixed_values_only_sum_numbers(self):
+        df = pd.DataFrame({"d1": ["a", "A", "b", "b"], "d2": ["x", "x", "y", "y"], "Value": [1.5, 2, "s", "t"]})
+
+        aggregated = build_dataframe_aggregate_intersections(df)
+
+        self.assertEqual([["a", "x", 3.5], ["b", "y", "s"], ["b", "y", "t"]], aggregated.values.tolist())
+
+
 if __name__ == "__main__":
     unittest.main()
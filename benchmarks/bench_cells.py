@@ -0,0 +1,72 @@
+from benchmarks import fixtures
+from benchmarks.runner import CLIENT_SIZES, SERVER_SIZES, benchmark
+from TM1py.Services.CellService import CellService
+from TM1py.Utils import (
+    build_content_from_cellset_dict,
+    build_dataframe_aggregate_intersections,
+)
+
+
+@benchmark(fixture=fixtures.mock_cube, sizes=SERVER_SIZES, name="execute_mdx_csv[default]")
+def execute_mdx_csv(fixture):
+    fixture.tm1.cells.execute_mdx_csv(fixture.mdx)
+
+
+@benchmark(fixture=fixtures.mock_cube, sizes=SERVER_SIZES, name="execute_mdx_csv[iterative_json]")
+def execute_mdx_csv_iterative_json(fixture):
+    fixture.tm1.cells.execute_mdx_csv(fixture.mdx, use_iterative_json=True)
+
+
+@benchmark(fixture=fixtures.mock_cube, sizes=SERVER_SIZES, name="execute_mdx_csv[compact_json]")
+def execute_mdx_csv_compact_json(fixture):
+    fixture.tm1.cells.execute_mdx_csv(fixture.mdx, use_compact_json=True)
+
+
+@benchmark(fixture=fixtures.mock_cube, sizes=SERVER_SIZES)
+def execute_mdx_dataframe(fixture):
+    fixture.tm1.cells.execute_mdx_dataframe(fixture.mdx)
+
+
+@benchmark(fixture=fixtures.mock_cube, sizes=SERVER_SIZES)
+def write_through_blob(fixture):
+    fixture.tm1.cells.write_through_blob(fixture.cube_name, fixture.cells, dimensions=["Row", "Measure"])
+
+
+@benchmark(fixture=fixtures.mock_cube, sizes=SERVER_SIZES, name="write_through_blob[persistent_loader]")
+def write_through_blob_persistent_loader(fixture):
+    fixture.tm1.cells.write_through_blob(
+        fixture.cube_name, fixture.cells, dimensions=["Row", "Measure"], use_persistent_loader=True
+    )
+
+
+@benchmark(fixture=fixtures.cellset_dict, sizes=CLIENT_SIZES, name="build_content_from_cellset_dict")
+def build_content(raw_cellset):
+    build_content_from_cellset_dict(raw_cellset, skip_cell_properties=True)
+
+
+@benchmark(fixture=fixtures.cells, sizes=CLIENT_SIZES)
+def build_cell_update_statements(cells):
+    for _ in CellService._build_cell_update_statements(
+        cube_name=fixtures.CubeFixture.cube_name,
+        cellset_as_dict=cells,
+        increment=False,
+        measure_dimension_elements={},
+    ):
+        pass
+
+
+@benchmark(fixture=fixtures.dataframe, sizes=CLIENT_SIZES)
+def blob_csv_from_dataframe(df):
+    for _ in CellService._iter_blob_csv_parts([df]):
+        pass
+
+
+@benchmark(fixture=fixtures.dataframe, sizes=CLIENT_SIZES, name="blob_csv_from_dataframe[compact]")
+def blob_csv_from_dataframe_compact(df):
+    for _ in CellService._iter_blob_csv_parts([df], compact=True):
+        pass
+
+
+@benchmark(fixture=fixtures.dataframe, sizes=CLIENT_SIZES)
+def aggregate_duplicate_intersections(df):
+    build_dataframe_aggregate_intersections(df)
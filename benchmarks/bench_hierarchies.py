@@ -0,0 +1,8 @@
+from benchmarks import fixtures
+from benchmarks.runner import SERVER_SIZES, benchmark
+
+
+@benchmark(fixture=fixtures.mock_hierarchy, sizes=SERVER_SIZES)
+def update_or_create_hierarchy_from_dataframe(fixture):
+    name = fixtures.HierarchyFixture.dimension_name
+    fixture.tm1.hierarchies.update_or_create_hierarchy_from_dataframe(name, name, fixture.df)
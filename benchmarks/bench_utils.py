@@ -0,0 +1,37 @@
+from benchmarks import fixtures
+from benchmarks.runner import CLIENT_SIZES, benchmark
+from TM1py.Utils import (
+    CaseAndSpaceInsensitiveDict,
+    CaseAndSpaceInsensitiveSet,
+    CaseAndSpaceInsensitiveTuplesDict,
+)
+
+
+@benchmark(fixture=fixtures.names, sizes=CLIENT_SIZES, name="CaseAndSpaceInsensitiveDict")
+def case_and_space_insensitive_dict(names):
+    keys, lookups = names
+    container = CaseAndSpaceInsensitiveDict()
+    for key in keys:
+        container[key] = key
+    for key in lookups:
+        container[key]
+
+
+@benchmark(fixture=fixtures.names, sizes=CLIENT_SIZES, name="CaseAndSpaceInsensitiveSet")
+def case_and_space_insensitive_set(names):
+    keys, lookups = names
+    container = CaseAndSpaceInsensitiveSet()
+    for key in keys:
+        container.add(key)
+    for key in lookups:
+        key in container
+
+
+@benchmark(fixture=fixtures.name_tuples, sizes=CLIENT_SIZES, name="CaseAndSpaceInsensitiveTuplesDict")
+def case_and_space_insensitive_tuples_dict(name_tuples):
+    keys, lookups = name_tuples
+    container = CaseAndSpaceInsensitiveTuplesDict()
+    for key in keys:
+        container[key] = 1
+    for key in lookups:
+        container[key]
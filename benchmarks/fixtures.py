@@ -0,0 +1,147 @@
+"""Data and servers for the benchmarks. All data is deterministic for a size"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from Tests.MockTM1Server import MockTM1Server
+from TM1py import TM1Service
+
+MEASURES = 10
+
+
+def _row_names(rows: int) -> List[str]:
+    return [f"Row {i:0{len(str(rows))}d}" for i in range(rows)]
+
+
+def _measure_names() -> List[str]:
+    return [f"Measure {i}" for i in range(MEASURES)]
+
+
+class CubeFixture:
+    """TM1Service connected to a MockTM1Server with a dense cube of `size` cells"""
+
+    cube_name = "Bench"
+
+    def __init__(self, tm1: TM1Service, server: MockTM1Server, size: int):
+        self.tm1 = tm1
+        self.server = server
+        self.size = size
+        rows = max(size // MEASURES, 1)
+        self.rows = _row_names(rows)
+        self.mdx = (
+            "SELECT {TM1SUBSETALL([Measure].[Measure])} ON 0, "
+            "{TM1FILTERBYLEVEL({TM1SUBSETALL([Row].[Row])},0)} ON 1 "
+            f"FROM [{self.cube_name}]"
+        )
+        self.cells = {(row, measure): float(i) for i, (row, measure) in enumerate(self._coordinates(), 1)}
+
+    def _coordinates(self) -> Iterator[Tuple[str, str]]:
+        return ((row, measure) for row in self.rows for measure in _measure_names())
+
+
+@contextmanager
+def mock_cube(size: int) -> Iterator[CubeFixture]:
+    with MockTM1Server() as server:
+        rows = max(size // MEASURES, 1)
+        server.add_dimension("Row", {"Total Row": "Consolidated", **{row: "Numeric" for row in _row_names(rows)}})
+        hierarchy = server.dimension("Row").hierarchy()
+        for row in _row_names(rows):
+            hierarchy.edges[("Total Row", row)] = 1
+        server.add_dimension("Measure", _measure_names())
+        cube = server.add_cube(CubeFixture.cube_name, ["Row", "Measure"])
+
+        with TM1Service(**server.connection_kwargs) as tm1:
+            fixture = CubeFixture(tm1, server, size)
+            cube.cells = dict(fixture.cells)
+            yield fixture
+
+
+def raw_cellset(rows: int, columns: int) -> Dict:
+    """Cellset as returned by TM1 for a query with `rows` tuples on rows and `columns` tuples on columns"""
+
+    def member(dimension: str, element: str) -> Dict:
+        unique_name = f"[{dimension}].[{dimension}].[{element}]"
+        return {"Name": element, "UniqueName": unique_name, "Element": {"UniqueName": unique_name}}
+
+    column_tuples = [{"Ordinal": i, "Members": [member("Measure", f"Measure {i}")]} for i in range(columns)]
+    row_tuples = [{"Ordinal": i, "Members": [member("Row", name)]} for i, name in enumerate(_row_names(rows))]
+    return {
+        "ID": "benchmark",
+        "Cube": {"Name": CubeFixture.cube_name, "Dimensions": [{"Name": "Row"}, {"Name": "Measure"}]},
+        "Axes": [
+            {"Ordinal": 0, "Cardinality": columns, "Tuples": column_tuples},
+            {"Ordinal": 1, "Cardinality": rows, "Tuples": row_tuples},
+        ],
+        "Cells": [{"Ordinal": i, "Value": float(i)} for i in range(rows * columns)],
+    }
+
+
+@contextmanager
+def cellset_dict(size: int) -> Iterator[Dict]:
+    yield raw_cellset(max(size // MEASURES, 1), MEASURES)
+
+
+@contextmanager
+def cells(size: int) -> Iterator[Dict[Tuple[str, str], float]]:
+    rows = _row_names(max(size // MEASURES, 1))
+    yield {(row, measure): i * 1.5 for i, (row, measure) in enumerate((r, m) for r in rows for m in _measure_names())}
+
+
+@contextmanager
+def dataframe(size: int) -> Iterator:
+    """cells as DataFrame: Row, Measure and Value columns"""
+    import pandas as pd
+
+    with cells(size) as data:
+        yield pd.DataFrame(
+            [(*coordinates, value) for coordinates, value in data.items()], columns=["Row", "Measure", "Value"]
+        )
+
+
+@contextmanager
+def names(size: int) -> Iterator[Tuple[List[str], List[str]]]:
+    """names and the same names in different case and spacing"""
+    keys = [f"Element Name {i}" for i in range(size)]
+    yield keys, [key.upper().replace(" ", "") for key in keys]
+
+
+@contextmanager
+def name_tuples(size: int) -> Iterator[Tuple[List[Tuple[str, ...]], List[Tuple[str, ...]]]]:
+    keys = [(f"Region {i % 1000}", f"Product {i // 1000}", "Sales Amount") for i in range(size)]
+    yield keys, [tuple(part.lower().replace(" ", "") for part in key) for key in keys]
+
+
+class HierarchyFixture:
+    """TM1Service connected to a MockTM1Server and a DataFrame with a hierarchy of `size` leaves"""
+
+    dimension_name = "Bench Hierarchy"
+
+    def __init__(self, tm1: TM1Service, server: MockTM1Server, size: int):
+        import pandas as pd
+
+        self.tm1 = tm1
+        self.server = server
+        leaves = _row_names(size)
+        self.df = pd.DataFrame(
+            {
+                "Element": leaves,
+                "ElementType": "Numeric",
+                "Alias:a": [f"Alias of {leaf}" for leaf in leaves],
+                "Size:n": range(size),
+                "level001": [f"Group {i // 100}" for i in range(size)],
+                "level000": "Total",
+                "level001_weight": 1,
+                "level000_weight": 1,
+            }
+        )
+
+
+@contextmanager
+def mock_hierarchy(size: int) -> Iterator[HierarchyFixture]:
+    with MockTM1Server() as server, TM1Service(**server.connection_kwargs) as tm1:
+        fixture = HierarchyFixture(tm1, server, size)
+        # the first run creates the dimension. Following runs update it
+        tm1.hierarchies.update_or_create_hierarchy_from_dataframe(
+            HierarchyFixture.dimension_name, HierarchyFixture.dimension_name, fixture.df
+        )
+        yield fixture
@@ -0,0 +1,247 @@
+"""Registry, timing and result files of the benchmark suite
+
+Benchmarks are functions that are registered through the `benchmark` decorator. A benchmark gets the object
+that its fixture provides for a size, e.g. a TM1Service that is connected to a MockTM1Server with a cube of
+that many cells. Fixtures are set up once per size and shared by all benchmarks that use them. Only the
+benchmark function itself is timed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+DEFAULT_SIZES = ("10k",)
+CLIENT_SIZES = ("10k", "1m", "10m")
+# the mock server holds the cells of a request in memory several times. 10m does not fit on most machines
+SERVER_SIZES = ("10k", "1m")
+
+
+def parse_size(size: str) -> int:
+    """'10k' -> 10000, '1m' -> 1000000, '250' -> 250"""
+    size = size.strip().lower()
+    factor = {"k": 1_000, "m": 1_000_000}.get(size[-1:], 1)
+    return int(float(size.rstrip("km")) * factor)
+
+
+class Benchmark:
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[Any], Any],
+        fixture: Callable[[int], ContextManager],
+        sizes: Tuple[str, ...],
+        group: str,
+    ):
+        """
+        :param name: unique name, e.g. 'cells.execute_mdx_csv[compact_json]'
+        :param function: called with the object of the fixture. Its execution time is measured
+        :param fixture: context manager factory that takes the size and provides the object for the function
+        :param sizes: sizes the benchmark supports
+        :param group: module of the benchmark
+        """
+        self.name = name
+        self.function = function
+        self.fixture = fixture
+        self.sizes = sizes
+        self.group = group
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(fixture: Callable[[int], ContextManager], sizes: Tuple[str, ...] = CLIENT_SIZES, name: str = None):
+    """Register a benchmark
+
+    >>> @benchmark(fixture=cellset_dict, sizes=CLIENT_SIZES)
+    >>> def build_content_from_cellset_dict(raw_cellset):
+    >>>     Utils.build_content_from_cellset_dict(raw_cellset)
+
+    """
+
+    def wrap(function):
+        group = function.__module__.rsplit(".", 1)[-1].replace("bench_", "")
+        full_name = f"{group}.{name or function.__name__}"
+        if full_name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{full_name}' is registered twice")
+        BENCHMARKS[full_name] = Benchmark(full_name, function, fixture, sizes, group)
+        return function
+
+    return wrap
+
+
+def load_benchmarks():
+    # registration happens on import
+    from benchmarks import bench_cells, bench_hierarchies, bench_utils  # noqa: F401
+
+
+def select(keyword: str = None) -> List[Benchmark]:
+    load_benchmarks()
+    return [b for name, b in BENCHMARKS.items() if not keyword or keyword.lower() in name.lower()]
+
+
+def measure(function: Callable[[Any], Any], argument: Any, repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "repeat": repeat,
+    }
+
+
+def run(
+    benchmarks: Iterable[Benchmark],
+    sizes: Iterable[str] = DEFAULT_SIZES,
+    repeat: int = 5,
+    report: Callable[[str, str, Dict], None] = None,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Run benchmarks for all sizes they support
+
+    :param sizes: e.g. ['10k', '1m']. Sizes that a benchmark doesn't declare are still run, if given as numbers
+    :param repeat: runs per benchmark and size. The median is used for comparisons
+    :param report: called with name, size and timings after every measurement
+    :return: name -> size -> timings
+    """
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    benchmarks = list(benchmarks)
+    for size in sizes:
+        # fixtures are entered once per size and shared by all benchmarks that use them
+        with ExitStack() as stack:
+            fixtures: Dict[Callable, Any] = {}
+            for bench in benchmarks:
+                if size not in bench.sizes and not size.isdigit():
+                    continue
+                if bench.fixture not in fixtures:
+                    fixtures[bench.fixture] = stack.enter_context(bench.fixture(parse_size(size)))
+                timings = measure(bench.function, fixtures[bench.fixture], repeat)
+                timings["per_second"] = parse_size(size) / timings["median"] if timings["median"] else None
+                results.setdefault(bench.name, {})[size] = timings
+                if report:
+                    report(bench.name, size, timings)
+    return results
+
+
+def environment() -> Dict[str, str]:
+    from TM1py import __version__
+
+    return {
+        "tm1py": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+    }
+
+
+def default_results_file() -> str:
+    from TM1py import __version__
+
+    return os.path.join(RESULTS_DIRECTORY, f"{__version__}.json")
+
+
+def save_results(results: Dict, file: str, settings: Dict = None):
+    """Store results with the environment. Results of other benchmarks and sizes in the file are kept"""
+    stored = load_results(file) if os.path.isfile(file) else {}
+    merged = stored.get("results", {})
+    for name, sizes in results.items():
+        merged.setdefault(name, {}).update(sizes)
+    os.makedirs(os.path.dirname(os.path.abspath(file)), exist_ok=True)
+    with open(file, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "settings": settings or {}, "results": merged}, f, indent=2)
+
+
+def load_results(file: str) -> Dict:
+    if not os.path.isfile(file) and not file.endswith(".json"):
+        # a version, e.g. '2.3.1'
+        file = os.path.join(RESULTS_DIRECTORY, f"{file}.json")
+    with open(file, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float = 0.2) -> List[Tuple[str, str, float, float, float, bool]]:
+    """Compare medians with a baseline
+
+    :param tolerance: relative slowdown that is accepted, e.g. 0.2 for 20%
+    :return: (name, size, baseline median, median, ratio, regression) for every benchmark and size in both
+    """
+    comparison = []
+    for name, sizes in results.items():
+        for size, timings in sizes.items():
+            before = baseline.get(name, {}).get(size)
+            if not before or not before.get("median"):
+                continue
+            ratio = timings["median"] / before["median"]
+            comparison.append((name, size, before["median"], timings["median"], ratio, ratio > 1 + tolerance))
+    return comparison
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:8.2f}s "
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.2f}ms"
+    return f"{seconds * 1e6:8.2f}us"
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="TM1py client side benchmarks")
+    parser.add_argument("-k", "--keyword", help="only benchmarks whose name contains the keyword")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(DEFAULT_SIZES),
+        help="comma separated sizes, e.g. 10k,1m,10m. 'all': all sizes each benchmark supports",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark and size")
+    parser.add_argument("--output", help="result file. Default: benchmarks/results/<TM1py version>.json")
+    parser.add_argument("--no-save", action="store_true", help="don't store the results")
+    parser.add_argument("--compare", help="result file or TM1py version to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="accepted relative slowdown. Default: 0.2")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and their sizes")
+    args = parser.parse_args(arguments)
+
+    benchmarks = select(args.keyword)
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name:60} {','.join(bench.sizes)}")
+        return 0
+
+    if args.sizes == "all":
+        sizes = [size for size in CLIENT_SIZES if any(size in bench.sizes for bench in benchmarks)]
+    else:
+        sizes = [size.strip().lower() for size in args.sizes.split(",") if size.strip()]
+
+    def report(name: str, size: str, timings: Dict):
+        print(f"{name:60} {size:>5} median {_format_seconds(timings['median'])}  min {_format_seconds(timings['min'])}")
+        sys.stdout.flush()
+
+    results = run(benchmarks, sizes=sizes, repeat=args.repeat, report=report)
+
+    if not args.no_save:
+        file = args.output or default_results_file()
+        save_results(results, file, settings={"repeat": args.repeat})
+        print(f"Results stored in '{file}'")
+
+    if args.compare:
+        comparison = compare(results, load_results(args.compare)["results"], args.tolerance)
+        regressions = [entry for entry in comparison if entry[5]]
+        for name, size, before, after, ratio, regression in comparison:
+            flag = "REGRESSION" if regression else ""
+            print(f"{name:60} {size:>5} {_format_seconds(before)} -> {_format_seconds(after)} {ratio:6.2f}x {flag}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.tolerance:.0%}")
+            return 1
+    return 0